@@ -32,7 +32,8 @@ Available Commands:
   init           Initialize a new automation project.
   create <type>  Create a new test suite, test case, or page object.
   run            Run the tests. (Options for selecting tests to run)
-  report         Generate a test report.
+  report         Open the latest test report, or query the run history
+                 (cafex report slowest|regressions|flaky|ingest).
   list           List available test suites, test cases, or page objects.
   config         View or modify project configuration.
   version        Show the version of Cafex.
@@ -48,6 +49,8 @@ Examples:
   cafex create testsuite LoginTests
   cafex run
   cafex report
+  cafex report slowest 20
+  cafex report regressions 10 1.5
 """)
 
 
@@ -429,12 +432,22 @@ def cafex_run(args):
         print(f"Error running tests: {e}")
 
 
-def cafex_report():
-    """Generate a test report."""
+def cafex_report(args=None):
+    """Open the latest test report or query the run history.
+
+    Args:
+        args: Optional history query followed by its arguments:
+            slowest [limit] [runs], regressions [runs] [threshold],
+            flaky [runs] or ingest
+    """
+    result_dir = "result"
+    if args:
+        cafex_report_history(result_dir, args[0], args[1:])
+        return
+
     print("Generating test report...")
 
     # Check if result directory exists and contains reports
-    result_dir = "result"
     if not os.path.exists(result_dir):
         print("No test results found. Run tests first with 'cafex run'.")
         return
@@ -469,6 +482,70 @@ def cafex_report():
         print(f"Error generating/opening report: {e}")
 
 
+def cafex_report_history(result_dir, query, query_args):
+    """Query the run index kept in the result directory.
+
+    Args:
+        result_dir: The result directory
+        query: One of slowest, regressions, flaky or ingest
+        query_args: Positional arguments of the query
+    """
+    from cafex_core.utils.run_history import RunHistory
+    from cafex_core.utils.run_index import RunIndex
+
+    if not os.path.isdir(result_dir):
+        print("No test results found. Run tests first with 'cafex run'.")
+        return
+    run_index = RunIndex(result_dir)
+    try:
+        if query == "ingest":
+            result_files = RunHistory(result_dir).get_result_files()
+            result_files += [
+                os.path.join(result_dir, d, "result.json") for d in os.listdir(result_dir)
+                if os.path.isfile(os.path.join(result_dir, d, "result.json"))
+            ]
+            for result_file in result_files:
+                run_index.ingest_result_file(result_file)
+            print(f"Ingested {len(result_files)} run(s) into {run_index.db_path}")
+            return
+        if not run_index.exists():
+            print("No run index found. Run tests first or use 'cafex report ingest'.")
+            return
+        if query == "slowest":
+            limit = int(query_args[0]) if len(query_args) > 0 else 10
+            runs = int(query_args[1]) if len(query_args) > 1 else 5
+            print(f"\nSlowest tests (median of last {runs} runs):")
+            for test in run_index.slowest_tests(limit, runs):
+                print(f"  {test['medianSeconds']:>10.2f}s  max {test['maxSeconds']:>10.2f}s  "
+                      f"{test['nodeId']}")
+        elif query == "regressions":
+            runs = int(query_args[0]) if len(query_args) > 0 else 10
+            threshold = float(query_args[1]) if len(query_args) > 1 else 1.5
+            regressions = run_index.duration_regressions(runs, threshold)
+            print(f"\nDuration regressions (latest run vs median of previous {runs} runs):")
+            if not regressions:
+                print("  None")
+            for test in regressions:
+                print(f"  {test['latestSeconds']:>10.2f}s  median {test['medianSeconds']:>10.2f}s  "
+                      f"x{test['ratio']}  {test['nodeId']}")
+        elif query == "flaky":
+            runs = int(query_args[0]) if len(query_args) > 0 else 10
+            flaky = run_index.flaky_tests(runs)
+            print(f"\nFlaky tests (last {runs} runs):")
+            if not flaky:
+                print("  None")
+            for test in flaky:
+                print(f"  {test['failures']}/{test['runs']} failed, {test['flips']} flip(s)  "
+                      f"{test['nodeId']}")
+        else:
+            print(f"Unknown report query: {query}. Must be 'slowest', 'regressions', 'flaky' "
+                  "or 'ingest'.")
+    except ValueError as e:
+        print(f"Invalid report arguments: {e}")
+    except Exception as e:
+        print(f"Error querying run history: {e}")
+
+
 def cafex_list(item_type):
     """List available test suites, test cases, or page objects.
 
@@ -619,7 +696,7 @@ def main():
     elif args.command == "run":
         cafex_run(args.extra_args)
     elif args.command == "report":
-        cafex_report()
+        cafex_report(args.extra_args)
     elif args.command == "list":
         if len(args.extra_args) != 1:
             print("Usage: cafex list <type>")
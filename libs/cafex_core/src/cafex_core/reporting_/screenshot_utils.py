@@ -3,6 +3,7 @@ import os
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
 from cafex_core.utils.date_time_utils import DateTimeActions
+from cafex_core.utils.phase_timer import PhaseTimer
 from cafex_core.utils.regex_constants import (
     DATETIME_CHARS_PATTERN,
     INVALID_FILENAME_CHARS_PATTERN,
@@ -50,6 +51,7 @@ def _format_timestamp(timestamp: str) -> str:
     return DATETIME_CHARS_PATTERN.sub("", timestamp)
 
 
+@PhaseTimer.timed("screenshot")
 def capture_screenshot(name, error=False):
     logger = CoreLogger(name=__name__).get_logger()
     session_store = SessionStore()
@@ -0,0 +1,220 @@
+"""
+This module provides a cached, indexed snapshot of the NiFi flow topology.
+"""
+import time
+
+import nipyapi
+
+from cafex_core.logging.logger_ import CoreLogger
+
+
+class NifiFlowSnapshot:
+    """
+    A snapshot of the process groups, processors and connections under a process group.
+
+    The flow is fetched once with nipyapi.canvas.recurse_flow (one request
+    per process group) and indexed by ID, name, parent process group and
+    connection endpoint, so lookups need no further requests. The entities
+    are the same nipyapi objects returned by the list_all_* functions of
+    nipyapi.canvas.
+
+    The snapshot does not follow later changes to the canvas. Call refresh
+    after changing the flow, or refresh_if_stale with a revision version
+    returned by NiFi to refresh only when the snapshot is older.
+    """
+
+    def __init__(self, pg_id: str = "root"):
+        self.pg_id = pg_id
+        self.logger = CoreLogger(name=__name__).get_logger()
+        self.root_id = None
+        self.refreshed_at = None
+        self.__entities = {}
+        self.__parents = {}
+        self.__names = {"processors": {}, "process_groups": {}}
+        self.__connections_by_endpoint = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Fetches the flow again and rebuilds the indexes.
+
+        Examples:
+            >> snapshot.refresh()
+        """
+        start = time.perf_counter()
+        flow = nipyapi.canvas.recurse_flow(self.pg_id)
+        entities = {"processors": {}, "process_groups": {}, "connections": {}}
+        parents = {}
+        names = {"processors": {}, "process_groups": {}}
+        by_endpoint = {}
+        self.root_id = flow.process_group_flow.id
+        parents[self.root_id] = None
+        groups = [(self.root_id, flow)]
+        while groups:
+            group_id, group_flow = groups.pop()
+            contents = group_flow.process_group_flow.flow
+            for processor in contents.processors or []:
+                entities["processors"][processor.id] = processor
+                parents[processor.id] = group_id
+                names["processors"].setdefault(processor.component.name, []).append(processor.id)
+            for connection in contents.connections or []:
+                entities["connections"][connection.id] = connection
+                parents[connection.id] = group_id
+                for endpoint in (connection.source_id, connection.destination_id):
+                    by_endpoint.setdefault(endpoint, []).append(connection.id)
+            for process_group in contents.process_groups or []:
+                entities["process_groups"][process_group.id] = process_group
+                parents[process_group.id] = group_id
+                names["process_groups"].setdefault(
+                    process_group.component.name, []).append(process_group.id)
+                child_flow = getattr(process_group, "nipyapi_extended", None)
+                if child_flow is not None:
+                    groups.append((process_group.id, child_flow))
+        self.__entities = entities
+        self.__parents = parents
+        self.__names = names
+        self.__connections_by_endpoint = by_endpoint
+        self.refreshed_at = time.time()
+        self.logger.info(
+            "NiFi flow snapshot of %s: %s process groups, %s processors, %s connections "
+            "in %.2fs", self.pg_id, len(entities["process_groups"]),
+            len(entities["processors"]), len(entities["connections"]),
+            time.perf_counter() - start,
+        )
+
+    def refresh_if_stale(self, component_id: str, revision_version: int) -> bool:
+        """
+        Refreshes the snapshot if it holds an older revision of a component.
+
+        Args:
+            component_id (str): The component ID.
+            revision_version (int): The current revision version of the component,
+                e.g. from the response of an update.
+
+        Returns:
+            bool: True if the snapshot was refreshed.
+
+        Examples:
+            >> snapshot.refresh_if_stale(processor.id, processor.revision.version)
+        """
+        entity = self.get(component_id)
+        if entity is not None and entity.revision.version >= revision_version:
+            return False
+        self.refresh()
+        return True
+
+    def get(self, component_id: str):
+        """
+        Returns the entity of a processor, process group or connection.
+
+        Args:
+            component_id (str): The component ID.
+
+        Returns:
+            The nipyapi entity, or None if the ID is not in the snapshot.
+        """
+        for entities in self.__entities.values():
+            if component_id in entities:
+                return entities[component_id]
+        return None
+
+    def __in_group(self, component_id: str, pg_id: str) -> bool:
+        """Returns whether a component is in a process group or its descendants."""
+        if pg_id in (None, "root", self.pg_id):
+            return True
+        parent = self.__parents.get(component_id)
+        while parent is not None:
+            if parent == pg_id:
+                return True
+            parent = self.__parents.get(parent)
+        return False
+
+    def __find_id(self, kind: str, name: str, parent_pg_id: str):
+        return next((component_id for component_id in self.__names[kind].get(name, [])
+                     if self.__in_group(component_id, parent_pg_id)), None)
+
+    def __list(self, kind: str, pg_id: str) -> list:
+        return [entity for component_id, entity in self.__entities[kind].items()
+                if self.__in_group(component_id, pg_id)]
+
+    def processor_id(self, name: str, parent_pg_id: str = None) -> str | None:
+        """
+        Returns the ID of the first processor with the given name.
+
+        Args:
+            name (str): Processor name.
+            parent_pg_id (str, optional): Only search this process group and its descendants.
+
+        Returns:
+            str: The processor ID, or None if not found.
+
+        Examples:
+            >> processor_id = snapshot.processor_id("processor_name")
+        """
+        return self.__find_id("processors", name, parent_pg_id)
+
+    def process_group_id(self, name: str, parent_pg_id: str = None) -> str | None:
+        """
+        Returns the ID of the first process group with the given name.
+
+        Args:
+            name (str): Process group name.
+            parent_pg_id (str, optional): Only search this process group and its descendants.
+
+        Returns:
+            str: The process group ID, or None if not found.
+
+        Examples:
+            >> pg_id = snapshot.process_group_id("process_group_name")
+        """
+        return self.__find_id("process_groups", name, parent_pg_id)
+
+    def processors(self, pg_id: str = None) -> list:
+        """
+        Returns the processors under a process group, recursively.
+
+        Args:
+            pg_id (str, optional): Process Group ID. Defaults to the whole snapshot.
+
+        Returns:
+            list: ProcessorEntity objects.
+        """
+        return self.__list("processors", pg_id)
+
+    def process_groups(self, pg_id: str = None) -> list:
+        """
+        Returns the process groups under a process group, recursively.
+
+        Args:
+            pg_id (str, optional): Process Group ID. Defaults to the whole snapshot.
+
+        Returns:
+            list: ProcessGroupEntity objects.
+        """
+        return self.__list("process_groups", pg_id)
+
+    def connections(self, pg_id: str = None) -> list:
+        """
+        Returns the connections under a process group, recursively.
+
+        Args:
+            pg_id (str, optional): Process Group ID. Defaults to the whole snapshot.
+
+        Returns:
+            list: ConnectionEntity objects.
+        """
+        return self.__list("connections", pg_id)
+
+    def component_connections(self, component_id: str) -> list:
+        """
+        Returns the connections whose source or destination is the component.
+
+        Args:
+            component_id (str): The component ID, e.g. a processor ID.
+
+        Returns:
+            list: ConnectionEntity objects.
+        """
+        return [self.__entities["connections"][connection_id]
+                for connection_id in dict.fromkeys(
+                    self.__connections_by_endpoint.get(component_id, []))]
@@ -2,14 +2,17 @@
 This module provides automation support for Apache NiFi process groups.
 """
 import time
-from typing import Any
+from typing import Any, Callable
 import nipyapi
 import requests
+from requests.adapters import HTTPAdapter
 from cafex_core.parsers.json_parser import ParseJsonData
 from cafex_core.utils.core_security import Security
 from cafex_core.reporting_.reporting import Reporting
 from cafex_core.utils.exceptions import CoreExceptions
 from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.utils.apache_utils.nifi_flow_snapshot import NifiFlowSnapshot
+from cafex_core.utils.poller import Poller
 
 
 class NifiProcessGroupUtils:
@@ -17,13 +20,19 @@ class NifiProcessGroupUtils:
     This Class provides automation support for Apache NiFi process groups.
     """
 
-    def __init__(self, pstr_nifi_url, pstr_nifi_registry_url=None):
+    def __init__(self, pstr_nifi_url, pstr_nifi_registry_url=None, pool_maxsize=10):
         self.reporting = Reporting()
         self.__obj_exception = CoreExceptions()
         self.__nifi_token = None
         self.nifi_module = nipyapi
         self.logger = CoreLogger(name=__name__).get_logger()
         self.security = Security()
+        self.nifi_url = pstr_nifi_url
+        self.__flow_snapshot = None
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         nipyapi.config.nifi_config.verify_ssl = False
         nipyapi.config.nifi_config.host = pstr_nifi_url
@@ -209,19 +218,30 @@ class NifiProcessGroupUtils:
             )
             return False
 
-    def start_then_stop_pg(self, pg_id: str, wait_time: int = 10) -> bool:
+    def start_then_stop_pg(self, pg_id: str, wait_time: int = 10, max_wait_time: int = None,
+                           server_name: str = None) -> bool:
         """
         Starts and stops the NiFi process group.
 
+        By default the process group runs for wait_time seconds. With
+        max_wait_time, it is stopped as soon as it is idle and its queues are
+        empty, after running at least wait_time seconds.
+
         Args:
             pg_id (str): The NiFi process group ID.
             wait_time (int): Time to wait before stopping the NiFi process group.
+            max_wait_time (int, optional): Maximum time to wait for the process group
+                to drain before stopping it.
+            server_name (str, optional): NiFi server URL. Defaults to the NiFi URL
+                of this instance.
 
         Returns:
             bool: True if successful; otherwise, False.
 
         Examples:
             >> result = ApacheUtils.Nifi().start_then_stop_pg("process_group_id", 10)
+            >> result = ApacheUtils.Nifi().start_then_stop_pg("process_group_id", 0,
+            max_wait_time=120)
         """
         try:
             process_group_status = nipyapi.canvas. \
@@ -232,11 +252,18 @@ class NifiProcessGroupUtils:
                 )
                 nipyapi.canvas.schedule_process_group(pg_id, scheduled=True)
                 self.logger.info("Process group %s started.", pg_id)
+                start = time.monotonic()
                 time.sleep(wait_time)
+                drained = True
+                if max_wait_time is not None:
+                    drained = self.wait_for_process_groups(
+                        [pg_id], idle=True, drained=True, server_name=server_name,
+                        parent_pg_id=pg_id, timeout=max_wait_time
+                    )
                 nipyapi.canvas.schedule_process_group(pg_id, scheduled=False)
-                self.logger.info("Process group %s stopped after %s seconds."
-                                 , pg_id, wait_time)
-                return True
+                self.logger.info("Process group %s stopped after %.2f seconds, drained: %s.",
+                                 pg_id, time.monotonic() - start, drained)
+                return drained
             self.reporting.insert_step(
                 "Processor group not found", "Processor group not found", "Fail"
             )
@@ -329,13 +356,14 @@ class NifiProcessGroupUtils:
             return False
 
     def get_process_group_id(self, pstr_process_group_name,
-                             parent_pg_id="root") -> tuple[bool, Any]:
+                             parent_pg_id="root", use_snapshot=False) -> tuple[bool, Any]:
         """
         Retrieves the process group ID.
 
         Args:
             pstr_process_group_name (str): Process group name.
             parent_pg_id (str): Parent Process Group ID.
+            use_snapshot (bool): Resolve the name from the cached flow snapshot.
 
         Returns:
             bool: Indicates whether the operation was successful.
@@ -345,11 +373,15 @@ class NifiProcessGroupUtils:
         """
         component_id = None
         try:
-            process_group_list = nipyapi.canvas.list_all_process_groups(pg_id=parent_pg_id)
-            for process_group in process_group_list:
-                if process_group.to_dict()["component"]["name"] == pstr_process_group_name:
-                    component_id = process_group.to_dict()["component"]["id"]
-                    break
+            if use_snapshot:
+                component_id = self.get_flow_snapshot().process_group_id(
+                    pstr_process_group_name, parent_pg_id)
+            else:
+                process_group_list = nipyapi.canvas.list_all_process_groups(pg_id=parent_pg_id)
+                for process_group in process_group_list:
+                    if process_group.to_dict()["component"]["name"] == pstr_process_group_name:
+                        component_id = process_group.to_dict()["component"]["id"]
+                        break
             if component_id is not None:
                 self.reporting.insert_step(
                     f"Successfully retrieved process group ID for: {pstr_process_group_name}",
@@ -375,6 +407,29 @@ class NifiProcessGroupUtils:
             )
             return False, component_id
 
+    def get_flow_snapshot(self, refresh: bool = False) -> NifiFlowSnapshot:
+        """
+        Returns the cached snapshot of the whole flow, fetching it on first use.
+
+        Name, ID and connection lookups on the snapshot need no requests. It is
+        shared by the use_snapshot option of the lookup methods.
+
+        Args:
+            refresh (bool): Fetch the flow again, e.g. after changing the canvas.
+
+        Returns:
+            NifiFlowSnapshot: The flow snapshot.
+
+        Examples:
+            >> snapshot = ApacheUtils.Nifi().get_flow_snapshot()
+            >> processor_id = snapshot.processor_id("processor_name")
+        """
+        if self.__flow_snapshot is None:
+            self.__flow_snapshot = NifiFlowSnapshot("root")
+        elif refresh:
+            self.__flow_snapshot.refresh()
+        return self.__flow_snapshot
+
     def list_queue_data(self, connection_id: str) -> list | None:
         """
         Lists the information of the queue in this connection.
@@ -417,13 +472,15 @@ class NifiProcessGroupUtils:
             )
             return None
 
-    def list_connections(self, pg_id: str = "root", key_path: str = None) -> list:
+    def list_connections(self, pg_id: str = "root", key_path: str = None,
+                         use_snapshot: bool = False) -> list:
         """
         Lists the connections of the queue in the process group.
 
         Args:
             pg_id (str): Process Group ID.
             key_path (str): Path of the field to be retrieved.
+            use_snapshot (bool): Read the connections from the cached flow snapshot.
 
         Returns:
             list: Connections list or specified key path values.
@@ -433,7 +490,8 @@ class NifiProcessGroupUtils:
         """
         try:
             connections_list = []
-            connection_list = nipyapi.canvas.list_all_connections(pg_id=pg_id)
+            connection_list = self.get_flow_snapshot().connections(pg_id) if use_snapshot \
+                else nipyapi.canvas.list_all_connections(pg_id=pg_id)
             for conn in connection_list:
                 if key_path:
                     field_values = self.get_key_path_value(
@@ -457,13 +515,16 @@ class NifiProcessGroupUtils:
             )
             return []
 
-    def get_process_groups(self, pg_id: str = "root", key_path: str = None) -> list:
+    def get_process_groups(self, pg_id: str = "root", key_path: str = None,
+                           use_snapshot: bool = False) -> list:
         """
         Retrieves details of process groups under the mentioned process group recursively.
 
         Args:
             pg_id (str): Process Group ID.
             key_path (str): Path of the field to be retrieved.
+            use_snapshot (bool): Read the process groups from the cached flow snapshot.
+                Unlike the live listing, the process group itself is not included.
 
         Returns:
             list: Process groups list or specified key path values.
@@ -474,7 +535,8 @@ class NifiProcessGroupUtils:
         """
         try:
             pgs_list = []
-            pg_list = nipyapi.canvas.list_all_process_groups(pg_id=pg_id)
+            pg_list = self.get_flow_snapshot().process_groups(pg_id) if use_snapshot \
+                else nipyapi.canvas.list_all_process_groups(pg_id=pg_id)
             for pg in pg_list:
                 if key_path:
                     field_values = self.get_key_path_value(
@@ -654,6 +716,200 @@ class NifiProcessGroupUtils:
             )
             return 0
 
+    def get_flow_status(self, pg_id: str = "root", server_name: str = None) -> dict:
+        """
+        Retrieves the status of every component under a process group in one call.
+
+        The recursive status of the process group is indexed by component ID.
+        The process group itself is also indexed under the given pg_id, so
+        "root" can be looked up directly.
+
+        Args:
+            pg_id (str): Process Group ID.
+            server_name (str, optional): NiFi server URL. Defaults to the NiFi URL
+                of this instance.
+
+        Returns:
+            dict: The status snapshots keyed by ID, under "processors",
+            "process_groups" and "connections".
+
+        Raises:
+            ValueError: If the status request fails.
+
+        Examples:
+            >> status = ApacheUtils.Nifi().get_flow_status("process_group_id")
+            >> status["processors"]["processor_id"]["runStatus"]
+        """
+        api_header = {"Content-Type": "application/json"}
+        if self.__nifi_token is not None:
+            api_header["Authorization"] = self.__nifi_token
+        request_url = f"{server_name or self.nifi_url}/nifi-api/flow/process-groups/" \
+                      f"{pg_id}/status?recursive=true"
+        response = self.call_request("GET", request_url, api_header)
+        if response.status_code != 200:
+            raise ValueError(f"Status request for process group {pg_id} failed with "
+                             f"status {response.status_code}")
+        status = {"processors": {}, "process_groups": {}, "connections": {}}
+        snapshot = response.json()["processGroupStatus"]["aggregateSnapshot"]
+        status["process_groups"][pg_id] = snapshot
+        snapshots = [snapshot]
+        while snapshots:
+            group = snapshots.pop()
+            status["process_groups"][group["id"]] = group
+            for entry in group.get("processorStatusSnapshots", []):
+                processor = entry["processorStatusSnapshot"]
+                status["processors"][processor["id"]] = processor
+            for entry in group.get("connectionStatusSnapshots", []):
+                connection = entry["connectionStatusSnapshot"]
+                status["connections"][connection["id"]] = connection
+            snapshots.extend(entry["processGroupStatusSnapshot"]
+                             for entry in group.get("processGroupStatusSnapshots", []))
+        return status
+
+    def wait_for_components(
+            self,
+            component_ids: list,
+            condition: Callable[[dict], bool],
+            component_type: str = "processors",
+            server_name: str = None,
+            pg_id: str = "root",
+            timeout: float = 60,
+            initial_interval: float = 0.5,
+            max_interval: float = 5.0,
+    ) -> bool:
+        """
+        Waits until a condition holds for every given component.
+
+        Each tick fetches the recursive status of the process group once and
+        checks all pending components against it. The polling interval grows
+        from initial_interval to max_interval.
+
+        Args:
+            component_ids (list): The IDs of the components.
+            condition (Callable): Returns True when a status snapshot is the awaited one.
+            component_type (str): "processors", "process_groups" or "connections".
+            server_name (str, optional): NiFi server URL. Defaults to the NiFi URL
+                of this instance.
+            pg_id (str): Process Group ID containing the components.
+            timeout (float): Maximum time to wait in seconds.
+            initial_interval (float): First polling interval in seconds.
+            max_interval (float): Maximum polling interval in seconds.
+
+        Returns:
+            bool: True if the condition held for every component; otherwise, False.
+
+        Examples:
+            >> done = ApacheUtils.Nifi().wait_for_components(
+            ["processor_id_1", "processor_id_2"],
+            lambda status: status["activeThreadCount"] == 0)
+        """
+        try:
+            poller = Poller(timeout, initial_interval, max_interval)
+            met, _, stats = poller.wait_all(
+                lambda: self.get_flow_status(pg_id, server_name)[component_type],
+                condition, component_ids
+            )
+            if met:
+                self.reporting.insert_step(
+                    f"{len(component_ids)} {component_type} should reach the expected state",
+                    f"All {component_type} reached the expected state after "
+                    f"{stats['seconds']} seconds.",
+                    "Pass",
+                )
+                return True
+            self.reporting.insert_step(
+                f"{len(component_ids)} {component_type} should reach the expected state",
+                f"{component_type} {', '.join(stats['pending'])} did not reach the expected "
+                f"state after {timeout} seconds.",
+                "Fail",
+            )
+            return False
+        except (nipyapi.nifi.rest.ApiException, ValueError, KeyError,
+                requests.RequestException) as e:
+            error_message = f"Error occurred while waiting for {component_type} " \
+                            f"{component_ids}: {str(e)}"
+            self.__obj_exception.raise_generic_exception(
+                message=error_message,
+                insert_report=True,
+                trim_log=True,
+                log_local=True,
+                fail_test=False,
+            )
+            return False
+
+    def wait_for_process_groups(
+            self,
+            pg_ids: list,
+            idle: bool = True,
+            drained: bool = False,
+            server_name: str = None,
+            parent_pg_id: str = "root",
+            timeout: float = 60,
+            initial_interval: float = 0.5,
+            max_interval: float = 5.0,
+    ) -> bool:
+        """
+        Waits until the given process groups are idle and, optionally, drained.
+
+        Args:
+            pg_ids (list): Process Group IDs.
+            idle (bool): Wait until no thread is active in the process groups.
+            drained (bool): Wait until no flow file is queued in the process groups.
+            server_name (str, optional): NiFi server URL.
+            parent_pg_id (str): Process Group ID containing the process groups.
+            timeout (float): Maximum time to wait in seconds.
+            initial_interval (float): First polling interval in seconds.
+            max_interval (float): Maximum polling interval in seconds.
+
+        Returns:
+            bool: True if every process group reached the state; otherwise, False.
+
+        Examples:
+            >> done = ApacheUtils.Nifi().wait_for_process_groups(["pg_id_1", "pg_id_2"],
+            drained=True, timeout=120)
+        """
+        return self.wait_for_components(
+            pg_ids,
+            lambda status: (not idle or int(status.get("activeThreadCount", 0)) == 0)
+            and (not drained or int(status.get("flowFilesQueued", 0)) == 0),
+            "process_groups", server_name, parent_pg_id, timeout, initial_interval, max_interval,
+        )
+
+    def wait_for_queue_drain(
+            self,
+            connection_ids: list,
+            server_name: str = None,
+            pg_id: str = "root",
+            timeout: float = 60,
+            initial_interval: float = 0.5,
+            max_interval: float = 5.0,
+    ) -> bool:
+        """
+        Waits until no flow file is queued in the given connections.
+
+        Unlike polling get_flow_file_count, no listing request is created; the
+        queued counts of all connections come from one status call per tick.
+
+        Args:
+            connection_ids (list): Connection IDs.
+            server_name (str, optional): NiFi server URL.
+            pg_id (str): Process Group ID containing the connections.
+            timeout (float): Maximum time to wait in seconds.
+            initial_interval (float): First polling interval in seconds.
+            max_interval (float): Maximum polling interval in seconds.
+
+        Returns:
+            bool: True if every connection was drained; otherwise, False.
+
+        Examples:
+            >> drained = ApacheUtils.Nifi().wait_for_queue_drain(["connection_id"])
+        """
+        return self.wait_for_components(
+            connection_ids,
+            lambda status: int(status.get("flowFilesQueued", 0)) == 0,
+            "connections", server_name, pg_id, timeout, initial_interval, max_interval,
+        )
+
     def get_key_path_value(self, **kwargs: Any) -> Any:
         """
         Extracts the value at the specified key path from the JSON data.
@@ -779,7 +1035,7 @@ class NifiProcessGroupUtils:
         method = method.upper()
         try:
             if method == "GET":
-                response = requests.get(
+                response = self.session.get(
                     url,
                     headers=headers,
                     verify=verify,
@@ -792,7 +1048,7 @@ class NifiProcessGroupUtils:
             elif method in ["POST", "PUT", "PATCH"]:
                 if payload is None:
                     raise ValueError("Payload is required for POST, PUT, and PATCH requests.")
-                response = requests.request(
+                response = self.session.request(
                     method,
                     url,
                     headers=headers,
@@ -807,7 +1063,7 @@ class NifiProcessGroupUtils:
                     proxies=proxies,
                 )
             elif method == "DELETE":
-                response = requests.delete(
+                response = self.session.delete(
                     url,
                     headers=headers,
                     verify=verify,
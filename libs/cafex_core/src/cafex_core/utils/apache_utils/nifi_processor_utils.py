@@ -11,6 +11,7 @@ from cafex_core.reporting_.reporting import Reporting
 from cafex_core.utils.apache_utils.nifi_process_group_utils import NifiProcessGroupUtils
 from cafex_core.utils.core_security import Security
 from cafex_core.utils.exceptions import CoreExceptions
+from cafex_core.utils.poller import Poller
 
 
 class NifiProcessorUtils:
@@ -181,13 +182,15 @@ class NifiProcessorUtils:
             )
             return False
 
-    def get_processor_id(self, processor_name: str, parent_pg_id: str = "root") -> bool:
+    def get_processor_id(self, processor_name: str, parent_pg_id: str = "root",
+                         use_snapshot: bool = False) -> bool:
         """
         Retrieves the processor ID.
 
         Args:
             processor_name (str): Processor name.
             parent_pg_id (str): Parent Process Group ID.
+            use_snapshot (bool): Resolve the name from the cached flow snapshot.
 
         Returns:
             bool: Indicates if the processor ID was retrieved successfully.
@@ -197,11 +200,15 @@ class NifiProcessorUtils:
         """
         component_id = None
         try:
-            processor_list = nipyapi.canvas.list_all_processors(pg_id=parent_pg_id)
-            for processor in processor_list:
-                if processor.to_dict()["component"]["name"] == processor_name:
-                    component_id = processor.to_dict()["component"]["id"]
-                    break
+            if use_snapshot:
+                component_id = self.nifi_process_group_utils.get_flow_snapshot().processor_id(
+                    processor_name, parent_pg_id)
+            else:
+                processor_list = nipyapi.canvas.list_all_processors(pg_id=parent_pg_id)
+                for processor in processor_list:
+                    if processor.to_dict()["component"]["name"] == processor_name:
+                        component_id = processor.to_dict()["component"]["id"]
+                        break
             if component_id is not None:
                 self.reporting.insert_step(
                     f"Successfully retrieved processor ID for: {processor_name}",
@@ -370,13 +377,71 @@ class NifiProcessorUtils:
             )
             return False, processor
 
-    def get_processors(self, pg_id: str = "root", key_path: str = None) -> list:
+    @staticmethod
+    def __poller(max_wait_time: float, wait_interval: float) -> Poller:
+        """Returns a poller backing off up to wait_interval until max_wait_time."""
+        return Poller(timeout=max_wait_time, initial_interval=min(0.5, wait_interval),
+                      max_interval=wait_interval)
+
+    def __get_processor_value(self, processor_id: str, key_path: str) -> Any:
+        """Returns the value at a key path of the current processor details."""
+        _, processor_data = self.__get_processor(processor_id)
+        return self.nifi_process_group_utils.get_key_path_value(
+            json=processor_data.to_dict(), keyPath=key_path, keyPathType="absolute"
+        )
+
+    def wait_for_processors(
+            self,
+            processor_ids: list,
+            run_status: str = None,
+            idle: bool = False,
+            server_name: str = None,
+            pg_id: str = "root",
+            timeout: float = 60,
+            initial_interval: float = 0.5,
+            max_interval: float = 5.0,
+    ) -> bool:
+        """
+        Waits until the given processors reach a run status and, optionally, are idle.
+
+        All processors are checked against one status call of the process group
+        per tick, instead of one request per processor.
+
+        Args:
+            processor_ids (list): NiFi processor IDs.
+            run_status (str, optional): The awaited run status, e.g. RUNNING, STOPPED
+                or DISABLED.
+            idle (bool): Wait until the processors have no active threads.
+            server_name (str, optional): NiFi server URL.
+            pg_id (str): Process Group ID containing the processors.
+            timeout (float): Maximum time to wait in seconds.
+            initial_interval (float): First polling interval in seconds.
+            max_interval (float): Maximum polling interval in seconds.
+
+        Returns:
+            bool: True if every processor reached the state; otherwise, False.
+
+        Examples:
+            >> done = ApacheUtils.Nifi().wait_for_processors(
+            ["processor_id_1", "processor_id_2"], run_status="STOPPED", idle=True)
+        """
+        return self.nifi_process_group_utils.wait_for_components(
+            processor_ids,
+            lambda status: (run_status is None
+                            or str(status.get("runStatus", "")).lower() == run_status.lower())
+            and (not idle or int(status.get("activeThreadCount", 0)) == 0),
+            "processors", server_name, pg_id, timeout, initial_interval, max_interval,
+        )
+
+    def get_processors(self, pg_id: str = "root", key_path: str = None,
+                       use_snapshot: bool = False) -> list:
         """
         Retrieves details of processors under the mentioned process group recursively.
 
         Args:
             pg_id (str): Process Group ID.
             key_path (str): Path of the field to be retrieved.
+            use_snapshot (bool): Read the processors from the cached flow snapshot.
 
         Returns:
             list: Processors list or specified key path values.
@@ -386,7 +451,9 @@ class NifiProcessorUtils:
         """
         try:
             processors_list = []
-            processor_list = nipyapi.canvas.list_all_processors(pg_id=pg_id)
+            processor_list = \
+                self.nifi_process_group_utils.get_flow_snapshot().processors(pg_id) \
+                if use_snapshot else nipyapi.canvas.list_all_processors(pg_id=pg_id)
             for processor in processor_list:
                 if key_path:
                     field_values = self.nifi_process_group_utils.get_key_path_value(
@@ -462,7 +529,8 @@ class NifiProcessorUtils:
             server_name (str): NiFi server URL.
             processor_id (str): NiFi processor ID.
             max_wait_time (int): Max wait time to wait for processor to enable.
-            wait_interval (int): Interval time to check the status.
+            wait_interval (int): Maximum interval time to check the status; polling
+                starts faster and backs off up to it.
             end_point (str): Service endpoint to invoke API call.
 
         Returns:
@@ -493,21 +561,12 @@ class NifiProcessorUtils:
                 dict_api_header,
                 pstr_payload=json.dumps(dict_payload),
             )
-            count = 0
-            max_count = max_wait_time // wait_interval
-
-            while count < max_count:
-                time.sleep(wait_interval)
-                str_path = "status/aggregate_snapshot/run_status"
-                _, processor_data = self.__get_processor(processor_id)
-                value = self.nifi_process_group_utils.get_key_path_value(
-                    json=processor_data.to_dict(), keyPath=str_path, keyPathType="absolute"
-                )
-
-                count += 1
-                if value.strip().lower() != "validating":
-                    break
-            else:
+            enabled, _, _ = self.__poller(max_wait_time, wait_interval).wait(
+                lambda: self.__get_processor_value(
+                    processor_id, "status/aggregate_snapshot/run_status"),
+                lambda value: value.strip().lower() not in ("validating", "disabled"),
+            )
+            if not enabled:
                 self.reporting.insert_step(
                     f"Processor ID {processor_id} should get enabled.",
                     f"Processor is not getting enabled after: {max_wait_time} seconds.",
@@ -549,7 +608,8 @@ class NifiProcessorUtils:
             server_name (str): NiFi server URL.
             processor_id (str): NiFi processor ID.
             max_wait_time (int): Max wait time to wait for processor to disable.
-            wait_interval (int): Interval time to check the status.
+            wait_interval (int): Maximum interval time to check the status; polling
+                starts faster and backs off up to it.
             end_point (str): Service endpoint to invoke API call.
 
         Returns:
@@ -580,22 +640,12 @@ class NifiProcessorUtils:
                 dict_api_header,
                 pstr_payload=json.dumps(dict_payload),
             )
-            count = 0
-            max_count = max_wait_time // wait_interval
-
-            while count < max_count:
-                time.sleep(wait_interval)
-                str_path = "status/aggregate_snapshot/active_thread_count"
-                _, str_processor_data = self.__get_processor(processor_id)
-                value = self.nifi_process_group_utils.get_key_path_value(
-                    json=str_processor_data.to_dict(), keyPath=str_path, keyPathType="absolute"
-                )
-
-                if int(value) == 0:
-                    break
-
-                count += 1
-            else:
+            disabled, _, _ = self.__poller(max_wait_time, wait_interval).wait(
+                lambda: self.__get_processor_value(
+                    processor_id, "status/aggregate_snapshot/active_thread_count"),
+                lambda value: int(value) == 0,
+            )
+            if not disabled:
                 self.reporting.insert_step(
                     f"Processor {processor_id} should be disabled.",
                     f"Processor is not getting disabled after {max_wait_time} seconds.",
@@ -705,7 +755,8 @@ class NifiProcessorUtils:
             processor_id (str): NiFi processor ID.
             min_wait_time (int): Minimum wait time in seconds.
             max_wait_time (int): Maximum wait time in seconds.
-            wait_interval (int): Polling time to check each time in seconds.
+            wait_interval (int): Maximum polling time to check each time in seconds;
+                polling starts faster and backs off up to it.
 
         Returns:
             bool: True if successful; otherwise, False.
@@ -724,21 +775,12 @@ class NifiProcessorUtils:
                     "Fail",
                 )
                 return False
-            limit = max_wait_time // wait_interval
-            count = 0
-            while count < limit:
-                time.sleep(wait_interval)
-                path = "status/aggregate_snapshot/active_thread_count"
-                _, processor_data = self.__get_processor(processor_id)
-                json_counter = self.nifi_process_group_utils.get_key_path_value(
-                    json=processor_data.to_dict(), keyPath=path, keyPathType="absolute"
-                )
-
-                if int(json_counter) == 0:
-                    break
-
-                count += 1
-            else:
+            idle, _, _ = self.__poller(max_wait_time, wait_interval).wait(
+                lambda: self.__get_processor_value(
+                    processor_id, "status/aggregate_snapshot/active_thread_count"),
+                lambda value: int(value) == 0,
+            )
+            if not idle:
                 self.reporting.insert_step(
                     f"Processor {processor_id} should not have active threads.",
                     f"Processor is taking more than {max_wait_time} seconds to stop.",
@@ -807,14 +849,15 @@ class NifiProcessorUtils:
             )
             return False
 
-    def get_component_connections(self, processor_id: str,
-                                  return_list: bool = False) -> tuple[bool, dict]:
+    def get_component_connections(self, processor_id: str, return_list: bool = False,
+                                  use_snapshot: bool = False) -> tuple[bool, dict]:
         """
         Retrieves the connections of a component/processor.
 
         Args:
             processor_id (str): Processor ID.
             return_list (bool): Return type identifier.
+            use_snapshot (bool): Read the connections from the cached flow snapshot.
 
         Returns:
             bool, dict: Tuple indicating 'execution_result' and connections
@@ -827,10 +870,16 @@ class NifiProcessorUtils:
         connections_dict = {"source": {}, "destination": {}}
 
         try:
-            execution, processor = self.__get_processor(processor_id)
+            if use_snapshot:
+                snapshot = self.nifi_process_group_utils.get_flow_snapshot()
+                execution = snapshot.get(processor_id) is not None
+                connections = snapshot.component_connections(processor_id)
+            else:
+                execution, processor = self.__get_processor(processor_id)
+                connections = nipyapi.canvas.get_component_connections(processor) \
+                    if execution else []
 
             if execution:
-                connections = nipyapi.canvas.get_component_connections(processor)
                 for connection in connections:
                     connection_status = connection.to_dict()["status"]
                     connection_name = connection_status["name"]
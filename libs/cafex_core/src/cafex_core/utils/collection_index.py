@@ -0,0 +1,200 @@
+"""This module contains the CollectionIndex class which builds a per-node-id
+index of test metadata once at collection time.
+
+The index is kept in the session store and persisted to the temporary
+execution directory so that xdist workers can look up tags, test type
+and data-driven flags by node id instead of re-inspecting every item
+during setup.
+"""
+
+import os
+
+from cafex_core.handlers.file_handler import FileHandler
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.item_attribute_accessor import ItemAttributeAccessor
+
+
+class CollectionIndex:
+    """A class that builds, persists and queries the collection index.
+
+    Attributes:
+        session_store (SessionStore): The session store object.
+        file_handler (FileHandler): The file handler object.
+        logger (Logger): The logger object.
+
+    Methods:
+        build: Builds the index for the collected items.
+        build_entry: Builds the index entry of a single item.
+        save: Persists the index to the temporary execution directory.
+        load: Loads a persisted index.
+        get: Returns the index entry of an item.
+    """
+
+    FILE_NAME = "collection_index.json"
+
+    def __init__(self):
+        """Initialize the CollectionIndex class."""
+        self.session_store = SessionStore()
+        self.file_handler = FileHandler()
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    @property
+    def entries(self):
+        """Returns the in-memory index, keyed by node id.
+
+        Returns:
+            dict: The index entries.
+        """
+        entries = self.session_store.storage.get("collection_index")
+        if entries is None:
+            entries = {}
+            self.session_store.collection_index = entries
+        return entries
+
+    def build(self, items):
+        """Builds the index for the collected items.
+
+        Entries already present in a persisted index (e.g. written by
+        another worker) are reused, so each item is inspected at most
+        once per execution.
+
+        Args:
+            items (list): The collected pytest items.
+
+        Returns:
+            dict: The index entries, keyed by node id.
+        """
+        entries = self.entries
+        if not entries:
+            entries.update(self.load())
+        for item in items:
+            if item.nodeid not in entries:
+                entries[item.nodeid] = self.build_entry(item)
+        return entries
+
+    @staticmethod
+    def build_entry(item):
+        """Builds the index entry of a single item.
+
+        Args:
+            item: The pytest item object.
+
+        Returns:
+            dict: The test metadata of the item.
+        """
+        accessor = ItemAttributeAccessor(item)
+        entry = accessor.get_properties()
+        is_scenario = accessor.is_scenario
+        is_data_driven = is_outline = False
+        example = None
+        feature_name = scenario_name = None
+
+        params = getattr(getattr(item, "callspec", None), "params", None)
+        if is_scenario:
+            scenario = accessor.scenario
+            scenario_name = getattr(scenario, "name", None)
+            feature_name = getattr(getattr(scenario, "feature", None), "name", None)
+            if params:
+                is_data_driven = True
+                is_outline = "_pytest_bdd_example" in params
+                example_data = params.get("_pytest_bdd_example") or params
+                example = str(dict(sorted(example_data.items()))).replace("'", "")
+        elif entry["testType"] == "pytest":
+            if params:
+                is_data_driven = True
+                example = str(params)
+        elif entry["testType"] == "unittest":
+            if CollectionIndex.uses_sub_test(getattr(item.cls, item.name, None)):
+                is_data_driven = True
+                example = "unittest with subTest"
+
+        entry.update(
+            {
+                "isScenario": is_scenario,
+                "isDataDriven": is_data_driven,
+                "isOutline": is_outline,
+                "example": example,
+                "featureName": feature_name,
+                "scenarioName": scenario_name,
+            }
+        )
+        return entry
+
+    @staticmethod
+    def uses_sub_test(test_method):
+        """Checks whether a unittest method calls self.subTest.
+
+        The attribute names referenced by the compiled code object are
+        inspected instead of the source, which avoids reading files.
+
+        Args:
+            test_method: The unittest test method.
+
+        Returns:
+            bool: True if the method references subTest, False otherwise.
+        """
+        code = getattr(getattr(test_method, "__func__", test_method), "__code__", None)
+        if code is None:
+            return False
+        return "subTest" in code.co_names
+
+    def save(self, directory=None):
+        """Persists the index to the temporary execution directory.
+
+        The file is written under a temporary name and then atomically
+        replaced, so workers never read a partially written index.
+
+        Args:
+            directory (str, optional): The target directory. Defaults to the
+                temporary execution directory.
+        """
+        directory = directory or self.session_store.temp_execution_dir
+        temp_name = f"{self.FILE_NAME}.{os.getpid()}.tmp"
+        self.file_handler.create_json_file(directory, temp_name, self.entries, indent=None)
+        os.replace(os.path.join(directory, temp_name), os.path.join(directory, self.FILE_NAME))
+
+    def load(self, directory=None):
+        """Loads a persisted index.
+
+        Args:
+            directory (str, optional): The source directory. Defaults to the
+                temporary execution directory.
+
+        Returns:
+            dict: The persisted entries, or an empty dict if none exist.
+        """
+        directory = directory or self.session_store.storage.get("temp_execution_dir")
+        if directory is None:
+            return {}
+        filepath = os.path.join(directory, self.FILE_NAME)
+        if not os.path.exists(filepath):
+            return {}
+        try:
+            return self.file_handler.read_data_from_json_file(filepath)
+        except ValueError as e:
+            self.logger.warning(f"Ignoring unreadable collection index: {e}")
+            return {}
+
+    def get(self, item):
+        """Returns the index entry of an item.
+
+        Falls back to the persisted index and finally to inspecting the
+        item, caching the result for subsequent lookups.
+
+        Args:
+            item: The pytest item object.
+
+        Returns:
+            dict: The test metadata of the item.
+        """
+        entries = self.entries
+        entry = entries.get(item.nodeid)
+        if entry is None:
+            if not entries:
+                entries.update(self.load())
+            entry = entries.get(item.nodeid)
+            if entry is None:
+                entry = self.build_entry(item)
+                entries[item.nodeid] = entry
+        return entry
@@ -0,0 +1,131 @@
+"""This module contains the ConnectionPool class which shares a small number of
+authenticated connections between concurrent file transfers."""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from cafex_core.logging.logger_ import CoreLogger
+
+
+class ConnectionPool:
+    """A fixed-size pool of authenticated connections.
+
+    Connections are opened lazily, up to ``size``, and handed to one
+    thread at a time. A connection whose transfer raised is closed and
+    replaced on the next checkout, so a broken control channel does not
+    poison the rest of the batch.
+
+    Attributes:
+        size (int): The maximum number of open connections.
+        logger (Logger): The logger object.
+
+    Methods:
+        connection: Context manager that checks out a connection.
+        run: Runs a transfer for each item on the pooled connections.
+        close: Closes all idle connections.
+    """
+
+    def __init__(self, open_connection, close_connection, size=4):
+        """Initialize the ConnectionPool class.
+
+        Args:
+            open_connection (function): Returns a new authenticated connection.
+            close_connection (function): Closes a connection.
+            size (int): The maximum number of open connections.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.__open_connection = open_connection
+        self.__close_connection = close_connection
+        self.__idle = queue.LifoQueue()
+        self.__opened = 0
+        self.__lock = threading.Lock()
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __discard(self, conn):
+        """Closes a connection and frees its slot."""
+        with self.__lock:
+            self.__opened -= 1
+        try:
+            self.__close_connection(conn)
+        except Exception as e:
+            self.logger.warning("Error closing pooled connection: %s", e)
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks out a connection.
+
+        Yields:
+            The connection, returned to the pool when the block succeeds and
+            discarded when it raises.
+        """
+        try:
+            conn = self.__idle.get_nowait()
+        except queue.Empty:
+            with self.__lock:
+                can_open = self.__opened < self.size
+                if can_open:
+                    self.__opened += 1
+            if can_open:
+                try:
+                    conn = self.__open_connection()
+                except Exception:
+                    with self.__lock:
+                        self.__opened -= 1
+                    raise
+            else:
+                conn = self.__idle.get()
+        try:
+            yield conn
+        except Exception:
+            self.__discard(conn)
+            raise
+        self.__idle.put(conn)
+
+    def run(self, transfer, items):
+        """Runs a transfer for each item on the pooled connections.
+
+        All items are attempted; the first error is raised once the batch
+        finishes.
+
+        Args:
+            transfer (function): Called as ``transfer(connection, item)``; returns
+                a dictionary describing the transferred file.
+            items (list): The items to transfer.
+
+        Returns:
+            list: The dictionary of each item, in order, with its seconds added.
+        """
+
+        def timed_transfer(item):
+            with self.connection() as conn:
+                start = time.perf_counter()
+                result = transfer(conn, item)
+            result["seconds"] = round(time.perf_counter() - start, 3)
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(timed_transfer, item) for item in items]
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            raise errors[0]
+        return [future.result() for future in futures]
+
+    def close(self):
+        """Closes all idle connections."""
+        while True:
+            try:
+                conn = self.__idle.get_nowait()
+            except queue.Empty:
+                return
+            self.__discard(conn)
@@ -0,0 +1,147 @@
+"""This module contains the DurationScheduler class which orders and
+distributes tests across xdist workers using durations from past runs."""
+
+from statistics import median
+
+import pytest
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.utils.item_attribute_accessor import ItemAttributeAccessor
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.run_history import RunHistory
+from cafex_core.utils.run_index import RunIndex
+
+
+class DurationScheduler:
+    """A class that schedules tests longest-processing-time-first.
+
+    With ``--dist load`` the items are ordered longest first, so the
+    xdist scheduler hands the slow tests out early and fills the gaps
+    with short ones. With ``--dist loadgroup`` the items are bin-packed
+    into one ``xdist_group`` per worker, and browser-heavy tests of the
+    same kind are kept on the same worker when that costs little
+    balance, so the worker can reuse its driver.
+
+    Attributes:
+        estimates (dict): The estimated duration in seconds, keyed by node id.
+        default_duration (float): The duration assumed for tests without history.
+        logger (Logger): The logger object.
+
+    Methods:
+        from_history: Creates a scheduler from the archived runs.
+        estimate: Returns the estimated duration of an item.
+        order_items: Orders the items longest first.
+        assign_groups: Bin-packs the items into one xdist group per worker.
+    """
+
+    BROWSER_TAGS = ("ui_web", "mobile_web", "playwright_web", "mobile_app", "ui_desktop_client")
+    GROUP_PREFIX = "cafex_lpt_"
+
+    def __init__(self, estimates, default_duration=None):
+        """Initialize the DurationScheduler class.
+
+        Args:
+            estimates (dict): The estimated duration in seconds, keyed by node id.
+            default_duration (float, optional): The duration assumed for tests
+                without history. Defaults to the median of the known estimates.
+        """
+        self.estimates = estimates
+        if default_duration is None:
+            default_duration = median(estimates.values()) if estimates else 1.0
+        self.default_duration = float(default_duration)
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    @classmethod
+    def from_history(cls, result_dir=None, history_runs=5, default_duration=None):
+        """Creates a scheduler from the archived runs.
+
+        The run index is used when it exists; otherwise the archived
+        result.json files are read.
+
+        Args:
+            result_dir (str, optional): The result directory.
+            history_runs (int): The number of recent runs to consider.
+            default_duration (float, optional): The duration assumed for tests
+                without history.
+
+        Returns:
+            DurationScheduler: The scheduler.
+        """
+        result_dir = result_dir or SessionStore().storage.get("result_dir")
+        run_index = RunIndex(result_dir)
+        estimates = run_index.get_duration_estimates(history_runs) if run_index.exists() else {}
+        if not estimates:
+            estimates = RunHistory(result_dir).get_duration_estimates(history_runs)
+        return cls(estimates, default_duration)
+
+    def estimate(self, item):
+        """Returns the estimated duration of an item.
+
+        Args:
+            item: The pytest item object.
+
+        Returns:
+            float: The estimated duration in seconds.
+        """
+        node_id = RunHistory.normalize_node_id(item.nodeid)
+        return self.estimates.get(node_id, self.default_duration)
+
+    def order_items(self, items):
+        """Orders the items longest first, in place.
+
+        The sort is stable, so tests with equal estimates keep their
+        collection order and every xdist worker computes the same order.
+
+        Args:
+            items (list): The collected pytest items.
+        """
+        items.sort(key=lambda item: -self.estimate(item))
+
+    @classmethod
+    def browser_kind(cls, item):
+        """Returns the browser tag of an item, if any.
+
+        Args:
+            item: The pytest item object.
+
+        Returns:
+            str: The first browser tag of the item, or None.
+        """
+        tags = ItemAttributeAccessor(item).tags
+        return next((tag for tag in cls.BROWSER_TAGS if tag in tags), None)
+
+    def assign_groups(self, items, worker_count, group_browser_tests=True):
+        """Bin-packs the items into one xdist group per worker.
+
+        Items are placed longest first on the least loaded group. Items
+        that already carry an ``xdist_group`` mark are left alone.
+
+        Args:
+            items (list): The collected pytest items.
+            worker_count (int): The number of xdist workers.
+            group_browser_tests (bool): Whether to keep browser tests of the
+                same kind together when that costs little balance.
+
+        Returns:
+            list: The estimated load in seconds of each group.
+        """
+        self.order_items(items)
+        loads = [0.0] * worker_count
+        kind_bins = {}
+        for item in items:
+            if item.get_closest_marker("xdist_group") is not None:
+                continue
+            duration = self.estimate(item)
+            kind = self.browser_kind(item) if group_browser_tests else None
+            target = min(range(worker_count), key=loads.__getitem__)
+            if kind is not None:
+                preferred = min(kind_bins.get(kind, ()), key=loads.__getitem__, default=None)
+                if preferred is not None and loads[preferred] <= loads[target] + duration:
+                    target = preferred
+                kind_bins.setdefault(kind, set()).add(target)
+            loads[target] += duration
+            item.add_marker(pytest.mark.xdist_group(name=f"{self.GROUP_PREFIX}{target}"))
+        self.logger.info(
+            "Estimated load per xdist group (s): "
+            + ", ".join(f"{self.GROUP_PREFIX}{index}={load:.1f}" for index, load in enumerate(loads))
+        )
+        return loads
@@ -3,13 +3,21 @@ This module contains utility methods to query Kibana or Elasticsearch through it
 """
 import itertools
 import json
+import random
 import re
 import time
 import types
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
+from requests.adapters import HTTPAdapter
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.parsers.json_parser import ParseJsonData
+from cafex_core.reporting_.reporting import Reporting
+from cafex_core.singletons_.session_ import SessionStore
 from cafex_core.utils.exceptions import CoreExceptions
+from cafex_core.utils.poller import Poller
+from cafex_core.utils.retry_policy import RetryPolicy
 
 
 class ElasticSearchUtils:
@@ -18,11 +26,27 @@ class ElasticSearchUtils:
         This class contains methods to query Kibana or Elasticsearch through its API.
     """
 
-    def __init__(self):
+    def __init__(self, retry_policy: RetryPolicy = None, pool_maxsize: int = 10):
+        """
+        Args:
+            retry_policy (RetryPolicy): Retry policy of call_request; by default
+                GET, HEAD, OPTIONS, PUT and DELETE requests are retried on connection
+                errors, timeouts and 429/502/503/504 responses, up to 3 attempts with
+                jittered exponential backoff or the capped Retry-After wait. Other
+                methods are only retried when the connection failed before the
+                request was sent.
+            pool_maxsize (int): Maximum number of pooled connections per host.
+        """
         self.logger_class = CoreLogger(name=__name__)
         self.logger = self.logger_class.get_logger()
         self.response = None
         self.__exceptions = CoreExceptions()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = {"requests": 0, "retries": 0, "waitSeconds": 0.0}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def generate_payload(self,
                          must_parameters: dict = None,
@@ -224,6 +248,11 @@ class ElasticSearchUtils:
         """
         Internal method to retry a request until a specified condition is met.
 
+        The request is sent again after a wait that starts at the polling
+        interval and grows by half after each attempt, with jitter, until the
+        maximum wait period has passed on the clock. The attempts and waits are
+        added to retry_stats and to the step report.
+
         Args:
             condition (function): A function that returns a boolean indicating if
             the condition is met.
@@ -254,17 +283,33 @@ class ElasticSearchUtils:
             )
 
         try:
-            start_time: int = 0
-            while start_time < max_wait_period:
-                if condition(response, **kwargs):
-                    return True
-
-                time.sleep(polling_interval)
+            request = response.request
+            stats = {"attempts": 0, "retries": 0, "waitSeconds": 0.0}
+
+            def jittered_sleep(seconds):
+                wait = random.uniform(0.8, 1.0) * seconds
+                stats["waitSeconds"] += wait
+                time.sleep(wait)
+
+            def send():
+                stats["attempts"] += 1
+                if stats["attempts"] == 1:
+                    return response
                 self.logger.info("Retrying request...")
-                response = requests.Session().send(response.request)
-                start_time += polling_interval
-
-            return False
+                stats["retries"] += 1
+                return self.session.send(request)
+
+            poller = Poller(
+                timeout=max_wait_period,
+                initial_interval=polling_interval,
+                max_interval=max_wait_period,
+                sleep=jittered_sleep,
+            )
+            params = {key: value for key, value in kwargs.items() if key != "response"}
+            met, response, _ = poller.wait(send, lambda current: condition(current, **params))
+            if stats["retries"]:
+                self.__record_retries(request.method, request.url, response, stats)
+            return met
         except Exception as e:
             self.logger.error("Error during retry: %s", str(e))
             self.__exceptions.raise_generic_exception(
@@ -871,6 +916,11 @@ class ElasticSearchUtils:
         """
         Performs various HTTP requests (GET, POST, PUT, PATCH, DELETE).
 
+        Requests share one pooled session, so connections are reused across calls,
+        and are retried according to the retry policy. POST and PATCH requests are
+        only retried in full when the policy lists them in retry_methods. When a call needed retries,
+        the retry count and total wait are added to the step report.
+
         Args:
             method (str): The HTTP method (e.g., 'GET', 'POST').
             url (str): The request URL.
@@ -886,13 +936,18 @@ class ElasticSearchUtils:
             auth_username (str): Username for authentication.
             auth_password (str): Password for authentication.
             timeout (float or tuple): Timeout in seconds for the request.
+            retry_policy (RetryPolicy): Retry policy overriding the one of the instance.
 
         Returns:
             requests.Response: The response object from the request.
 
         Examples:
-            >> response = ApacheUtils.Nifi().call_request("GET", "https://www.samplesite.com/api",
+            >> response = ElasticSearchUtils().call_request("GET", "https://www.samplesite.com/api",
              headers={"Accept": "application/json"})
+            >> response = ElasticSearchUtils().call_request("GET", url, headers,
+             retry_policy=RetryPolicy(max_attempts=10, deadline=120))
+            >> response = ElasticSearchUtils().call_request("POST", url, headers, json=query,
+             retry_policy=RetryPolicy(retry_methods=("GET", "POST")))
         """
         if not url:
             raise ValueError("URL cannot be null")
@@ -901,76 +956,59 @@ class ElasticSearchUtils:
         auth_password = kwargs.get("auth_password")
         auth = (auth_username, auth_password) if auth_username and auth_password else None
         method = method.upper()
+        retry_policy = (kwargs.get("retry_policy") or self.retry_policy).for_method(method)
         try:
-            if method == "GET":
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    verify=kwargs.get("verify", False),
-                    allow_redirects=kwargs.get("allow_redirects", False),
-                    cookies=kwargs.get("cookies", {}),
-                    auth=auth,
-                    timeout=kwargs.get("timeout", None),
-                    proxies=kwargs.get("proxies", None),
-                )
-            elif method == "POST":
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    data=kwargs.get("payload", None),
-                    json=kwargs.get("json", None),
-                    verify=kwargs.get("verify", False),
-                    allow_redirects=kwargs.get("allow_redirects", False),
-                    cookies=kwargs.get("cookies", {}),
-                    auth=auth,
-                    timeout=kwargs.get("timeout", None),
-                    proxies=kwargs.get("proxies", None),
-                )
-            elif method == "PUT":
-                response = requests.put(
-                    url,
-                    headers=headers,
-                    data=kwargs.get("payload", None),
-                    verify=kwargs.get("verify", False),
-                    allow_redirects=kwargs.get("allow_redirects", False),
-                    cookies=kwargs.get("cookies", {}),
-                    auth=auth,
-                    timeout=kwargs.get("timeout", None),
-                    proxies=kwargs.get("proxies", None),
-                )
-            elif method == "PATCH":
-                response = requests.patch(
-                    url,
-                    headers=headers,
-                    data=kwargs.get("payload", None),
-                    verify=kwargs.get("verify", False),
-                    allow_redirects=kwargs.get("allow_redirects", False),
-                    cookies=kwargs.get("cookies", {}),
-                    auth=auth,
-                    timeout=kwargs.get("timeout", None),
-                    proxies=kwargs.get("proxies", None),
-                )
-            elif method == "DELETE":
-                response = requests.delete(
-                    url,
-                    headers=headers,
-                    verify=kwargs.get("verify", False),
-                    allow_redirects=kwargs.get("allow_redirects", False),
-                    cookies=kwargs.get("cookies", {}),
-                    auth=auth,
-                    timeout=kwargs.get("timeout", None),
-                    proxies=kwargs.get("proxies", None),
-                )
-            else:
+            if method not in ("GET", "POST", "PUT", "PATCH", "DELETE"):
                 raise ValueError(f"Invalid HTTP method: {method}. Valid options are: "
                                  f"GET, POST, PUT, PATCH, DELETE")
 
+            response, stats = retry_policy.execute(
+                self.session.request,
+                method,
+                url,
+                headers=headers,
+                data=kwargs.get("payload", None),
+                json=kwargs.get("json", None),
+                verify=kwargs.get("verify", False),
+                allow_redirects=kwargs.get("allow_redirects", False),
+                cookies=kwargs.get("cookies", {}),
+                auth=auth,
+                timeout=kwargs.get("timeout", None),
+                proxies=kwargs.get("proxies", None),
+            )
+            self.__record_retries(method, url, response, stats)
             return response
 
         except Exception as e:
             self.logger.exception("Error in API Request: %s", e)
             raise e
 
+    def __record_retries(self, method: str, url: str, response: requests.Response,
+                         stats: dict) -> None:
+        """
+        Adds the retry statistics of a call to the totals and to the step report.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            response (requests.Response): The final response.
+            stats (dict): The attempts, retries and waitSeconds of the call.
+        """
+        self.retry_stats["requests"] += 1
+        self.retry_stats["retries"] += stats["retries"]
+        self.retry_stats["waitSeconds"] += stats["waitSeconds"]
+        if stats["retries"] and SessionStore().current_test:
+            Reporting().insert_step(
+                expected_message=f"{method} {url} succeeds",
+                actual_message=f"Status {response.status_code} after {stats['retries']} "
+                               f"retries, waited {stats['waitSeconds']:.2f}s",
+                status="Pass" if response.ok else "IC",
+                step_type="retry",
+                take_screenshot=False,
+                api_response={"retries": stats["retries"],
+                              "retryWaitSeconds": round(stats["waitSeconds"], 3)},
+            )
+
     def count_documents(self, host_name: str, index: str, query: dict = None,
                         headers: dict = None) -> requests.Response:
         """
@@ -1012,6 +1050,9 @@ class ElasticSearchUtils:
         """
         Retrieves all documents from a specified index.
 
+        Only the first page of ``size`` documents is returned; use iter_documents
+        to stream indices of any size.
+
         Args:
             host_name (str): Kibana/Elastic server hostname.
             index (str): Index name.
@@ -1041,6 +1082,187 @@ class ElasticSearchUtils:
             self.logger.error("Error getting all documents: %s", str(e))
             raise e
 
+    def iter_documents(self, host_name: str, index: str, query: dict = None,
+                       page_size: int = 1000, source_fields: list = None,
+                       headers: dict = None, keep_alive: str = "1m",
+                       use_scroll: bool = False, **kwargs):
+        """
+        Yields every document (hit) of an index, one page at a time.
+
+        Unlike get_all_documents, the result is not truncated at one page and only
+        one page is held in memory. A point in time with search_after pagination,
+        sorted on _shard_doc, is used from Elasticsearch 7.12. The scroll API is used
+        instead when use_scroll is True or the cluster cannot open a point in time
+        (before 7.10). It is also used when the first point in time page fails, as
+        sorting on _shard_doc needs 7.12; the point in time is then closed first.
+        The point in time or scroll context is released when the generator is
+        exhausted or closed.
+
+        Args:
+            host_name (str): Kibana/Elastic server hostname.
+            index (str): Index name or pattern.
+            query (dict): Query to filter documents (default is match_all).
+            page_size (int): Number of documents fetched per request (default is 1000).
+            source_fields (list): Source fields to return; all fields when None.
+            headers (dict): Headers for the requests.
+            keep_alive (str): How long the search context is kept between pages.
+            use_scroll (bool): Whether to use the scroll API instead of a point in time.
+
+        Kwargs:
+            Passed to call_request (e.g. auth_username, auth_password, verify, timeout).
+
+        Yields:
+            dict: One hit, with _index, _id and _source.
+
+        Examples:
+            >> for hit in ElasticSearchUtils().iter_documents("http://localhost:9200",
+             "my_index", source_fields=["id"]):
+            >>     ids.add(hit["_source"]["id"])
+        """
+        if not host_name or not index:
+            raise ValueError("Host name and index are mandatory")
+
+        headers = {"Content-Type": "application/json", **(headers or {})}
+        body = {"size": page_size, "query": query or {"match_all": {}}}
+        if source_fields is not None:
+            body["_source"] = source_fields
+
+        pit_id = None
+        if not use_scroll:
+            response = self.call_request(
+                method="POST",
+                url=f"{host_name}/{index}/_pit?keep_alive={keep_alive}",
+                headers=headers,
+                **kwargs,
+            )
+            if response.status_code == 200:
+                pit_id = response.json()["id"]
+            else:
+                self.logger.info("Point in time is not available (status %s), using scroll",
+                                 response.status_code)
+        first_page = None
+        if pit_id is not None:
+            try:
+                first_page = self.__search_page(
+                    f"{host_name}/_search",
+                    {**body, "sort": [{"_shard_doc": "asc"}],
+                     "pit": {"id": pit_id, "keep_alive": keep_alive}},
+                    headers,
+                    **kwargs,
+                )
+            except ConnectionError as e:
+                self.logger.info("Point in time search failed, using scroll: %s", str(e))
+                self.__close_pit(host_name, pit_id, headers, **kwargs)
+        if first_page is not None:
+            yield from self.__iter_with_pit(host_name, first_page, pit_id, body, headers,
+                                            keep_alive, **kwargs)
+        else:
+            yield from self.__iter_with_scroll(host_name, index, body, headers, keep_alive,
+                                               **kwargs)
+
+    def __search_page(self, url: str, body: dict, headers: dict, **kwargs) -> dict:
+        """
+        Posts one paginated search request and returns its JSON body.
+
+        Args:
+            url (str): The search URL.
+            body (dict): The search body.
+            headers (dict): Request headers.
+
+        Returns:
+            dict: The JSON body of the response.
+
+        Raises:
+            ConnectionError: If the search does not return status 200.
+        """
+        response = self.call_request(
+            method="POST", url=url, headers=headers, payload=json.dumps(body), **kwargs
+        )
+        if response.status_code != 200:
+            raise ConnectionError(
+                f"Search request failed with status {response.status_code}: {response.text}"
+            )
+        return response.json()
+
+    def __close_pit(self, host_name: str, pit_id: str, headers: dict, **kwargs) -> None:
+        """
+        Closes a point in time, logging instead of raising on failure.
+
+        Args:
+            host_name (str): Kibana/Elastic server hostname.
+            pit_id (str): The point in time id.
+            headers (dict): Request headers.
+        """
+        try:
+            self.call_request(method="DELETE", url=f"{host_name}/_pit", headers=headers,
+                              payload=json.dumps({"id": pit_id}), **kwargs)
+        except Exception as e:
+            self.logger.warning("Error closing point in time: %s", str(e))
+
+    def __iter_with_pit(self, host_name: str, page: dict, pit_id: str, body: dict,
+                        headers: dict, keep_alive: str, **kwargs):
+        """
+        Yields the hits of a point in time using search_after pagination.
+
+        Args:
+            host_name (str): Kibana/Elastic server hostname.
+            page (dict): The first page of the point in time search.
+            pit_id (str): The point in time id.
+            body (dict): The search body with size, query and _source.
+            headers (dict): Request headers.
+            keep_alive (str): How long the point in time is kept between pages.
+
+        Yields:
+            dict: One hit.
+        """
+        body = {**body, "sort": [{"_shard_doc": "asc"}]}
+        try:
+            while True:
+                pit_id = page.get("pit_id", pit_id)
+                hits = page["hits"]["hits"]
+                yield from hits
+                if len(hits) < body["size"]:
+                    return
+                body["search_after"] = hits[-1]["sort"]
+                body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+                page = self.__search_page(f"{host_name}/_search", body, headers, **kwargs)
+        finally:
+            self.__close_pit(host_name, pit_id, headers, **kwargs)
+
+    def __iter_with_scroll(self, host_name: str, index: str, body: dict, headers: dict,
+                           keep_alive: str, **kwargs):
+        """
+        Yields the hits of a search using the scroll API.
+
+        Args:
+            host_name (str): Kibana/Elastic server hostname.
+            index (str): Index name or pattern.
+            body (dict): The search body with size, query and _source.
+            headers (dict): Request headers.
+            keep_alive (str): How long the scroll context is kept between pages.
+
+        Yields:
+            dict: One hit.
+        """
+        page = self.__search_page(f"{host_name}/{index}/_search?scroll={keep_alive}", body,
+                                  headers, **kwargs)
+        scroll_id = page.get("_scroll_id")
+        try:
+            while page["hits"]["hits"]:
+                yield from page["hits"]["hits"]
+                page = self.__search_page(f"{host_name}/_search/scroll",
+                                          {"scroll": keep_alive, "scroll_id": scroll_id},
+                                          headers, **kwargs)
+                scroll_id = page.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id:
+                try:
+                    self.call_request(method="DELETE", url=f"{host_name}/_search/scroll",
+                                      headers=headers,
+                                      payload=json.dumps({"scroll_id": [scroll_id]}), **kwargs)
+                except Exception as e:
+                    self.logger.warning("Error clearing scroll context: %s", str(e))
+
     def update_document(self, host_name: str, index: str, document_id: str,
                         payload: dict, headers: dict = None) -> requests.Response:
         """
@@ -1117,6 +1339,9 @@ class ElasticSearchUtils:
         """
         Inserts multiple documents into Elasticsearch in a single request.
 
+        The whole body is built in memory; use stream_bulk_insert for large or
+        generated datasets.
+
         Args:
             host_name (str): Kibana/Elastic server hostname.
             payloads (list): List of payloads to insert.
@@ -1147,3 +1372,138 @@ class ElasticSearchUtils:
         except Exception as e:
             self.logger.error("Error bulk inserting documents: %s", str(e))
             raise e
+
+    def stream_bulk_insert(self, host_name: str, documents, index: str = None,
+                           batch_size: int = 500, max_batch_bytes: int = 5 * 1024 * 1024,
+                           concurrency: int = 1, id_field: str = None,
+                           headers: dict = None, **kwargs) -> dict:
+        """
+        Indexes documents from any iterable in NDJSON batches.
+
+        Documents are encoded one at a time and flushed as a _bulk request once the
+        batch reaches batch_size documents or max_batch_bytes bytes, so memory stays
+        bounded by the in-flight batches. With concurrency above 1, that many batches
+        are sent in parallel.
+
+        Args:
+            host_name (str): Kibana/Elastic server hostname.
+            documents (iterable): The documents (dicts) to index.
+            index (str): Target index written into each bulk action; when None the
+                actions carry no index, as in bulk_insert.
+            batch_size (int): Maximum number of documents per request (default is 500).
+            max_batch_bytes (int): Maximum request body size in bytes (default is 5 MiB),
+                keep it below the cluster's http.max_content_length.
+            concurrency (int): Number of batches sent in parallel (default is 1).
+            id_field (str): Document field used as the _id; generated when None.
+            headers (dict): Headers for the requests.
+
+        Kwargs:
+            Passed to call_request (e.g. auth_username, auth_password, verify, timeout).
+
+        Returns:
+            dict: indexed and failed counts, the number of batches and an errors list
+            with the position, id, status and error of each failed document.
+
+        Examples:
+            >> result = ElasticSearchUtils().stream_bulk_insert("http://localhost:9200",
+             ({"id": i} for i in range(100000)), index="my_index", concurrency=4)
+            >> assert result["failed"] == 0, result["errors"][:5]
+        """
+        if not host_name:
+            raise ValueError("Kibana host name is mandatory")
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be at least 1")
+
+        headers = {"Content-Type": "application/x-ndjson", **(headers or {})}
+        result = {"indexed": 0, "failed": 0, "batches": 0, "errors": []}
+
+        def collect(future):
+            indexed, errors = future.result()
+            result["indexed"] += indexed
+            result["failed"] += len(errors)
+            result["errors"].extend(errors)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = set()
+            for start, lines, ids in self.__bulk_batches(documents, index, batch_size,
+                                                         max_batch_bytes, id_field):
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+                pending.add(executor.submit(self.__send_bulk_batch, host_name, start, lines,
+                                            ids, headers, **kwargs))
+                result["batches"] += 1
+            for future in pending:
+                collect(future)
+
+        result["errors"].sort(key=lambda error: error["position"])
+        self.logger.info("Bulk indexed %s documents in %s batches, %s failed",
+                         result["indexed"], result["batches"], result["failed"])
+        return result
+
+    @staticmethod
+    def __bulk_batches(documents, index, batch_size, max_batch_bytes, id_field):
+        """
+        Encodes documents into NDJSON batches.
+
+        Args:
+            documents (iterable): The documents to index.
+            index (str): Target index.
+            batch_size (int): Maximum number of documents per batch.
+            max_batch_bytes (int): Maximum batch size in bytes.
+            id_field (str): Document field used as the _id.
+
+        Yields:
+            tuple: The position of the first document, the encoded lines and the ids.
+        """
+        start, lines, ids, size = 0, [], [], 0
+        for position, document in enumerate(documents):
+            action = {"_index": index} if index else {}
+            if id_field is not None:
+                action["_id"] = document[id_field]
+            line = (json.dumps({"index": action}) + "\n" + json.dumps(document) + "\n").encode()
+            if lines and (len(lines) >= batch_size or size + len(line) > max_batch_bytes):
+                yield start, lines, ids
+                start, lines, ids, size = position, [], [], 0
+            lines.append(line)
+            ids.append(action.get("_id"))
+            size += len(line)
+        if lines:
+            yield start, lines, ids
+
+    def __send_bulk_batch(self, host_name, start, lines, ids, headers, **kwargs):
+        """
+        Sends one NDJSON batch and returns its per-document outcome.
+
+        Args:
+            host_name (str): Kibana/Elastic server hostname.
+            start (int): The position of the first document of the batch.
+            lines (list): The encoded action/document lines.
+            ids (list): The requested _id of each document, or None.
+            headers (dict): Request headers.
+
+        Returns:
+            tuple: The number of indexed documents and the list of errors.
+        """
+        try:
+            response = self.call_request(method="POST", url=f"{host_name}/_bulk",
+                                         headers=headers, payload=b"".join(lines), **kwargs)
+        except Exception as e:
+            self.logger.error("Error sending bulk batch at position %s: %s", start, str(e))
+            return 0, [{"position": start + offset, "id": doc_id, "status": None,
+                        "error": str(e)} for offset, doc_id in enumerate(ids)]
+        if response.status_code != 200:
+            return 0, [{"position": start + offset, "id": doc_id,
+                        "status": response.status_code, "error": response.text[:500]}
+                       for offset, doc_id in enumerate(ids)]
+        body = response.json()
+        if not body.get("errors"):
+            return len(lines), []
+        errors = []
+        for offset, item in enumerate(body.get("items", [])):
+            outcome = next(iter(item.values()))
+            if "error" in outcome:
+                errors.append({"position": start + offset, "id": outcome.get("_id"),
+                               "status": outcome.get("status"), "error": outcome["error"]})
+        return len(lines) - len(errors), errors
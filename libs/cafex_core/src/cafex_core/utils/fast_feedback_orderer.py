@@ -0,0 +1,200 @@
+"""This module contains the FastFeedbackOrderer class which moves the tests
+most likely to fail to the front of the run."""
+
+import hashlib
+import os
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.duration_scheduler import DurationScheduler
+from cafex_core.utils.run_history import RunHistory
+from cafex_core.utils.run_index import RunIndex
+
+
+class FastFeedbackOrderer:
+    """A class that orders tests failed first, changed second.
+
+    The items are split into three tiers: tests that failed in the last
+    run, tests whose source files changed since the last run, and the
+    rest. Each tier is ordered shortest first by historical duration,
+    so the first failure is reported as early as possible. The order
+    only depends on the collected items and the stored history, so every
+    xdist worker computes the same order.
+
+    Attributes:
+        last_statuses (dict): The test status of the last run, keyed by node id.
+        previous_hashes (dict): The source file hashes of the last run, keyed by path.
+        scheduler (DurationScheduler): The scheduler providing the duration estimates.
+        logger (Logger): The logger object.
+
+    Methods:
+        from_history: Creates an orderer from the run index or the archived runs.
+        source_files: Returns the source files of an item.
+        hash_file: Returns the SHA-256 hex digest of a file.
+        current_hashes: Returns the hashes of the source files of the items.
+        order_items: Orders the items failed first, changed second.
+    """
+
+    FAILED = 0
+    CHANGED = 1
+    UNCHANGED = 2
+    FILE_NAME = "source_hashes.json"
+
+    def __init__(self, last_statuses, previous_hashes, estimates, default_duration=None):
+        """Initialize the FastFeedbackOrderer class.
+
+        Args:
+            last_statuses (dict): The test status of the last run, keyed by node id.
+            previous_hashes (dict): The source file hashes of the last run, keyed by path.
+            estimates (dict): The estimated duration in seconds, keyed by node id.
+            default_duration (float, optional): The duration assumed for tests
+                without history.
+        """
+        self.last_statuses = last_statuses
+        self.previous_hashes = previous_hashes
+        self.scheduler = DurationScheduler(estimates, default_duration)
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    @classmethod
+    def from_history(cls, result_dir=None, history_runs=5, default_duration=None):
+        """Creates an orderer from the run index.
+
+        When the run index does not exist yet, the statuses and durations
+        are read from the archived result.json files and no source file
+        hashes are known.
+
+        Args:
+            result_dir (str, optional): The result directory.
+            history_runs (int): The number of recent runs used for the durations.
+            default_duration (float, optional): The duration assumed for tests
+                without history.
+
+        Returns:
+            FastFeedbackOrderer: The orderer.
+        """
+        result_dir = result_dir or SessionStore().storage.get("result_dir")
+        run_index = RunIndex(result_dir)
+        if run_index.exists():
+            return cls(
+                run_index.get_last_run_statuses(),
+                run_index.get_source_hashes(),
+                run_index.get_duration_estimates(history_runs),
+                default_duration,
+            )
+        run_history = RunHistory(result_dir)
+        last_run = next(run_history.iter_runs(1), [])
+        last_statuses = {
+            RunHistory.normalize_node_id(test["nodeId"]): test.get("testStatus") for test in last_run
+        }
+        return cls(
+            last_statuses,
+            {},
+            run_history.get_duration_estimates(history_runs),
+            default_duration,
+        )
+
+    @staticmethod
+    def source_files(item):
+        """Returns the source files of an item, relative to the rootdir.
+
+        These are the test module and, for pytest-bdd scenarios, the
+        feature file.
+
+        Args:
+            item: The pytest item object.
+
+        Returns:
+            list: The source file paths.
+        """
+        paths = [str(item.path)]
+        scenario = getattr(getattr(item, "obj", None), "__scenario__", None)
+        if scenario is not None:
+            paths.append(scenario.feature.filename)
+        root_dir = str(item.config.rootpath)
+        return [os.path.relpath(path, root_dir).replace(os.sep, "/") for path in paths]
+
+    @staticmethod
+    def hash_file(path):
+        """Returns the SHA-256 hex digest of a file.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            str: The hex digest, or None if the file cannot be read.
+        """
+        sha256 = hashlib.sha256()
+        try:
+            with open(path, "rb") as file:
+                for chunk in iter(lambda: file.read(65536), b""):
+                    sha256.update(chunk)
+        except OSError:
+            return None
+        return sha256.hexdigest()
+
+    def current_hashes(self, items):
+        """Returns the hashes of the source files of the items.
+
+        Each file is hashed once, however many items it holds.
+
+        Args:
+            items (list): The collected pytest items.
+
+        Returns:
+            dict: The SHA-256 hex digest, keyed by path relative to the rootdir.
+        """
+        hashes = {}
+        for item in items:
+            for path in self.source_files(item):
+                if path not in hashes:
+                    hashes[path] = self.hash_file(os.path.join(str(item.config.rootpath), path))
+        return hashes
+
+    def tier(self, item, hashes, failed_first=True, changed_first=True):
+        """Returns the tier of an item.
+
+        Args:
+            item: The pytest item object.
+            hashes (dict): The current source file hashes.
+            failed_first (bool): Whether tests that failed last run come first.
+            changed_first (bool): Whether tests with changed sources come next.
+
+        Returns:
+            int: FAILED, CHANGED or UNCHANGED.
+        """
+        if failed_first and self.last_statuses.get(RunHistory.normalize_node_id(item.nodeid)) == "F":
+            return self.FAILED
+        if (
+            changed_first
+            and self.previous_hashes
+            and any(
+                self.previous_hashes.get(path) != hashes[path] for path in self.source_files(item)
+            )
+        ):
+            return self.CHANGED
+        return self.UNCHANGED
+
+    def order_items(self, items, failed_first=True, changed_first=True):
+        """Orders the items failed first, changed second, in place.
+
+        Source changes are only detected when hashes of a previous run
+        are known. The sort is stable, so ties keep their collection order.
+
+        Args:
+            items (list): The collected pytest items.
+            failed_first (bool): Whether tests that failed last run come first.
+            changed_first (bool): Whether tests with changed sources come next.
+
+        Returns:
+            dict: The current source file hashes, to be stored once the run finishes.
+        """
+        hashes = self.current_hashes(items)
+        tiers = {
+            item.nodeid: self.tier(item, hashes, failed_first, changed_first) for item in items
+        }
+        items.sort(key=lambda item: (tiers[item.nodeid], self.scheduler.estimate(item)))
+        self.logger.info(
+            "Fast feedback ordering: %d failed, %d changed, %d unchanged",
+            *(list(tiers.values()).count(tier) for tier in (self.FAILED, self.CHANGED, self.UNCHANGED)),
+        )
+        return hashes
@@ -4,17 +4,93 @@ Description: This module provides methods to interact with File transfer protoco
 """
 import os
 import pathlib
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from ftplib import FTP, error_perm, FTP_TLS
 
 import boto3
 import paramiko
+from boto3.s3.transfer import TransferConfig
 from dateutil import parser
 
 from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.reporting_.reporting import Reporting
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.connection_pool import ConnectionPool
 from cafex_core.utils.core_security import Security
 from cafex_core.utils.exceptions import CoreExceptions
 
+FTP_BLOCK_SIZE = 64 * 1024
+SFTP_BLOCK_SIZE = 32 * 1024
+
+
+def _local_size(file_path: str) -> int:
+    """Returns the size of a local file, or 0 if it does not exist."""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+def _ftp_download_file(ftp_conn: FTP, file: str, local_path: str, block_size: int,
+                       resume: bool) -> dict:
+    """Downloads one file over FTP or FTPS, continuing a partial local copy if asked."""
+    local_file_path = os.path.join(local_path, file)
+    offset = _local_size(local_file_path) if resume else 0
+    if offset:
+        remote_size = ftp_conn.size(file)
+        if offset == remote_size:
+            return {"file": file, "bytes": 0, "resumedFrom": offset}
+        if offset > remote_size:
+            offset = 0
+    with open(local_file_path, "ab" if offset else "wb") as local_file:
+        ftp_conn.retrbinary(f"RETR {file}", local_file.write, block_size, rest=offset or None)
+    return {"file": file, "bytes": _local_size(local_file_path) - offset, "resumedFrom": offset}
+
+
+def _ftp_upload_file(ftp_conn: FTP, file: str, local_path: str, block_size: int,
+                     resume: bool) -> dict:
+    """Uploads one file over FTP or FTPS, continuing a partial remote copy if asked."""
+    local_file_path = os.path.join(local_path, file)
+    local_size = os.path.getsize(local_file_path)
+    offset = 0
+    if resume:
+        try:
+            offset = ftp_conn.size(file) or 0
+        except error_perm:
+            offset = 0
+        if offset == local_size:
+            return {"file": file, "bytes": 0, "resumedFrom": offset}
+        if offset > local_size:
+            offset = 0
+    with open(local_file_path, "rb") as local_file:
+        local_file.seek(offset)
+        ftp_conn.storbinary(f"STOR {file}", local_file, block_size, rest=offset or None)
+    return {"file": file, "bytes": local_size - offset, "resumedFrom": offset}
+
+
+def _report_transfers(action: str, files: list, seconds: float) -> dict:
+    """Logs a batch of transfers and adds its per-file timings to the test report."""
+    summary = {
+        "files": len(files),
+        "bytes": sum(file["bytes"] for file in files),
+        "seconds": round(seconds, 3),
+        "transfers": files,
+    }
+    logger = CoreLogger(name=__name__).get_logger()
+    logger.info("%s %s files (%s bytes) in %.2fs", action, len(files), summary["bytes"], seconds)
+    if SessionStore().current_test:
+        Reporting().insert_step(
+            expected_message=f"{action} {len(files)} files",
+            actual_message=f"{action} {summary['bytes']} bytes in {seconds:.2f}s",
+            status="Pass",
+            step_type="transfer",
+            take_screenshot=False,
+            api_response=summary,
+        )
+    return summary
+
 
 class FileTransferUtils:
     """
@@ -103,7 +179,8 @@ class FileTransferUtils:
                 raise e
 
         def download_files_from_ftp(
-                self, ftp_conn: FTP, files_to_download: list, ftp_dir: str, local_path: str
+                self, ftp_conn: FTP, files_to_download: list, ftp_dir: str, local_path: str,
+                block_size: int = 1024
         ) -> None:
             """
             Downloads files from an FTP server.
@@ -113,6 +190,7 @@ class FileTransferUtils:
                 files_to_download (list): List of filenames to download.
                 ftp_dir (str): Directory on the FTP server from which to download files.
                 local_path (str): Local directory where the files will be saved.
+                block_size (int, optional): The block size of each read, in bytes.
 
             Examples:
                 >> FileTransferUtils().FTP().download_files_from_ftp(ftp_conn,
@@ -124,7 +202,7 @@ class FileTransferUtils:
                 for file in files_to_download:
                     local_file_path = os.path.join(local_path, file)
                     with open(local_file_path, "wb") as local_file:
-                        ftp_conn.retrbinary(f"RETR {file}", local_file.write, 1024)
+                        ftp_conn.retrbinary(f"RETR {file}", local_file.write, block_size)
             except Exception as e:
                 error_message = f"An error occurred while downloading files from the FTP " \
                                 f"server: {str(e)}"
@@ -159,6 +237,117 @@ class FileTransferUtils:
                 self.__obj_exception.raise_generic_exception(str(e))
                 raise e
 
+        def download_files_parallel(
+                self, ftp_host: str, ftp_username: str, ftp_password: str,
+                files_to_download: list, ftp_dir: str, local_path: str, pool_size: int = 4,
+                block_size: int = FTP_BLOCK_SIZE, resume: bool = False
+        ) -> dict:
+            """
+            Downloads files from an FTP server over a pool of connections.
+
+            Each pooled connection is authenticated once and changed to the
+            directory, and the files are downloaded concurrently with a larger
+            block size than download_files_from_ftp. With resume, a partial local
+            file is continued from its size instead of downloaded again.
+
+            Args:
+                ftp_host (str): The hostname of the FTP server.
+                ftp_username (str): The username for authentication on the FTP server.
+                ftp_password (str): The password for authentication on the FTP server.
+                files_to_download (list): List of filenames to download.
+                ftp_dir (str): Directory on the FTP server from which to download files.
+                local_path (str): Local directory where the files will be saved.
+                pool_size (int, optional): The number of concurrent connections.
+                block_size (int, optional): The block size of each read, in bytes.
+                resume (bool, optional): Whether to continue partial local files.
+
+            Returns:
+                dict: The files, bytes and seconds of the batch, and the transfers
+                with the bytes, resumedFrom and seconds of each file.
+
+            Examples:
+                >> summary = FileTransferUtils().FTP().download_files_parallel(
+                'ftp.example.com', 'username', 'password', ['file1.pdf'], '/Inbox/',
+                'C:/Users/Project/', pool_size=4, resume=True)
+            """
+            try:
+                os.makedirs(local_path, exist_ok=True)
+                start = time.perf_counter()
+                with ConnectionPool(
+                        lambda: self.__open_pooled_connection(ftp_host, ftp_username,
+                                                              ftp_password, ftp_dir),
+                        lambda conn: conn.quit(), pool_size
+                ) as pool:
+                    files = pool.run(
+                        lambda conn, file: _ftp_download_file(conn, file, local_path,
+                                                              block_size, resume),
+                        files_to_download
+                    )
+                return _report_transfers("Downloaded", files, time.perf_counter() - start)
+            except Exception as e:
+                error_message = f"An error occurred while downloading files from the " \
+                                f"FTP server: {str(e)}"
+                self.__obj_exception.raise_generic_exception(error_message)
+                raise e
+
+        def upload_files_parallel(
+                self, ftp_host: str, ftp_username: str, ftp_password: str,
+                files_to_upload: list, ftp_dir: str, local_path: str, pool_size: int = 4,
+                block_size: int = FTP_BLOCK_SIZE, resume: bool = False
+        ) -> dict:
+            """
+            Uploads files to an FTP server over a pool of connections.
+
+            With resume, a partial remote file is continued from its size
+            (REST before STOR) instead of uploaded again.
+
+            Args:
+                ftp_host (str): The hostname of the FTP server.
+                ftp_username (str): The username for authentication on the FTP server.
+                ftp_password (str): The password for authentication on the FTP server.
+                files_to_upload (list): List of filenames to upload.
+                ftp_dir (str): Directory on the FTP server to which the files are uploaded.
+                local_path (str): Local directory from where the files are uploaded.
+                pool_size (int, optional): The number of concurrent connections.
+                block_size (int, optional): The block size of each write, in bytes.
+                resume (bool, optional): Whether to continue partial remote files.
+
+            Returns:
+                dict: The files, bytes and seconds of the batch, and the transfers
+                with the bytes, resumedFrom and seconds of each file.
+
+            Examples:
+                >> summary = FileTransferUtils().FTP().upload_files_parallel(
+                'ftp.example.com', 'username', 'password', ['file1.pdf'], '/Inbox/',
+                'C:/Users/Project/')
+            """
+            try:
+                start = time.perf_counter()
+                with ConnectionPool(
+                        lambda: self.__open_pooled_connection(ftp_host, ftp_username,
+                                                              ftp_password, ftp_dir),
+                        lambda conn: conn.quit(), pool_size
+                ) as pool:
+                    files = pool.run(
+                        lambda conn, file: _ftp_upload_file(conn, file, local_path,
+                                                            block_size, resume),
+                        files_to_upload
+                    )
+                return _report_transfers("Uploaded", files, time.perf_counter() - start)
+            except Exception as e:
+                error_message = f"An error occurred while uploading files to the " \
+                                f"FTP server: {str(e)}"
+                self.__obj_exception.raise_generic_exception(error_message)
+                raise e
+
+        def __open_pooled_connection(self, ftp_host: str, ftp_username: str,
+                                     ftp_password: str, ftp_dir: str) -> FTP:
+            """Opens a binary-mode connection in the transfer directory."""
+            ftp_conn = self.open_ftp_connection(ftp_host, ftp_username, ftp_password)
+            ftp_conn.voidcmd("TYPE I")
+            ftp_conn.cwd(ftp_dir)
+            return ftp_conn
+
         def close_ftp_conn(self, ftp_conn: FTP) -> None:
             """
             Closes the FTP connection.
@@ -316,6 +505,161 @@ class FileTransferUtils:
                 self.__obj_exception.raise_generic_exception(error_message)
                 raise e
 
+        def download_files_parallel(
+                self, sftp_host: str, sftp_port: int, sftp_username: str, sftp_password: str,
+                download_files: list, sftp_dir: str, local_path: str, pool_size: int = 4,
+                block_size: int = SFTP_BLOCK_SIZE, resume: bool = False,
+                max_concurrent_prefetch_requests: int = None
+        ) -> dict:
+            """
+            Downloads files from SFTP over a pool of connections.
+
+            Each file is read with prefetch, so the read requests are pipelined
+            instead of waiting for one round trip per block. With resume, a
+            partial local file is continued from its size.
+
+            Args:
+                sftp_host (str): Host name of the SFTP server.
+                sftp_port (int): Port number for the SFTP server.
+                sftp_username (str): Username for the SFTP server.
+                sftp_password (str): Password for the SFTP server.
+                download_files (list): List of files that need to be downloaded.
+                sftp_dir (str): Directory from where the files are to be downloaded.
+                local_path (str): Target path to download the files.
+                pool_size (int, optional): The number of concurrent connections.
+                block_size (int, optional): The size of each local write, in bytes.
+                resume (bool, optional): Whether to continue partial local files.
+                max_concurrent_prefetch_requests (int, optional): The limit of
+                 outstanding prefetch requests per file. Unlimited if not provided.
+
+            Returns:
+                dict: The files, bytes and seconds of the batch, and the transfers
+                with the bytes, resumedFrom and seconds of each file.
+
+            Examples:
+                >> summary = FileTransferUtils().SFTP().download_files_parallel(
+                'sftp.example.com', 22, 'username', 'password', ['file1.pdf'], '/Inbox/',
+                'C:/Users/Project/', resume=True)
+            """
+
+            def download(sftp_conn, file):
+                remote_file_path = f"{sftp_dir.rstrip('/')}/{file}"
+                local_file_path = os.path.join(local_path, file)
+                remote_size = sftp_conn.stat(remote_file_path).st_size
+                offset = _local_size(local_file_path) if resume else 0
+                if offset > remote_size:
+                    offset = 0
+                if offset and offset == remote_size:
+                    return {"file": file, "bytes": 0, "resumedFrom": offset}
+                with sftp_conn.open(remote_file_path, "rb") as remote_file, \
+                        open(local_file_path, "ab" if offset else "wb") as local_file:
+                    remote_file.seek(offset)
+                    remote_file.prefetch(remote_size, max_concurrent_prefetch_requests)
+                    for chunk in iter(lambda: remote_file.read(block_size), b""):
+                        local_file.write(chunk)
+                return {"file": file, "bytes": remote_size - offset, "resumedFrom": offset}
+
+            try:
+                os.makedirs(local_path, exist_ok=True)
+                start = time.perf_counter()
+                with self.__connection_pool(sftp_host, sftp_port, sftp_username,
+                                            sftp_password, pool_size) as pool:
+                    files = pool.run(download, download_files)
+                return _report_transfers("Downloaded", files, time.perf_counter() - start)
+            except Exception as e:
+                error_message = f"An error occurred while downloading files from the " \
+                                f"SFTP server: {str(e)}"
+                self.__obj_exception.raise_generic_exception(error_message)
+                raise e
+
+        def upload_files_parallel(
+                self, sftp_host: str, sftp_port: int, sftp_username: str, sftp_password: str,
+                upload_files: list, sftp_dir: str, local_path: str, pool_size: int = 4,
+                block_size: int = SFTP_BLOCK_SIZE, resume: bool = False
+        ) -> dict:
+            """
+            Uploads files to SFTP over a pool of connections.
+
+            Each file is written pipelined, so the writes do not wait for the
+            server to acknowledge each block. With resume, a partial remote file
+            is continued from its size.
+
+            Args:
+                sftp_host (str): Host name of the SFTP server.
+                sftp_port (int): Port number for the SFTP server.
+                sftp_username (str): Username for the SFTP server.
+                sftp_password (str): Password for the SFTP server.
+                upload_files (list): List of files that need to be uploaded.
+                sftp_dir (str): Directory to where the files need to be uploaded.
+                local_path (str): Local path from where the files need to be uploaded.
+                pool_size (int, optional): The number of concurrent connections.
+                block_size (int, optional): The size of each remote write, in bytes.
+                resume (bool, optional): Whether to continue partial remote files.
+
+            Returns:
+                dict: The files, bytes and seconds of the batch, and the transfers
+                with the bytes, resumedFrom and seconds of each file.
+
+            Examples:
+                >> summary = FileTransferUtils().SFTP().upload_files_parallel(
+                'sftp.example.com', 22, 'username', 'password', ['file1.pdf'], '/Inbox/',
+                'C:/Users/Project/')
+            """
+
+            def upload(sftp_conn, file):
+                remote_file_path = f"{sftp_dir.rstrip('/')}/{file}"
+                local_file_path = os.path.join(local_path, file)
+                local_size = os.path.getsize(local_file_path)
+                offset = 0
+                if resume:
+                    try:
+                        offset = sftp_conn.stat(remote_file_path).st_size
+                    except FileNotFoundError:
+                        offset = 0
+                    if offset > local_size:
+                        offset = 0
+                    if offset and offset == local_size:
+                        return {"file": file, "bytes": 0, "resumedFrom": offset}
+                with open(local_file_path, "rb") as local_file, \
+                        sftp_conn.open(remote_file_path, "r+b" if offset else "wb") as remote_file:
+                    remote_file.set_pipelined(True)
+                    local_file.seek(offset)
+                    remote_file.seek(offset)
+                    for chunk in iter(lambda: local_file.read(block_size), b""):
+                        remote_file.write(chunk)
+                return {"file": file, "bytes": local_size - offset, "resumedFrom": offset}
+
+            try:
+                start = time.perf_counter()
+                with self.__connection_pool(sftp_host, sftp_port, sftp_username,
+                                            sftp_password, pool_size) as pool:
+                    files = pool.run(upload, upload_files)
+                return _report_transfers("Uploaded", files, time.perf_counter() - start)
+            except Exception as e:
+                error_message = f"An error occurred while uploading files to the " \
+                                f"SFTP server: {str(e)}"
+                self.__obj_exception.raise_generic_exception(error_message)
+                raise e
+
+        @staticmethod
+        def __connection_pool(sftp_host: str, sftp_port: int, sftp_username: str,
+                              sftp_password: str, pool_size: int) -> ConnectionPool:
+            """Returns a pool of SFTP clients, each on its own transport."""
+
+            def open_connection():
+                sftp_conn, transport = FileTransferUtils().security.open_sftp_connection(
+                    sftp_host, sftp_port, sftp_username, sftp_password
+                )
+                transports[id(sftp_conn)] = transport
+                return sftp_conn
+
+            def close_connection(sftp_conn):
+                sftp_conn.close()
+                transports.pop(id(sftp_conn)).close()
+
+            transports = {}
+            return ConnectionPool(open_connection, close_connection, pool_size)
+
         def close_sftp_conn(self, sftp_conn: paramiko.SFTPClient) -> None:
             """
             This method closes the SFTP connection.
@@ -413,7 +757,8 @@ class FileTransferUtils:
                 raise e
 
         def download_files_from_ftps(
-                self, ftps_conn: FTP_TLS, download_files: list, ftps_dir: str, local_path: str
+                self, ftps_conn: FTP_TLS, download_files: list, ftps_dir: str, local_path: str,
+                block_size: int = 1024
         ) -> None:
             """
             This method downloads files from FTPS.
@@ -423,6 +768,7 @@ class FileTransferUtils:
                 download_files (list): List of files that need to be downloaded.
                 ftps_dir (str): Directory from where the files are to be downloaded.
                 local_path (str): Target path to download the files.
+                block_size (int, optional): The block size of each read, in bytes.
 
             Examples:
                 >> FileTransferUtils().FTPS().download_files_from_ftps(ftps_conn,
@@ -434,7 +780,7 @@ class FileTransferUtils:
                 for file in download_files:
                     local_file_path = os.path.join(local_path, file)
                     with open(local_file_path, "wb") as local_file:
-                        ftps_conn.retrbinary(f"RETR {file}", local_file.write, 1024)
+                        ftps_conn.retrbinary(f"RETR {file}", local_file.write, block_size)
             except Exception as e:
                 error_message = f"An error occurred while downloading files from the" \
                                 f" FTPS server: {str(e)}"
@@ -469,6 +815,117 @@ class FileTransferUtils:
                 self.__obj_exception.raise_generic_exception(error_message)
                 raise e
 
+        def download_files_parallel(
+                self, ftps_host: str, ftps_username: str, ftps_password: str,
+                files_to_download: list, ftps_dir: str, local_path: str, pool_size: int = 4,
+                block_size: int = FTP_BLOCK_SIZE, resume: bool = False
+        ) -> dict:
+            """
+            Downloads files from an FTPS server over a pool of connections.
+
+            Each pooled connection is authenticated once and changed to the
+            directory, and the files are downloaded concurrently with a larger
+            block size than download_files_from_ftps. With resume, a partial local
+            file is continued from its size instead of downloaded again.
+
+            Args:
+                ftps_host (str): The hostname of the FTPS server.
+                ftps_username (str): The username for authentication on the FTPS server.
+                ftps_password (str): The password for authentication on the FTPS server.
+                files_to_download (list): List of filenames to download.
+                ftps_dir (str): Directory on the FTPS server from which to download files.
+                local_path (str): Local directory where the files will be saved.
+                pool_size (int, optional): The number of concurrent connections.
+                block_size (int, optional): The block size of each read, in bytes.
+                resume (bool, optional): Whether to continue partial local files.
+
+            Returns:
+                dict: The files, bytes and seconds of the batch, and the transfers
+                with the bytes, resumedFrom and seconds of each file.
+
+            Examples:
+                >> summary = FileTransferUtils().FTPS().download_files_parallel(
+                'ftps.example.com', 'username', 'password', ['file1.pdf'], '/Inbox/',
+                'C:/Users/Project/', pool_size=4, resume=True)
+            """
+            try:
+                os.makedirs(local_path, exist_ok=True)
+                start = time.perf_counter()
+                with ConnectionPool(
+                        lambda: self.__open_pooled_connection(ftps_host, ftps_username,
+                                                              ftps_password, ftps_dir),
+                        lambda conn: conn.quit(), pool_size
+                ) as pool:
+                    files = pool.run(
+                        lambda conn, file: _ftp_download_file(conn, file, local_path,
+                                                              block_size, resume),
+                        files_to_download
+                    )
+                return _report_transfers("Downloaded", files, time.perf_counter() - start)
+            except Exception as e:
+                error_message = f"An error occurred while downloading files from the " \
+                                f"FTPS server: {str(e)}"
+                self.__obj_exception.raise_generic_exception(error_message)
+                raise e
+
+        def upload_files_parallel(
+                self, ftps_host: str, ftps_username: str, ftps_password: str,
+                files_to_upload: list, ftps_dir: str, local_path: str, pool_size: int = 4,
+                block_size: int = FTP_BLOCK_SIZE, resume: bool = False
+        ) -> dict:
+            """
+            Uploads files to an FTPS server over a pool of connections.
+
+            With resume, a partial remote file is continued from its size
+            (REST before STOR) instead of uploaded again.
+
+            Args:
+                ftps_host (str): The hostname of the FTPS server.
+                ftps_username (str): The username for authentication on the FTPS server.
+                ftps_password (str): The password for authentication on the FTPS server.
+                files_to_upload (list): List of filenames to upload.
+                ftps_dir (str): Directory on the FTPS server to which the files are uploaded.
+                local_path (str): Local directory from where the files are uploaded.
+                pool_size (int, optional): The number of concurrent connections.
+                block_size (int, optional): The block size of each write, in bytes.
+                resume (bool, optional): Whether to continue partial remote files.
+
+            Returns:
+                dict: The files, bytes and seconds of the batch, and the transfers
+                with the bytes, resumedFrom and seconds of each file.
+
+            Examples:
+                >> summary = FileTransferUtils().FTPS().upload_files_parallel(
+                'ftps.example.com', 'username', 'password', ['file1.pdf'], '/Inbox/',
+                'C:/Users/Project/')
+            """
+            try:
+                start = time.perf_counter()
+                with ConnectionPool(
+                        lambda: self.__open_pooled_connection(ftps_host, ftps_username,
+                                                              ftps_password, ftps_dir),
+                        lambda conn: conn.quit(), pool_size
+                ) as pool:
+                    files = pool.run(
+                        lambda conn, file: _ftp_upload_file(conn, file, local_path,
+                                                            block_size, resume),
+                        files_to_upload
+                    )
+                return _report_transfers("Uploaded", files, time.perf_counter() - start)
+            except Exception as e:
+                error_message = f"An error occurred while uploading files to the " \
+                                f"FTPS server: {str(e)}"
+                self.__obj_exception.raise_generic_exception(error_message)
+                raise e
+
+        def __open_pooled_connection(self, ftps_host: str, ftps_username: str,
+                                     ftps_password: str, ftps_dir: str) -> FTP_TLS:
+            """Opens a binary-mode connection in the transfer directory."""
+            ftps_conn = self.open_ftps_connection(ftps_host, ftps_username, ftps_password)
+            ftps_conn.voidcmd("TYPE I")
+            ftps_conn.cwd(ftps_dir)
+            return ftps_conn
+
         def close_ftps_conn(self, ftps_conn: FTP_TLS) -> None:
             """
             This method closes the FTPS connection.
@@ -654,12 +1111,48 @@ class FileTransferUtils:
                 self.__obj_exception.raise_generic_exception(error_message)
                 raise e
 
+        def iter_s3_objects(self, s3_client: boto3.Session.client, bucket_name: str,
+                            prefix: str = None, file_suffix: str = "",
+                            page_size: int = 1000):
+            """
+            Lazily yields the objects under the specified AWS S3 bucket.
+
+            The listing is paginated, so buckets with more than 1000 keys are read
+            completely while only one page is held in memory.
+
+            Args:
+                s3_client (S3.Client): The AWS S3 client connection object.
+                bucket_name (str): The name of the bucket.
+                prefix (str, optional): An optional prefix to filter the objects.
+                file_suffix (str, optional): An optional suffix to filter the objects.
+                page_size (int, optional): The number of keys requested per page.
+
+            Yields:
+                dict: The object entry with Key, LastModified and Size.
+
+            Examples:
+                >> for s3_object in FileTransferUtils().AWSS3().iter_s3_objects(s3_client,
+                 'my_bucket', prefix='folder/'):
+                >>     print(s3_object["Key"])
+            """
+            paginate_args = {"Bucket": bucket_name, "PaginationConfig": {"PageSize": page_size}}
+            if prefix:
+                paginate_args["Prefix"] = prefix
+            paginator = s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(**paginate_args):
+                for content in page.get("Contents", []):
+                    if content.get("Key").endswith(file_suffix):
+                        yield content
+
         def read_content_from_s3(self, s3_client: boto3.Session.client,
                                  bucket_name: str, folder_prefix: str = None,
                                  file_suffix: str = "") -> tuple[int, list, dict]:
             """
             Retrieves a list of objects under the specified AWS S3 bucket.
 
+            All pages of the listing are read; use iter_s3_objects to process the
+            objects without holding the whole listing in memory.
+
             Args:
                 s3_client (S3.Client): The AWS S3 client connection object.
                 bucket_name (str): The name of the bucket.
@@ -676,23 +1169,18 @@ class FileTransferUtils:
                  folder_prefix='folder/')
             """
             try:
-                if folder_prefix:
-                    response = s3_client.list_objects_v2(Bucket=bucket_name,
-                                                         Prefix=folder_prefix)
-                else:
-                    response = s3_client.list_objects_v2(Bucket=bucket_name)
-
                 s3_files = []
                 dict_s3_file_details = {}
 
-                for index, content in enumerate(response.get("Contents", []), start=1):
-                    if content.get("Key").endswith(file_suffix):
-                        s3_files.append(content.get("Key"))
-                        dict_s3_file_details[f"file{index}"] = {
-                            "file_name": content.get("Key"),
-                            "last_modified": str(content.get("LastModified")),
-                            "size": content.get("Size")
-                        }
+                for index, content in enumerate(
+                        self.iter_s3_objects(s3_client, bucket_name, prefix=folder_prefix,
+                                             file_suffix=file_suffix), start=1):
+                    s3_files.append(content.get("Key"))
+                    dict_s3_file_details[f"file{index}"] = {
+                        "file_name": content.get("Key"),
+                        "last_modified": str(content.get("LastModified")),
+                        "size": content.get("Size")
+                    }
 
                 file_count = len(s3_files)
                 return file_count, s3_files, dict_s3_file_details
@@ -707,6 +1195,7 @@ class FileTransferUtils:
                 bucket_name: str,
                 src_local_file_path: str,
                 tgt_s3_file_path: str = None,
+                transfer_config: TransferConfig = None,
         ):
             """
             Uploads a file into the specified AWS S3 bucket.
@@ -717,6 +1206,8 @@ class FileTransferUtils:
                 src_local_file_path (str): Local source file path.
                 tgt_s3_file_path (str, optional): Target file path in S3. If not provided,
                 the local file name will be used.
+                transfer_config (TransferConfig, optional): Multipart threshold, chunk size
+                and concurrency of the transfer. boto3 defaults are used if not provided.
 
             Returns:
                 None
@@ -734,6 +1225,7 @@ class FileTransferUtils:
                     src_local_file_path,
                     bucket_name,
                     tgt_s3_file_path,
+                    **({"Config": transfer_config} if transfer_config else {}),
                 )
                 self.logger.info("File %s successfully uploaded to S3 as %s."
                                  , src_local_file_path, tgt_s3_file_path)
@@ -749,6 +1241,7 @@ class FileTransferUtils:
                 bucket_name: str,
                 src_s3_file_path: str,
                 tgt_local_file_path: str = None,
+                transfer_config: TransferConfig = None,
         ):
             """
             Downloads a file from the specified AWS S3 bucket.
@@ -760,6 +1253,8 @@ class FileTransferUtils:
                 tgt_local_file_path (str, optional): Optional local target file path.
                 If not provided, the file will be saved in the current working directory
                 with the same name as in S3.
+                transfer_config (TransferConfig, optional): Multipart threshold, chunk size
+                and concurrency of the transfer. boto3 defaults are used if not provided.
 
             Returns:
                 None
@@ -782,6 +1277,7 @@ class FileTransferUtils:
                     bucket_name,
                     src_s3_file_path,
                     tgt_local_file_path,
+                    **({"Config": transfer_config} if transfer_config else {}),
                 )
 
                 self.logger.info("File '%s' successfully downloaded to '%s'.",
@@ -799,10 +1295,17 @@ class FileTransferUtils:
                 bucket_name: str,
                 src_s3_folder_path: str,
                 tgt_local_folder_path: str = None,
-        ):
+                file_prefix: str = None,
+                max_workers: int = 8,
+                transfer_config: TransferConfig = None,
+        ) -> dict:
             """
             Downloads a folder and its contents from the specified AWS S3 bucket.
 
+            The listing is paginated and the files are downloaded concurrently by a
+            bounded thread pool; the first failed download is raised once the
+            running downloads finish.
+
             Args:
                 s3_client (S3.Client): The AWS S3 client connection object.
                 bucket_name (str): The name of the S3 bucket.
@@ -810,9 +1313,19 @@ class FileTransferUtils:
                 tgt_local_folder_path (str, optional): Optional local target folder path.
                  If not provided, the folder will be created in the current
                  working directory.
+                file_prefix (str, optional): Only download files whose path relative to
+                 the folder starts with this prefix.
+                max_workers (int, optional): The number of concurrent downloads. Keep it
+                 within the client's max_pool_connections (10 by default).
+                transfer_config (TransferConfig, optional): Multipart settings of each
+                 download.
 
             Returns:
-                None
+                dict: A progress summary with files, bytes and seconds.
+
+            Examples:
+                >> summary = FileTransferUtils().AWSS3().download_folder_from_s3(s3_client,
+                 'my_bucket', 'data/', '/tmp/data', file_prefix='year=2024/')
             """
             try:
                 if not bucket_name:
@@ -828,10 +1341,9 @@ class FileTransferUtils:
                 if not src_s3_folder_path.endswith("/"):
                     src_s3_folder_path += "/"
 
-                paginator = s3_client.get_paginator("list_objects_v2")
-
-                for result in paginator.paginate(Bucket=bucket_name, Prefix=src_s3_folder_path):
-                    for key in result.get("Contents", []):
+                def transfers():
+                    for key in self.iter_s3_objects(s3_client, bucket_name,
+                                                    prefix=src_s3_folder_path + (file_prefix or "")):
                         rel_path = key["Key"][len(src_s3_folder_path):]
                         local_file_path = os.path.normpath(os.path.join(tgt_local_folder_path, rel_path))
 
@@ -839,12 +1351,17 @@ class FileTransferUtils:
                             os.makedirs(local_file_path, exist_ok=True)
                             self.logger.info("Directory created: %s", local_file_path)
                         else:
-                            local_file_dir = os.path.dirname(local_file_path)
-                            os.makedirs(local_file_dir, exist_ok=True)
-                            self.logger.info("Starting file download: %s", key["Key"])
-                            s3_client.download_file(bucket_name, key["Key"], local_file_path)
-                            self.logger.info("File %s successfully downloaded to %s.",
-                                             key["Key"], local_file_path)
+                            os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+                            yield (s3_client.download_file,
+                                   (bucket_name, key["Key"], local_file_path),
+                                   {"Config": transfer_config} if transfer_config else {},
+                                   key.get("Size", 0))
+
+                summary = self.__run_transfers(transfers(), max_workers)
+                self.logger.info("Downloaded %s files (%s bytes) from s3://%s/%s in %.2fs.",
+                                 summary["files"], summary["bytes"], bucket_name,
+                                 src_s3_folder_path, summary["seconds"])
+                return summary
             except ValueError as ve:
                 self.logger.error("Validation error: %s", str(ve))
                 raise ve
@@ -860,10 +1377,16 @@ class FileTransferUtils:
                 s3_bucket_name: str,
                 src_local_folder_path: str,
                 tgt_s3_folder_path: str = None,
-        ):
+                file_prefix: str = None,
+                max_workers: int = 8,
+                transfer_config: TransferConfig = None,
+        ) -> dict:
             """
             Uploads a folder and its contents to the specified AWS S3 bucket.
 
+            The files are uploaded concurrently by a bounded thread pool; the first
+            failed upload is raised once the running uploads finish.
+
             Args:
                 s3_client (S3.Client): The AWS S3 client connection object.
                 s3_bucket_name (str): The name of the S3 bucket.
@@ -871,9 +1394,19 @@ class FileTransferUtils:
                 tgt_s3_folder_path (str, optional): Optional target folder path in
                 S3. If not provided, the folder will be created in S3 with the same
                 name as the local folder.
+                file_prefix (str, optional): Only upload files whose path relative to
+                the folder starts with this prefix.
+                max_workers (int, optional): The number of concurrent uploads. Keep it
+                within the client's max_pool_connections (10 by default).
+                transfer_config (TransferConfig, optional): Multipart settings of each
+                upload.
 
             Returns:
-                None
+                dict: A progress summary with files, bytes and seconds.
+
+            Examples:
+                >> summary = FileTransferUtils().AWSS3().upload_folder_into_s3(s3_client,
+                 'my_bucket', '/tmp/data', 'data/', max_workers=10)
             """
             try:
                 if not os.path.exists(src_local_folder_path):
@@ -888,15 +1421,23 @@ class FileTransferUtils:
                     tgt_s3_folder_path += "/"
                 list_of_local_files = self.get_list_of_files_local(src_local_folder_path)
 
-                for full_path in list_of_local_files:
-                    source_full_path = os.path.normpath(full_path)
-                    relative_path = os.path.relpath(source_full_path, src_local_folder_path)
-                    target_full_path = os.path.join(tgt_s3_folder_path, relative_path).replace("\\", "/")
-                    self.logger.info("Beginning file upload from %s to %s...", source_full_path, target_full_path)
-                    self.upload_file_into_s3(
-                        s3_client, s3_bucket_name, source_full_path, target_full_path
-                    )
-                    self.logger.info("Successfully transferred file %s to S3.", source_full_path)
+                def transfers():
+                    for full_path in list_of_local_files:
+                        source_full_path = os.path.normpath(full_path)
+                        relative_path = os.path.relpath(source_full_path, src_local_folder_path)
+                        if file_prefix and not relative_path.replace("\\", "/").startswith(file_prefix):
+                            continue
+                        target_full_path = os.path.join(tgt_s3_folder_path, relative_path).replace("\\", "/")
+                        yield (self.upload_file_into_s3,
+                               (s3_client, s3_bucket_name, source_full_path, target_full_path),
+                               {"transfer_config": transfer_config} if transfer_config else {},
+                               self.__file_size(source_full_path))
+
+                summary = self.__run_transfers(transfers(), max_workers)
+                self.logger.info("Uploaded %s files (%s bytes) to s3://%s/%s in %.2fs.",
+                                 summary["files"], summary["bytes"], s3_bucket_name,
+                                 tgt_s3_folder_path, summary["seconds"])
+                return summary
 
             except ValueError as ve:
                 raise ve
@@ -905,6 +1446,62 @@ class FileTransferUtils:
                 self.__obj_exception.raise_generic_exception(error_message)
                 raise e
 
+        @staticmethod
+        def __file_size(file_path: str) -> int:
+            """Returns the size of a local file, or 0 if it cannot be read."""
+            try:
+                return os.path.getsize(file_path)
+            except OSError:
+                return 0
+
+        @staticmethod
+        def __run_transfers(transfers, max_workers: int) -> dict:
+            """
+            Runs transfers on a bounded thread pool.
+
+            At most twice max_workers transfers are queued at a time, so lazily
+            listed folders are never fully materialized.
+
+            Args:
+                transfers (iterable): Tuples of function, args, kwargs and size in bytes.
+                max_workers (int): The number of concurrent transfers.
+
+            Returns:
+                dict: A progress summary with files, bytes and seconds.
+            """
+            if max_workers < 1:
+                raise ValueError("max_workers must be at least 1")
+            summary = {"files": 0, "bytes": 0, "seconds": 0.0}
+            start = time.perf_counter()
+            errors = []
+
+            def collect(done):
+                for future in done:
+                    try:
+                        summary["bytes"] += future.result()
+                        summary["files"] += 1
+                    except Exception as e:
+                        errors.append(e)
+
+            def transfer(func, args, kwargs, size):
+                func(*args, **kwargs)
+                return size
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = set()
+                for func, args, kwargs, size in transfers:
+                    if errors:
+                        break
+                    if len(pending) >= 2 * max_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    pending.add(executor.submit(transfer, func, args, kwargs, size))
+                collect(wait(pending).done)
+            if errors:
+                raise errors[0]
+            summary["seconds"] = round(time.perf_counter() - start, 3)
+            return summary
+
         def get_list_of_files_local(self, local_dir_name: str) -> list:
             """
             Lists all the files in a given local directory, including files in subdirectories.
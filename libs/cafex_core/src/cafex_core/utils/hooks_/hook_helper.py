@@ -1,5 +1,6 @@
 # This file contains the HookHelper class which is responsible for initializing the hooks and creating the folders
 from ...singletons_.session_ import SessionStore
+from ..phase_timer import PhaseTimer
 from .hook_util import HookUtil
 from .pytest_add_option_hook import PytestAddOptionHook
 from .pytest_after_scenario_hook import PytestAfterScenario
@@ -8,10 +9,12 @@ from .pytest_bdd_before_step import PytestBddBeforeStep
 from .pytest_bdd_step_error import PytestBDDStepError
 from .pytest_before_scenario_hook import PytestBeforeScenario
 from .pytest_collection_finish_hook import PytestCollectionFinish
+from .pytest_collection_modifyitems_hook import PytestCollectionModifyItems
 from .pytest_configure_hook import PytestConfiguration
 from .pytest_run_test_logreport import PytestRunLogReport
 from .pytest_run_test_make_report import PytestRunTestMakeReport
 from .pytest_run_test_setup import PytestRunTestSetup
+from .pytest_run_test_teardown import PytestRunTestTeardown
 from .pytest_session_finish_ import PytestSessionFinish
 from .pytest_session_start_hook import PytestSessionStart
 
@@ -42,46 +45,67 @@ class HookHelper:
         PytestAddOptionHook(parser_).add_option_hook()
 
     @staticmethod
+    @PhaseTimer.timed("configure")
     def pytest_configure_(config):
         PytestConfiguration(config).configure_hook()
 
     @staticmethod
+    @PhaseTimer.timed("collection_modifyitems")
+    def pytest_collection_modifyitems_(session, config, items):
+        PytestCollectionModifyItems(session, config, items).collection_modifyitems_hook()
+
+    @staticmethod
+    @PhaseTimer.timed("collection_finish")
     def pytest_collection_finish_(session):
         PytestCollectionFinish(session).collection_finish_hook()
 
     @staticmethod
+    @PhaseTimer.timed("session_start")
     def pytest_session_start_(session, sys_arg):
         PytestSessionStart(session, sys_arg).session_start_hook()
 
     @staticmethod
+    @PhaseTimer.timed("before_scenario")
     def pytest_before_scenario_(feature, scenario_, request, args):
         PytestBeforeScenario(feature, scenario_, request, args).before_scenario_hook()
 
     @staticmethod
+    @PhaseTimer.timed("before_step")
     def pytest_before_step(scenario_, step_):
         PytestBddBeforeStep(scenario_, step_).before_step_hook()
 
     @staticmethod
+    @PhaseTimer.timed("after_step")
     def pytest_after_step(step_):
         PytestBddAfterStep(step_).after_step_hook()
 
     @staticmethod
+    @PhaseTimer.timed("after_scenario")
     def pytest_after_scenario(scenario, sys_args, feature):
         PytestAfterScenario(scenario, sys_args, feature).after_scenario_hook()
 
     @staticmethod
+    @PhaseTimer.timed("run_test_setup")
     def pytest_run_test_setup(item_):
         PytestRunTestSetup(item_).run_setup()
 
     @staticmethod
+    @PhaseTimer.timed("run_test_teardown")
+    def pytest_run_test_teardown(item_):
+        PytestRunTestTeardown(item_).run_teardown()
+
+    @staticmethod
+    @PhaseTimer.timed("make_report")
     def pytest_run_test_make_report(report_):
         PytestRunTestMakeReport(report_).run_make_report()
 
     @staticmethod
+    @PhaseTimer.timed("log_report")
     def pytest_run_test_log_report(report):
         PytestRunLogReport(report).run_log_report()
 
     @staticmethod
+    @PhaseTimer.timed("step_error")
     def pytest_bdd_step_error(step):
         PytestBDDStepError(step).bdd_step_error()
 
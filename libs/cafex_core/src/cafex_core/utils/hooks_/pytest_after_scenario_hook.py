@@ -4,6 +4,8 @@ from cafex_core.singletons_.session_ import SessionStore
 from cafex_core.utils.config_utils import ConfigUtils
 from cafex_core.utils.hooks_.hook_util import HookUtil
 from cafex_ui.cafex_ui_config_utils import MobileConfigUtils
+from cafex_ui.web_client.playwright_context_pool import PlaywrightContextPool
+from cafex_ui.web_client.web_driver_pool import WebDriverPool
 
 
 class PytestAfterScenario:
@@ -31,6 +33,8 @@ class PytestAfterScenario:
             self.after_scenario_mobile_teardown()
         if "mobile_app" in self.scenario.tags:
             self.after_scenario_mobile_teardown()
+        if "playwright_web" in self.scenario.tags and PlaywrightContextPool.is_enabled():
+            PlaywrightContextPool().close_context()
 
         self.pop_scenario_end_values()
 
@@ -112,12 +116,18 @@ class PytestAfterScenario:
 
     def close_driver(self):
         try:
+            if WebDriverPool.is_enabled():
+                WebDriverPool().release(self.session_store.driver)
+                return
             self.session_store.driver.close()
         except Exception as e:
             self.logger.exception(f"Error while closing driver : {e}")
 
     def quit_driver(self, session_object, debug_id):
         try:
+            if WebDriverPool.is_enabled():
+                WebDriverPool().release(session_object.driver)
+                return
             session_object.driver.quit()
         except Exception as e:
             self.logger.exception(f"Error while quitting driver {e} : Debug Id : {debug_id}")
@@ -7,8 +7,8 @@ from cafex_core.handlers.file_handler import FileHandler
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.request_ import RequestSingleton
 from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.collection_index import CollectionIndex
 from cafex_core.utils.date_time_utils import DateTimeActions
-from cafex_core.utils.item_attribute_accessor import ItemAttributeAccessor
 
 from .hook_util import HookUtil
 
@@ -47,14 +47,22 @@ class PytestCollectionFinish:
         """The collection finish hook method that is called at the end of the
         test collection.
 
-        It logs the collection finish event, retrieves the worker ID,
-        gathers scenario details, creates a JSON file with collection
-        details, and logs the collection details.
+        It builds the collection index on every worker, then on the
+        master (or first) worker persists the index, gathers scenario
+        details, creates a JSON file with collection details, and logs
+        the collection details.
         """
+        collection_index = CollectionIndex()
+        index_entries = collection_index.build(self.session.items)
         if self.session_store.worker_id in ["master", "gw0"]:
             self.logger.info(f"Worker ID : {self.session_store.worker_id}")
+            collection_index.save()
             test_details = [
-                ItemAttributeAccessor(item_).get_properties() for item_ in self.session.items
+                {
+                    key: index_entries[item_.nodeid][key]
+                    for key in ("name", "nodeId", "tags", "testType")
+                }
+                for item_ in self.session.items
             ]
 
             # Count different test types
@@ -0,0 +1,148 @@
+"""This module contains the PytestCollectionModifyItems class which is used to
+reorder and distribute the collected items in Pytest."""
+
+from cafex_core.handlers.file_handler import FileHandler
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.duration_scheduler import DurationScheduler
+from cafex_core.utils.fast_feedback_orderer import FastFeedbackOrderer
+
+from .hook_util import HookUtil
+
+
+class PytestCollectionModifyItems:
+    """A class that handles the collection modifyitems hook in Pytest.
+
+    Duration scheduling is configured in config.yml:
+
+        'duration_scheduling':
+          'enabled': true
+          'history_runs': 5
+          'default_duration': null
+          'group_browser_tests': true
+
+    Fast feedback ordering is configured in config.yml:
+
+        'fast_feedback_ordering':
+          'enabled': true
+          'failed_first': true
+          'changed_first': true
+          'history_runs': 5
+
+    Attributes:
+        session (Session): The pytest session object.
+        config (Config): The pytest config object.
+        items (list): The collected pytest items.
+        session_store (SessionStore): The session store object.
+        logger (Logger): The logger object.
+
+    Methods:
+        collection_modifyitems_hook: The collection modifyitems hook method.
+        apply_duration_scheduling: Orders or groups the items by estimated duration.
+        apply_fast_feedback_ordering: Orders the items failed first, changed second.
+    """
+
+    def __init__(self, session, config, items):
+        """Initialize the PytestCollectionModifyItems class.
+
+        Args:
+            session: The pytest session object.
+            config: The pytest config object.
+            items: The collected pytest items.
+        """
+        self.session = session
+        self.config = config
+        self.items = items
+        self.session_store = SessionStore()
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    @property
+    def scheduling_config(self):
+        """Returns the duration_scheduling section of config.yml.
+
+        Returns:
+            dict: The duration scheduling configuration.
+        """
+        base_config = self.session_store.base_config or {}
+        return base_config.get("duration_scheduling") or {}
+
+    @property
+    def ordering_config(self):
+        """Returns the fast_feedback_ordering section of config.yml.
+
+        Returns:
+            dict: The fast feedback ordering configuration.
+        """
+        base_config = self.session_store.base_config or {}
+        return base_config.get("fast_feedback_ordering") or {}
+
+    def collection_modifyitems_hook(self):
+        """The collection modifyitems hook method that is called after the
+        items are collected.
+
+        It applies duration scheduling when it is enabled and the run is
+        distributed across xdist workers, then fast feedback ordering when
+        it is enabled. The xdist groups assigned by duration scheduling are
+        kept; only the order in which the items are handed out changes.
+        """
+        if self.scheduling_config.get("enabled", False):
+            self.apply_duration_scheduling()
+        if self.ordering_config.get("enabled", False):
+            self.apply_fast_feedback_ordering()
+
+    def apply_duration_scheduling(self):
+        """Orders or groups the items by their estimated duration.
+
+        With ``--dist loadgroup`` the items are bin-packed into one
+        xdist group per worker; otherwise they are ordered longest
+        first.
+        """
+        worker_count = int(HookUtil.workers_count() or 0)
+        if worker_count < 2:
+            return
+        try:
+            scheduler = DurationScheduler.from_history(
+                self.session_store.result_dir,
+                self.scheduling_config.get("history_runs", 5),
+                self.scheduling_config.get("default_duration"),
+            )
+            if not scheduler.estimates:
+                self.logger.info("Duration scheduling skipped: no execution history found")
+                return
+            if self.config.getoption("loadgroup", False):
+                scheduler.assign_groups(
+                    self.items,
+                    worker_count,
+                    self.scheduling_config.get("group_browser_tests", True),
+                )
+            else:
+                scheduler.order_items(self.items)
+        except Exception as e:
+            self.logger.error(f"Error in apply_duration_scheduling: {e}")
+
+    def apply_fast_feedback_ordering(self):
+        """Orders the items failed first, changed second, then shortest first.
+
+        The current source file hashes are written to the temp execution
+        directory by a single process and moved into the run index at
+        session finish, so an interrupted run does not hide its changes
+        from the next one.
+        """
+        try:
+            orderer = FastFeedbackOrderer.from_history(
+                self.session_store.result_dir,
+                self.ordering_config.get("history_runs", 5),
+            )
+            source_hashes = orderer.order_items(
+                self.items,
+                self.ordering_config.get("failed_first", True),
+                self.ordering_config.get("changed_first", True),
+            )
+            if self.session_store.worker_id in ["master", "gw0"]:
+                FileHandler.create_json_file(
+                    self.session_store.temp_execution_dir,
+                    FastFeedbackOrderer.FILE_NAME,
+                    source_hashes,
+                )
+        except Exception as e:
+            self.logger.error(f"Error in apply_fast_feedback_ordering: {e}")
@@ -4,12 +4,10 @@ the setup of a test run in Pytest.
 It includes methods to initialize the class and run the setup.
 """
 
-import inspect
-
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.collection_index import CollectionIndex
 from cafex_core.utils.date_time_utils import DateTimeActions
-from cafex_core.utils.item_attribute_accessor import ItemAttributeAccessor
 
 
 class PytestRunTestSetup:
@@ -18,7 +16,7 @@ class PytestRunTestSetup:
     Attributes:
         item_ (Item): The pytest item object.
         logger (Logger): The logger object.
-        item_attribute_accessor (ItemAttributeAccessor): An attribute accessor for the item.
+        test_metadata (dict): The collection index entry of the item.
         session_store (SessionStore): The session store object.
 
     Methods:
@@ -34,7 +32,7 @@ class PytestRunTestSetup:
         """
         self.item_ = item_
         self.logger = CoreLogger(name=__name__).get_logger()
-        self.item_attribute_accessor = None
+        self.test_metadata = None
         self.session_store = SessionStore()
         self.date_time_util = DateTimeActions()
 
@@ -45,12 +43,13 @@ class PytestRunTestSetup:
         item is a BDD scenario. It also updates the reporting attribute
         of the session store.
         """
-        self.item_attribute_accessor = ItemAttributeAccessor(self.item_)
+        self.test_metadata = CollectionIndex().get(self.item_)
 
         test_name = self.item_.name
         node_id = self.item_.nodeid
-        tags = list(self.item_attribute_accessor.tags)
-        test_type = self.item_attribute_accessor.test_type
+        tags = list(self.test_metadata["tags"])
+        test_type = self.test_metadata["testType"]
+        is_scenario = self.test_metadata["isScenario"]
         self.logger.info(f"Running test : {test_name}")
         self.logger.info(f"Node Id : {node_id}")
         self.logger.info(f"tags : {tags}")
@@ -78,32 +77,20 @@ class PytestRunTestSetup:
                 "evidence": {"screenshots": [], "exceptions": [], "errorMessages": []},
             }
 
-            if test_type == "pytest":
-                is_parametrized = hasattr(self.item_, "callspec") and self.item_.callspec.params
+            if test_type in ("pytest", "unittest"):
                 test_data.update(
                     {
-                        "isDataDriven": True if is_parametrized else False,
+                        "isDataDriven": self.test_metadata["isDataDriven"],
                         "isOutline": False,  # Regular pytest tests are never outlines
-                        "example": str(self.item_.callspec.params) if is_parametrized else None,
+                        "example": self.test_metadata["example"],
                     }
                 )
-            if test_type == "unittest":
-                # Check if the test method uses subTest
-                test_method = getattr(self.item_.cls, self.item_.name)
-                if "self.subTest" in inspect.getsource(test_method):
-                    test_data.update(
-                        {
-                            "isDataDriven": True,
-                            "isOutline": False,
-                            "example": "unittest with subTest",
-                        }
-                    )
 
             self.session_store.reporting["tests"][node_id] = test_data
 
         if hasattr(self.item_.function, "pytestmark"):
             for marker in self.item_.function.pytestmark:
-                if marker.name == "ui_web" and not self.item_attribute_accessor.is_scenario:
+                if marker.name == "ui_web" and not is_scenario:
                     from cafex_ui.web_client.ui_web_driver_initializer import (
                         WebDriverInitializer,
                     )
@@ -111,7 +98,19 @@ class PytestRunTestSetup:
                     self.logger.info("Setting up web driver for non-BDD test.")
                     self.session_store.ui_scenario = True
                     WebDriverInitializer().initialize_driver()
-                if marker.name == "mobile_app" and not self.item_attribute_accessor.is_scenario:
+                if marker.name == "playwright_web" and not is_scenario:
+                    from cafex_ui.web_client.playwright_context_pool import (
+                        PlaywrightContextPool,
+                    )
+                    from cafex_ui.web_client.ui_web_driver_initializer import (
+                        WebDriverInitializer,
+                    )
+
+                    if PlaywrightContextPool.is_enabled():
+                        self.logger.info("Opening Playwright context for non-BDD test.")
+                        self.session_store.playwright_ui_scenario = True
+                        WebDriverInitializer().initialize_playwright_driver()
+                if marker.name == "mobile_app" and not is_scenario:
                     from cafex_ui.mobile_client.mobile_driver_initializer import (
                         MobileDriverInitializer,
                     )
@@ -119,7 +118,7 @@ class PytestRunTestSetup:
                     self.logger.info("Setting up mobile driver for non-BDD test.")
                     self.session_store.mobile_ui_scenario = True
                     MobileDriverInitializer().initialize_driver()
-                if marker.name == "ui_desktop_client" and not self.item_attribute_accessor.is_scenario:
+                if marker.name == "ui_desktop_client" and not is_scenario:
                     from cafex_desktop.desktop_client.desktop_client_driver_initializer \
                         import DesktopClientDriverInitializer
                     self.logger.info("Setting up Desktop Client Handler for non-BDD test.")
@@ -0,0 +1,60 @@
+"""This module contains the PytestRunTestTeardown class which is used to handle
+the teardown of a test run in Pytest."""
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.collection_index import CollectionIndex
+
+
+class PytestRunTestTeardown:
+    """A class that handles the teardown of a test run in Pytest.
+
+    Attributes:
+        item_ (Item): The pytest item object.
+        logger (Logger): The logger object.
+        session_store (SessionStore): The session store object.
+
+    Methods:
+        __init__: Initializes the PytestRunTestTeardown class.
+        run_teardown: Runs the teardown.
+    """
+
+    def __init__(self, item_):
+        """Initialize the PytestRunTestTeardown class.
+
+        Args:
+            item_: The pytest item object.
+        """
+        self.item_ = item_
+        self.logger = CoreLogger(name=__name__).get_logger()
+        self.session_store = SessionStore()
+
+    def run_teardown(self):
+        """Runs the teardown.
+
+        When the web driver pool is enabled, the driver of a non-BDD
+        ui_web test is reset and returned to the pool so the next test on
+        this worker can reuse it. Otherwise nothing is done here, and the
+        driver is quit at session finish as before. BDD scenarios release
+        their driver in the after scenario hook.
+
+        Likewise, the Playwright context of a non-BDD playwright_web test is closed
+        when the Playwright context pool is enabled.
+        """
+        try:
+            if CollectionIndex().get(self.item_)["isScenario"]:
+                return
+            markers = {marker.name for marker in getattr(self.item_.function, "pytestmark", [])}
+            if "ui_web" in markers and self.session_store.storage.get("driver") is not None:
+                from cafex_ui.web_client.web_driver_pool import WebDriverPool
+
+                if WebDriverPool.is_enabled():
+                    WebDriverPool().release(self.session_store.driver)
+                    self.session_store.driver = None
+            if "playwright_web" in markers:
+                from cafex_ui.web_client.playwright_context_pool import PlaywrightContextPool
+
+                if PlaywrightContextPool.is_enabled():
+                    PlaywrightContextPool().close_context()
+        except Exception as e:
+            self.logger.error(f"Error in run_teardown: {e}")
@@ -8,6 +8,7 @@ session finish event and saving the session report to a JSON file.
 
 import hashlib
 import os
+import time
 from datetime import datetime
 
 import xdist
@@ -17,6 +18,9 @@ from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.reporting_.report_generator import ReportGenerator
 from cafex_core.singletons_.session_ import SessionStore
 from cafex_core.utils.date_time_utils import DateTimeActions
+from cafex_core.utils.fast_feedback_orderer import FastFeedbackOrderer
+from cafex_core.utils.phase_timer import LOCATOR_TIMINGS, PhaseTimer
+from cafex_core.utils.run_index import RunIndex
 
 
 class PytestSessionFinish:
@@ -50,6 +54,8 @@ class PytestSessionFinish:
         self.tests_data = []
         self.execution_data = {}
         self.collection_data = {}
+        self.phase_timer = PhaseTimer()
+        self.start_time = time.perf_counter()
 
     def session_finish_(self):
         """
@@ -62,6 +68,8 @@ class PytestSessionFinish:
         self.scenarios_folder = self.session_store.temp_execution_dir + os.sep + "scenarios"
         if not os.path.exists(self.scenarios_folder):
             os.makedirs(self.scenarios_folder)
+        if self.timing_config.get("per_test", False):
+            self.add_per_test_timings()
         for node_id in self.session_store.reporting["tests"]:
             # Create a simple, unique filename using just the test module and a hash
             # Create a short hash of the node_id for uniqueness
@@ -82,6 +90,54 @@ class PytestSessionFinish:
             self.logger.info("Combining all files")
             self.combine_all_tests_data()
             self.generate_report()
+        elif self.timing_config.get("enabled", True):
+            self.save_phase_timings()
+
+    @property
+    def timing_config(self):
+        """Returns the phase_timing section of config.yml.
+
+        Returns:
+            dict: The phase timing configuration.
+        """
+        base_config = self.session_store.base_config or {}
+        return base_config.get("phase_timing") or {}
+
+    def slowest_locators(self, locator_timings):
+        """Returns the locators with the highest p95 lookup time.
+
+        Args:
+            locator_timings (dict): The aggregated lookup timings, keyed by locator.
+
+        Returns:
+            dict: At most timing_config['slowest_locators'] entries (default 20),
+            slowest first.
+        """
+        limit = int(self.timing_config.get("slowest_locators", 20))
+        ordered = sorted(
+            locator_timings.items(), key=lambda item: item[1]["p95Seconds"], reverse=True
+        )
+        return dict(ordered[:limit])
+
+    def add_per_test_timings(self):
+        """Adds the framework time spent on each test, per phase, to its test data."""
+        for node_id, timings in self.phase_timer.per_test.items():
+            if node_id in self.session_store.reporting["tests"]:
+                self.session_store.reporting["tests"][node_id]["frameworkTimings"] = {
+                    phase: round(seconds, 3) for phase, seconds in sorted(timings.items())
+                }
+
+    def save_phase_timings(self):
+        """Records the time spent in session finish so far and writes the phase
+        timings of this process to the temp execution directory."""
+        try:
+            self.phase_timer.record("session_finish", time.perf_counter() - self.start_time)
+            self.phase_timer.save(self.session_store.temp_execution_dir)
+            locator_timer = PhaseTimer(LOCATOR_TIMINGS)
+            if locator_timer.samples:
+                locator_timer.save(self.session_store.temp_execution_dir)
+        except Exception as e:
+            self.logger.error("Error in saving phase timings: %s", e)
 
     def combine_all_tests_data(self):
         """
@@ -137,6 +193,16 @@ class PytestSessionFinish:
         )
 
         self.execution_data.update({"executionStatus": self.find_execution_status(self.tests_data)})
+        if self.timing_config.get("enabled", True):
+            self.save_phase_timings()
+            self.execution_data.update(
+                {"frameworkTimings": PhaseTimer.aggregate(self.phase_timer.load_samples())}
+            )
+            locator_timings = self.slowest_locators(
+                PhaseTimer.aggregate(PhaseTimer(LOCATOR_TIMINGS).load_samples())
+            )
+            if locator_timings:
+                self.execution_data.update({"locatorTimings": locator_timings})
 
         restructured_tests = self.restructure_tests_data(self.tests_data)
         # Combine all test data into a single dictionary
@@ -150,9 +216,29 @@ class PytestSessionFinish:
         self.file_handler.create_json_file(
             self.session_store.execution_dir, "result.json", report_data
         )
+        self.update_run_index(report_data)
         ReportGenerator.prepare_report_viewer(self.session_store.execution_dir)
         self.folder_handler.delete_folder(self.session_store.temp_dir)
 
+    def update_run_index(self, report_data):
+        """
+        Ingests the report data into the run index kept in the result directory,
+        along with the source file hashes recorded by fast feedback ordering.
+
+        Args:
+            report_data (dict): The combined report data written to result.json.
+        """
+        try:
+            run_index = RunIndex(self.session_store.result_dir)
+            run_index.ingest_run(report_data)
+            hashes_file = os.path.join(
+                self.session_store.temp_execution_dir, FastFeedbackOrderer.FILE_NAME
+            )
+            if os.path.exists(hashes_file):
+                run_index.save_source_hashes(self.file_handler.read_data_from_json_file(hashes_file))
+        except Exception as e:
+            self.logger.error("Error in updating run index: %s", e)
+
     def find_execution_status(self, tests_data):
         """
         Determines the overall execution status based on individual test results.
@@ -188,6 +274,12 @@ class PytestSessionFinish:
             mobile_driver = self.session_store.storage.get("mobile_driver")
             handler = self.session_store.storage.get("handler")
             playwright_browser = self.session_store.storage.get("playwright_browser")
+            web_driver_pool = self.session_store.storage.get("web_driver_pool")
+            if web_driver_pool is not None:
+                if driver is web_driver_pool.driver:
+                    driver = None
+                web_driver_pool.shutdown()
+                self.logger.info("Pooled driver quit successfully")
             if driver is not None:
                 driver.quit()
                 self.logger.info("Driver quit successfully")
@@ -239,6 +331,11 @@ class PytestSessionFinish:
 
         """
         try:
+            playwright_context_pool = self.session_store.storage.get("playwright_context_pool")
+            if playwright_context_pool is not None:
+                playwright_context_pool.shutdown()
+                self.logger.info("Playwright browser pool closed successfully")
+                return
             if self.session_store.playwright_browser is not None:
                 self.session_store.playwright_browser.close()
                 self.session_store.playwright_browser = None
@@ -0,0 +1,188 @@
+"""This module contains the PhaseTimer class which measures the time CAFEX
+itself spends in its hooks, driver creation and screenshot capture."""
+
+import math
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from cafex_core.handlers.file_handler import FileHandler
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+
+LOCATOR_TIMINGS = "locator_timings"
+"""The name of the timer recording web element lookups, keyed by locator."""
+
+
+class PhaseTimer:
+    """A class that records and aggregates framework phase timings.
+
+    Every process records its own samples in the session store. At
+    session finish each process writes them to the phase_timings folder
+    of the temp execution directory, and the master process aggregates
+    the files of all workers into executionInfo. A timer created with
+    another name keeps its samples and folder apart, e.g. for locator
+    lookups.
+
+    Attributes:
+        name (str): The name of the samples and of their folder.
+        session_store (SessionStore): The session store object.
+        logger (Logger): The logger object.
+
+    Methods:
+        timed: Decorator that records the duration of a function.
+        measure: Context manager that records the duration of a block.
+        record: Records one sample of a phase.
+        save: Writes the samples of this process to the temp execution directory.
+        load_samples: Reads and merges the samples of all processes.
+        aggregate: Returns count, total and p95 of each phase.
+    """
+
+    FOLDER_NAME = "phase_timings"
+
+    def __init__(self, name=None):
+        """Initialize the PhaseTimer class.
+
+        Args:
+            name (str, optional): The name of the samples and of their folder.
+                Defaults to phase_timings.
+        """
+        self.name = name or self.FOLDER_NAME
+        self.session_store = SessionStore()
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    @property
+    def samples(self):
+        """Returns the samples recorded by this process.
+
+        Returns:
+            dict: The durations in seconds, keyed by phase.
+        """
+        return self.session_store.storage.setdefault(self.name, {})
+
+    @property
+    def per_test(self):
+        """Returns the phase totals of each test recorded by this process.
+
+        Returns:
+            dict: The seconds per phase, keyed by node id.
+        """
+        return self.session_store.storage.setdefault(f"{self.name}_per_test", {})
+
+    @classmethod
+    def timed(cls, phase):
+        """Decorator that records the duration of each call of a function.
+
+        Args:
+            phase (str): The phase name.
+
+        Returns:
+            function: The decorator.
+        """
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with cls().measure(phase):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @contextmanager
+    def measure(self, phase):
+        """Context manager that records the duration of a block.
+
+        The sample is attributed to the test running when the block
+        starts, or else to the test running when it ends.
+
+        Args:
+            phase (str): The phase name.
+        """
+        node_id = self.session_store.current_test
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(
+                phase, time.perf_counter() - start, node_id or self.session_store.current_test
+            )
+
+    def record(self, phase, seconds, node_id=None):
+        """Records one sample of a phase.
+
+        Args:
+            phase (str): The phase name.
+            seconds (float): The duration in seconds.
+            node_id (str, optional): The test the sample belongs to.
+        """
+        self.samples.setdefault(phase, []).append(seconds)
+        if node_id is not None:
+            test_timings = self.per_test.setdefault(node_id, {})
+            test_timings[phase] = test_timings.get(phase, 0.0) + seconds
+
+    def save(self, directory=None):
+        """Writes the samples of this process to the phase_timings folder.
+
+        Args:
+            directory (str, optional): The temp execution directory. Defaults
+                to the one of the current session.
+        """
+        folder = os.path.join(
+            directory or self.session_store.temp_execution_dir, self.name
+        )
+        os.makedirs(folder, exist_ok=True)
+        worker_id = self.session_store.storage.get("worker_id", "master")
+        FileHandler.create_json_file(folder, f"{worker_id}.json", self.samples)
+
+    def load_samples(self, directory=None):
+        """Reads and merges the samples written by all processes.
+
+        Args:
+            directory (str, optional): The temp execution directory. Defaults
+                to the one of the current session.
+
+        Returns:
+            dict: The durations in seconds, keyed by phase.
+        """
+        folder = os.path.join(
+            directory or self.session_store.temp_execution_dir, self.name
+        )
+        merged = {}
+        if not os.path.isdir(folder):
+            return merged
+        for file_name in sorted(os.listdir(folder)):
+            try:
+                samples = FileHandler.read_data_from_json_file(os.path.join(folder, file_name))
+            except ValueError as e:
+                self.logger.warning(f"Skipping unreadable phase timings file: {e}")
+                continue
+            for phase, values in samples.items():
+                merged.setdefault(phase, []).extend(values)
+        return merged
+
+    @staticmethod
+    def aggregate(samples):
+        """Returns the count, total and 95th percentile of each phase.
+
+        The percentile uses the nearest-rank method.
+
+        Args:
+            samples (dict): The durations in seconds, keyed by phase.
+
+        Returns:
+            dict: Dictionaries with count, totalSeconds and p95Seconds, keyed by phase.
+        """
+        summary = {}
+        for phase, values in sorted(samples.items()):
+            if not values:
+                continue
+            ordered = sorted(values)
+            summary[phase] = {
+                "count": len(ordered),
+                "totalSeconds": round(sum(ordered), 3),
+                "p95Seconds": round(ordered[math.ceil(0.95 * len(ordered)) - 1], 3),
+            }
+        return summary
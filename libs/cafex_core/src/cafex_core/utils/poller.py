@@ -0,0 +1,108 @@
+"""This module contains the Poller class which waits until a condition holds,
+polling with a growing interval up to a deadline."""
+
+import time
+
+from cafex_core.logging.logger_ import CoreLogger
+
+
+class Poller:
+    """A reusable wait-until engine.
+
+    The first probe runs immediately. The interval then starts at
+    ``initial_interval`` and grows by ``backoff`` up to ``max_interval``,
+    so fast state changes are seen quickly and slow ones do not flood the
+    server. No sleep goes past the deadline, and the condition is probed
+    one last time when it is reached.
+
+    Attributes:
+        timeout (float): The maximum total seconds to wait.
+        initial_interval (float): The first wait in seconds between probes.
+        max_interval (float): The maximum wait in seconds between probes.
+        backoff (float): The factor applied to the interval after each probe.
+        logger (Logger): The logger object.
+
+    Methods:
+        intervals: Yields the waits between probes.
+        wait: Probes one value until a condition holds.
+        wait_all: Probes many values with one call per tick until each holds.
+    """
+
+    def __init__(self, timeout=60.0, initial_interval=0.5, max_interval=5.0, backoff=1.5,
+                 sleep=None, clock=None):
+        """Initialize the Poller class.
+
+        Args:
+            timeout (float): The maximum total seconds to wait.
+            initial_interval (float): The first wait in seconds between probes.
+            max_interval (float): The maximum wait in seconds between probes.
+            backoff (float): The factor applied to the interval after each probe.
+            sleep (function, optional): The function used to wait. Defaults to time.sleep.
+            clock (function, optional): The monotonic clock used for the deadline.
+                Defaults to time.monotonic.
+        """
+        if initial_interval <= 0 or max_interval <= 0:
+            raise ValueError("Polling intervals must be greater than 0")
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max(max_interval, initial_interval)
+        self.backoff = max(backoff, 1.0)
+        self.sleep = sleep or time.sleep
+        self.clock = clock or time.monotonic
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    def intervals(self):
+        """Yields the waits between probes.
+
+        Yields:
+            float: The next wait in seconds.
+        """
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def wait(self, probe, condition):
+        """Probes one value until a condition holds or the deadline passes.
+
+        Args:
+            probe (function): Returns the current value.
+            condition (function): Returns True when the value is the awaited one.
+
+        Returns:
+            tuple: Whether the condition held, the last value, and a dictionary
+            with the polls and seconds spent.
+        """
+        met, values, stats = self.wait_all(lambda: {None: probe()}, condition, [None])
+        return met, values.get(None), stats
+
+    def wait_all(self, probe_all, condition, keys):
+        """Probes many values with one call per tick until each holds.
+
+        Args:
+            probe_all (function): Returns the current values, keyed like ``keys``.
+                Keys it omits count as not yet ready.
+            condition (function): Returns True when a value is the awaited one.
+            keys (list): The keys to wait for.
+
+        Returns:
+            tuple: Whether the condition held for every key, the last value of
+            each key, and a dictionary with the polls, seconds and pending keys.
+        """
+        pending = list(keys)
+        values = {}
+        polls = 0
+        start = self.clock()
+        deadline = start + self.timeout
+        for interval in self.intervals():
+            current = probe_all()
+            polls += 1
+            values.update({key: current[key] for key in pending if key in current})
+            pending = [key for key in pending if key not in current or not condition(current[key])]
+            remaining = deadline - self.clock()
+            if not pending or remaining <= 0:
+                break
+            self.sleep(min(interval, remaining))
+        stats = {"polls": polls, "seconds": round(self.clock() - start, 3), "pending": pending}
+        self.logger.debug("Polling finished after %s polls, pending: %s", polls, pending)
+        return not pending, values, stats
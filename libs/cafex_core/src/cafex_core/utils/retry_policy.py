@@ -0,0 +1,204 @@
+"""This module contains the RetryPolicy class which retries HTTP calls with
+exponential backoff, jitter, Retry-After support and an overall deadline."""
+
+import copy
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from cafex_core.logging.logger_ import CoreLogger
+from urllib3.exceptions import NewConnectionError
+
+
+class RetryPolicy:
+    """A reusable retry policy for HTTP calls.
+
+    A call is retried when it raises one of ``retry_on_exceptions`` or
+    returns a response whose status code is in ``retry_on_status``. The
+    wait before retry ``n`` is ``backoff_factor * 2 ** (n - 1)`` seconds,
+    capped at ``max_backoff``; with jitter a random wait between zero and
+    that value is used, so parallel clients do not retry in lockstep. A
+    Retry-After header on the response takes precedence, also capped at
+    ``max_backoff``. No wait goes past the deadline.
+
+    Only the methods in ``retry_methods`` are retried in full. A request
+    with another method, such as POST, may have been applied by the server
+    before the error, so ``for_method`` only retries it on connection errors
+    raised before it was sent. Add the method to ``retry_methods`` to retry
+    it in full.
+
+    Attributes:
+        max_attempts (int): The maximum number of attempts, including the first.
+        backoff_factor (float): The base wait in seconds.
+        max_backoff (float): The maximum wait in seconds between attempts.
+        jitter (bool): Whether to randomize the waits.
+        retry_on_status (tuple): The status codes that are retried.
+        retry_on_exceptions (tuple): The exception classes that are retried.
+        respect_retry_after (bool): Whether to honor the Retry-After header.
+        deadline (float): The maximum total seconds spent on a call, or None.
+        retry_methods (tuple): The HTTP methods that are retried in full.
+        connect_errors_only (bool): Whether only errors raised before the request
+            was sent are retried.
+        logger (Logger): The logger object.
+
+    Methods:
+        backoff: Returns the wait before a retry.
+        retry_after: Returns the wait requested by a response.
+        is_connect_error: Returns whether an error was raised before the request was sent.
+        for_method: Returns the policy to use for an HTTP method.
+        execute: Calls a function until it succeeds or the policy gives up.
+    """
+
+    RETRY_ON_STATUS = (429, 502, 503, 504)
+    RETRY_ON_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=30.0, jitter=True,
+                 retry_on_status=RETRY_ON_STATUS, retry_on_exceptions=RETRY_ON_EXCEPTIONS,
+                 respect_retry_after=True, deadline=None, sleep=time.sleep,
+                 retry_methods=IDEMPOTENT_METHODS, connect_errors_only=False):
+        """Initialize the RetryPolicy class.
+
+        Args:
+            max_attempts (int): The maximum number of attempts, including the first.
+            backoff_factor (float): The base wait in seconds.
+            max_backoff (float): The maximum wait in seconds between attempts.
+            jitter (bool): Whether to randomize the waits.
+            retry_on_status (tuple): The status codes that are retried.
+            retry_on_exceptions (tuple): The exception classes that are retried.
+            respect_retry_after (bool): Whether to honor the Retry-After header.
+            deadline (float, optional): The maximum total seconds spent on a call.
+            sleep (function): The function used to wait.
+            retry_methods (tuple): The HTTP methods that are retried in full.
+            connect_errors_only (bool): Whether only errors raised before the
+                request was sent are retried.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on_status = tuple(retry_on_status)
+        self.retry_on_exceptions = tuple(retry_on_exceptions)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self.sleep = sleep
+        self.retry_methods = tuple(method.upper() for method in retry_methods)
+        self.connect_errors_only = connect_errors_only
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    def backoff(self, retry):
+        """Returns the wait before a retry.
+
+        Args:
+            retry (int): The retry number, starting at 1.
+
+        Returns:
+            float: The wait in seconds.
+        """
+        wait = min(self.max_backoff, self.backoff_factor * 2 ** (retry - 1))
+        return random.uniform(0, wait) if self.jitter else wait
+
+    @staticmethod
+    def retry_after(response):
+        """Returns the wait requested by the Retry-After header of a response.
+
+        Args:
+            response (requests.Response): The response.
+
+        Returns:
+            float: The wait in seconds, or None if the header is absent or invalid.
+        """
+        value = getattr(response, "headers", {}).get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def is_connect_error(error):
+        """Returns whether an error was raised before the request was sent.
+
+        Args:
+            error (Exception): The error of the call.
+
+        Returns:
+            bool: True for connect timeouts and refused or unresolved connections.
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectionError) and isinstance(
+            reason, NewConnectionError)
+
+    def for_method(self, method):
+        """Returns the policy to use for an HTTP method.
+
+        Args:
+            method (str): The HTTP method of the request.
+
+        Returns:
+            RetryPolicy: This policy if the method is retried in full, otherwise a
+            copy that only retries connection errors raised before sending.
+        """
+        if method.upper() in self.retry_methods:
+            return self
+        policy = copy.copy(self)
+        policy.retry_on_status = ()
+        policy.connect_errors_only = True
+        return policy
+
+    def execute(self, func, *args, **kwargs):
+        """Calls a function until it succeeds or the policy gives up.
+
+        When the policy gives up, the last response is returned or the
+        last exception is raised.
+
+        Args:
+            func (function): The function performing the call.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            tuple: The result of the function and a dictionary with the
+            attempts, retries and waitSeconds of the call.
+        """
+        stats = {"attempts": 0, "retries": 0, "waitSeconds": 0.0}
+        start = time.monotonic()
+        while True:
+            stats["attempts"] += 1
+            response, error = None, None
+            try:
+                response = func(*args, **kwargs)
+            except self.retry_on_exceptions as e:
+                if self.connect_errors_only and not self.is_connect_error(e):
+                    raise e
+                error = e
+            if error is None and getattr(response, "status_code", None) not in self.retry_on_status:
+                return response, stats
+            wait = self.retry_after(response) if self.respect_retry_after else None
+            if wait is not None:
+                wait = min(wait, self.max_backoff)
+            else:
+                wait = self.backoff(stats["attempts"])
+            elapsed = time.monotonic() - start
+            if stats["attempts"] >= self.max_attempts or (
+                    self.deadline is not None and elapsed + wait > self.deadline):
+                if error is not None:
+                    raise error
+                return response, stats
+            self.logger.info(
+                "Retrying in %.2fs after %s (attempt %s of %s)", wait,
+                error or f"status {response.status_code}", stats["attempts"], self.max_attempts
+            )
+            self.sleep(wait)
+            stats["retries"] += 1
+            stats["waitSeconds"] += wait
@@ -0,0 +1,116 @@
+"""This module contains the RunHistory class which reads the results of past
+executions archived under result/history."""
+
+import os
+import re
+from statistics import median
+
+from cafex_core.handlers.file_handler import FileHandler
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+
+
+class RunHistory:
+    """A class that reads per-test data from archived result.json files.
+
+    Attributes:
+        result_dir (str): The result directory containing the history folder.
+        file_handler (FileHandler): The file handler object.
+        logger (Logger): The logger object.
+
+    Methods:
+        get_result_files: Returns the archived result.json paths, newest first.
+        iter_runs: Yields the flattened test data of each archived run.
+        get_duration_estimates: Returns the median duration of each test.
+        normalize_node_id: Strips the xdist group suffix from a node id.
+    """
+
+    XDIST_GROUP_SUFFIX = re.compile(r"@[^\[\]/:@]+$")
+
+    def __init__(self, result_dir=None):
+        """Initialize the RunHistory class.
+
+        Args:
+            result_dir (str, optional): The result directory. Defaults to the
+                result directory of the current session.
+        """
+        self.result_dir = result_dir or SessionStore().storage.get("result_dir")
+        self.file_handler = FileHandler()
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    @property
+    def history_dir(self):
+        """Returns the path of the history folder.
+
+        Returns:
+            str: The path of the history folder.
+        """
+        return os.path.join(self.result_dir, "history")
+
+    def get_result_files(self, max_runs=None):
+        """Returns the archived result.json paths, newest first.
+
+        Args:
+            max_runs (int, optional): The maximum number of runs to return.
+
+        Returns:
+            list: The paths of the archived result.json files.
+        """
+        if self.result_dir is None or not os.path.isdir(self.history_dir):
+            return []
+        run_dirs = [
+            os.path.join(self.history_dir, d)
+            for d in os.listdir(self.history_dir)
+            if os.path.isfile(os.path.join(self.history_dir, d, "result.json"))
+        ]
+        run_dirs.sort(key=os.path.getctime, reverse=True)
+        return [os.path.join(d, "result.json") for d in run_dirs[:max_runs]]
+
+    def iter_runs(self, max_runs=None):
+        """Yields the flattened test data of each archived run, newest first.
+
+        Unreadable result files are logged and skipped.
+
+        Args:
+            max_runs (int, optional): The maximum number of runs to read.
+
+        Yields:
+            list: The test data dictionaries of one run.
+        """
+        for result_file in self.get_result_files(max_runs):
+            try:
+                tests = self.file_handler.read_data_from_json_file(result_file).get("tests", {})
+            except ValueError as e:
+                self.logger.warning(f"Skipping unreadable result file: {e}")
+                continue
+            yield [test for tests_of_type in tests.values() for test in tests_of_type]
+
+    def get_duration_estimates(self, max_runs=5):
+        """Returns the median duration of each test over the recent runs.
+
+        Args:
+            max_runs (int): The number of recent runs to consider.
+
+        Returns:
+            dict: The estimated duration in seconds, keyed by node id.
+        """
+        durations = {}
+        for tests in self.iter_runs(max_runs):
+            for test in tests:
+                duration = test.get("durationSeconds")
+                if duration is not None:
+                    node_id = self.normalize_node_id(test["nodeId"])
+                    durations.setdefault(node_id, []).append(float(duration))
+        return {node_id: median(values) for node_id, values in durations.items()}
+
+    @classmethod
+    def normalize_node_id(cls, node_id):
+        """Strips the suffix xdist appends to node ids under --dist loadgroup.
+
+        Args:
+            node_id (str): The node id.
+
+        Returns:
+            str: The node id without the xdist group suffix.
+        """
+        return cls.XDIST_GROUP_SUFFIX.sub("", node_id)
@@ -0,0 +1,360 @@
+"""This module contains the RunIndex class which keeps a compact SQLite index
+of past executions in the result directory.
+
+Each execution's per-test status and duration, step durations and
+execution info are ingested once at session finish, so trend queries
+such as the slowest tests, duration regressions and flaky tests no
+longer need to load the archived result.json files.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from statistics import median
+
+from cafex_core.handlers.file_handler import FileHandler
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.utils.run_history import RunHistory
+
+
+class RunIndex:
+    """A class that ingests and queries the historical run index.
+
+    Attributes:
+        db_path (str): The path of the SQLite database file.
+        logger (Logger): The logger object.
+
+    Methods:
+        ingest_run: Ingests the report data of one execution.
+        ingest_result_file: Ingests an archived result.json file.
+        get_execution_ids: Returns the ids of the recent executions.
+        get_duration_estimates: Returns the median duration of each test.
+        get_last_run_statuses: Returns the test statuses of the latest execution.
+        slowest_tests: Returns the slowest tests of the recent executions.
+        duration_regressions: Returns the tests that got slower in the latest execution.
+        flaky_tests: Returns the tests that both passed and failed recently.
+        get_source_hashes: Returns the recorded source file hashes.
+        save_source_hashes: Stores the source file hashes of an execution.
+    """
+
+    FILE_NAME = "run_index.db"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            execution_id TEXT PRIMARY KEY,
+            start_time TEXT,
+            end_time TEXT,
+            duration_seconds REAL,
+            status TEXT,
+            total_passed INTEGER,
+            total_failed INTEGER,
+            execution_info TEXT
+        );
+        CREATE TABLE IF NOT EXISTS test_results (
+            execution_id TEXT,
+            node_id TEXT,
+            name TEXT,
+            test_type TEXT,
+            status TEXT,
+            duration_seconds REAL,
+            PRIMARY KEY (execution_id, node_id)
+        );
+        CREATE TABLE IF NOT EXISTS step_results (
+            execution_id TEXT,
+            node_id TEXT,
+            step_index INTEGER,
+            step_name TEXT,
+            status TEXT,
+            duration_seconds REAL,
+            PRIMARY KEY (execution_id, node_id, step_index)
+        );
+        CREATE TABLE IF NOT EXISTS source_hashes (
+            path TEXT PRIMARY KEY,
+            sha256 TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_test_results_node_id ON test_results (node_id);
+    """
+
+    def __init__(self, result_dir):
+        """Initialize the RunIndex class.
+
+        Args:
+            result_dir (str): The result directory holding the database file.
+        """
+        self.db_path = os.path.join(result_dir, self.FILE_NAME)
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    def exists(self):
+        """Checks whether the database file exists.
+
+        Returns:
+            bool: True if the database file exists, False otherwise.
+        """
+        return os.path.exists(self.db_path)
+
+    def _connect(self):
+        """Opens a connection and makes sure the schema exists.
+
+        Returns:
+            sqlite3.Connection: The database connection.
+        """
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.executescript(self.SCHEMA)
+        return connection
+
+    def ingest_run(self, report_data):
+        """Ingests the report data of one execution.
+
+        Re-ingesting an execution replaces its previous rows.
+
+        Args:
+            report_data (dict): The content of result.json, with the
+                executionInfo and tests keys.
+        """
+        execution_info = report_data.get("executionInfo", {})
+        execution_id = execution_info.get("executionId")
+        if execution_id is None:
+            raise ValueError("executionInfo.executionId is required to ingest a run")
+        tests = [test for tests_of_type in report_data.get("tests", {}).values() for test in tests_of_type]
+        test_rows = []
+        step_rows = []
+        for test in tests:
+            node_id = RunHistory.normalize_node_id(test["nodeId"])
+            test_rows.append(
+                (
+                    execution_id,
+                    node_id,
+                    test.get("name"),
+                    test.get("testType"),
+                    test.get("testStatus"),
+                    test.get("durationSeconds"),
+                )
+            )
+            for step_index, step in enumerate(test.get("steps", [])):
+                step_rows.append(
+                    (
+                        execution_id,
+                        node_id,
+                        step_index,
+                        step.get("stepName"),
+                        step.get("stepStatus"),
+                        step.get("stepDurationSeconds"),
+                    )
+                )
+        with closing(self._connect()) as connection, connection:
+            for table in ("runs", "test_results", "step_results"):
+                connection.execute(f"DELETE FROM {table} WHERE execution_id = ?", (execution_id,))
+            connection.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    execution_id,
+                    execution_info.get("executionStartTime"),
+                    execution_info.get("executionEndTime"),
+                    execution_info.get("executionDurationSeconds"),
+                    execution_info.get("executionStatus"),
+                    execution_info.get("totalPassed"),
+                    execution_info.get("totalFailed"),
+                    json.dumps(execution_info),
+                ),
+            )
+            connection.executemany("INSERT INTO test_results VALUES (?, ?, ?, ?, ?, ?)", test_rows)
+            connection.executemany("INSERT INTO step_results VALUES (?, ?, ?, ?, ?, ?)", step_rows)
+
+    def ingest_result_file(self, result_file):
+        """Ingests an archived result.json file.
+
+        Args:
+            result_file (str): The path of the result.json file.
+        """
+        self.ingest_run(FileHandler.read_data_from_json_file(result_file))
+
+    def get_execution_ids(self, runs=None):
+        """Returns the ids of the recent executions, newest first.
+
+        Args:
+            runs (int, optional): The maximum number of executions.
+
+        Returns:
+            list: The execution ids.
+        """
+        if not self.exists():
+            return []
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT execution_id FROM runs ORDER BY start_time DESC LIMIT ?",
+                (-1 if runs is None else runs,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _get_test_rows(self, execution_ids):
+        """Returns node id, execution id, status and duration of the given
+        executions, ordered newest execution first.
+
+        Args:
+            execution_ids (list): The execution ids, newest first.
+
+        Returns:
+            list: The (node_id, execution_id, status, duration_seconds) rows.
+        """
+        if not execution_ids:
+            return []
+        placeholders = ", ".join("?" * len(execution_ids))
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT node_id, execution_id, status, duration_seconds FROM test_results "
+                f"WHERE execution_id IN ({placeholders})",
+                execution_ids,
+            ).fetchall()
+        order = {execution_id: index for index, execution_id in enumerate(execution_ids)}
+        return sorted(rows, key=lambda row: order[row[1]])
+
+    def _get_durations(self, runs):
+        """Returns the durations of each test over the recent executions.
+
+        Args:
+            runs (int): The number of recent executions.
+
+        Returns:
+            dict: The durations, newest first, keyed by node id.
+        """
+        durations = {}
+        for node_id, _, _, duration in self._get_test_rows(self.get_execution_ids(runs)):
+            if duration is not None:
+                durations.setdefault(node_id, []).append(duration)
+        return durations
+
+    def get_duration_estimates(self, runs=5):
+        """Returns the median duration of each test over the recent executions.
+
+        Args:
+            runs (int): The number of recent executions.
+
+        Returns:
+            dict: The estimated duration in seconds, keyed by node id.
+        """
+        return {node_id: median(values) for node_id, values in self._get_durations(runs).items()}
+
+    def get_last_run_statuses(self):
+        """Returns the test statuses of the latest execution.
+
+        Returns:
+            dict: The test status, keyed by node id.
+        """
+        return {
+            node_id: status
+            for node_id, _, status, _ in self._get_test_rows(self.get_execution_ids(1))
+        }
+
+    def slowest_tests(self, limit=10, runs=5):
+        """Returns the slowest tests of the recent executions.
+
+        Args:
+            limit (int): The number of tests to return.
+            runs (int): The number of recent executions.
+
+        Returns:
+            list: Dictionaries with nodeId, medianSeconds, maxSeconds and runs.
+        """
+        slowest = [
+            {
+                "nodeId": node_id,
+                "medianSeconds": median(values),
+                "maxSeconds": max(values),
+                "runs": len(values),
+            }
+            for node_id, values in self._get_durations(runs).items()
+        ]
+        slowest.sort(key=lambda test: test["medianSeconds"], reverse=True)
+        return slowest[:limit]
+
+    def duration_regressions(self, runs=10, threshold=1.5, min_seconds=1.0):
+        """Returns the tests that got slower in the latest execution.
+
+        A test regresses when its duration in the latest execution exceeds
+        the median of the previous executions by the given factor and by at
+        least ``min_seconds``. Tests that did not run in the latest
+        execution are skipped.
+
+        Args:
+            runs (int): The number of previous executions to compare with.
+            threshold (float): The slowdown factor.
+            min_seconds (float): The minimum absolute slowdown in seconds.
+
+        Returns:
+            list: Dictionaries with nodeId, latestSeconds, medianSeconds and ratio.
+        """
+        execution_ids = self.get_execution_ids(runs + 1)
+        latest_durations, previous_durations = {}, {}
+        for node_id, execution_id, _, duration in self._get_test_rows(execution_ids):
+            if duration is None:
+                continue
+            if execution_id == execution_ids[0]:
+                latest_durations[node_id] = duration
+            else:
+                previous_durations.setdefault(node_id, []).append(duration)
+        regressions = []
+        for node_id, latest in latest_durations.items():
+            if node_id not in previous_durations:
+                continue
+            baseline = median(previous_durations[node_id])
+            if latest > baseline * threshold and latest - baseline >= min_seconds:
+                regressions.append(
+                    {
+                        "nodeId": node_id,
+                        "latestSeconds": latest,
+                        "medianSeconds": baseline,
+                        "ratio": round(latest / baseline, 2) if baseline else None,
+                    }
+                )
+        regressions.sort(key=lambda test: test["latestSeconds"] - test["medianSeconds"], reverse=True)
+        return regressions
+
+    def flaky_tests(self, runs=10):
+        """Returns the tests that both passed and failed in the recent executions.
+
+        Args:
+            runs (int): The number of recent executions.
+
+        Returns:
+            list: Dictionaries with nodeId, failures, runs and flips, where flips
+            counts the status changes between consecutive executions.
+        """
+        statuses = {}
+        for node_id, _, status, _ in self._get_test_rows(self.get_execution_ids(runs)):
+            if status in ("P", "F"):
+                statuses.setdefault(node_id, []).append(status)
+        flaky = [
+            {
+                "nodeId": node_id,
+                "failures": values.count("F"),
+                "runs": len(values),
+                "flips": sum(1 for previous, current in zip(values, values[1:]) if previous != current),
+            }
+            for node_id, values in statuses.items()
+            if "P" in values and "F" in values
+        ]
+        flaky.sort(key=lambda test: (test["flips"], test["failures"]), reverse=True)
+        return flaky
+
+    def get_source_hashes(self):
+        """Returns the source file hashes recorded by the past executions.
+
+        Returns:
+            dict: The SHA-256 hex digest, keyed by file path.
+        """
+        if not self.exists():
+            return {}
+        with closing(self._connect()) as connection:
+            return dict(connection.execute("SELECT path, sha256 FROM source_hashes").fetchall())
+
+    def save_source_hashes(self, source_hashes):
+        """Stores the source file hashes of an execution.
+
+        Args:
+            source_hashes (dict): The SHA-256 hex digest, keyed by file path.
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO source_hashes VALUES (?, ?)", source_hashes.items()
+            )
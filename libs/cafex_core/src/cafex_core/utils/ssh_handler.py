@@ -2,12 +2,18 @@
 to a remote machine using SSH and perform operations like command execution
 """
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import paramiko
 
 from cafex_core.utils.core_security import Security
 from cafex_core.utils.exceptions import CoreExceptions
 
+ANSI_ESCAPE_PATTERN = re.compile(r"(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]")
+PROMPT_PATTERN = re.compile(r"\[.*?\]\$|\[.*?\]#")
+
 
 class SshHandler:
     """
@@ -18,12 +24,15 @@ class SshHandler:
         |  3.Download file from remote
         |  4.Upload file to remote
         |  5.Close the SSH connection
+        |  6.Non-interactive command execution, on one or many hosts
 
     """
 
     def __init__(self):
         self.__exceptions_generic = CoreExceptions()
         self.security = Security()
+        self.__connections = {}
+        self.__connections_lock = threading.Lock()
 
     def establish_ssh_connection(
             self, server_name: str, username: str = None, password: str = None, pem_file: str = None
@@ -146,8 +155,7 @@ class SshHandler:
             exit_status = 0
 
             for line in stdout:
-                if (re.findall(r"\[.*?\]\$", line) or re.findall(r"\[.*?\]#", line)) \
-                        and not capture:
+                if PROMPT_PATTERN.search(line) and not capture:
                     capture = True
                 if capture:
                     if line.startswith(finish):
@@ -157,7 +165,7 @@ class SshHandler:
                             output = []
                         break
                     output.append(
-                        re.compile(r"(\x9B|\x1B\[)[0-?]*[ -/]*[@-~]")
+                        ANSI_ESCAPE_PATTERN
                         .sub("", line)
                         .replace("\b", "")
                         .replace("\r", "")
@@ -274,6 +282,194 @@ class SshHandler:
             )
             raise e
 
+    def get_connection(
+            self, server_name: str, username: str = None, password: str = None, pem_file: str = None
+    ) -> paramiko.SSHClient:
+        """Returns the cached SSH connection of a host, connecting if needed.
+
+        Connections are cached per host and username for the lifetime of this
+        handler; a connection whose transport has dropped is replaced.
+
+        Args:
+            server_name (str): Server name or IP address.
+            username (str, optional): Username.
+            password (str, optional): Password.
+            pem_file (str, optional): Filepath of the PEM authentication file.
+
+        Returns:
+            object: SSH object.
+
+        Examples:
+            >> ssh_client = ssh_obj.get_connection('ip_address', username='username',
+            pem_file='/path/key.pem')
+        """
+        key = (server_name, username)
+        with self.__connections_lock:
+            ssh_client = self.__connections.get(key)
+            transport = ssh_client.get_transport() if ssh_client else None
+            if transport is not None and transport.is_active():
+                return ssh_client
+        ssh_client = self.establish_ssh_connection(server_name, username, password, pem_file)
+        with self.__connections_lock:
+            stale = self.__connections.get(key)
+            self.__connections[key] = ssh_client
+        if stale is not None:
+            stale.close()
+        return ssh_client
+
+    def close_all_connections(self) -> None:
+        """This method closes every connection cached by get_connection."""
+        with self.__connections_lock:
+            connections = list(self.__connections.values())
+            self.__connections.clear()
+        for ssh_client in connections:
+            self.close_ssh_connection(ssh_client)
+
+    @staticmethod
+    def __run_exec_command(client: paramiko.SSHClient, command: str, timeout: float = None,
+                           get_pty: bool = False, environment: dict = None,
+                           on_output=None) -> dict:
+        stdin, stdout, stderr = client.exec_command(
+            command, timeout=timeout, get_pty=get_pty, environment=environment
+        )
+        stdin.close()
+        start = time.perf_counter()
+        errors = []
+
+        def read_stderr():
+            for line in stderr:
+                errors.append(line)
+                if on_output:
+                    on_output("stderr", line)
+
+        # stderr is drained on its own thread so a full stderr window cannot
+        # stall stdout.
+        stderr_reader = threading.Thread(target=read_stderr, daemon=True)
+        stderr_reader.start()
+        output = []
+        for line in stdout:
+            output.append(line)
+            if on_output:
+                on_output("stdout", line)
+        stderr_reader.join(timeout)
+        return {
+            "exit_status": stdout.channel.recv_exit_status(),
+            "stdout": output,
+            "stderr": errors,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+    def exec_command(
+            self,
+            ssh_client: paramiko.SSHClient,
+            command: str,
+            timeout: float = None,
+            get_pty: bool = False,
+            environment: dict = None,
+            on_output=None,
+    ) -> dict:
+        """This method runs a command on an exec channel and returns its output and
+        exit status.
+
+        Unlike execute, no interactive shell or echo sentinel is used: the
+        command runs in its own channel, stdout and stderr are read as they
+        arrive and the exit status comes from the server. Shell state such as
+        the working directory does not carry over between calls.
+
+        Args:
+            ssh_client (object): SSH Object returned by the establish_connection method.
+            command (str): The command to execute.
+            timeout (float, optional): Seconds to wait for output before raising.
+            get_pty (bool, optional): Whether to request a pseudo-terminal.
+            environment (dict, optional): Environment variables for the command.
+            on_output (function, optional): Called as on_output(stream, line) for each
+             line, with stream "stdout" or "stderr".
+
+        Returns:
+            dict: The exit_status, the stdout and stderr lines and the seconds taken.
+
+        Examples:
+            >> result = ssh_obj.exec_command(SSHClient, 'grep -c ERROR /var/log/app.log')
+            >> result["exit_status"], result["stdout"]
+        """
+        try:
+            if ssh_client is None:
+                raise ValueError("The SSH client passed is None, please check the connection "
+                                 "object")
+            return self.__run_exec_command(ssh_client, command, timeout, get_pty, environment,
+                                           on_output)
+        except Exception as e:
+            error_description = f"An error occurred while executing the command: {str(e)}"
+            self.__exceptions_generic.raise_generic_exception(
+                message=error_description,
+                insert_report=True,
+                trim_log=True,
+                log_local=True,
+                fail_test=False,
+            )
+            raise e
+
+    def exec_command_on_hosts(
+            self,
+            server_names: list,
+            command: str,
+            username: str = None,
+            password: str = None,
+            pem_file: str = None,
+            timeout: float = None,
+            max_workers: int = 10,
+    ) -> dict:
+        """This method runs the same command on many hosts concurrently.
+
+        Each host uses its cached connection from get_connection. A host that
+        cannot be reached or fails does not stop the others; its result holds
+        the error instead.
+
+        Args:
+            server_names (list): Server names or IP addresses.
+            command (str): The command to execute.
+            username (str, optional): Username for all hosts.
+            password (str, optional): Password for all hosts.
+            pem_file (str, optional): Filepath of the PEM authentication file.
+            timeout (float, optional): Seconds to wait for output on each host.
+            max_workers (int, optional): The number of hosts handled at once.
+
+        Returns:
+            dict: The result of each host, keyed by server name, with exit_status,
+            stdout, stderr, seconds and error (None on success).
+
+        Examples:
+            >> results = ssh_obj.exec_command_on_hosts(['node1', 'node2'],
+            'grep -c ERROR /var/log/app.log', username='username', pem_file='/path/key.pem')
+            >> failed = [host for host, result in results.items() if result["exit_status"] != 0]
+        """
+
+        def run(server_name):
+            try:
+                ssh_client = self.get_connection(server_name, username, password, pem_file)
+                result = self.__run_exec_command(ssh_client, command, timeout)
+                result["error"] = None
+                return result
+            except Exception as e:
+                return {"exit_status": None, "stdout": [], "stderr": [], "seconds": None,
+                        "error": str(e)}
+
+        try:
+            if not isinstance(server_names, list):
+                raise TypeError("Server names should be of type list")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(server_names, executor.map(run, server_names)))
+        except Exception as e:
+            error_description = f"An error occurred while executing the command on hosts: {str(e)}"
+            self.__exceptions_generic.raise_generic_exception(
+                message=error_description,
+                insert_report=True,
+                trim_log=True,
+                log_local=True,
+                fail_test=False,
+            )
+            raise e
+
     def download_file_from_remote(self, ssh_client: paramiko.SSHClient, remote_path: str, local_path: str) -> None:
         """
         Downloads a file from a remote server to a local machine.
@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.collection_index import CollectionIndex
+
+
+class SampleTestCase(unittest.TestCase):
+    __test__ = False
+
+    def test_with_sub_test(self):
+        for value in range(2):
+            with self.subTest(value=value):
+                self.assertTrue(value >= 0)
+
+    def test_plain(self):
+        self.assertTrue(True)
+
+
+class TestCollectionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.session_store = SessionStore()
+        self.session_store.temp_execution_dir = self.temp_dir
+        self.session_store.collection_index = {}
+        self.collection_index = CollectionIndex()
+
+    def tearDown(self):
+        self.session_store.collection_index = {}
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _pytest_item(node_id, params=None):
+        item = MagicMock(spec=["obj", "nodeid", "name", "cls", "iter_markers", "callspec"])
+        item.obj = MagicMock(spec=[])
+        item.nodeid = node_id
+        item.name = node_id.split("::")[-1]
+        item.cls = None
+        item.iter_markers.return_value = []
+        item.callspec.params = params or {}
+        return item
+
+    @staticmethod
+    def _unittest_item(name):
+        item = MagicMock(spec=["obj", "nodeid", "name", "cls", "iter_markers"])
+        item.obj = MagicMock(spec=[])
+        item.nodeid = f"test_sample.py::SampleTestCase::{name}"
+        item.name = name
+        item.cls = SampleTestCase
+        item.iter_markers.return_value = []
+        return item
+
+    def test_build_entry_parametrized_pytest(self):
+        item = self._pytest_item("test_a.py::test_one[1]", {"value": 1})
+        entry = CollectionIndex.build_entry(item)
+        self.assertEqual(entry["testType"], "pytest")
+        self.assertTrue(entry["isDataDriven"])
+        self.assertFalse(entry["isOutline"])
+        self.assertEqual(entry["example"], "{'value': 1}")
+
+    def test_build_entry_scenario_outline(self):
+        item = self._pytest_item(
+            "test_b.py::test_outline[row]", {"_pytest_bdd_example": {"user": "bob"}}
+        )
+        scenario = MagicMock()
+        scenario.name = "Login"
+        scenario.feature.name = "Authentication"
+        scenario.tags = {"ui_web"}
+        item.obj.__scenario__ = scenario
+        entry = CollectionIndex.build_entry(item)
+        self.assertEqual(entry["testType"], "pytestBdd")
+        self.assertTrue(entry["isScenario"])
+        self.assertTrue(entry["isOutline"])
+        self.assertEqual(entry["example"], "{user: bob}")
+        self.assertEqual(entry["scenarioName"], "Login")
+        self.assertEqual(entry["featureName"], "Authentication")
+        self.assertEqual(entry["tags"], ["ui_web"])
+
+    def test_build_entry_unittest_sub_test(self):
+        entry = CollectionIndex.build_entry(self._unittest_item("test_with_sub_test"))
+        self.assertEqual(entry["testType"], "unittest")
+        self.assertTrue(entry["isDataDriven"])
+        self.assertEqual(entry["example"], "unittest with subTest")
+
+        entry = CollectionIndex.build_entry(self._unittest_item("test_plain"))
+        self.assertFalse(entry["isDataDriven"])
+        self.assertIsNone(entry["example"])
+
+    def test_save_and_load_round_trip(self):
+        items = [self._pytest_item("test_a.py::test_one"), self._pytest_item("test_a.py::test_two")]
+        self.collection_index.build(items)
+        self.collection_index.save()
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, CollectionIndex.FILE_NAME)))
+        self.assertEqual(set(self.collection_index.load()), {"test_a.py::test_one", "test_a.py::test_two"})
+
+    def test_get_reads_persisted_index_without_inspecting_item(self):
+        item = self._pytest_item("test_a.py::test_one")
+        self.collection_index.build([item])
+        self.collection_index.save()
+        self.session_store.collection_index = {}
+
+        worker_item = MagicMock(spec=["nodeid"])
+        worker_item.nodeid = "test_a.py::test_one"
+        entry = CollectionIndex().get(worker_item)
+        self.assertEqual(entry["name"], "test_one")
+
+    def test_get_builds_missing_entry(self):
+        item = self._pytest_item("test_a.py::test_three")
+        entry = self.collection_index.get(item)
+        self.assertEqual(entry["nodeId"], "test_a.py::test_three")
+        self.assertIn("test_a.py::test_three", self.session_store.collection_index)
+
+    def test_load_ignores_invalid_file(self):
+        with open(os.path.join(self.temp_dir, CollectionIndex.FILE_NAME), "w") as file:
+            file.write("{not json")
+        self.assertEqual(self.collection_index.load(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from cafex_core.utils.connection_pool import ConnectionPool
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.opened = []
+        self.closed = []
+
+    def _open(self):
+        conn = MagicMock(name=f"conn{len(self.opened)}")
+        self.opened.append(conn)
+        return conn
+
+    def _pool(self, size):
+        return ConnectionPool(self._open, self.closed.append, size)
+
+    def test_run_never_exceeds_pool_size(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def transfer(conn, item):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return {"file": item, "bytes": item}
+
+        with self._pool(3) as pool:
+            results = pool.run(transfer, list(range(12)))
+
+        self.assertEqual([result["file"] for result in results], list(range(12)))
+        self.assertTrue(all("seconds" in result for result in results))
+        self.assertLessEqual(peak[0], 3)
+        self.assertLessEqual(len(self.opened), 3)
+        self.assertCountEqual(self.closed, self.opened)
+
+    def test_failed_connection_is_replaced_and_error_raised(self):
+        def transfer(conn, item):
+            if item == "bad":
+                raise IOError("broken pipe")
+            return {"file": item, "bytes": 1}
+
+        pool = self._pool(1)
+        with self.assertRaises(IOError):
+            pool.run(transfer, ["bad", "good"])
+        self.assertEqual(len(self.opened), 2)
+        self.assertEqual(self.closed, [self.opened[0]])
+        pool.close()
+        self.assertEqual(self.closed, self.opened)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(self._open, self.closed.append, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock
+
+from cafex_core.utils.duration_scheduler import DurationScheduler
+
+
+class TestDurationScheduler(unittest.TestCase):
+
+    @staticmethod
+    def _item(node_id, tags=(), group=None):
+        item = MagicMock()
+        item.nodeid = node_id
+        item.obj = MagicMock(spec=[])
+        item.iter_markers.return_value = [MagicMock(name=tag) for tag in tags]
+        for marker, tag in zip(item.iter_markers.return_value, tags):
+            marker.name = tag
+        item.get_closest_marker.return_value = group
+        item.markers = []
+        item.add_marker.side_effect = item.markers.append
+        return item
+
+    def test_default_duration_is_median_of_estimates(self):
+        scheduler = DurationScheduler({"a": 1.0, "b": 3.0, "c": 10.0})
+        self.assertEqual(scheduler.default_duration, 3.0)
+        self.assertEqual(DurationScheduler({}).default_duration, 1.0)
+
+    def test_order_items_longest_first_and_stable(self):
+        scheduler = DurationScheduler({"a": 1.0, "b": 5.0, "c": 1.0}, default_duration=2.0)
+        items = [self._item(node_id) for node_id in ("a", "b", "c", "new")]
+        scheduler.order_items(items)
+        self.assertEqual([item.nodeid for item in items], ["b", "new", "a", "c"])
+
+    def test_assign_groups_balances_load(self):
+        durations = {"a": 8.0, "b": 7.0, "c": 6.0, "d": 5.0}
+        scheduler = DurationScheduler(durations)
+        items = [self._item(node_id) for node_id in durations]
+        loads = scheduler.assign_groups(items, 2, group_browser_tests=False)
+        self.assertEqual(loads, [13.0, 13.0])
+        for item in items:
+            self.assertEqual(len(item.markers), 1)
+            self.assertEqual(item.markers[0].name, "xdist_group")
+
+    def test_assign_groups_keeps_browser_tests_together(self):
+        durations = {"ui_1": 5.0, "api_1": 5.0, "ui_2": 1.0, "api_2": 1.0}
+        scheduler = DurationScheduler(durations)
+        items = [
+            self._item("ui_1", tags=("ui_web",)),
+            self._item("api_1"),
+            self._item("ui_2", tags=("ui_web",)),
+            self._item("api_2"),
+        ]
+        scheduler.assign_groups(items, 2)
+        groups = {item.nodeid: item.markers[0].kwargs["name"] for item in items}
+        self.assertEqual(groups["ui_1"], groups["ui_2"])
+
+    def test_assign_groups_skips_user_groups(self):
+        scheduler = DurationScheduler({"a": 1.0})
+        item = self._item("a", group=MagicMock())
+        scheduler.assign_groups([item], 2)
+        self.assertEqual(item.markers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
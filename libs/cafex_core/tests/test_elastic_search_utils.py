@@ -5,6 +5,7 @@ from unittest.mock import patch, MagicMock
 import requests
 
 from cafex_core.utils.elastic_search_utils import ElasticSearchUtils
+from cafex_core.utils.retry_policy import RetryPolicy
 
 
 class TestElasticSearchUtils(unittest.TestCase):
@@ -788,7 +789,7 @@ class TestElasticSearchUtils(unittest.TestCase):
         except Exception as e:
             print("Error at extract regex matches on messages exception")
 
-    @patch('requests.get')
+    @patch.object(requests.Session, 'request')
     def test_call_request_get_success(self, mock_get):
         # Setup
         mock_response = MagicMock(spec=requests.Response)
@@ -802,8 +803,11 @@ class TestElasticSearchUtils(unittest.TestCase):
         # Verify
         self.assertEqual(response, mock_response)
         mock_get.assert_called_once_with(
+            "GET",
             url,
             headers=headers,
+            data=None,
+            json=None,
             verify=False,
             allow_redirects=False,
             cookies={},
@@ -812,7 +816,7 @@ class TestElasticSearchUtils(unittest.TestCase):
             proxies=None
         )
 
-    @patch('requests.post')
+    @patch.object(requests.Session, 'request')
     def test_call_request_post_success(self, mock_post):
         # Setup
         mock_response = MagicMock(spec=requests.Response)
@@ -827,6 +831,7 @@ class TestElasticSearchUtils(unittest.TestCase):
         # Verify
         self.assertEqual(response, mock_response)
         mock_post.assert_called_once_with(
+            "POST",
             url,
             headers=headers,
             data=payload,
@@ -839,7 +844,7 @@ class TestElasticSearchUtils(unittest.TestCase):
             proxies=None
         )
 
-    @patch('requests.put')
+    @patch.object(requests.Session, 'request')
     def test_call_request_put_success(self, mock_put):
         # Setup
         mock_response = MagicMock(spec=requests.Response)
@@ -854,9 +859,11 @@ class TestElasticSearchUtils(unittest.TestCase):
         # Verify
         self.assertEqual(response, mock_response)
         mock_put.assert_called_once_with(
+            "PUT",
             url,
             headers=headers,
             data=payload,
+            json=None,
             verify=False,
             allow_redirects=False,
             cookies={},
@@ -865,7 +872,7 @@ class TestElasticSearchUtils(unittest.TestCase):
             proxies=None
         )
 
-    @patch('requests.patch')
+    @patch.object(requests.Session, 'request')
     def test_call_request_patch_success(self, mock_patch):
         # Setup
         mock_response = MagicMock(spec=requests.Response)
@@ -880,9 +887,11 @@ class TestElasticSearchUtils(unittest.TestCase):
         # Verify
         self.assertEqual(response, mock_response)
         mock_patch.assert_called_once_with(
+            "PATCH",
             url,
             headers=headers,
             data=payload,
+            json=None,
             verify=False,
             allow_redirects=False,
             cookies={},
@@ -891,7 +900,7 @@ class TestElasticSearchUtils(unittest.TestCase):
             proxies=None
         )
 
-    @patch('requests.delete')
+    @patch.object(requests.Session, 'request')
     def test_call_request_delete_success(self, mock_delete):
         # Setup
         mock_response = MagicMock(spec=requests.Response)
@@ -905,8 +914,11 @@ class TestElasticSearchUtils(unittest.TestCase):
         # Verify
         self.assertEqual(response, mock_response)
         mock_delete.assert_called_once_with(
+            "DELETE",
             url,
             headers=headers,
+            data=None,
+            json=None,
             verify=False,
             allow_redirects=False,
             cookies={},
@@ -924,7 +936,7 @@ class TestElasticSearchUtils(unittest.TestCase):
             self.elastic_search_utils.call_request("GET", "", headers)
         self.assertEqual(str(context.exception), "URL cannot be null")
 
-    @patch('requests.get')
+    @patch.object(requests.Session, 'request')
     @patch('cafex_core.utils.elastic_search_utils.CoreLogger')
     def test_call_request_exception(self, mock_logger, mock_get):
         try:
@@ -1285,6 +1297,223 @@ class TestElasticSearchUtils(unittest.TestCase):
         except Exception as e:
             print("Error at bulk insert request exception")
 
+    @staticmethod
+    def _search_stub(documents, support_pit=True, support_shard_doc=True):
+        """Returns a call_request replacement that pages over the given documents."""
+        calls = []
+
+        def response(status_code, body):
+            mock_response = MagicMock()
+            mock_response.status_code = status_code
+            mock_response.json.return_value = body
+            return mock_response
+
+        def page(start, size, source):
+            hits = [
+                {"_id": str(i), "_source": {k: v for k, v in doc.items() if source is None or k in source},
+                 "sort": [i]}
+                for i, doc in enumerate(documents[start:start + size], start)
+            ]
+            return {"hits": {"hits": hits}}
+
+        def call_request(method, url, headers, **kwargs):
+            body = json.loads(kwargs.get("payload") or "{}")
+            calls.append((method, url, body))
+            if url.endswith("_pit?keep_alive=1m"):
+                return response(200, {"id": "pit-1"}) if support_pit else response(400, {})
+            if method == "DELETE":
+                return response(200, {})
+            if "pit" in body and not support_shard_doc:
+                return response(400, {"error": "No mapping found for [_shard_doc]"})
+            if "pit" in body:
+                start = body.get("search_after", [-1])[0] + 1
+                return response(200, {"pit_id": "pit-1", **page(start, body["size"], body.get("_source"))})
+            if url.endswith("/_search/scroll"):
+                start = int(body["scroll_id"])
+                result = page(start, 2, None)
+                return response(200, {"_scroll_id": str(start + 2), **result})
+            return response(200, {"_scroll_id": "2", **page(0, body["size"], body.get("_source"))})
+
+        return call_request, calls
+
+    def test_iter_documents_with_point_in_time(self):
+        documents = [{"id": i, "name": f"doc{i}"} for i in range(5)]
+        stub, calls = self._search_stub(documents)
+        with patch.object(ElasticSearchUtils, "call_request", side_effect=stub):
+            hits = list(ElasticSearchUtils().iter_documents(
+                "http://localhost:9200", "my_index", page_size=2, source_fields=["id"]))
+        self.assertEqual([hit["_source"] for hit in hits], [{"id": i} for i in range(5)])
+        self.assertEqual(calls[-1][:2], ("DELETE", "http://localhost:9200/_pit"))
+        self.assertEqual(calls[-1][2], {"id": "pit-1"})
+
+    def test_iter_documents_falls_back_to_scroll(self):
+        documents = [{"id": i} for i in range(5)]
+        stub, calls = self._search_stub(documents, support_pit=False)
+        with patch.object(ElasticSearchUtils, "call_request", side_effect=stub):
+            hits = list(ElasticSearchUtils().iter_documents(
+                "http://localhost:9200", "my_index", page_size=2))
+        self.assertEqual([hit["_source"]["id"] for hit in hits], list(range(5)))
+        self.assertEqual(calls[-1][:2], ("DELETE", "http://localhost:9200/_search/scroll"))
+
+    def test_iter_documents_falls_back_to_scroll_without_shard_doc(self):
+        documents = [{"id": i} for i in range(5)]
+        stub, calls = self._search_stub(documents, support_shard_doc=False)
+        with patch.object(ElasticSearchUtils, "call_request", side_effect=stub):
+            hits = list(ElasticSearchUtils().iter_documents(
+                "http://localhost:9200", "my_index", page_size=2))
+        self.assertEqual([hit["_source"]["id"] for hit in hits], list(range(5)))
+        self.assertIn(("DELETE", "http://localhost:9200/_pit", {"id": "pit-1"}), calls)
+        self.assertEqual(calls[-1][:2], ("DELETE", "http://localhost:9200/_search/scroll"))
+
+    def test_iter_documents_releases_context_when_closed_early(self):
+        stub, calls = self._search_stub([{"id": i} for i in range(10)])
+        with patch.object(ElasticSearchUtils, "call_request", side_effect=stub):
+            documents = ElasticSearchUtils().iter_documents("http://localhost:9200", "my_index",
+                                                            page_size=2)
+            next(documents)
+            documents.close()
+        self.assertEqual(calls[-1][0], "DELETE")
+
+    def test_iter_documents_missing_index(self):
+        with self.assertRaises(ValueError):
+            next(ElasticSearchUtils().iter_documents("http://localhost:9200", ""))
+
+    @staticmethod
+    def _bulk_stub(failing_ids=()):
+        """Returns a call_request replacement that answers _bulk requests."""
+        bodies = []
+
+        def call_request(method, url, headers, **kwargs):
+            lines = kwargs["payload"].decode().splitlines()
+            bodies.append(lines)
+            items = []
+            for action_line in lines[::2]:
+                doc_id = json.loads(action_line)["index"].get("_id")
+                if doc_id in failing_ids:
+                    items.append({"index": {"_id": doc_id, "status": 400,
+                                            "error": {"type": "mapper_parsing_exception"}}})
+                else:
+                    items.append({"index": {"_id": doc_id, "status": 201}})
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"errors": bool(failing_ids), "items": items}
+            return mock_response
+
+        return call_request, bodies
+
+    def test_stream_bulk_insert_batches_by_count(self):
+        stub, bodies = self._bulk_stub()
+        with patch.object(ElasticSearchUtils, "call_request", side_effect=stub):
+            result = ElasticSearchUtils().stream_bulk_insert(
+                "http://localhost:9200", ({"id": i} for i in range(5)), index="my_index",
+                batch_size=2)
+        self.assertEqual(result, {"indexed": 5, "failed": 0, "batches": 3, "errors": []})
+        self.assertEqual([len(lines) for lines in bodies], [4, 4, 2])
+        self.assertEqual(json.loads(bodies[0][0]), {"index": {"_index": "my_index"}})
+
+    def test_stream_bulk_insert_batches_by_bytes(self):
+        stub, bodies = self._bulk_stub()
+        documents = [{"text": "x" * 100} for _ in range(4)]
+        with patch.object(ElasticSearchUtils, "call_request", side_effect=stub):
+            result = ElasticSearchUtils().stream_bulk_insert(
+                "http://localhost:9200", documents, batch_size=100, max_batch_bytes=250)
+        self.assertEqual(result["batches"], 4)
+        self.assertEqual(result["indexed"], 4)
+
+    def test_stream_bulk_insert_reports_item_errors_concurrently(self):
+        stub, _ = self._bulk_stub(failing_ids={3, 7})
+        with patch.object(ElasticSearchUtils, "call_request", side_effect=stub):
+            result = ElasticSearchUtils().stream_bulk_insert(
+                "http://localhost:9200", [{"id": i} for i in range(10)], index="my_index",
+                batch_size=3, concurrency=3, id_field="id")
+        self.assertEqual(result["indexed"], 8)
+        self.assertEqual(result["failed"], 2)
+        self.assertEqual([(error["position"], error["id"], error["status"])
+                          for error in result["errors"]], [(3, 3, 400), (7, 7, 400)])
+
+    def test_stream_bulk_insert_failed_request(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 413
+        mock_response.text = "Request Entity Too Large"
+        with patch.object(ElasticSearchUtils, "call_request", return_value=mock_response):
+            result = ElasticSearchUtils().stream_bulk_insert(
+                "http://localhost:9200", [{"id": 1}, {"id": 2}])
+        self.assertEqual(result["failed"], 2)
+        self.assertEqual(result["errors"][0]["status"], 413)
+
+    @patch.object(requests.Session, "request")
+    def test_call_request_retries_on_pooled_session(self, mock_request):
+        unavailable = MagicMock(status_code=502, headers={"Retry-After": "0"})
+        available = MagicMock(status_code=200, headers={})
+        mock_request.side_effect = [unavailable, available]
+        es_utils = ElasticSearchUtils()
+
+        response = es_utils.call_request("GET", "http://localhost:9200/_cluster/health", {})
+
+        self.assertEqual(response, available)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(es_utils.retry_stats, {"requests": 1, "retries": 1, "waitSeconds": 0.0})
+
+    @patch.object(requests.Session, "request")
+    def test_call_request_honors_retry_after_on_unavailable_cluster(self, mock_request):
+        unavailable = MagicMock(status_code=503, headers={"Retry-After": "2"})
+        available = MagicMock(status_code=200, headers={})
+        mock_request.side_effect = [unavailable, available]
+        es_utils = ElasticSearchUtils()
+        waits = []
+        es_utils.retry_policy.sleep = waits.append
+
+        response = es_utils.call_request("GET", "http://localhost:9200/_cluster/health", {})
+
+        self.assertEqual(response, available)
+        self.assertEqual(waits, [2.0])
+        self.assertEqual(es_utils.retry_stats, {"requests": 1, "retries": 1, "waitSeconds": 2.0})
+
+    @patch("cafex_core.utils.elastic_search_utils.time.sleep")
+    @patch.object(requests.Session, "send")
+    def test_verify_response_code_retry_backs_off_and_records_stats(self, mock_send, mock_sleep):
+        request = MagicMock(method="GET", url="http://localhost:9200/_cluster/health")
+        responses = [MagicMock(status_code=503, request=request) for _ in range(3)]
+        mock_send.side_effect = responses[1:] + [MagicMock(status_code=200, request=request)]
+        es_utils = ElasticSearchUtils()
+
+        result = es_utils.verify_response_code(200, response=responses[0], retry=True,
+                                               polling_interval_sec=10, max_wait_period_sec=600)
+
+        self.assertTrue(result)
+        self.assertEqual(mock_send.call_count, 3)
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 3)
+        self.assertTrue(8 <= waits[0] <= 10)
+        self.assertTrue(waits[0] < waits[1] < waits[2])
+        self.assertEqual(es_utils.retry_stats["retries"], 3)
+        self.assertAlmostEqual(es_utils.retry_stats["waitSeconds"], sum(waits))
+
+    @patch.object(requests.Session, "request")
+    def test_call_request_does_not_resend_post_after_read_timeout(self, mock_request):
+        mock_request.side_effect = requests.exceptions.ReadTimeout("read timed out")
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            ElasticSearchUtils().call_request("POST", "http://localhost:9200/_bulk", {})
+        mock_request.assert_called_once()
+
+    @patch.object(requests.Session, "request")
+    def test_call_request_retries_post_when_connection_failed(self, mock_request):
+        available = MagicMock(status_code=200, headers={})
+        mock_request.side_effect = [requests.exceptions.ConnectTimeout("connect timed out"),
+                                    available]
+        es_utils = ElasticSearchUtils(retry_policy=RetryPolicy(jitter=False, backoff_factor=0))
+        response = es_utils.call_request("POST", "http://localhost:9200/_bulk", {})
+        self.assertEqual(response, available)
+
+    @patch.object(requests.Session, "request")
+    def test_call_request_retries_post_when_opted_in(self, mock_request):
+        available = MagicMock(status_code=200, headers={})
+        mock_request.side_effect = [MagicMock(status_code=502, headers={}), available]
+        policy = RetryPolicy(jitter=False, backoff_factor=0, retry_methods=("POST",))
+        response = ElasticSearchUtils().call_request(
+            "POST", "http://localhost:9200/_bulk", {}, retry_policy=policy)
+        self.assertEqual(response, available)
+
 
 if __name__ == '__main__':
     unittest.main()
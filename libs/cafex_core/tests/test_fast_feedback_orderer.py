@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from cafex_core.utils.fast_feedback_orderer import FastFeedbackOrderer
+from cafex_core.utils.run_index import RunIndex
+
+
+class TestFastFeedbackOrderer(unittest.TestCase):
+
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        for name in ("test_a.py", "test_b.py"):
+            with open(os.path.join(self.root_dir, name), "w") as file:
+                file.write(f"# {name}\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir, ignore_errors=True)
+
+    def _item(self, node_id):
+        item = MagicMock()
+        item.nodeid = node_id
+        item.obj = MagicMock(spec=[])
+        item.path = Path(self.root_dir, node_id.split("::")[0])
+        item.config.rootpath = Path(self.root_dir)
+        return item
+
+    def test_failed_then_changed_then_shortest_first(self):
+        items = [
+            self._item("test_a.py::test_slow"),
+            self._item("test_a.py::test_fast"),
+            self._item("test_b.py::test_failed"),
+            self._item("test_b.py::test_passed"),
+        ]
+        previous_hashes = {
+            "test_a.py": FastFeedbackOrderer.hash_file(os.path.join(self.root_dir, "test_a.py")),
+            "test_b.py": "outdated",
+        }
+        orderer = FastFeedbackOrderer(
+            {"test_b.py::test_failed": "F", "test_b.py::test_passed": "P"},
+            previous_hashes,
+            {"test_a.py::test_slow": 9.0, "test_a.py::test_fast": 1.0, "test_b.py::test_passed": 5.0},
+        )
+        hashes = orderer.order_items(items)
+        self.assertEqual(
+            [item.nodeid for item in items],
+            [
+                "test_b.py::test_failed",
+                "test_b.py::test_passed",
+                "test_a.py::test_fast",
+                "test_a.py::test_slow",
+            ],
+        )
+        self.assertEqual(hashes["test_a.py"], previous_hashes["test_a.py"])
+        self.assertNotEqual(hashes["test_b.py"], "outdated")
+
+    def test_without_previous_hashes_nothing_is_changed(self):
+        items = [self._item("test_a.py::test_one"), self._item("test_b.py::test_two")]
+        orderer = FastFeedbackOrderer({}, {}, {"test_a.py::test_one": 2.0, "test_b.py::test_two": 1.0})
+        orderer.order_items(items, failed_first=False)
+        self.assertEqual([item.nodeid for item in items], ["test_b.py::test_two", "test_a.py::test_one"])
+
+    def test_from_history_reads_run_index(self):
+        run_index = RunIndex(self.root_dir)
+        run_index.ingest_run(
+            {
+                "executionInfo": {"executionId": "run-1", "executionStartTime": "2024-01-01 10:00:00"},
+                "tests": {
+                    "pytest": [
+                        {"nodeId": "test_a.py::test_one@cafex_lpt_0", "testStatus": "F", "durationSeconds": 3.0}
+                    ]
+                },
+            }
+        )
+        run_index.save_source_hashes({"test_a.py": "abc"})
+        orderer = FastFeedbackOrderer.from_history(self.root_dir)
+        self.assertEqual(orderer.last_statuses, {"test_a.py::test_one": "F"})
+        self.assertEqual(orderer.previous_hashes, {"test_a.py": "abc"})
+        self.assertEqual(orderer.scheduler.estimates, {"test_a.py::test_one": 3.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
 import os
+import shutil
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 from ftplib import error_perm, FTP, FTP_TLS
@@ -10,6 +13,19 @@ from dateutil import parser
 
 from cafex_core.utils.file_transfer_utils import FileTransferUtils
 
+try:
+    import boto3
+    from moto import mock_aws
+except ImportError:
+    mock_aws = None
+
+try:
+    from pyftpdlib.authorizers import DummyAuthorizer
+    from pyftpdlib.handlers import FTPHandler
+    from pyftpdlib.servers import ThreadedFTPServer
+except ImportError:
+    ThreadedFTPServer = None
+
 
 class TestFTPUtils(unittest.TestCase):
     def setUp(self):
@@ -793,12 +809,17 @@ class TestFTPUtils(unittest.TestCase):
     def test_read_content_from_s3_success(self, mock_raise_generic_exception):
         """Test successful retrieval of content from S3."""
 
-        self.mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
+        mock_paginator = MagicMock()
+        self.mock_s3_client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = [
+            {"Contents": [
                 {"Key": "folder/file1.txt", "LastModified": "2023-01-01T12:00:00", "Size": 1234},
+                {"Key": "folder/notes.md", "LastModified": "2023-01-01T13:00:00", "Size": 10},
+            ]},
+            {"Contents": [
                 {"Key": "folder/file2.txt", "LastModified": "2023-01-02T12:00:00", "Size": 5678},
-            ]
-        }
+            ]},
+        ]
 
         file_count, s3_files, file_details = self.s3_utils.read_content_from_s3(
             self.mock_s3_client, "test_bucket", folder_prefix="folder/", file_suffix=".txt"
@@ -810,13 +831,16 @@ class TestFTPUtils(unittest.TestCase):
         self.assertEqual(file_details["file1"]["size"], 1234)
         self.assertEqual(file_details["file2"]["file_name"], "folder/file2.txt")
         self.assertEqual(file_details["file2"]["size"], 5678)
-        self.mock_s3_client.list_objects_v2.assert_called_once_with(Bucket="test_bucket", Prefix="folder/")
+        self.mock_s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        mock_paginator.paginate.assert_called_once_with(
+            Bucket="test_bucket", Prefix="folder/", PaginationConfig={"PageSize": 1000}
+        )
         mock_raise_generic_exception.assert_not_called()
 
     @patch("cafex_core.utils.file_transfer_utils.CoreExceptions.raise_generic_exception")
     def test_read_content_from_s3_exception(self, mock_raise_generic_exception):
         """Test exception during content retrieval from S3."""
-        self.mock_s3_client.list_objects_v2.side_effect = Exception("Mocked exception")
+        self.mock_s3_client.get_paginator.return_value.paginate.side_effect = Exception("Mocked exception")
 
         with self.assertRaises(Exception) as context:
             self.s3_utils.read_content_from_s3(self.mock_s3_client, "test_bucket")
@@ -1229,5 +1253,161 @@ class TestFTPUtils(unittest.TestCase):
         )
 
 
+@unittest.skipUnless(mock_aws, "moto is not installed")
+class TestAWSS3WithMoto(unittest.TestCase):
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        self.s3_client = boto3.client("s3", region_name="us-east-1")
+        self.s3_client.create_bucket(Bucket="test-bucket")
+        self.s3_utils = FileTransferUtils().AWSS3()
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.mock.stop()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_read_content_from_s3_reads_all_pages(self):
+        for index in range(1005):
+            self.s3_client.put_object(Bucket="test-bucket", Key=f"data/{index:04}.txt", Body=b"x")
+
+        file_count, s3_files, file_details = self.s3_utils.read_content_from_s3(
+            self.s3_client, "test-bucket", folder_prefix="data/"
+        )
+
+        self.assertEqual(file_count, 1005)
+        self.assertEqual(s3_files[-1], "data/1004.txt")
+        self.assertEqual(file_details["file1005"]["size"], 1)
+
+    def test_folder_round_trip_with_prefix_filter(self):
+        source_dir = os.path.join(self.work_dir, "source")
+        for rel_path in ("a/1.txt", "a/2.txt", "b/3.txt"):
+            os.makedirs(os.path.dirname(os.path.join(source_dir, rel_path)), exist_ok=True)
+            with open(os.path.join(source_dir, rel_path), "w") as file:
+                file.write(rel_path)
+
+        upload_summary = self.s3_utils.upload_folder_into_s3(
+            self.s3_client, "test-bucket", source_dir, "remote", max_workers=4
+        )
+        target_dir = os.path.join(self.work_dir, "target")
+        download_summary = self.s3_utils.download_folder_from_s3(
+            self.s3_client, "test-bucket", "remote", target_dir, file_prefix="a/", max_workers=4
+        )
+
+        self.assertEqual(upload_summary["files"], 3)
+        self.assertEqual(upload_summary["bytes"], 21)
+        self.assertEqual(download_summary["files"], 2)
+        self.assertEqual(download_summary["bytes"], 14)
+        with open(os.path.join(target_dir, "a", "2.txt")) as file:
+            self.assertEqual(file.read(), "a/2.txt")
+        self.assertFalse(os.path.exists(os.path.join(target_dir, "b")))
+
+
+class TestSFTPParallelTransfers(unittest.TestCase):
+    def setUp(self):
+        self.sftp_utils = FileTransferUtils().SFTP()
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    @patch("cafex_core.utils.file_transfer_utils.FileTransferUtils.security.open_sftp_connection")
+    def test_download_files_parallel_prefetches_and_resumes(self, mock_open_sftp_connection):
+        mock_sftp_conn, mock_transport = MagicMock(), MagicMock()
+        mock_open_sftp_connection.return_value = (mock_sftp_conn, mock_transport)
+        mock_sftp_conn.stat.return_value.st_size = 10
+        remote_file = mock_sftp_conn.open.return_value.__enter__.return_value
+        remote_file.read.side_effect = [b"6789", b""]
+        with open(os.path.join(self.work_dir, "file1.txt"), "wb") as file:
+            file.write(b"012345")
+
+        summary = self.sftp_utils.download_files_parallel(
+            "sftp.example.com", 22, "user", "pass", ["file1.txt"], "/remote/", self.work_dir,
+            pool_size=2, resume=True
+        )
+
+        remote_file.seek.assert_called_once_with(6)
+        remote_file.prefetch.assert_called_once_with(10, None)
+        with open(os.path.join(self.work_dir, "file1.txt"), "rb") as file:
+            self.assertEqual(file.read(), b"0123456789")
+        self.assertEqual(summary["bytes"], 4)
+        self.assertEqual(summary["transfers"][0]["resumedFrom"], 6)
+        mock_open_sftp_connection.assert_called_once()
+        mock_transport.close.assert_called_once()
+
+    @patch("cafex_core.utils.file_transfer_utils.FileTransferUtils.security.open_sftp_connection")
+    def test_upload_files_parallel_pipelines_writes(self, mock_open_sftp_connection):
+        mock_sftp_conn = MagicMock()
+        mock_open_sftp_connection.return_value = (mock_sftp_conn, MagicMock())
+        remote_file = mock_sftp_conn.open.return_value.__enter__.return_value
+        with open(os.path.join(self.work_dir, "file1.txt"), "wb") as file:
+            file.write(b"x" * 10)
+
+        summary = self.sftp_utils.upload_files_parallel(
+            "sftp.example.com", 22, "user", "pass", ["file1.txt"], "/remote", self.work_dir,
+            block_size=4
+        )
+
+        mock_sftp_conn.open.assert_called_once_with("/remote/file1.txt", "wb")
+        remote_file.set_pipelined.assert_called_once_with(True)
+        self.assertEqual(remote_file.write.call_count, 3)
+        self.assertEqual(summary["bytes"], 10)
+
+
+@unittest.skipUnless(ThreadedFTPServer, "pyftpdlib is not installed")
+class TestFTPParallelTransfersWithServer(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.server_dir = os.path.join(self.work_dir, "server")
+        self.local_dir = os.path.join(self.work_dir, "local")
+        os.makedirs(self.server_dir)
+        os.makedirs(self.local_dir)
+        authorizer = DummyAuthorizer()
+        authorizer.add_user("user", "pass", self.server_dir, perm="elradfmwMT")
+        handler = type("Handler", (FTPHandler,), {"authorizer": authorizer})
+        self.server = ThreadedFTPServer(("127.0.0.1", 0), handler)
+        self.port = self.server.address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.ftp_utils = FileTransferUtils().FTP()
+
+    def tearDown(self):
+        self.server.close_all()
+        self.thread.join(5)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _open(self, host, username, password):
+        ftp_conn = FTP()
+        ftp_conn.connect(host, self.port)
+        ftp_conn.login(username, password)
+        return ftp_conn
+
+    def test_upload_then_download_with_resume(self):
+        names = [f"file{index}.bin" for index in range(5)]
+        for name in names:
+            with open(os.path.join(self.local_dir, name), "wb") as file:
+                file.write(os.urandom(100000))
+        with open(os.path.join(self.server_dir, "file0.bin"), "wb") as file, \
+                open(os.path.join(self.local_dir, "file0.bin"), "rb") as source:
+            file.write(source.read(40000))
+
+        with patch.object(FileTransferUtils.security, "open_ftp_connection", side_effect=self._open):
+            upload = self.ftp_utils.upload_files_parallel(
+                "127.0.0.1", "user", "pass", names, "/", self.local_dir, pool_size=3, resume=True
+            )
+            download_dir = os.path.join(self.work_dir, "download")
+            download = self.ftp_utils.download_files_parallel(
+                "127.0.0.1", "user", "pass", names, "/", download_dir, pool_size=3
+            )
+
+        self.assertEqual(upload["transfers"][0]["resumedFrom"], 40000)
+        self.assertEqual(upload["bytes"], 460000)
+        self.assertEqual(download["bytes"], 500000)
+        for name in names:
+            with open(os.path.join(self.local_dir, name), "rb") as expected, \
+                    open(os.path.join(download_dir, name), "rb") as actual:
+                self.assertEqual(expected.read(), actual.read())
+
+
 if __name__ == "__main__":
     unittest.main()
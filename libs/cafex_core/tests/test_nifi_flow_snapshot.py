@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from cafex_core.utils.apache_utils.nifi_flow_snapshot import NifiFlowSnapshot
+from cafex_core.utils.apache_utils.nifi_process_group_utils import NifiProcessGroupUtils
+
+
+def make_entity(entity_id, name=None, version=1, source_id=None, destination_id=None):
+    entity = MagicMock()
+    entity.id = entity_id
+    entity.component.name = name
+    entity.revision.version = version
+    entity.source_id = source_id
+    entity.destination_id = destination_id
+    return entity
+
+
+def make_flow(pg_id, processors=(), connections=(), process_groups=()):
+    flow = MagicMock()
+    flow.process_group_flow.id = pg_id
+    flow.process_group_flow.flow.processors = list(processors)
+    flow.process_group_flow.flow.connections = list(connections)
+    flow.process_group_flow.flow.process_groups = list(process_groups)
+    return flow
+
+
+def build_tree(processor_version=1):
+    """root -> [proc_a, group_1 -> [proc_b, proc_a2 (same name as proc_a)]]"""
+    group_1 = make_entity("group_1", "Ingest")
+    group_1.nipyapi_extended = make_flow(
+        "group_1",
+        processors=[make_entity("proc_b", "Transform", processor_version),
+                    make_entity("proc_a2", "Fetch")],
+        connections=[make_entity("conn_2", source_id="proc_b", destination_id="proc_a2")],
+    )
+    return make_flow(
+        "root_id",
+        processors=[make_entity("proc_a", "Fetch")],
+        connections=[make_entity("conn_1", source_id="proc_a", destination_id="proc_b")],
+        process_groups=[group_1],
+    )
+
+
+class TestNifiFlowSnapshot(unittest.TestCase):
+
+    @patch("nipyapi.canvas.recurse_flow")
+    def test_lookups_use_a_single_fetch(self, mock_recurse_flow):
+        mock_recurse_flow.return_value = build_tree()
+
+        snapshot = NifiFlowSnapshot()
+
+        self.assertEqual(snapshot.root_id, "root_id")
+        self.assertEqual(snapshot.processor_id("Fetch"), "proc_a")
+        self.assertEqual(snapshot.processor_id("Fetch", "group_1"), "proc_a2")
+        self.assertEqual(snapshot.process_group_id("Ingest"), "group_1")
+        self.assertIsNone(snapshot.processor_id("Missing"))
+        self.assertIsNone(snapshot.processor_id("Fetch", "unknown_group"))
+        mock_recurse_flow.assert_called_once_with("root")
+
+    @patch("nipyapi.canvas.recurse_flow")
+    def test_listings_are_scoped_to_subtree(self, mock_recurse_flow):
+        mock_recurse_flow.return_value = build_tree()
+
+        snapshot = NifiFlowSnapshot()
+
+        self.assertEqual(len(snapshot.processors()), 3)
+        self.assertEqual({p.id for p in snapshot.processors("group_1")}, {"proc_b", "proc_a2"})
+        self.assertEqual([g.id for g in snapshot.process_groups()], ["group_1"])
+        self.assertEqual([c.id for c in snapshot.connections("group_1")], ["conn_2"])
+        self.assertEqual(snapshot.get("conn_1").source_id, "proc_a")
+        self.assertIsNone(snapshot.get("missing"))
+
+    @patch("nipyapi.canvas.recurse_flow")
+    def test_component_connections(self, mock_recurse_flow):
+        mock_recurse_flow.return_value = build_tree()
+
+        snapshot = NifiFlowSnapshot()
+
+        self.assertEqual({c.id for c in snapshot.component_connections("proc_b")},
+                         {"conn_1", "conn_2"})
+        self.assertEqual(snapshot.component_connections("group_1"), [])
+
+    @patch("nipyapi.canvas.recurse_flow")
+    def test_refresh_if_stale(self, mock_recurse_flow):
+        mock_recurse_flow.side_effect = [build_tree(1), build_tree(2)]
+
+        snapshot = NifiFlowSnapshot()
+
+        self.assertFalse(snapshot.refresh_if_stale("proc_b", 1))
+        self.assertTrue(snapshot.refresh_if_stale("proc_b", 2))
+        self.assertEqual(snapshot.get("proc_b").revision.version, 2)
+        self.assertEqual(mock_recurse_flow.call_count, 2)
+
+    @patch("nipyapi.canvas.recurse_flow")
+    def test_process_group_utils_share_snapshot(self, mock_recurse_flow):
+        mock_recurse_flow.return_value = build_tree()
+        nifi_utils = NifiProcessGroupUtils("http://localhost:8080")
+
+        with patch("nipyapi.canvas.list_all_process_groups") as mock_list_all_process_groups:
+            self.assertEqual(nifi_utils.get_process_group_id("Ingest", use_snapshot=True),
+                             (True, "group_1"))
+            self.assertEqual(nifi_utils.get_process_group_id("Missing", use_snapshot=True),
+                             (False, None))
+            mock_list_all_process_groups.assert_not_called()
+        self.assertIs(nifi_utils.get_flow_snapshot(), nifi_utils.get_flow_snapshot())
+        mock_recurse_flow.assert_called_once()
+
+        nifi_utils.get_flow_snapshot(refresh=True)
+        self.assertEqual(mock_recurse_flow.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
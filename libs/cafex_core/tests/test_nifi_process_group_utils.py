@@ -327,7 +327,11 @@ class TestNifiProcessGroupUtils(unittest.TestCase):
         mock_schedule_process_group.assert_any_call("test_pg_id", scheduled=False)
         nifi_utils.reporting.insert_step.assert_called_with("Processor group found", "Processor group found", "Pass")
         nifi_utils.logger.info.assert_any_call("Process group %s started.", "test_pg_id")
-        nifi_utils.logger.info.assert_any_call("Process group %s stopped after %s seconds.", "test_pg_id", 5)
+        stopped = nifi_utils.logger.info.call_args_list[-1].args
+        self.assertEqual(stopped[0], "Process group %s stopped after %.2f seconds, drained: %s.")
+        self.assertEqual(stopped[1], "test_pg_id")
+        self.assertGreaterEqual(stopped[2], 0)
+        self.assertTrue(stopped[3])
 
     @patch('cafex_core.utils.apache_utils.nifi_process_group_utils.nipyapi.canvas.get_process_group_status')
     def test_start_then_stop_pg_not_found(self, mock_get_process_group_status):
@@ -1130,7 +1134,7 @@ class TestNifiProcessGroupUtils(unittest.TestCase):
             fail_test=False,
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_call_request_get_success(self, mock_get):
         # Arrange
         mock_response = MagicMock()
@@ -1156,7 +1160,7 @@ class TestNifiProcessGroupUtils(unittest.TestCase):
             proxies=None,
         )
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_call_request_delete_success(self, mock_delete):
         # Arrange
         mock_response = MagicMock()
@@ -1195,7 +1199,7 @@ class TestNifiProcessGroupUtils(unittest.TestCase):
         self.assertEqual(str(context.exception),
                          "Invalid HTTP method: INVALID. Valid options are: GET, POST, PUT, PATCH, DELETE")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_call_request_exception(self, mock_get):
         # Arrange
         mock_get.side_effect = requests.RequestException("Test Exception")
@@ -1210,7 +1214,7 @@ class TestNifiProcessGroupUtils(unittest.TestCase):
         nifi_utils.logger.exception.assert_called_once_with("Error in Apache call request method: %s", "Test Exception")
 
     @patch('cafex_core.utils.apache_utils.nifi_process_group_utils.Security.get_auth_string')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_call_request_with_auth_string(self, mock_get, mock_get_auth_string):
         # Arrange
         mock_get_auth_string.return_value = "Basic test_auth_string"
@@ -1264,7 +1268,7 @@ class TestNifiProcessGroupUtils(unittest.TestCase):
             )
         self.assertEqual(str(context.exception), "Payload is required for POST, PUT, and PATCH requests.")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_call_request_post_success(self, mock_request):
         # Arrange
         mock_response = MagicMock()
@@ -1316,6 +1320,69 @@ class TestNifiProcessGroupUtils(unittest.TestCase):
         # Assert
         self.assertEqual(mock_registry_config.host, expected_host)
 
+    @staticmethod
+    def _status_response(run_status="Running", queued=0):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"processGroupStatus": {"aggregateSnapshot": {
+            "id": "root-id", "activeThreadCount": 0, "flowFilesQueued": queued,
+            "processorStatusSnapshots": [
+                {"processorStatusSnapshot": {"id": "p1", "runStatus": run_status, "activeThreadCount": 0}}
+            ],
+            "connectionStatusSnapshots": [
+                {"connectionStatusSnapshot": {"id": "c1", "flowFilesQueued": queued}}
+            ],
+            "processGroupStatusSnapshots": [
+                {"processGroupStatusSnapshot": {
+                    "id": "child", "activeThreadCount": 1, "flowFilesQueued": 0,
+                    "processorStatusSnapshots": [
+                        {"processorStatusSnapshot": {"id": "p2", "runStatus": run_status, "activeThreadCount": 1}}
+                    ],
+                }}
+            ],
+        }}}
+        return response
+
+    @patch('cafex_core.utils.apache_utils.nifi_process_group_utils.NifiProcessGroupUtils.call_request')
+    def test_get_flow_status_indexes_nested_components(self, mock_call_request):
+        mock_call_request.return_value = self._status_response()
+
+        nifi_utils = NifiProcessGroupUtils("http://localhost:8080")
+        status = nifi_utils.get_flow_status()
+
+        mock_call_request.assert_called_once_with(
+            "GET", "http://localhost:8080/nifi-api/flow/process-groups/root/status?recursive=true",
+            {"Content-Type": "application/json"}
+        )
+        self.assertEqual(set(status["processors"]), {"p1", "p2"})
+        self.assertEqual(set(status["process_groups"]), {"root", "root-id", "child"})
+        self.assertEqual(status["connections"]["c1"]["flowFilesQueued"], 0)
+
+    @patch('time.sleep', return_value=None)
+    @patch('cafex_core.utils.apache_utils.nifi_process_group_utils.NifiProcessGroupUtils.call_request')
+    def test_wait_for_queue_drain_polls_one_status_per_tick(self, mock_call_request, mock_sleep):
+        mock_call_request.side_effect = [self._status_response(queued=5), self._status_response(queued=0)]
+
+        nifi_utils = NifiProcessGroupUtils("http://localhost:8080")
+        nifi_utils.reporting = MagicMock()
+
+        self.assertTrue(nifi_utils.wait_for_queue_drain(["c1"], timeout=10))
+        self.assertEqual(mock_call_request.call_count, 2)
+        mock_sleep.assert_called_once_with(0.5)
+        self.assertEqual(nifi_utils.reporting.insert_step.call_args[0][2], "Pass")
+
+    @patch('time.sleep', return_value=None)
+    @patch('cafex_core.utils.apache_utils.nifi_process_group_utils.NifiProcessGroupUtils.call_request')
+    def test_wait_for_process_groups_reports_pending(self, mock_call_request, mock_sleep):
+        mock_call_request.return_value = self._status_response()
+
+        nifi_utils = NifiProcessGroupUtils("http://localhost:8080")
+        nifi_utils.reporting = MagicMock()
+
+        self.assertFalse(nifi_utils.wait_for_process_groups(["root", "child"], timeout=0))
+        self.assertEqual(mock_call_request.call_count, 1)
+        self.assertIn("process_groups child did not reach", nifi_utils.reporting.insert_step.call_args[0][1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1313,6 +1313,20 @@ class TestNifiProcessorUtils(unittest.TestCase):
         self.assertFalse(result)
         nifi_utils._NifiProcessorUtils__obj_exception.raise_generic_exception.assert_called_once()
 
+    def test_wait_for_processors_checks_run_status_and_threads(self):
+        nifi_utils = NifiProcessorUtils("http://localhost:8080")
+        nifi_utils.nifi_process_group_utils = MagicMock()
+
+        nifi_utils.wait_for_processors(["p1", "p2"], run_status="STOPPED", idle=True, timeout=30)
+
+        args = nifi_utils.nifi_process_group_utils.wait_for_components.call_args[0]
+        self.assertEqual(args[0], ["p1", "p2"])
+        self.assertEqual(args[2:6], ("processors", None, "root", 30))
+        condition = args[1]
+        self.assertTrue(condition({"runStatus": "Stopped", "activeThreadCount": 0}))
+        self.assertFalse(condition({"runStatus": "Stopped", "activeThreadCount": 2}))
+        self.assertFalse(condition({"runStatus": "Running", "activeThreadCount": 0}))
+
 
 if __name__ == '__main__':
     unittest.main()
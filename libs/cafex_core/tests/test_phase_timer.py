@@ -0,0 +1,71 @@
+import shutil
+import tempfile
+import unittest
+
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.phase_timer import LOCATOR_TIMINGS, PhaseTimer
+
+
+class TestPhaseTimer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.session_store = SessionStore()
+        self.session_store.phase_timings = {}
+        self.session_store.phase_timings_per_test = {}
+        self.session_store.current_test = None
+        self.worker_id = self.session_store.storage.get("worker_id")
+        self.phase_timer = PhaseTimer()
+
+    def tearDown(self):
+        self.session_store.phase_timings = {}
+        self.session_store.phase_timings_per_test = {}
+        self.session_store.storage.pop(LOCATOR_TIMINGS, None)
+        self.session_store.current_test = None
+        self.session_store.worker_id = self.worker_id
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_timed_records_sample_and_returns_result(self):
+        @PhaseTimer.timed("sample_phase")
+        def sample(value):
+            return value * 2
+
+        self.assertEqual(sample(3), 6)
+        self.assertEqual(len(self.phase_timer.samples["sample_phase"]), 1)
+
+    def test_measure_records_sample_on_error(self):
+        with self.assertRaises(ValueError):
+            with self.phase_timer.measure("failing_phase"):
+                raise ValueError("boom")
+        self.assertEqual(len(self.phase_timer.samples["failing_phase"]), 1)
+
+    def test_measure_attributes_sample_to_test_started_in_block(self):
+        with self.phase_timer.measure("run_test_setup"):
+            self.session_store.current_test = "test_a.py::test_one"
+        self.assertIn("run_test_setup", self.phase_timer.per_test["test_a.py::test_one"])
+
+    def test_aggregate_count_total_and_p95(self):
+        summary = PhaseTimer.aggregate({"step": [float(value) for value in range(1, 21)], "empty": []})
+        self.assertEqual(summary, {"step": {"count": 20, "totalSeconds": 210.0, "p95Seconds": 19.0}})
+
+    def test_save_and_load_merges_workers(self):
+        for worker_id, seconds in (("gw0", 1.0), ("gw1", 2.0)):
+            self.session_store.worker_id = worker_id
+            self.session_store.phase_timings = {}
+            self.phase_timer.record("log_report", seconds)
+            self.phase_timer.save(self.temp_dir)
+        self.assertEqual(sorted(self.phase_timer.load_samples(self.temp_dir)["log_report"]), [1.0, 2.0])
+
+    def test_named_timer_keeps_samples_and_folder_apart(self):
+        locator_timer = PhaseTimer(LOCATOR_TIMINGS)
+        locator_timer.record("id=username", 0.5)
+        self.phase_timer.record("log_report", 1.0)
+        locator_timer.save(self.temp_dir)
+
+        self.assertNotIn("id=username", self.phase_timer.samples)
+        self.assertEqual(PhaseTimer(LOCATOR_TIMINGS).load_samples(self.temp_dir), {"id=username": [0.5]})
+        self.assertEqual(self.phase_timer.load_samples(self.temp_dir), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from cafex_core.utils.poller import Poller
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def __call__(self):
+        return self.now
+
+
+class TestPoller(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _poller(self, timeout=10, initial_interval=0.5, max_interval=2.0):
+        return Poller(timeout, initial_interval, max_interval, backoff=2.0,
+                      sleep=self.clock.sleep, clock=self.clock)
+
+    def test_wait_returns_immediately_when_condition_holds(self):
+        met, value, stats = self._poller().wait(lambda: "RUNNING", lambda v: v == "RUNNING")
+        self.assertTrue(met)
+        self.assertEqual(value, "RUNNING")
+        self.assertEqual(stats["polls"], 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_intervals_back_off_up_to_max_interval(self):
+        values = iter([3, 2, 1, 1, 0])
+        met, value, stats = self._poller().wait(lambda: next(values), lambda v: v == 0)
+        self.assertTrue(met)
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0, 2.0, 2.0])
+        self.assertEqual(stats["polls"], 5)
+
+    def test_wait_stops_at_deadline(self):
+        met, value, stats = self._poller(timeout=3).wait(lambda: 1, lambda v: v == 0)
+        self.assertFalse(met)
+        self.assertEqual(value, 1)
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0, 1.5])
+        self.assertEqual(stats["seconds"], 3.0)
+
+    def test_wait_all_uses_one_probe_per_tick(self):
+        ticks = iter([
+            {"a": "STOPPED", "b": "RUNNING"},
+            {"a": "STOPPED", "b": "RUNNING", "c": "STOPPED"},
+            {"a": "RUNNING", "b": "STOPPED", "c": "STOPPED"},
+        ])
+        calls = []
+
+        def probe_all():
+            calls.append(1)
+            return next(ticks)
+
+        met, values, stats = self._poller().wait_all(probe_all, lambda v: v == "STOPPED", ["a", "b", "c"])
+        self.assertTrue(met)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(values, {"a": "STOPPED", "b": "STOPPED", "c": "STOPPED"})
+        self.assertEqual(stats["pending"], [])
+
+    def test_wait_all_reports_pending_keys(self):
+        met, _, stats = self._poller(timeout=1).wait_all(lambda: {"a": 0}, lambda v: v == 0, ["a", "b"])
+        self.assertFalse(met)
+        self.assertEqual(stats["pending"], ["b"])
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            Poller(initial_interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
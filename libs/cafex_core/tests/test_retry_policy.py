@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+
+from cafex_core.utils.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.waits = []
+
+    def _policy(self, **kwargs):
+        kwargs.setdefault("jitter", False)
+        return RetryPolicy(sleep=self.waits.append, **kwargs)
+
+    @staticmethod
+    def _response(status_code, headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        return response
+
+    def test_returns_first_success_without_waiting(self):
+        response, stats = self._policy().execute(lambda: self._response(200))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(stats, {"attempts": 1, "retries": 0, "waitSeconds": 0.0})
+        self.assertEqual(self.waits, [])
+
+    def test_retries_status_with_exponential_backoff(self):
+        responses = iter([self._response(503), self._response(503), self._response(200)])
+        response, stats = self._policy(backoff_factor=1.0).execute(lambda: next(responses))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.waits, [1.0, 2.0])
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["waitSeconds"], 3.0)
+
+    def test_honors_retry_after_header(self):
+        responses = iter([self._response(429, {"Retry-After": "7"}), self._response(200)])
+        self._policy().execute(lambda: next(responses))
+        self.assertEqual(self.waits, [7.0])
+
+    def test_caps_retry_after_at_max_backoff(self):
+        responses = iter([self._response(503, {"Retry-After": "3600"}), self._response(200)])
+        self._policy(max_backoff=5.0).execute(lambda: next(responses))
+        self.assertEqual(self.waits, [5.0])
+
+    def test_non_idempotent_method_only_retries_connect_errors(self):
+        policy = self._policy().for_method("POST")
+        func = MagicMock(side_effect=requests.exceptions.ReadTimeout("read timed out"))
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            policy.execute(func)
+        self.assertEqual(func.call_count, 1)
+        response, _ = policy.execute(lambda: self._response(503))
+        self.assertEqual(response.status_code, 503)
+
+        func = MagicMock(side_effect=[requests.exceptions.ConnectTimeout("timed out"),
+                                      self._response(200)])
+        response, stats = policy.execute(func)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(stats["retries"], 1)
+
+    def test_idempotent_and_opted_in_methods_use_the_policy(self):
+        policy = self._policy(retry_methods=("GET", "post"))
+        self.assertIs(policy.for_method("get"), policy)
+        self.assertIs(policy.for_method("POST"), policy)
+        self.assertTrue(policy.for_method("PATCH").connect_errors_only)
+
+    def test_returns_last_response_when_attempts_exhausted(self):
+        response, stats = self._policy(max_attempts=2).execute(lambda: self._response(503))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(stats["attempts"], 2)
+
+    def test_raises_last_exception_when_attempts_exhausted(self):
+        func = MagicMock(side_effect=requests.exceptions.ConnectionError("refused"))
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self._policy(max_attempts=3).execute(func)
+        self.assertEqual(func.call_count, 3)
+
+    def test_does_not_retry_other_exceptions(self):
+        func = MagicMock(side_effect=ValueError("bad"))
+        with self.assertRaises(ValueError):
+            self._policy().execute(func)
+        self.assertEqual(func.call_count, 1)
+
+    def test_deadline_stops_retries(self):
+        responses = iter([self._response(503, {"Retry-After": "60"}), self._response(200)])
+        response, stats = self._policy(deadline=10).execute(lambda: next(responses))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.waits, [])
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=3.0)
+        for retry in range(1, 6):
+            self.assertTrue(0 <= policy.backoff(retry) <= min(3.0, 2 ** (retry - 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
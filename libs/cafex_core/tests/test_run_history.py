@@ -0,0 +1,69 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from cafex_core.utils.run_history import RunHistory
+
+
+class TestRunHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.result_dir = tempfile.mkdtemp()
+        self.history_dir = os.path.join(self.result_dir, "history")
+        os.makedirs(self.history_dir)
+        self.run_history = RunHistory(self.result_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.result_dir, ignore_errors=True)
+
+    def _write_run(self, name, tests):
+        run_dir = os.path.join(self.history_dir, name)
+        os.makedirs(run_dir)
+        with open(os.path.join(run_dir, "result.json"), "w") as file:
+            json.dump({"tests": {"pytest": tests, "pytestBdd": [], "unittest": []}}, file)
+        time.sleep(0.01)
+
+    def test_get_result_files_newest_first(self):
+        self._write_run("20240101_000000_a", [])
+        self._write_run("20240102_000000_b", [])
+        os.makedirs(os.path.join(self.history_dir, "incomplete"))
+        files = self.run_history.get_result_files()
+        self.assertEqual(len(files), 2)
+        self.assertIn("20240102_000000_b", files[0])
+        self.assertEqual(len(self.run_history.get_result_files(max_runs=1)), 1)
+
+    def test_get_result_files_without_history(self):
+        self.assertEqual(RunHistory(os.path.join(self.result_dir, "missing")).get_result_files(), [])
+
+    def test_get_duration_estimates_uses_median(self):
+        for index, duration in enumerate([1.0, 9.0, 2.0]):
+            self._write_run(
+                f"run_{index}",
+                [
+                    {"nodeId": "t.py::test_a", "durationSeconds": duration},
+                    {"nodeId": "t.py::test_b@cafex_lpt_1", "durationSeconds": 4.0},
+                    {"nodeId": "t.py::test_c", "durationSeconds": None},
+                ],
+            )
+        estimates = self.run_history.get_duration_estimates()
+        self.assertEqual(estimates["t.py::test_a"], 2.0)
+        self.assertEqual(estimates["t.py::test_b"], 4.0)
+        self.assertNotIn("t.py::test_c", estimates)
+
+    def test_iter_runs_skips_invalid_files(self):
+        run_dir = os.path.join(self.history_dir, "broken")
+        os.makedirs(run_dir)
+        with open(os.path.join(run_dir, "result.json"), "w") as file:
+            file.write("{broken")
+        self.assertEqual(list(self.run_history.iter_runs()), [])
+
+    def test_normalize_node_id(self):
+        self.assertEqual(RunHistory.normalize_node_id("t.py::test_a@group_1"), "t.py::test_a")
+        self.assertEqual(RunHistory.normalize_node_id("t.py::test_a[x@y]"), "t.py::test_a[x@y]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import shutil
+import tempfile
+import unittest
+
+from cafex_core.utils.run_index import RunIndex
+
+
+class TestRunIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.result_dir = tempfile.mkdtemp()
+        self.run_index = RunIndex(self.result_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.result_dir, ignore_errors=True)
+
+    def _ingest(self, index, tests):
+        self.run_index.ingest_run(
+            {
+                "executionInfo": {
+                    "executionId": f"run-{index}",
+                    "executionStartTime": f"2024-01-{index + 1:02d}T10:00:00.000",
+                    "executionStatus": "P",
+                },
+                "tests": {
+                    "pytest": [
+                        {
+                            "nodeId": node_id,
+                            "name": node_id.split("::")[-1],
+                            "testType": "pytest",
+                            "testStatus": status,
+                            "durationSeconds": duration,
+                            "steps": [{"stepName": "step", "stepStatus": status,
+                                       "stepDurationSeconds": duration}],
+                        }
+                        for node_id, (status, duration) in tests.items()
+                    ]
+                },
+            }
+        )
+
+    def test_exists_and_execution_ids(self):
+        self.assertFalse(self.run_index.exists())
+        self.assertEqual(self.run_index.get_execution_ids(), [])
+        self._ingest(0, {"t.py::a": ("P", 1.0)})
+        self._ingest(1, {"t.py::a": ("P", 1.0)})
+        self.assertTrue(self.run_index.exists())
+        self.assertEqual(self.run_index.get_execution_ids(), ["run-1", "run-0"])
+        self.assertEqual(self.run_index.get_execution_ids(1), ["run-1"])
+
+    def test_ingest_run_replaces_existing_rows(self):
+        self._ingest(0, {"t.py::a": ("P", 1.0)})
+        self._ingest(0, {"t.py::a": ("F", 3.0)})
+        self.assertEqual(self.run_index.get_last_run_statuses(), {"t.py::a": "F"})
+        self.assertEqual(self.run_index.get_duration_estimates(), {"t.py::a": 3.0})
+
+    def test_ingest_run_requires_execution_id(self):
+        with self.assertRaises(ValueError):
+            self.run_index.ingest_run({"executionInfo": {}, "tests": {}})
+
+    def test_ingest_run_normalizes_xdist_group_suffix(self):
+        self._ingest(0, {"t.py::a@cafex_lpt_0": ("P", 1.0)})
+        self.assertIn("t.py::a", self.run_index.get_duration_estimates())
+
+    def test_slowest_tests(self):
+        for index, durations in enumerate([(1.0, 5.0), (2.0, 7.0), (3.0, 6.0)]):
+            self._ingest(index, {"t.py::fast": ("P", durations[0]), "t.py::slow": ("P", durations[1])})
+        slowest = self.run_index.slowest_tests(limit=1)
+        self.assertEqual(slowest, [{"nodeId": "t.py::slow", "medianSeconds": 6.0, "maxSeconds": 7.0,
+                                    "runs": 3}])
+
+    def test_duration_regressions(self):
+        for index, duration in enumerate([2.0, 2.0, 2.2, 6.0]):
+            self._ingest(index, {"t.py::a": ("P", duration), "t.py::b": ("P", 1.0)})
+        regressions = self.run_index.duration_regressions(runs=3, threshold=1.5)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["nodeId"], "t.py::a")
+        self.assertEqual(regressions[0]["medianSeconds"], 2.0)
+        self.assertEqual(regressions[0]["ratio"], 3.0)
+
+    def test_duration_regressions_skip_tests_missing_from_latest_run(self):
+        self._ingest(0, {"t.py::a": ("P", 1.0), "t.py::b": ("P", 1.0)})
+        self._ingest(1, {"t.py::a": ("P", 5.0), "t.py::b": ("P", 1.0)})
+        self._ingest(2, {"t.py::b": ("P", 1.0)})
+        self.assertEqual(self.run_index.duration_regressions(runs=3), [])
+
+    def test_flaky_tests(self):
+        for index, status in enumerate(["P", "F", "P", "P"]):
+            self._ingest(index, {"t.py::flaky": (status, 1.0), "t.py::stable": ("P", 1.0)})
+        flaky = self.run_index.flaky_tests()
+        self.assertEqual(flaky, [{"nodeId": "t.py::flaky", "failures": 1, "runs": 4, "flips": 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -524,6 +524,72 @@ class TestSshHandler(unittest.TestCase):
         except Exception as e:
             print("Exception Occurred")
 
+    @staticmethod
+    def _exec_client(stdout_lines, stderr_lines, exit_status=0):
+        client = MagicMock()
+        stdout, stderr = MagicMock(), MagicMock()
+        stdout.__iter__.return_value = iter(stdout_lines)
+        stderr.__iter__.return_value = iter(stderr_lines)
+        stdout.channel.recv_exit_status.return_value = exit_status
+        client.exec_command.return_value = (MagicMock(), stdout, stderr)
+        client.get_transport.return_value.is_active.return_value = True
+        return client
+
+    def test_exec_command_streams_output_and_exit_status(self):
+        client = self._exec_client(["line1\n", "line2\n"], ["warning\n"], exit_status=2)
+        streamed = []
+
+        result = self.ssh_handler.exec_command(
+            client, "tail -2 app.log", timeout=5, on_output=lambda stream, line: streamed.append(stream)
+        )
+
+        self.assertEqual(result["exit_status"], 2)
+        self.assertEqual(result["stdout"], ["line1\n", "line2\n"])
+        self.assertEqual(result["stderr"], ["warning\n"])
+        self.assertCountEqual(streamed, ["stdout", "stdout", "stderr"])
+        client.exec_command.assert_called_once_with(
+            "tail -2 app.log", timeout=5, get_pty=False, environment=None
+        )
+
+    @patch('cafex_core.utils.exceptions.CoreExceptions.raise_generic_exception')
+    def test_exec_command_with_none_ssh_client(self, mock_raise_generic_exception):
+        with self.assertRaises(ValueError):
+            self.ssh_handler.exec_command(None, "ls")
+        mock_raise_generic_exception.assert_called_once()
+
+    @patch('cafex_core.utils.core_security.Security.establish_ssh_connection')
+    def test_get_connection_is_cached_per_host(self, mock_establish_ssh_connection):
+        mock_establish_ssh_connection.side_effect = lambda *args: self._exec_client([], [])
+
+        first = self.ssh_handler.get_connection("node1", "user", "pass")
+        self.assertIs(self.ssh_handler.get_connection("node1", "user", "pass"), first)
+        first.get_transport.return_value.is_active.return_value = False
+        self.assertIsNot(self.ssh_handler.get_connection("node1", "user", "pass"), first)
+        self.assertEqual(mock_establish_ssh_connection.call_count, 2)
+        first.close.assert_called_once()
+
+    @patch('cafex_core.utils.core_security.Security.establish_ssh_connection')
+    @patch('cafex_core.utils.exceptions.CoreExceptions.raise_generic_exception')
+    def test_exec_command_on_hosts_returns_per_host_results(self, mock_raise_generic_exception,
+                                                            mock_establish_ssh_connection):
+        def connect(server_name, *args):
+            if server_name == "down":
+                raise TimeoutError("timed out")
+            return self._exec_client([f"{server_name}\n"], [])
+
+        mock_establish_ssh_connection.side_effect = connect
+
+        results = self.ssh_handler.exec_command_on_hosts(
+            ["node1", "down", "node2"], "hostname", username="user", password="pass"
+        )
+
+        self.assertEqual(list(results), ["node1", "down", "node2"])
+        self.assertEqual(results["node1"]["stdout"], ["node1\n"])
+        self.assertEqual(results["node2"]["exit_status"], 0)
+        self.assertIsNone(results["node2"]["error"])
+        self.assertIsNone(results["down"]["exit_status"])
+        self.assertIn("timed out", results["down"]["error"])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,16 +1,24 @@
 import base64
+import hashlib
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from pyhive import hive
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from thrift.transport import THttpClient
 
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.utils.core_security import Security
 from cafex_core.utils.exceptions import CoreExceptions
+from cafex_core.utils.poller import Poller
+
+
+DBFS_BLOCK_SIZE = 1024 * 1024
+"""The maximum number of bytes the DBFS API accepts in one add-block or returns from one read."""
 
 
 class DatabricksUtils:
@@ -20,7 +28,9 @@ class DatabricksUtils:
         Databricks Rest API
     """
 
-    def __init__(self, str_databricks_url, str_access_token=None):
+    TERMINAL_LIFE_CYCLE_STATES = ("TERMINATED", "SKIPPED", "INTERNAL_ERROR")
+
+    def __init__(self, str_databricks_url, str_access_token=None, pint_pool_maxsize=10):
         self.__obj_db_exception = CoreExceptions()
         self.__databricks_api_version = "2.0"
         self.__databricks_api_path = str_databricks_url + "/api/" + self.__databricks_api_version
@@ -29,6 +39,10 @@ class DatabricksUtils:
         self.context_id = None
         self.logger = CoreLogger(name=__name__).get_logger()
         self.security = Security()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pint_pool_maxsize, pool_maxsize=pint_pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def list_dbfs_files(self, str_dbfs_path):
         """
@@ -115,6 +129,146 @@ class DatabricksUtils:
                 fail_test=False,
             )
 
+    def __dbfs_request(self, str_method, str_resource, dict_payload):
+        """
+        Description:
+                |  This private method calls a DBFS endpoint and returns its JSON response
+
+        :param str_method: HTTP method
+        :type str_method: String
+        :param str_resource: DBFS resource, e.g. /dbfs/add-block
+        :type str_resource: String
+        :param dict_payload: request body
+        :type dict_payload: dictionary
+
+        :return: dict - the response body
+        """
+        dict_api_header = {"Content-Type": "application/json",
+                           "Authorization": "Bearer " + self.databricks_access_token}
+        obj_response = self.call_request(
+            str_method, self.__databricks_api_path + str_resource, dict_api_header,
+            str_payload=json.dumps(dict_payload)
+        )
+        if obj_response.status_code != 200:
+            raise requests.HTTPError(
+                f"{str_resource} returned {obj_response.status_code}: {obj_response.text}",
+                response=obj_response,
+            )
+        return obj_response.json()
+
+    def upload_file_to_dbfs(self, str_src_path, str_dbfs_file_path, bln_overwrite=True,
+                            pint_block_size=DBFS_BLOCK_SIZE, bln_verify_checksum=False):
+        """
+        Description:
+                |  This method is used to upload a file of any size to dbfs. The file is streamed in
+                |  blocks through the create/add-block/close handle API, so only one block is held in
+                |  memory and the single-request size limit of /dbfs/put does not apply.
+
+        :param str_src_path: Source Path for the File to upload
+        :type str_src_path: String
+        :param str_dbfs_file_path: DBFS path of the uploaded file, including the file name
+        :type str_dbfs_file_path: String
+        :param bln_overwrite: overwrite an existing file
+        :type bln_overwrite: boolean
+        :param pint_block_size: bytes sent per add-block request, at most DBFS_BLOCK_SIZE
+        :type pint_block_size: integer
+        :param bln_verify_checksum: read the uploaded file back and compare its sha256 with the source
+        :type bln_verify_checksum: boolean
+
+        :return: boolean, dict - Tuple without parentheses indicating 'execution_result' and dictionary object
+        with the path, bytes, sha256, seconds and, when verified, checksum_match of the upload.
+        Examples:
+                |  upload_file_to_dbfs("jars/DatabricksApps-0.0.7-SNAPSHOT.jar", "/FileStore/mdata-1/app.jar")
+                |  upload_file_to_dbfs("testdata/student.csv", "/FileStore/mdata-1/student.csv", bln_verify_checksum=True)
+
+        """
+        try:
+            int_block_size = min(pint_block_size, DBFS_BLOCK_SIZE)
+            start = time.perf_counter()
+            obj_sha256 = hashlib.sha256()
+            int_bytes = 0
+            int_handle = self.__dbfs_request(
+                "POST", "/dbfs/create", {"path": str_dbfs_file_path, "overwrite": bln_overwrite}
+            )["handle"]
+            try:
+                with open(str_src_path, "rb") as fp:
+                    for bytes_block in iter(lambda: fp.read(int_block_size), b""):
+                        obj_sha256.update(bytes_block)
+                        int_bytes += len(bytes_block)
+                        self.__dbfs_request(
+                            "POST", "/dbfs/add-block",
+                            {"handle": int_handle,
+                             "data": base64.b64encode(bytes_block).decode("ascii")},
+                        )
+            finally:
+                self.__dbfs_request("POST", "/dbfs/close", {"handle": int_handle})
+            dict_result = {
+                "path": str_dbfs_file_path,
+                "bytes": int_bytes,
+                "sha256": obj_sha256.hexdigest(),
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+            if bln_verify_checksum:
+                obj_remote_sha256 = hashlib.sha256()
+                for bytes_block in self.iter_dbfs_file(str_dbfs_file_path):
+                    obj_remote_sha256.update(bytes_block)
+                dict_result["checksum_match"] = \
+                    obj_remote_sha256.hexdigest() == dict_result["sha256"]
+                if not dict_result["checksum_match"]:
+                    self.logger.info("Checksum mismatch after uploading %s", str_dbfs_file_path)
+                    return False, dict_result
+            self.logger.info("Uploaded %s bytes to %s in %ss", int_bytes, str_dbfs_file_path,
+                             dict_result["seconds"])
+            return True, dict_result
+        except Exception as e:
+            self.__obj_db_exception.raise_generic_exception(
+                message=f"Error -> DB not connected properly: {str(e)}",
+                trim_log=True,
+                fail_test=False,
+            )
+            return False, None
+
+    def upload_files_to_dbfs_parallel(self, plist_src_paths, str_dbfs_path, bln_overwrite=True,
+                                      pint_max_workers=4, bln_verify_checksum=False):
+        """
+        Description:
+                |  This method is used to upload several files to a dbfs folder concurrently, each
+                |  streamed with upload_file_to_dbfs.
+
+        :param plist_src_paths: Source Paths of the Files to upload
+        :type plist_src_paths: list
+        :param str_dbfs_path: DBFS folder path
+        :type str_dbfs_path: String
+        :param bln_overwrite: overwrite existing files
+        :type bln_overwrite: boolean
+        :param pint_max_workers: maximum number of concurrent uploads
+        :type pint_max_workers: integer
+        :param bln_verify_checksum: read every uploaded file back and compare its sha256 with the source
+        :type bln_verify_checksum: boolean
+
+        :return: boolean, dict - Tuple without parentheses indicating whether every file was uploaded and
+        dictionary object keyed by source path with the result of upload_file_to_dbfs for each file.
+        Examples:
+                |  upload_files_to_dbfs_parallel(["testdata/a.csv", "testdata/b.csv"], "/FileStore/mdata-1/")
+
+        .. note::
+                |  Please don't include the name of file in 'str_dbfs_path' parameter. Refer Examples
+
+        """
+        str_dbfs_folder = str_dbfs_path.rstrip("/") + "/"
+
+        def upload(str_src_path):
+            return self.upload_file_to_dbfs(
+                str_src_path, str_dbfs_folder + os.path.basename(str_src_path),
+                bln_overwrite=bln_overwrite, bln_verify_checksum=bln_verify_checksum,
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(pint_max_workers,
+                                                       len(plist_src_paths)))) as executor:
+            list_results = list(executor.map(upload, plist_src_paths))
+        dict_results = {src: result[1] for src, result in zip(plist_src_paths, list_results)}
+        return all(result[0] for result in list_results), dict_results
+
     def create_notebook(self, str_file_path, str_workspace_path, str_language="PYTHON"):
         """
         Description:
@@ -720,6 +874,69 @@ class DatabricksUtils:
                 fail_test=False,
             )
 
+    def execute_jobs(self, plist_job_ids, pdict_params=None, bln_wait=True, pint_timeout=3600,
+                     pint_initial_interval=5, pint_max_interval=60):
+        """
+        Description:
+                |  This method is used to execute several spark jobs at once and optionally wait for all
+                |  of them to finish. The runs are triggered together and then waited on together with
+                |  wait_for_runs, so the total wait is that of the slowest job rather than the sum of all.
+
+        :param plist_job_ids: Spark Job ids
+        :type plist_job_ids: list
+        :param pdict_params: optional parameters to execute every job with, or a dictionary of such
+                             parameters keyed by job id
+        :type pdict_params: dictionary
+        :param bln_wait: wait for the runs to reach a terminal state
+        :type bln_wait: boolean
+        :param pint_timeout: overall deadline in seconds for all the runs
+        :type pint_timeout: integer
+        :param pint_initial_interval: first wait in seconds between status checks
+        :type pint_initial_interval: integer
+        :param pint_max_interval: maximum wait in seconds between status checks
+        :type pint_max_interval: integer
+
+        :return: boolean, dict - Tuple without parentheses indicating 'execution_result' and dictionary object
+        keyed by job id. Without waiting each value is the run-now response; otherwise it is the run state
+        returned by wait_for_runs. The result is True only if every job was triggered and, when waiting,
+        every run succeeded.
+        Examples:
+                |  execute_jobs([65656, 65657])
+                |  execute_jobs([65656, 65657], pdict_params={65656: {"notebook_params": {"env": "qa"}}})
+
+        """
+        try:
+            pdict_params = pdict_params or {}
+            bln_per_job = bool(pdict_params) and set(pdict_params).issubset(set(plist_job_ids))
+            dict_runs = {}
+            bln_triggered = True
+            for job_id in plist_job_ids:
+                dict_job_params = pdict_params.get(job_id) if bln_per_job else pdict_params
+                result = self.execute_job(job_id, pdict_params=dict_job_params or None)
+                if result and result[0]:
+                    dict_runs[job_id] = result[1]
+                else:
+                    self.logger.info("Job %s could not be triggered", job_id)
+                    dict_runs[job_id] = None
+                    bln_triggered = False
+            if not bln_wait:
+                return bln_triggered, dict_runs
+            dict_run_ids = {job_id: run["run_id"] for job_id, run in dict_runs.items() if run}
+            bln_succeeded, dict_states = self.wait_for_runs(
+                list(dict_run_ids.values()),
+                pint_timeout=pint_timeout,
+                pint_initial_interval=pint_initial_interval,
+                pint_max_interval=pint_max_interval,
+            )
+            dict_result = {job_id: dict_states.get(dict_run_ids.get(job_id)) for job_id in plist_job_ids}
+            return bln_triggered and bln_succeeded, dict_result
+        except Exception as e:
+            self.__obj_db_exception.raise_generic_exception(
+                message=f"Error -> DB not connected properly: {str(e)}",
+                trim_log=True,
+                fail_test=False,
+            )
+
     def get_job_output(self, pint_run_id):
         """
         Description:
@@ -752,6 +969,38 @@ class DatabricksUtils:
                 fail_test=False,
             )
 
+    def get_run(self, pint_run_id):
+        """
+        Description:
+                |  This method is used to get the metadata and state of a job run
+
+        :param pint_run_id: Job run id
+        :type pint_run_id: integer
+
+        :return: boolean, dict - Tuple without parentheses indicating 'execution_result' and dictionary object.
+        Examples:
+                |  get_run(65655)
+
+        """
+        try:
+            str_api_method = "GET"
+            dict_api_header = {"Authorization": "Bearer " + self.databricks_access_token}
+            str_resource = "/jobs/runs/get"
+            str_uri = self.__databricks_api_path + str_resource
+            dict_payload = {"run_id": pint_run_id}
+            obj_response = self.call_request(
+                str_api_method, str_uri, dict_api_header, str_payload=json.dumps(dict_payload)
+            )
+            if obj_response.status_code == 200:
+                return True, obj_response.json()
+            return False, None
+        except Exception as e:
+            self.__obj_db_exception.raise_generic_exception(
+                message=f"Error -> DB not connected properly: {str(e)}",
+                trim_log=True,
+                fail_test=False,
+            )
+
     def read_dbfs_file(self, str_dbfs_path, pint_offset=0, pint_length=1000):
         """
         Description:
@@ -788,6 +1037,91 @@ class DatabricksUtils:
                 fail_test=False,
             )
 
+    def iter_dbfs_file(self, str_dbfs_path, pint_offset=0, pint_chunk_size=DBFS_BLOCK_SIZE):
+        """
+        Description:
+                |  This method is used to read a dbfs file of any size chunk by chunk. Each chunk is one
+                |  /dbfs/read request, so the file is never held in memory as a whole.
+
+        :param str_dbfs_path: dbfs path
+        :type str_dbfs_path: String
+        :param pint_offset: the point from where to start reading the content
+        :type pint_offset: integer
+        :param pint_chunk_size: bytes read per request, at most DBFS_BLOCK_SIZE
+        :type pint_chunk_size: integer
+
+        :return: generator - yields the decoded bytes of each chunk; raises requests.HTTPError when a
+        read fails.
+        Examples:
+                |  for chunk in iter_dbfs_file("/FileStore/mdata-1/users-11.csv"):
+                |      process(chunk)
+
+        """
+        int_chunk_size = min(pint_chunk_size, DBFS_BLOCK_SIZE)
+        int_offset = pint_offset
+        while True:
+            dict_response = self.__dbfs_request(
+                "GET", "/dbfs/read",
+                {"path": str_dbfs_path, "offset": int_offset, "length": int_chunk_size},
+            )
+            int_bytes_read = dict_response.get("bytes_read", 0)
+            if int_bytes_read:
+                yield base64.b64decode(dict_response["data"])
+                int_offset += int_bytes_read
+            if int_bytes_read < int_chunk_size:
+                return
+
+    def download_file_from_dbfs(self, str_dbfs_path, str_local_path,
+                                pint_chunk_size=DBFS_BLOCK_SIZE, pstr_expected_sha256=None):
+        """
+        Description:
+                |  This method is used to download a dbfs file of any size to a local path, streaming it
+                |  chunk by chunk with iter_dbfs_file.
+
+        :param str_dbfs_path: dbfs path
+        :type str_dbfs_path: String
+        :param str_local_path: local file path
+        :type str_local_path: String
+        :param pint_chunk_size: bytes read per request, at most DBFS_BLOCK_SIZE
+        :type pint_chunk_size: integer
+        :param pstr_expected_sha256: expected sha256 of the file, e.g. from upload_file_to_dbfs
+        :type pstr_expected_sha256: String
+
+        :return: boolean, dict - Tuple without parentheses indicating 'execution_result' and dictionary object
+        with the path, bytes, sha256, seconds and, when an expected sha256 is given, checksum_match.
+        Examples:
+                |  download_file_from_dbfs("/FileStore/mdata-1/users-11.csv", "downloads/users-11.csv")
+
+        """
+        try:
+            start = time.perf_counter()
+            obj_sha256 = hashlib.sha256()
+            int_bytes = 0
+            with open(str_local_path, "wb") as fp:
+                for bytes_chunk in self.iter_dbfs_file(str_dbfs_path, pint_chunk_size=pint_chunk_size):
+                    fp.write(bytes_chunk)
+                    obj_sha256.update(bytes_chunk)
+                    int_bytes += len(bytes_chunk)
+            dict_result = {
+                "path": str_local_path,
+                "bytes": int_bytes,
+                "sha256": obj_sha256.hexdigest(),
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+            if pstr_expected_sha256 is not None:
+                dict_result["checksum_match"] = dict_result["sha256"] == pstr_expected_sha256
+                if not dict_result["checksum_match"]:
+                    self.logger.info("Checksum mismatch after downloading %s", str_dbfs_path)
+                    return False, dict_result
+            return True, dict_result
+        except Exception as e:
+            self.__obj_db_exception.raise_generic_exception(
+                message=f"Error -> DB not connected properly: {str(e)}",
+                trim_log=True,
+                fail_test=False,
+            )
+            return False, None
+
     def __create_context(self, str_language, str_cluster_id, str_version=None):
         """
         Description:
@@ -1084,7 +1418,7 @@ class DatabricksUtils:
             }
             """obj_response = self.call_request(str_api_method, str_uri,
             dict_api_header, str_payload=json.dumps(str_payload))"""
-            obj_response = requests.post(
+            obj_response = self.session.post(
                 str_uri,
                 auth=HTTPBasicAuth(str_username, str_password),
                 data=json.dumps(str_payload),
@@ -1173,31 +1507,121 @@ class DatabricksUtils:
         :return: If the job status is SUCCESS method returns true.
         """
         try:
-            bln_job_completed = False
-            for int_cnt in range(pint_retry_count):
-                bool_job_output_exists, dict_job_output = self.get_job_output(pint_run_id)
-                if bool_job_output_exists and (
-                    dict_job_output["metadata"]["state"]["life_cycle_state"] == "TERMINATED"
-                    or dict_job_output["metadata"]["state"]["life_cycle_state"] == "INTERNAL_ERROR"
-                ):
-                    str_job_result_state = dict_job_output["metadata"]["state"]["result_state"]
-                    if str_job_result_state is not None and str_job_result_state == "FAILED":
-                        bln_job_completed = False
-                        break
-                    if str_job_result_state is not None and str_job_result_state == "SUCCESS":
-                        bln_job_completed = True
-                        break
-                elif not bool_job_output_exists:
-                    self.logger.info(
-                        "The databricks Job Run ID do not exits or has some issue."
-                        + str(pint_run_id)
-                    )
-                    break
-                else:
-                    time.sleep(pint_retry_interval)
+            bln_job_completed, dict_states = self.wait_for_runs(
+                [pint_run_id],
+                pint_timeout=pint_retry_count * pint_retry_interval,
+                pint_initial_interval=pint_retry_interval,
+                pint_max_interval=pint_retry_interval,
+            )
+            if dict_states[pint_run_id]["life_cycle_state"] == "NOT_FOUND":
+                self.logger.info(
+                    "The databricks Job Run ID do not exits or has some issue."
+                    + str(pint_run_id)
+                )
             return bln_job_completed
-        except Exception as ex:
-            self.__obj_generic_exception.raise_custom_exception(str(ex))
+        except Exception as e:
+            self.__obj_db_exception.raise_generic_exception(
+                message=f"Error -> DB not connected properly: {str(e)}",
+                trim_log=True,
+                fail_test=False,
+            )
+
+    def __get_run_state(self, pint_run_id):
+        """
+        Description:
+                |  This private method returns the state of a job run, None if it could not be read
+
+        :param pint_run_id: Job run id
+        :type pint_run_id: integer
+
+        :return: dict - life_cycle_state, result_state, state_message and seconds of the run
+        """
+        result = self.get_run(pint_run_id)
+        if result is None:
+            return None
+        bln_found, dict_run = result
+        if not bln_found:
+            return {"life_cycle_state": "NOT_FOUND", "result_state": None, "state_message": None,
+                    "seconds": None}
+        dict_state = dict_run.get("state", {})
+        int_start_time = dict_run.get("start_time") or 0
+        int_end_time = dict_run.get("end_time") or 0
+        return {
+            "life_cycle_state": dict_state.get("life_cycle_state"),
+            "result_state": dict_state.get("result_state"),
+            "state_message": dict_state.get("state_message"),
+            "seconds": (int_end_time - int_start_time) / 1000 if int_start_time and int_end_time
+            else None,
+        }
+
+    def wait_for_runs(self, plist_run_ids, pint_timeout=3600, pint_initial_interval=5,
+                      pint_max_interval=60, pint_max_workers=10):
+        """
+        Description:
+                |  This method is used to wait for several job runs at once. Every pending run is checked
+                |  concurrently on each poll, and the wait between polls grows from pint_initial_interval
+                |  to pint_max_interval until all runs reach a terminal state or pint_timeout passes.
+                |  Runs that have finished are not checked again.
+
+        :param plist_run_ids: Job run ids
+        :type plist_run_ids: list
+        :param pint_timeout: overall deadline in seconds for all the runs
+        :type pint_timeout: integer
+        :param pint_initial_interval: first wait in seconds between polls
+        :type pint_initial_interval: integer
+        :param pint_max_interval: maximum wait in seconds between polls
+        :type pint_max_interval: integer
+        :param pint_max_workers: maximum number of concurrent status requests
+        :type pint_max_workers: integer
+
+        :return: boolean, dict - Tuple without parentheses indicating whether every run finished with result
+        state SUCCESS, and dictionary object keyed by run id with the life_cycle_state, result_state,
+        state_message and seconds (run duration) of each run. Runs still running at the deadline keep
+        their last state; runs that do not exist have the life_cycle_state NOT_FOUND.
+        Examples:
+                |  wait_for_runs([1001, 1002, 1003], pint_timeout=1800)
+
+        """
+        try:
+            tuple_terminal = self.TERMINAL_LIFE_CYCLE_STATES + ("NOT_FOUND",)
+            dict_finished = {}
+
+            def probe_all():
+                list_pending = [run_id for run_id in plist_run_ids if run_id not in dict_finished]
+                dict_current = dict(dict_finished)
+                with ThreadPoolExecutor(max_workers=max(1, min(pint_max_workers,
+                                                               len(list_pending)))) as executor:
+                    for run_id, dict_state in zip(list_pending,
+                                                  executor.map(self.__get_run_state, list_pending)):
+                        if dict_state is None:
+                            continue
+                        dict_current[run_id] = dict_state
+                        if dict_state["life_cycle_state"] in tuple_terminal:
+                            dict_finished[run_id] = dict_state
+                return dict_current
+
+            poller = Poller(timeout=pint_timeout, initial_interval=pint_initial_interval,
+                            max_interval=pint_max_interval)
+            bln_finished, dict_states, dict_stats = poller.wait_all(
+                probe_all, lambda state: state["life_cycle_state"] in tuple_terminal, plist_run_ids
+            )
+            for run_id in plist_run_ids:
+                dict_states.setdefault(run_id, {"life_cycle_state": None, "result_state": None,
+                                                "state_message": None, "seconds": None})
+            bln_succeeded = bln_finished and all(
+                state["result_state"] == "SUCCESS" for state in dict_states.values()
+            )
+            self.logger.info(
+                "Waited %ss for %s runs in %s polls, pending: %s", dict_stats["seconds"],
+                len(plist_run_ids), dict_stats["polls"], dict_stats["pending"]
+            )
+            return bln_succeeded, dict_states
+        except Exception as e:
+            self.__obj_db_exception.raise_generic_exception(
+                message=f"Error -> DB not connected properly: {str(e)}",
+                trim_log=True,
+                fail_test=False,
+            )
 
     def get_list_of_job_runs(self, pint_job_id, pdict_payload=None):
         """
@@ -1283,7 +1707,7 @@ class DatabricksUtils:
                 )
             method = str_method.upper()
             if method == "GET":
-                response = requests.get(
+                response = self.session.get(
                     str_url,
                     headers=pdict_headers,
                     verify=bln_verify,
@@ -1297,7 +1721,7 @@ class DatabricksUtils:
                 )
             elif method == "POST":
                 if str_payload is not None:
-                    response = requests.post(
+                    response = self.session.post(
                         str_url,
                         headers=pdict_headers,
                         data=str_payload,
@@ -1314,7 +1738,7 @@ class DatabricksUtils:
                     raise Exception("Error-->Payload is missing")
             elif method == "PUT":
                 if str_payload is not None:
-                    response = requests.put(
+                    response = self.session.put(
                         str_url,
                         headers=pdict_headers,
                         data=str_payload,
@@ -1330,7 +1754,7 @@ class DatabricksUtils:
                     raise Exception("Error-->Payload is missing")
             elif method == "PATCH":
                 if str_payload is not None:
-                    response = requests.patch(
+                    response = self.session.patch(
                         str_url,
                         headers=pdict_headers,
                         data=str_payload,
@@ -1345,7 +1769,7 @@ class DatabricksUtils:
                 else:
                     raise Exception("Error-->Payload is missing")
             elif method == "DELETE":
-                response = requests.delete(
+                response = self.session.delete(
                     str_url,
                     headers=pdict_headers,
                     verify=bln_verify,
@@ -0,0 +1,253 @@
+# pylint: disable=redefined-outer-name, protected-access
+import base64
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cafex_db.databricks_utils import DatabricksUtils
+
+
+# Mocking cafex_core.logging.logger_ to avoid actual logging during tests
+@pytest.fixture(autouse=True)
+def mock_core_logger():
+    """Mocks the CoreLogger class to prevent actual logging."""
+    with patch("cafex_core.logging.logger_.CoreLogger") as mock_logger:
+        yield mock_logger
+
+
+# --- databricks_utils.py Tests ---
+@pytest.fixture
+def databricks_utils():
+    """Fixture for creating a DatabricksUtils instance."""
+    return DatabricksUtils("https://databricks.example.com", "token")
+
+
+def run_response(life_cycle_state, result_state=None, start_time=1000, end_time=0):
+    """Builds a /jobs/runs/get response."""
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "state": {"life_cycle_state": life_cycle_state, "result_state": result_state},
+        "start_time": start_time,
+        "end_time": end_time,
+    }
+    return response
+
+
+def fake_runs_get(states):
+    """Returns a session.get replacement serving a list of states per run id."""
+    def get(url, **kwargs):
+        run_id = json.loads(kwargs["data"])["run_id"]
+        if run_id not in states:
+            return MagicMock(status_code=400)
+        return states[run_id].pop(0) if len(states[run_id]) > 1 else states[run_id][0]
+    return get
+
+
+def test_call_request_uses_pooled_session(databricks_utils):
+    """Tests that call_request goes through the shared session."""
+    with patch.object(databricks_utils.session, "get", return_value=MagicMock(status_code=200)) as mock_get, \
+            patch("requests.get") as mock_requests_get:
+        databricks_utils.call_request("GET", "https://databricks.example.com/api/2.0/jobs/list", {})
+    mock_get.assert_called_once()
+    mock_requests_get.assert_not_called()
+
+
+@patch("time.sleep")
+def test_wait_for_runs_tracks_many_runs(mock_sleep, databricks_utils):
+    """Tests that runs are polled together until each is terminal."""
+    states = {
+        1: [run_response("RUNNING"), run_response("TERMINATED", "SUCCESS", end_time=61000)],
+        2: [run_response("TERMINATED", "SUCCESS", end_time=31000)],
+    }
+    with patch.object(databricks_utils.session, "get", side_effect=fake_runs_get(states)) as mock_get:
+        result, runs = databricks_utils.wait_for_runs([1, 2], pint_timeout=60, pint_initial_interval=1)
+    assert result is True
+    assert runs[1] == {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS",
+                       "state_message": None, "seconds": 60.0}
+    assert runs[2]["seconds"] == 30.0
+    # run 2 is finished after the first poll and is not requested again
+    assert mock_get.call_count == 3
+
+
+@patch("time.sleep")
+def test_wait_for_runs_reports_failures_and_missing_runs(mock_sleep, databricks_utils):
+    """Tests that a failed or unknown run makes the wait unsuccessful."""
+    states = {1: [run_response("TERMINATED", "FAILED", end_time=2000)]}
+    with patch.object(databricks_utils.session, "get", side_effect=fake_runs_get(states)):
+        result, runs = databricks_utils.wait_for_runs([1, 99], pint_timeout=60)
+    assert result is False
+    assert runs[1]["result_state"] == "FAILED"
+    assert runs[99]["life_cycle_state"] == "NOT_FOUND"
+
+
+def test_wait_for_runs_stops_at_deadline(databricks_utils):
+    """Tests that runs still running at the deadline keep their last state."""
+    states = {1: [run_response("RUNNING")]}
+    with patch.object(databricks_utils.session, "get", side_effect=fake_runs_get(states)):
+        result, runs = databricks_utils.wait_for_runs([1], pint_timeout=0)
+    assert result is False
+    assert runs[1]["life_cycle_state"] == "RUNNING"
+
+
+@patch("time.sleep")
+def test_execute_jobs_triggers_all_then_waits(mock_sleep, databricks_utils):
+    """Tests that several jobs are triggered and waited on together."""
+    run_ids = {10: 1, 20: 2}
+
+    def post(url, **kwargs):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"run_id": run_ids[json.loads(kwargs["data"])["job_id"]]}
+        return response
+
+    states = {1: [run_response("TERMINATED", "SUCCESS")], 2: [run_response("TERMINATED", "SUCCESS")]}
+    with patch.object(databricks_utils.session, "post", side_effect=post) as mock_post, \
+            patch.object(databricks_utils.session, "get", side_effect=fake_runs_get(states)):
+        result, runs = databricks_utils.execute_jobs(
+            [10, 20], pdict_params={10: {"notebook_params": {"env": "qa"}}}
+        )
+    assert result is True
+    assert set(runs) == {10, 20}
+    first_payload = json.loads(mock_post.call_args_list[0].kwargs["data"])
+    assert first_payload == {"job_id": 10, "notebook_params": {"env": "qa"}}
+    assert json.loads(mock_post.call_args_list[1].kwargs["data"]) == {"job_id": 20}
+
+
+@patch("time.sleep")
+def test_check_job_status_and_wait(mock_sleep, databricks_utils):
+    """Tests the single-run wait built on wait_for_runs."""
+    states = {5: [run_response("PENDING"), run_response("TERMINATED", "SUCCESS")]}
+    with patch.object(databricks_utils.session, "get", side_effect=fake_runs_get(states)):
+        assert databricks_utils.check_job_status_and_wait(5, 3, 10) is True
+    mock_sleep.assert_called_once_with(10)
+
+
+# --- DBFS streaming tests against a local HTTP stub ---
+class DbfsStubHandler(BaseHTTPRequestHandler):
+    """Serves the DBFS create/add-block/close/read endpoints from memory."""
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, body, status=200):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def handle_dbfs(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        resource = self.path.split("/api/2.0")[1]
+        with server.lock:
+            server.calls.append(resource)
+            if resource == "/dbfs/create":
+                server.handles[len(server.handles) + 1] = (payload["path"], bytearray())
+                return self.respond({"handle": len(server.handles)})
+            if resource == "/dbfs/add-block":
+                block = base64.b64decode(payload["data"])
+                if len(block) > server.max_block:
+                    return self.respond({"error_code": "MAX_BLOCK_SIZE_EXCEEDED"}, 400)
+                server.handles[payload["handle"]][1].extend(block)
+                return self.respond({})
+            if resource == "/dbfs/close":
+                path, data = server.handles[payload["handle"]]
+                server.files[path] = bytes(data)
+                return self.respond({})
+            if resource == "/dbfs/read":
+                if payload["path"] not in server.files:
+                    return self.respond({"error_code": "RESOURCE_DOES_NOT_EXIST"}, 404)
+                chunk = server.files[payload["path"]][
+                    payload["offset"]:payload["offset"] + payload["length"]]
+                return self.respond({"bytes_read": len(chunk),
+                                     "data": base64.b64encode(chunk).decode()})
+        return self.respond({}, 404)
+
+    do_GET = handle_dbfs
+    do_POST = handle_dbfs
+
+
+@pytest.fixture
+def dbfs_stub():
+    """Runs the DBFS stub and returns a DatabricksUtils instance pointed at it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DbfsStubHandler)
+    server.lock = threading.Lock()
+    server.handles, server.files, server.calls = {}, {}, []
+    server.max_block = 1024 * 1024
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, DatabricksUtils(f"http://127.0.0.1:{server.server_port}", "token")
+    server.shutdown()
+    server.server_close()
+
+
+def test_upload_file_to_dbfs_streams_blocks(dbfs_stub, tmp_path):
+    """Tests that a file larger than one block is uploaded in blocks and verified."""
+    server, databricks_utils = dbfs_stub
+    content = bytes(range(256)) * 10000
+    source = tmp_path / "data.bin"
+    source.write_bytes(content)
+
+    result, details = databricks_utils.upload_file_to_dbfs(
+        str(source), "/FileStore/data.bin", pint_block_size=1000000, bln_verify_checksum=True
+    )
+
+    assert result is True
+    assert server.files["/FileStore/data.bin"] == content
+    assert server.calls.count("/dbfs/add-block") == 3
+    assert details["bytes"] == len(content)
+    assert details["sha256"] == hashlib.sha256(content).hexdigest()
+    assert details["checksum_match"] is True
+
+
+def test_download_file_from_dbfs_streams_chunks(dbfs_stub, tmp_path):
+    """Tests that a file is read chunk by chunk and checked against its sha256."""
+    server, databricks_utils = dbfs_stub
+    content = b"x" * 2500
+    server.files["/FileStore/users.csv"] = content
+    target = tmp_path / "users.csv"
+
+    assert b"".join(databricks_utils.iter_dbfs_file("/FileStore/users.csv", pint_chunk_size=1000)) \
+        == content
+    result, details = databricks_utils.download_file_from_dbfs(
+        "/FileStore/users.csv", str(target), pint_chunk_size=1000,
+        pstr_expected_sha256=hashlib.sha256(content).hexdigest()
+    )
+
+    assert result is True
+    assert target.read_bytes() == content
+    assert details["checksum_match"] is True
+    assert server.calls.count("/dbfs/read") == 6
+
+
+def test_download_file_from_dbfs_missing_file(dbfs_stub, tmp_path):
+    """Tests that a missing file is reported as a failed download."""
+    _, databricks_utils = dbfs_stub
+    result, details = databricks_utils.download_file_from_dbfs(
+        "/FileStore/missing.csv", str(tmp_path / "missing.csv")
+    )
+    assert result is False
+    assert details is None
+
+
+def test_upload_files_to_dbfs_parallel(dbfs_stub, tmp_path):
+    """Tests that several files are uploaded concurrently into one folder."""
+    server, databricks_utils = dbfs_stub
+    sources = []
+    for index in range(5):
+        source = tmp_path / f"file_{index}.csv"
+        source.write_bytes(f"row,{index}\n".encode() * 1000)
+        sources.append(str(source))
+
+    result, details = databricks_utils.upload_files_to_dbfs_parallel(
+        sources, "/FileStore/batch", pint_max_workers=3
+    )
+
+    assert result is True
+    assert sorted(server.files) == [f"/FileStore/batch/file_{index}.csv" for index in range(5)]
+    assert all(details[source]["bytes"] == 6000 for source in sources)
@@ -1,6 +1,7 @@
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
 from cafex_core.utils.config_utils import ConfigUtils
+from cafex_core.utils.phase_timer import PhaseTimer
 from cafex_desktop.desktop_client.desktop_application_handler import (
     DesktopApplicationHandler,
 )
@@ -22,6 +23,7 @@ class DesktopClientDriverInitializer:
         self.session_store = SessionStore()
         self.config_utils = ConfigUtils()
 
+    @PhaseTimer.timed("driver_creation")
     def initialize_driver(self):
         try:
             if self.session_store.ui_desktop_client_scenario:
@@ -0,0 +1,188 @@
+"""This module contains the BrowserStackCatalog class which caches the
+BrowserStack browser and device catalogs on disk and selects capabilities
+from them reproducibly."""
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+
+
+class BrowserStackCatalog:
+    """An on-disk cache of the BrowserStack catalogs shared by xdist workers.
+
+    A catalog is fetched once and then read from a JSON file until it is
+    older than the TTL. Workers that need a catalog at the same time take
+    a lock file, so only one of them calls the API and the others read what
+    it wrote. Failed fetches are not cached.
+
+    Selection intersects the catalog with the wanted entries through a set
+    of canonical keys. It then picks from the sorted intersection with a
+    seeded random generator, so the same seed picks the same entry. When no
+    seed is configured, one is generated and logged so the pick can be
+    repeated.
+
+    The cache is configured in config.yml:
+
+        'browserstack_catalog':
+          'cache_dir': null
+          'ttl_seconds': 86400
+          'seed': null
+
+    Attributes:
+        cache_dir (str): The directory of the catalog files.
+        ttl_seconds (float): The age after which a catalog is fetched again.
+        logger (Logger): The logger object.
+
+    Methods:
+        get: Returns a catalog from the cache, fetching it when missing or expired.
+        select: Picks an entry present in both the catalog and the wanted entries.
+        canonical_key: Returns a hashable key of an entry.
+    """
+
+    LOCK_TIMEOUT = 60
+
+    def __init__(self, cache_dir: str = None, ttl_seconds: float = None):
+        """Initialize the BrowserStackCatalog class.
+
+        Args:
+            cache_dir: The directory of the catalog files. Defaults to config.yml, then to
+                       cafex_browserstack_catalog in the temporary directory.
+            ttl_seconds: The age after which a catalog is fetched again. Defaults to
+                         config.yml, then to one day.
+        """
+        self.catalog_config = (SessionStore().base_config or {}).get("browserstack_catalog") or {}
+        self.cache_dir = (
+            cache_dir
+            or self.catalog_config.get("cache_dir")
+            or os.path.join(tempfile.gettempdir(), "cafex_browserstack_catalog")
+        )
+        self.ttl_seconds = float(
+            ttl_seconds if ttl_seconds is not None else self.catalog_config.get("ttl_seconds", 86400)
+        )
+        self.logger = CoreLogger(name=__name__).get_logger()
+
+    def get(self, url: str, user_name: str, fetch) -> list:
+        """Returns a catalog from the cache, fetching it when missing or expired.
+
+        Args:
+            url: The BrowserStack API URL of the catalog.
+            user_name: The BrowserStack user, as catalogs can differ per account.
+            fetch: Called without arguments to get the catalog from the API.
+
+        Returns:
+            list: The catalog.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        name = hashlib.sha256(f"{user_name}|{url}".encode("utf-8")).hexdigest()[:16]
+        path = os.path.join(self.cache_dir, f"{name}.json")
+        catalog = self.__read(path)
+        if catalog is not None:
+            return catalog
+        with self.__lock(path + ".lock"):
+            catalog = self.__read(path)
+            if catalog is not None:
+                return catalog
+            start = time.perf_counter()
+            catalog = fetch()
+            self.logger.info(
+                "Fetched BrowserStack catalog %s in %.2fs", url, time.perf_counter() - start
+            )
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as catalog_file:
+                json.dump(catalog, catalog_file)
+            os.replace(temp_path, path)
+            return catalog
+
+    @staticmethod
+    def canonical_key(entry: dict) -> str:
+        """Returns a hashable key of an entry, independent of key order.
+
+        Args:
+            entry: A browser or device.
+
+        Returns:
+            str: The key.
+        """
+        return json.dumps(entry, sort_keys=True)
+
+    def select(self, catalog: list, wanted: list, seed=None, entry_type: str = "entries") -> dict:
+        """Picks an entry present in both the catalog and the wanted entries.
+
+        Args:
+            catalog: The entries BrowserStack offers.
+            wanted: The entries the tests want to run on.
+            seed: The seed of the pick. Defaults to config.yml, then to a logged random seed.
+            entry_type: What the entries are, for the error message, e.g. browsers.
+
+        Returns:
+            dict: The selected entry.
+
+        Raises:
+            ValueError: If no entry is in both lists.
+        """
+        wanted_keys = {self.canonical_key(entry) for entry in wanted}
+        common = {
+            key: entry
+            for key, entry in ((self.canonical_key(entry), entry) for entry in catalog)
+            if key in wanted_keys
+        }
+        if not common:
+            raise ValueError(
+                f"No common {entry_type} found between user list and BrowserStack list."
+            )
+        if seed is None:
+            seed = self.catalog_config.get("seed")
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**32)
+        selected = common[random.Random(seed).choice(sorted(common))]
+        self.logger.info(
+            "Selected %s out of %d common entries with seed %s", selected, len(common), seed
+        )
+        return selected
+
+    def __read(self, path: str):
+        """Returns the cached catalog, or None if it is missing, expired or unreadable."""
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, encoding="utf-8") as catalog_file:
+                return json.load(catalog_file)
+        except (OSError, ValueError):
+            return None
+
+    @contextmanager
+    def __lock(self, lock_path: str):
+        """Holds a lock file, so only one process fetches a catalog at a time.
+
+        A lock older than LOCK_TIMEOUT is left from a crashed process and is
+        taken over.
+        """
+        deadline = time.monotonic() + self.LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock_path) > self.LOCK_TIMEOUT:
+                        os.remove(lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {lock_path}")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
@@ -1,8 +1,15 @@
+import hashlib
+import re
 from typing import Tuple, Union
 
 from appium import webdriver
 from appium.webdriver import WebElement
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from cafex_core.logging.logger_ import CoreLogger
@@ -10,6 +17,34 @@ from cafex_core.singletons_.session_ import SessionStore
 from cafex_core.utils.exceptions import CoreExceptions
 from cafex_ui.cafex_ui_config_utils import WebConfigUtils
 
+# Start and end of a swipe as fractions of the width and height: start x, start y, end x, end y.
+SWIPE_FRACTIONS = {
+    "down": (0.20, 0.80, 0.20, 0.20),
+    "up": (0.20, 0.20, 0.20, 0.80),
+    "right": (0.80, 0.50, 0.20, 0.50),
+    "left": (0.20, 0.50, 0.80, 0.50),
+}
+
+# UiSelector methods matching the locator strategies, for UiScrollable on Android.
+UI_SELECTOR_METHODS = {
+    AppiumBy.ID: "resourceId",
+    AppiumBy.ACCESSIBILITY_ID: "description",
+    AppiumBy.CLASS_NAME: "className",
+}
+
+# mobile: scroll arguments matching the locator strategies, on iOS.
+IOS_SCROLL_ARGUMENTS = {
+    AppiumBy.ACCESSIBILITY_ID: "name",
+    AppiumBy.ID: "name",
+    AppiumBy.NAME: "name",
+    AppiumBy.IOS_PREDICATE: "predicateString",
+}
+
+
+def _java_string(value: str) -> str:
+    """Returns a value as a quoted Java string for a UiSelector."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
 
 class MobileClientActions:
     """Provides actions for interacting with mobile elements."""
@@ -375,68 +410,152 @@ class MobileClientActions:
             raise e
 
     def scroll_mobile(
-            self, direction: str, find_locator: str, explicit_wait: int = None, max_swipes: int = 10
+            self,
+            direction: str,
+            find_locator: str,
+            explicit_wait: int = None,
+            max_swipes: int = 10,
+            native: bool = True,
+            scroll_container: str = None,
+            swipe_duration: int = 1000,
     ) -> bool:
         """Scrolls horizontally or vertically to find an element.
 
+        Without a scroll container, the platform first scrolls the element
+        into view when it can: UiScrollable on Android for id,
+        accessibility_id, class_name and android_uiautomator locators, and
+        mobile: scroll on iOS for accessibility_id, id, name and
+        ios_predicate locators. If that does not bring the element into
+        view, for example because another list was scrolled, the list is
+        swiped with a short presence check after each swipe. Swiping stops
+        early when the page source no longer changes, as the end of the list
+        has been reached.
+
         Args:
             direction: Scroll direction ('down', 'up', 'right', 'left').
             find_locator: Locator string of the element to find.
-            explicit_wait: Optional explicit wait time (seconds).
+            explicit_wait: Optional wait (seconds) of each presence check. Defaults to
+                           half a second, as the check runs after every swipe.
             max_swipes: Maximum number of swipes to attempt.
+            native: If True, tries the platform scroll before swiping.
+            scroll_container: Optional locator of the scrollable view to swipe in.
+                              Defaults to the whole screen. The platform scroll is
+                              skipped when it is given.
+            swipe_duration: The duration of a swipe (milliseconds).
 
         Returns:
             True if the element is found, False otherwise.
 
         Raises:
+            ValueError: If the direction is not supported.
             Exception: If an error occurs during scrolling.
         """
         try:
-            explicit_wait = explicit_wait or self.default_explicit_wait
-
-            if self.is_element_displayed(find_locator, explicit_wait):
+            if direction not in SWIPE_FRACTIONS:
+                raise ValueError(
+                    f"Unsupported scroll direction: {direction}. "
+                    f"Supported directions are: {', '.join(SWIPE_FRACTIONS)}"
+                )
+            check_wait = explicit_wait if explicit_wait is not None else 0.5
+            if self.__is_displayed_now(find_locator, check_wait):
                 return True
 
-            size = self.mobile_driver.get_window_size()
-            for _ in range(max_swipes):
-                if direction == "down":
-                    self.mobile_driver.swipe(
-                        size["width"] * 0.20,
-                        size["height"] * 0.80,
-                        size["width"] * 0.20,
-                        size["height"] * 0.20,
-                        3000,
-                    )
-                elif direction == "up":
-                    self.mobile_driver.swipe(
-                        size["width"] * 0.20,
-                        size["height"] * 0.20,
-                        size["width"] * 0.20,
-                        size["height"] * 0.80,
-                        3000,
-                    )
-                elif direction == "right":
-                    self.mobile_driver.swipe(
-                        size["width"] * 0.80,
-                        size["height"] * 0.50,
-                        size["width"] * 0.20,
-                        size["height"] * 0.50,
-                        3000,
-                    )
-                elif direction == "left":
-                    self.mobile_driver.swipe(
-                        size["width"] * 0.20,
-                        size["height"] * 0.50,
-                        size["width"] * 0.80,
-                        size["height"] * 0.50,
-                        3000,
-                    )
+            if (
+                    native
+                    and not scroll_container
+                    and self.__native_scroll(direction, find_locator, max_swipes)
+                    and self.__is_displayed_now(find_locator, check_wait)
+            ):
+                return True
 
-                if self.is_element_displayed(find_locator, explicit_wait):
+            if scroll_container:
+                area = self.get_web_element(scroll_container).rect
+            else:
+                size = self.mobile_driver.get_window_size()
+                area = {"x": 0, "y": 0, **size}
+            start_x, start_y, end_x, end_y = SWIPE_FRACTIONS[direction]
+            start_x = area["x"] + area["width"] * start_x
+            end_x = area["x"] + area["width"] * end_x
+            start_y = area["y"] + area["height"] * start_y
+            end_y = area["y"] + area["height"] * end_y
+            page_hash = self.__page_source_hash()
+            for swipe in range(max_swipes):
+                self.mobile_driver.swipe(start_x, start_y, end_x, end_y, swipe_duration)
+                if self.__is_displayed_now(find_locator, check_wait):
                     return True
+                previous_hash, page_hash = page_hash, self.__page_source_hash()
+                if page_hash == previous_hash:
+                    self.logger.debug(
+                        "Reached the end of the list after %d swipes looking for %s",
+                        swipe + 1, find_locator,
+                    )
+                    break
 
             return False
 
         except Exception as e:
             self.logger.exception("Exception in scroll_mobile method. Exception Details: %s", e)
             raise e
+
+    def __is_displayed_now(self, locator: str, wait: float) -> bool:
+        """Checks if an element is displayed, waiting at most the given
+        seconds instead of the default explicit wait."""
+        strategy, value = self._parse_locator(locator)
+
+        def displayed(driver):
+            return any(
+                element.is_displayed() for element in driver.find_elements(strategy, value)
+            )
+
+        try:
+            if wait <= 0:
+                return displayed(self.mobile_driver)
+            return WebDriverWait(self.mobile_driver, wait, poll_frequency=0.1).until(displayed)
+        except (TimeoutException, StaleElementReferenceException):
+            return False
+
+    def __page_source_hash(self) -> str:
+        """Returns a hash of the page source, to detect the end of a list."""
+        return hashlib.sha256(self.mobile_driver.page_source.encode("utf-8")).hexdigest()
+
+    def __native_scroll(self, direction: str, locator: str, max_swipes: int) -> bool:
+        """Scrolls the element into view with the platform scroll.
+
+        Returns:
+            True if the platform scrolled, False if the locator or platform is
+            not supported or the scroll failed.
+        """
+        strategy, value = self._parse_locator(locator)
+        platform = str(self.mobile_driver.capabilities.get("platformName", "")).lower()
+        try:
+            if platform == "android" and (
+                    strategy in UI_SELECTOR_METHODS or strategy == AppiumBy.ANDROID_UIAUTOMATOR
+            ):
+                if strategy == AppiumBy.ANDROID_UIAUTOMATOR:
+                    selector = value
+                elif strategy == AppiumBy.ID and ":id/" not in value:
+                    # Appium prefixes a bare id with the app package.
+                    selector = (
+                        "new UiSelector().resourceIdMatches("
+                        f"{_java_string('.*:id/' + re.escape(value))})"
+                    )
+                else:
+                    selector = (
+                        f"new UiSelector().{UI_SELECTOR_METHODS[strategy]}({_java_string(value)})"
+                    )
+                horizontal = ".setAsHorizontalList()" if direction in ("left", "right") else ""
+                scrollable = (
+                    f"new UiScrollable(new UiSelector().scrollable(true)){horizontal}"
+                    f".setMaxSearchSwipes({max_swipes}).scrollIntoView({selector})"
+                )
+                self.mobile_driver.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, scrollable)
+                return True
+            if platform == "ios" and strategy in IOS_SCROLL_ARGUMENTS:
+                # The driver ignores the locator when a direction is given.
+                self.mobile_driver.execute_script(
+                    "mobile: scroll", {IOS_SCROLL_ARGUMENTS[strategy]: value}
+                )
+                return True
+        except WebDriverException as e:
+            self.logger.debug("Native scroll to %s failed, swiping instead: %s", locator, e)
+        return False
@@ -2,6 +2,7 @@ import os
 
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.phase_timer import PhaseTimer
 from cafex_ui.mobile_client.mobile_client_actions import MobileClientActions
 from cafex_ui.mobile_client.mobile_driver_factory import MobileDriverFactory
 from cafex_ui.mobile_client.mobile_utils import MobileUtils
@@ -17,6 +18,7 @@ class MobileDriverInitializer:
         self.web_config_utils = WebConfigUtils()
         self.logger = CoreLogger(name=__name__).get_logger()
 
+    @PhaseTimer.timed("driver_creation")
     def initialize_driver(self):
         """Sets up the mobile driver based on configuration settings."""
         if self.session_store.mobile_driver is None:
@@ -1,10 +1,10 @@
 import json
 import os
-import random
 from typing import Any, Dict, List
 
 import requests
 from cafex_core.logging.logger_ import CoreLogger
+from cafex_ui.browserstack_catalog import BrowserStackCatalog
 from cafex_ui.ui_security import UISecurity
 
 
@@ -123,24 +123,31 @@ class MobileUtils:
             Exception: If an error occurs while fetching devices from BrowserStack.
         """
         try:
-            bs_response = UISecurity().get_browser_stack_devices_list(
-                browserstack_user_name=browserstack_user_name,
-                browserstack_access_key=browserstack_access_key,
-                browserstack_url=get_browserstack_devices_url,
-            )
-            if bs_response.status_code == 200:
-                devices = bs_response.json()
-                filtered_devices = [
-                    {k: v for k, v in device.items() if k not in ("os", "realMobile")}
-                    for device in devices
-                    if device["os"] == mobile_os.lower()
-                ]
-                return filtered_devices
 
-            self.logger.error(
-                "Failed to fetch devices from BrowserStack. Response: %s", bs_response.text
-            )
-            return []
+            def fetch_devices():
+                bs_response = UISecurity().get_browser_stack_devices_list(
+                    browserstack_user_name=browserstack_user_name,
+                    browserstack_access_key=browserstack_access_key,
+                    browserstack_url=get_browserstack_devices_url,
+                )
+                if isinstance(bs_response, Exception):
+                    raise bs_response
+                if bs_response.status_code != 200:
+                    raise requests.HTTPError(bs_response.text, response=bs_response)
+                return bs_response.json()
+
+            try:
+                devices = BrowserStackCatalog().get(
+                    get_browserstack_devices_url, browserstack_user_name, fetch_devices
+                )
+            except requests.HTTPError as e:
+                self.logger.error("Failed to fetch devices from BrowserStack. Response: %s", e)
+                return []
+            return [
+                {k: v for k, v in device.items() if k not in ("os", "realMobile")}
+                for device in devices
+                if device["os"] == mobile_os.lower()
+            ]
         except Exception as e:
             self.logger.exception("Error fetching devices from BrowserStack: %s", e)
             raise e
@@ -213,6 +220,7 @@ class MobileUtils:
         get_browserstack_devices_url: str,
         ios_device_json_path: str = None,
         android_device_json_path: str = None,
+        seed=None,
     ) -> dict:
         """Retrieves a random available device from BrowserStack, filtering by
         devices specified in local JSON files.
@@ -224,6 +232,8 @@ class MobileUtils:
             get_browserstack_devices_url: BrowserStack devices API URL.
             ios_device_json_path: Path to the JSON file for iOS devices (required if mobile_os is 'ios').
             android_device_json_path: Path to the JSON file for Android devices (required if mobile_os is 'android').
+            seed: The seed of the random selection, so a run can pick the same device again.
+                  Defaults to browserstack_catalog in config.yml.
 
         Returns:
             A dictionary representing a randomly selected available device.
@@ -263,16 +273,9 @@ class MobileUtils:
                 ios_device_json_path=ios_device_json_path,
                 android_device_json_path=android_device_json_path,
             )
-            common_devices = [
-                device for device in browser_stack_devices if device in client_devices
-            ]
-
-            if not common_devices:
-                raise ValueError(
-                    "No common devices found between client usage and BrowserStack lists."
-                )
-
-            return random.choice(common_devices)
+            return BrowserStackCatalog().select(
+                browser_stack_devices, client_devices, seed, entry_type="devices"
+            )
         except Exception as e:
             self.logger.exception("Error while fetching devices: %s", e)
             raise e
@@ -1,11 +1,12 @@
 import json
 import os
-import random
 
+import requests
 from browserstack.local import Local
 from selenium.webdriver.remote.webdriver import WebDriver
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.utils.exceptions import CoreExceptions
+from cafex_ui.browserstack_catalog import BrowserStackCatalog
 from cafex_ui.cafex_ui_config_utils import WebConfigUtils
 from cafex_ui.ui_security import UISecurity
 
@@ -136,22 +137,36 @@ class BrowserStackDriverFactory:
             bs_config = self._get_data_from_browserstack_config_file()
             resultant_list = []
             if "use_random_browsers" in bs_config.keys():
-                response = UISecurity().get_browser_stack_browsers_list(
-                    browserstack_api_endpoint, browserstack_username, browserstack_access_key
-                )
-                if response.status_code == 200:
-                    browsers_list = response.json()
-                    for browser in browsers_list:
-                        browser_dict = {
-                            "browserName": browser["browser"].lower(),
-                            "bstack:options": {
-                                "os": browser["os"],
-                                "osVersion": browser["os_version"],
-                                "browserVersion": browser["browser_version"],
-                            },
-                        }
-                        resultant_list.append(browser_dict)
-                return resultant_list
+
+                def fetch_browsers():
+                    response = UISecurity().get_browser_stack_browsers_list(
+                        browserstack_api_endpoint, browserstack_username, browserstack_access_key
+                    )
+                    if isinstance(response, Exception):
+                        raise response
+                    if response.status_code != 200:
+                        raise requests.HTTPError(
+                            f"BrowserStack returned {response.status_code}", response=response
+                        )
+                    return response.json()
+
+                try:
+                    browsers_list = BrowserStackCatalog().get(
+                        browserstack_api_endpoint, browserstack_username, fetch_browsers
+                    )
+                except requests.HTTPError as e:
+                    self.logger.error("Failed to fetch browsers from BrowserStack: %s", e)
+                    return resultant_list
+                for browser in browsers_list:
+                    browser_dict = {
+                        "browserName": browser["browser"].lower(),
+                        "bstack:options": {
+                            "os": browser["os"],
+                            "osVersion": browser["os_version"],
+                            "browserVersion": browser["browser_version"],
+                        },
+                    }
+                    resultant_list.append(browser_dict)
             return resultant_list
         except Exception as e:
             self.logger.exception("Error in get_browser_stack_browsers_list method--> %s", str(e))
@@ -199,7 +214,8 @@ class BrowserStackDriverFactory:
             raise e
 
     def get_available_browsers(
-            self, browsers_file: str, browserstack_username: str, browserstack_access_key: str
+            self, browsers_file: str, browserstack_username: str, browserstack_access_key: str,
+            seed=None
     ) -> dict:
         """Retrieve a randomly selected browser from a list of common browsers.
 
@@ -211,6 +227,8 @@ class BrowserStackDriverFactory:
             browsers_file: The file name which contains the list of browsers.
             browserstack_username: The username for BrowserStack.
             browserstack_access_key: The access key for BrowserStack.
+            seed: The seed of the random selection, so a run can pick the same browser again.
+                  By default, it is read from browserstack_catalog in config.yml.
 
         Returns:
             dict: A randomly selected available browser from the common devices list.
@@ -223,14 +241,9 @@ class BrowserStackDriverFactory:
             browser_stack_browsers = self.get_browser_stack_browsers_list(
                 browserstack_username, browserstack_access_key
             )
-            common_browsers = [
-                browser for browser in browser_stack_browsers if browser in client_intended_browsers
-            ]
-            if not common_browsers:
-                raise ValueError(
-                    "No common browsers found between user list and BrowserStack list."
-                )
-            random_browser = random.choice(common_browsers)
+            random_browser = BrowserStackCatalog().select(
+                browser_stack_browsers, client_intended_browsers, seed, entry_type="browsers"
+            )
             self.logger.info("Randomly selected browser: %s", random_browser)
             return random_browser
         except Exception as e:
@@ -0,0 +1,274 @@
+"""This module contains the DownloadWatcher class which waits for downloads to
+complete by watching the download directory instead of the browser."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.poller import Poller
+
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".download", ".partial", ".tmp")
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+class _Inotify:
+    """A minimal inotify watch on one directory, through libc."""
+
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, seconds: float) -> bool:
+        """Returns whether the directory changed within the given seconds."""
+        readable, _, _ = select.select([self.fd], [], [], max(seconds, 0))
+        if readable:
+            try:
+                while os.read(self.fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        return bool(readable)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class DownloadWatcher:
+    """Waits for downloads to complete by watching the download directory.
+
+    It works for any browser, local or headless, Selenium or Playwright,
+    as long as the files land in a directory this process can read. On
+    Linux the directory is watched with inotify, so a change is seen at
+    once; elsewhere it is polled. Files that existed when the watcher
+    started are ignored, so the watcher must be started, or used as a
+    context manager, before the download is triggered. A new file is
+    complete when it has no partial suffix such as .crdownload or .part,
+    no partial file of the same name remains next to it, and its size has
+    not changed for stable_seconds.
+
+    The directory defaults to download_dir in config.yml, then to the
+    download directory in chrome_preferences or firefox_preferences, then
+    to ~/Downloads.
+
+    Examples:
+        >> with DownloadWatcher() as downloads:
+        >>     CafeXWeb().click("id=export")
+        >>     paths = downloads.wait(expected_count=1, timeout=120)
+
+    Attributes:
+        directory (str): The watched directory.
+        stable_seconds (float): The seconds a file size must stay unchanged.
+        poll_interval (float): The seconds between scans without a change.
+        logger (Logger): The logger object.
+
+    Methods:
+        configured_directory: Returns the download directory from config.yml.
+        start: Records the existing files and starts watching.
+        pending: Returns the new files that are still being downloaded.
+        completed: Returns the new files that are complete.
+        wait: Waits until the expected number of downloads are complete.
+        stop: Stops watching.
+    """
+
+    def __init__(self, directory: str = None, stable_seconds: float = 0.5,
+                 poll_interval: float = 0.25):
+        """Initialize the DownloadWatcher class.
+
+        Args:
+            directory: The download directory. Defaults to configured_directory.
+            stable_seconds: The seconds a file size must stay unchanged to be complete.
+            poll_interval: The seconds between scans when nothing changes.
+        """
+        self.directory = os.path.abspath(
+            os.path.expanduser(directory or self.configured_directory())
+        )
+        self.stable_seconds = stable_seconds
+        self.poll_interval = poll_interval
+        self.logger = CoreLogger(name=__name__).get_logger()
+        self.__existing = None
+        self.__sizes = {}
+        self.__inotify = None
+        self.__started = False
+
+    @staticmethod
+    def configured_directory() -> str:
+        """Returns the download directory from config.yml.
+
+        Returns:
+            str: The download_dir entry, the download directory of chrome_preferences or
+            firefox_preferences, or ~/Downloads.
+        """
+        base_config = SessionStore().base_config or {}
+        chrome_preferences = base_config.get("chrome_preferences") or {}
+        firefox_preferences = base_config.get("firefox_preferences") or {}
+        return (
+            base_config.get("download_dir")
+            or chrome_preferences.get("download.default_directory")
+            or firefox_preferences.get("browser.download.dir")
+            or os.path.join(os.path.expanduser("~"), "Downloads")
+        )
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self) -> "DownloadWatcher":
+        """Records the existing files and starts watching. Does nothing when
+        the watcher is already started.
+
+        Returns:
+            DownloadWatcher: The watcher.
+        """
+        if self.__started:
+            return self
+        self.__started = True
+        os.makedirs(self.directory, exist_ok=True)
+        self.__existing = set(self.__list_files())
+        self.__sizes = {}
+        if sys.platform.startswith("linux"):
+            try:
+                self.__inotify = _Inotify(self.directory)
+            except (OSError, AttributeError, TypeError) as e:
+                self.logger.debug("inotify is not available, polling instead: %s", e)
+                self.__inotify = None
+        return self
+
+    def stop(self) -> None:
+        """Stops watching."""
+        self.__started = False
+        if self.__inotify is not None:
+            self.__inotify.close()
+            self.__inotify = None
+
+    def pending(self) -> list:
+        """Returns the new files that are still being downloaded.
+
+        Returns:
+            list: The paths of the new partial files.
+
+        Raises:
+            RuntimeError: If the watcher was never started.
+        """
+        return sorted(
+            os.path.join(self.directory, name)
+            for name in self.__new_files()
+            if self.__is_partial(name)
+        )
+
+    def completed(self) -> list:
+        """Returns the new files that are complete.
+
+        Returns:
+            list: The paths of the new files whose download has finished.
+
+        Raises:
+            RuntimeError: If the watcher was never started.
+        """
+        names = self.__new_files()
+        partial_stems = {
+            os.path.splitext(name)[0] for name in names if self.__is_partial(name)
+        }
+        now = time.monotonic()
+        completed = []
+        for name in names:
+            if self.__is_partial(name) or name in partial_stems:
+                continue
+            try:
+                size = os.path.getsize(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            last_size, since = self.__sizes.get(name, (None, now))
+            if size != last_size:
+                self.__sizes[name] = (size, now)
+            elif now - since >= self.stable_seconds:
+                completed.append(os.path.join(self.directory, name))
+        return sorted(completed)
+
+    def wait(self, expected_count: int = 1, timeout: float = 60) -> list:
+        """Waits until the expected number of downloads are complete.
+
+        Args:
+            expected_count: The number of new files to wait for.
+            timeout: The maximum seconds to wait.
+
+        Returns:
+            list: The paths of the completed downloads.
+
+        Raises:
+            RuntimeError: If the watcher was never started.
+            TimeoutError: If the downloads do not complete in time.
+        """
+        self.__new_files()
+        poller = Poller(
+            timeout=timeout,
+            initial_interval=self.poll_interval,
+            max_interval=self.poll_interval,
+            backoff=1.0,
+            sleep=self.__sleep,
+        )
+        met, paths, stats = poller.wait(
+            self.completed,
+            lambda completed: len(completed) >= expected_count and not self.pending(),
+        )
+        if not met:
+            raise TimeoutError(
+                f"{len(paths or [])} of {expected_count} downloads completed in {self.directory} "
+                f"within {timeout}s; still downloading: {self.pending()}"
+            )
+        self.logger.info(
+            "Downloads completed in %.2fs: %s", stats["seconds"], paths
+        )
+        return paths
+
+    def __sleep(self, seconds: float) -> None:
+        """Sleeps, waking early when the directory changes."""
+        if self.__inotify is not None:
+            if self.__inotify.wait(seconds):
+                # Coalesce the burst of events a file being written produces.
+                time.sleep(min(0.05, seconds))
+        else:
+            time.sleep(seconds)
+
+    def __new_files(self) -> list:
+        """Returns the names of the files added since the watcher started."""
+        if self.__existing is None:
+            raise RuntimeError(
+                "The DownloadWatcher was not started; call start() or use it as a context "
+                "manager before triggering the download"
+            )
+        return [name for name in self.__list_files() if name not in self.__existing]
+
+    def __list_files(self) -> list:
+        """Returns the names of the files in the directory."""
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry.name for entry in entries if entry.is_file()]
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def __is_partial(name: str) -> bool:
+        """Returns whether a file name is a download in progress."""
+        return name.lower().endswith(PARTIAL_SUFFIXES) or name.startswith(".com.google.Chrome.")
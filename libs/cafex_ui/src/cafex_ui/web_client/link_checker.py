@@ -0,0 +1,234 @@
+"""This module contains the LinkChecker class which checks the links of web
+pages concurrently, with one pooled session and a result cache per
+process."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class LinkChecker:
+    """A per-process link checker with a bounded worker pool.
+
+    Links are normalised and deduplicated, then checked concurrently over
+    one pooled requests session. Each link is requested with HEAD, and with
+    GET when the server does not answer HEAD properly. The number of
+    requests in flight to one host is limited. A link is checked once per
+    process: results are cached and reused when other pages link to it.
+
+    The checker is configured in config.yml:
+
+        'link_checker':
+          'max_workers': 16
+          'max_per_host': 4
+          'timeout': 10
+
+    Attributes:
+        logger (Logger): The logger object.
+        session_store (SessionStore): The session store object.
+        session (Session): The pooled requests session.
+
+    Methods:
+        normalize_url: Returns the canonical form of a link, or None for non-HTTP links.
+        is_broken: Returns whether a check result is a broken link.
+        check_url: Checks one link, using the cache.
+        check_urls: Checks many links concurrently and returns a report.
+        clear_cache: Forgets the cached results.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Ensures only one instance of LinkChecker exists per process.
+
+        Returns:
+            LinkChecker: The singleton instance.
+        """
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.logger = CoreLogger(name=__name__).get_logger()
+            cls._instance.session_store = SessionStore()
+            cls._instance.session = None
+            cls._instance.results = {}
+            cls._instance.host_limits = {}
+            cls._instance.lock = threading.Lock()
+        return cls._instance
+
+    @property
+    def checker_config(self) -> dict:
+        """Returns the link_checker section of config.yml.
+
+        Returns:
+            dict: The link checker configuration.
+        """
+        base_config = self.session_store.base_config or {}
+        return base_config.get("link_checker") or {}
+
+    @property
+    def max_workers(self) -> int:
+        """Returns the number of links checked at once."""
+        return int(self.checker_config.get("max_workers", 16))
+
+    @property
+    def max_per_host(self) -> int:
+        """Returns the number of requests in flight to one host."""
+        return int(self.checker_config.get("max_per_host", 4))
+
+    @property
+    def timeout(self) -> float:
+        """Returns the timeout of one request in seconds."""
+        return float(self.checker_config.get("timeout", 10))
+
+    @staticmethod
+    def normalize_url(url: str, base_url: str = None):
+        """Returns the canonical form of a link, or None for non-HTTP links.
+
+        Relative links are resolved against the base URL. The scheme and
+        host are lower-cased, default ports and fragments are dropped and an
+        empty path becomes /.
+
+        Examples:
+            >> LinkChecker.normalize_url("HTTPS://Example.com:443#top")
+            'https://example.com/'
+            >> LinkChecker.normalize_url("mailto:someone@example.com")
+            None
+
+        Args:
+            url: The link.
+            base_url: The URL of the page the link is on.
+
+        Returns:
+            str: The normalised link, or None if it is not an HTTP(S) link.
+        """
+        if not url:
+            return None
+        url = url.strip()
+        if base_url:
+            url = urljoin(base_url, url)
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parts.hostname:
+            return None
+        netloc = parts.hostname.lower()
+        if ":" in netloc:
+            netloc = f"[{netloc}]"
+        if parts.port and parts.port != DEFAULT_PORTS[scheme]:
+            netloc = f"{netloc}:{parts.port}"
+        if parts.username:
+            credentials = parts.username + (f":{parts.password}" if parts.password else "")
+            netloc = f"{credentials}@{netloc}"
+        return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+    @staticmethod
+    def is_broken(result: dict) -> bool:
+        """Returns whether a check result is a broken link.
+
+        Args:
+            result: A result of check_url.
+
+        Returns:
+            bool: True if the request failed or answered with a 4xx or 5xx status.
+        """
+        return result["status_code"] is None or result["status_code"] >= 400
+
+    def check_url(self, url: str) -> dict:
+        """Checks one link, using the cache.
+
+        Args:
+            url: The normalised link.
+
+        Returns:
+            dict: url, status_code, method, seconds and error. status_code is
+            None when the request failed.
+        """
+        with self.lock:
+            cached = self.results.get(url)
+        if cached is not None:
+            return cached
+        with self.__host_limit(urlsplit(url).netloc):
+            result = self.__request(url)
+        with self.lock:
+            self.results[url] = result
+        return result
+
+    def check_urls(self, urls: list, base_url: str = None, max_workers: int = None) -> dict:
+        """Checks many links concurrently and returns a report.
+
+        Args:
+            urls: The links, as found on the page.
+            base_url: The URL of the page, used to resolve relative links.
+            max_workers: The number of links checked at once; defaults to config.yml.
+
+        Returns:
+            dict: total is the number of links given, checked the number of
+            distinct HTTP(S) links, broken and results the check results
+            and seconds the time taken.
+        """
+        start = time.perf_counter()
+        unique_urls = list(
+            dict.fromkeys(filter(None, (self.normalize_url(url, base_url) for url in urls)))
+        )
+        max_workers = max_workers or self.max_workers
+        self.__ensure_session(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.check_url, unique_urls))
+        broken = [result for result in results if self.is_broken(result)]
+        for result in broken:
+            self.logger.info(
+                "Broken link: %s (%s)", result["url"], result["status_code"] or result["error"]
+            )
+        return {
+            "total": len(urls),
+            "checked": len(unique_urls),
+            "broken": broken,
+            "results": results,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+    def clear_cache(self) -> None:
+        """Forgets the cached results."""
+        with self.lock:
+            self.results.clear()
+
+    def __ensure_session(self, pool_size: int) -> None:
+        """Creates the pooled session on first use."""
+        with self.lock:
+            if self.session is None:
+                self.session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                self.session.mount("http://", adapter)
+                self.session.mount("https://", adapter)
+
+    def __host_limit(self, host: str) -> threading.Semaphore:
+        """Returns the semaphore limiting the requests in flight to a host."""
+        with self.lock:
+            if host not in self.host_limits:
+                self.host_limits[host] = threading.Semaphore(self.max_per_host)
+            return self.host_limits[host]
+
+    def __request(self, url: str) -> dict:
+        """Requests a link with HEAD, falling back to GET."""
+        self.__ensure_session(self.max_workers)
+        start = time.perf_counter()
+        result = {"url": url, "status_code": None, "method": "HEAD", "seconds": 0.0, "error": None}
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in (403, 405, 501) or response.status_code >= 500:
+                result["method"] = "GET"
+                response = self.session.get(
+                    url, timeout=self.timeout, allow_redirects=True, stream=True
+                )
+                response.close()
+            result["status_code"] = response.status_code
+        except requests.RequestException as e:
+            result["error"] = repr(e)
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        return result
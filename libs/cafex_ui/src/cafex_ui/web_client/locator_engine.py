@@ -0,0 +1,259 @@
+"""This module contains the LocatorEngine class which resolves locator strings
+to web elements with cached parsing, an optional element cache, fast presence
+checks and per-locator lookup timings."""
+
+import time
+import weakref
+from functools import lru_cache
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.phase_timer import LOCATOR_TIMINGS, PhaseTimer
+from cafex_core.utils.poller import Poller
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+LOCATOR_STRATEGIES = (
+    "XPATH",
+    "ID",
+    "NAME",
+    "CLASS_NAME",
+    "LINK_TEXT",
+    "CSS_SELECTOR",
+    "PARTIAL_LINK_TEXT",
+    "TAG_NAME",
+)
+
+
+@lru_cache(maxsize=None)
+def locator_strategy(strategy: str) -> str:
+    """Returns the selenium By value of a locator strategy name.
+
+    Args:
+        strategy: The strategy name, e.g. xpath or css_selector.
+
+    Returns:
+        str: The By value.
+    """
+    if strategy.upper() not in LOCATOR_STRATEGIES:
+        raise Exception(
+            "Unsupported locator strategy - "
+            + strategy.upper()
+            + "! "
+            + "Supported locator strategies are 'XPATH', 'ID', 'NAME', "
+              "'CSS_SELECTOR', 'TAG_NAME', 'LINK_TEXT' , 'CLASS_NAME' and 'PARTIAL_LINK_TEXT'"
+        )
+    return getattr(By, strategy.upper())
+
+
+@lru_cache(maxsize=4096)
+def parse_locator(locator: str) -> tuple:
+    """Parses a locator string in the format locator_type=locator.
+
+    Examples:
+        >> parse_locator("xpath=//a[@id='x']")
+        ('xpath', "//a[@id='x']")
+
+    Args:
+        locator: The locator string. "accessibility id" is read as id.
+
+    Returns:
+        tuple: The By value and the locator value.
+    """
+    if locator.lower().find("accessibility id") != -1:
+        locator = locator.replace("accessibility id", "id")
+    strategy, value = locator.split("=", 1)
+    return locator_strategy(strategy), value
+
+
+class LocatorEngine:
+    """Resolves locator strings to web elements for one driver.
+
+    Locator strings are parsed once and cached for the whole process.
+    Every lookup is timed under its locator, and the slowest locators are
+    added to the report.
+
+    Elements can also be cached per driver when the element cache is enabled
+    in config.yml. A cached element is reused only while it still passes
+    the awaited condition. It is dropped when it goes stale, which happens
+    on navigation. Navigation through WebDriverInteractions clears the
+    cache. Locators whose match changes while the page stays loaded, such
+    as positional XPaths over re-ordered lists, should not be used with
+    the element cache.
+
+        'locator_engine':
+          'cache_elements': true
+
+    Attributes:
+        driver (WebDriver): The selenium webdriver instance.
+        timer (PhaseTimer): The timer recording lookups, keyed by locator.
+        logger (Logger): The logger object.
+
+    Methods:
+        for_driver: Returns the engine shared by all users of a driver.
+        find: Waits for a locator to meet a condition and returns the element.
+        find_now: Returns the elements matching a locator without waiting.
+        is_present: Returns whether a locator matches, waiting at most a timeout.
+        is_absent: Returns whether a locator matches nothing, waiting at most a timeout.
+        invalidate: Clears the element cache.
+    """
+
+    PRESENT = "present"
+    VISIBLE = "visible"
+    CLICKABLE = "clickable"
+
+    __conditions = {
+        PRESENT: (EC.presence_of_element_located, lambda element: bool(element.tag_name)),
+        VISIBLE: (EC.visibility_of_element_located, lambda element: element.is_displayed()),
+        CLICKABLE: (
+            EC.element_to_be_clickable,
+            lambda element: element.is_displayed() and element.is_enabled(),
+        ),
+    }
+    __engines = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, poll_frequency: float = 0.1):
+        """Initialize the LocatorEngine class.
+
+        Args:
+            driver: The selenium webdriver instance.
+            poll_frequency: The seconds between polls of an explicit wait.
+        """
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+        self.timer = PhaseTimer(LOCATOR_TIMINGS)
+        self.logger = CoreLogger(name=__name__).get_logger()
+        self.__elements = {}
+
+    @classmethod
+    def for_driver(cls, driver) -> "LocatorEngine":
+        """Returns the engine shared by all users of a driver.
+
+        Args:
+            driver: The selenium webdriver instance.
+
+        Returns:
+            LocatorEngine: The engine of the driver.
+        """
+        engine = cls.__engines.get(driver)
+        if engine is None:
+            engine = cls(driver)
+            cls.__engines[driver] = engine
+        return engine
+
+    @property
+    def cache_elements(self) -> bool:
+        """Returns whether the element cache is enabled in config.yml."""
+        base_config = SessionStore().base_config or {}
+        engine_config = base_config.get("locator_engine") or {}
+        return str(engine_config.get("cache_elements", False)).lower() == "true"
+
+    def find(self, locator: str, explicit_wait: float, condition: str = PRESENT):
+        """Waits for a locator to meet a condition and returns the element.
+
+        Args:
+            locator: The locator string in the format locator_type=locator.
+            explicit_wait: The maximum seconds to wait.
+            condition: PRESENT, VISIBLE or CLICKABLE.
+
+        Returns:
+            WebElement: The element.
+
+        Raises:
+            TimeoutException: If the condition is not met in time.
+        """
+        by_value = parse_locator(locator)
+        expected_condition, check_element = self.__conditions[condition]
+        start = time.perf_counter()
+        try:
+            cached = self.__elements.get(by_value) if self.cache_elements else None
+            if cached is not None:
+                try:
+                    if check_element(cached):
+                        return cached
+                except WebDriverException:
+                    self.__elements.pop(by_value, None)
+            element = WebDriverWait(
+                self.driver, explicit_wait, poll_frequency=self.poll_frequency
+            ).until(expected_condition(by_value))
+            if self.cache_elements:
+                self.__elements[by_value] = element
+            return element
+        finally:
+            self.timer.record(locator, time.perf_counter() - start)
+
+    def find_now(self, locator: str) -> list:
+        """Returns the elements matching a locator without waiting.
+
+        The implicit wait of the driver is suspended for the lookup, so a
+        locator that matches nothing returns immediately.
+
+        Args:
+            locator: The locator string in the format locator_type=locator.
+
+        Returns:
+            list: The matching elements.
+        """
+        by, value = parse_locator(locator)
+        implicit_wait = self.driver.timeouts.implicit_wait
+        if implicit_wait:
+            self.driver.implicitly_wait(0)
+        try:
+            return self.driver.find_elements(by, value)
+        finally:
+            if implicit_wait:
+                self.driver.implicitly_wait(implicit_wait)
+
+    def is_present(self, locator: str, timeout: float = 0, visible: bool = False) -> bool:
+        """Returns whether a locator matches, waiting at most a timeout.
+
+        Args:
+            locator: The locator string in the format locator_type=locator.
+            timeout: The maximum seconds to wait; 0 checks once.
+            visible: Only count displayed elements.
+
+        Returns:
+            bool: True if the locator matched in time.
+        """
+        return self.__wait_for_count(locator, timeout, visible, present=True)
+
+    def is_absent(self, locator: str, timeout: float = 0, visible: bool = False) -> bool:
+        """Returns whether a locator matches nothing, waiting at most a timeout.
+
+        Unlike waiting for presence to time out, this returns as soon as the
+        locator matches nothing, which is immediately when the element was
+        never there.
+
+        Args:
+            locator: The locator string in the format locator_type=locator.
+            timeout: The maximum seconds to wait for the element to go away; 0 checks once.
+            visible: Only count displayed elements, so hidden elements count as absent.
+
+        Returns:
+            bool: True if the locator matched nothing in time.
+        """
+        return self.__wait_for_count(locator, timeout, visible, present=False)
+
+    def invalidate(self) -> None:
+        """Clears the element cache."""
+        self.__elements.clear()
+
+    def __wait_for_count(self, locator, timeout, visible, present) -> bool:
+        """Polls find_now until the locator matches (present) or not (absent)."""
+
+        def count():
+            try:
+                elements = self.find_now(locator)
+                if visible:
+                    elements = [element for element in elements if element.is_displayed()]
+                return len(elements)
+            except WebDriverException:
+                return 0
+
+        start = time.perf_counter()
+        poller = Poller(timeout=timeout, initial_interval=self.poll_frequency, max_interval=0.5)
+        met, _, _ = poller.wait(count, lambda matched: (matched > 0) == present)
+        self.timer.record(locator, time.perf_counter() - start)
+        return met
@@ -0,0 +1,155 @@
+"""This module contains the PageSnapshot class, a static, parsed copy of a
+page or element for running many read-only assertions without the
+driver."""
+
+import time
+from functools import partial
+
+from cafex_core.parsers.html_parser import HTMLParser
+
+PARSER_METHODS = (
+    "get_element_by_xpath",
+    "get_element_by_css",
+    "get_hyperlink_value",
+    "get_text",
+    "get_cell_value",
+    "get_row_data",
+    "get_column_data",
+    "get_row_count",
+    "get_column_count",
+    "get_all_elements",
+    "get_all_elements_text",
+    "get_first_element",
+    "element_should_exist",
+    "get_element_count",
+    "get_attributes",
+)
+
+_LOCATOR_XPATHS = {
+    "id": "//*[@id=$value]",
+    "name": "//*[@name=$value]",
+    "class_name": (
+        "//*[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $value, ' '))]"
+    ),
+    "link_text": "//a[normalize-space(.)=$value]",
+    "partial_link_text": "//a[contains(., $value)]",
+}
+
+
+class PageSnapshot:
+    """A static, parsed copy of a page or element.
+
+    The HTML is captured from the browser once and parsed with lxml, so
+    queries run locally in microseconds instead of costing a driver call
+    each. The snapshot is static: it does not change when the page does.
+    Take a new snapshot after any action that changes the page, and use the
+    driver for anything that depends on layout, visibility or live state.
+
+    The HTMLParser methods are available with the snapshot as their tree,
+    so the html_tree argument is left out:
+
+        >> snapshot = CafeXWeb().get_page_snapshot("xpath=//table[@id='report']")
+        >> snapshot.get_row_count()
+        >> snapshot.get_cell_value(by_locator=False, row=2, col=3)
+        >> snapshot.get_column_data()
+
+    Attributes:
+        tree (HtmlElement): The parsed HTML.
+        url (str): The URL of the page when the snapshot was taken.
+        captured_at (float): The time the snapshot was taken, as time.time().
+
+    Methods:
+        age_seconds: Returns how old the snapshot is.
+        find_all: Returns the elements matching a locator.
+        find: Returns the first element matching a locator.
+        get_texts: Returns the text of the elements matching a locator.
+        count: Returns the number of elements matching a locator.
+    """
+
+    def __init__(self, html_content: str, url: str = None, parser: HTMLParser = None):
+        """Initialize the PageSnapshot class.
+
+        Args:
+            html_content: The HTML of the page or element.
+            url: The URL of the page.
+            parser: The HTMLParser whose methods are exposed. Defaults to a new one.
+        """
+        self.parser = parser or HTMLParser()
+        self.tree = self.parser.parse_html_data(html_content)
+        if self.tree is None:
+            raise ValueError("The snapshot HTML could not be parsed")
+        self.url = url
+        self.captured_at = time.time()
+
+    def __getattr__(self, name):
+        if name in PARSER_METHODS:
+            return partial(getattr(self.parser, name), self.tree)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self):
+        return f"<PageSnapshot of {self.url or 'HTML'} taken {self.age_seconds:.1f}s ago>"
+
+    @property
+    def age_seconds(self) -> float:
+        """Returns how old the snapshot is, in seconds."""
+        return time.time() - self.captured_at
+
+    def find_all(self, locator: str) -> list:
+        """Returns the elements matching a locator.
+
+        Examples:
+            >> snapshot.find_all("xpath=//table[@id='report']//tr")
+            >> snapshot.find_all("class_name=error")
+
+        Args:
+            locator: A string in the format locator_type=locator. The types are xpath,
+                     css_selector, id, name, class_name, tag_name, link_text and partial_link_text.
+
+        Returns:
+            list: The matching elements.
+        """
+        strategy, value = locator.split("=", 1)
+        strategy = strategy.strip().lower().replace(" ", "_")
+        if strategy == "xpath":
+            return self.tree.xpath(value)
+        if strategy == "css_selector":
+            return self.tree.cssselect(value)
+        if strategy == "tag_name":
+            return self.tree.xpath(f"//{value}")
+        if strategy in _LOCATOR_XPATHS:
+            return self.tree.xpath(_LOCATOR_XPATHS[strategy], value=value)
+        raise ValueError(f"Unsupported locator strategy - {strategy.upper()}!")
+
+    def find(self, locator: str):
+        """Returns the first element matching a locator.
+
+        Args:
+            locator: A string in the format locator_type=locator.
+
+        Returns:
+            HtmlElement: The first match, or None.
+        """
+        elements = self.find_all(locator)
+        return elements[0] if elements else None
+
+    def get_texts(self, locator: str) -> list:
+        """Returns the whitespace-normalised text of the elements matching a locator.
+
+        Args:
+            locator: A string in the format locator_type=locator.
+
+        Returns:
+            list: The texts, including the text of child elements.
+        """
+        return [" ".join(element.text_content().split()) for element in self.find_all(locator)]
+
+    def count(self, locator: str) -> int:
+        """Returns the number of elements matching a locator.
+
+        Args:
+            locator: A string in the format locator_type=locator.
+
+        Returns:
+            int: The number of matches.
+        """
+        return len(self.find_all(locator))
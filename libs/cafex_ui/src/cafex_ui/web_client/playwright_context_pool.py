@@ -0,0 +1,235 @@
+"""This module contains the PlaywrightContextPool class which keeps one
+Playwright browser per worker and gives every test its own browser context."""
+
+import os
+import re
+import time
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+
+
+class PlaywrightContextPool:
+    """A per-process Playwright browser with a new context per test.
+
+    Launching a browser takes seconds; a new context takes milliseconds and
+    is as isolated as a fresh browser profile. The browser is launched once
+    per process, so once per xdist worker, and every test gets its own
+    context and page, which are closed after the test.
+
+    Storage-state snapshots capture the cookies and local storage of a
+    logged-in context under a name. Later contexts are created from the
+    snapshot instead of replaying the UI login. With a storage state
+    directory the snapshots are also written to disk and shared between
+    workers.
+
+    The pool is configured in config.yml:
+
+        'playwright_context_pool':
+          'enabled': true
+          'storage_state_dir': null
+
+    Attributes:
+        logger (Logger): The logger object.
+        session_store (SessionStore): The session store object.
+        playwright: The running Playwright instance.
+        browser (Browser): The browser shared by the contexts.
+        context (BrowserContext): The context of the current test.
+        page (Page): The page of the current test.
+
+    Methods:
+        is_enabled: Returns whether the pool is enabled in config.yml.
+        get_browser: Returns the browser, launching it on first use.
+        new_context: Closes the current context and opens a new one.
+        close_context: Closes the context of the current test.
+        save_storage_state: Saves the state of the current context under a name.
+        has_storage_state: Returns whether a snapshot exists.
+        use_storage_state: Opens a context from a snapshot, creating it if needed.
+        shutdown: Closes the browser and stops Playwright.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Ensures only one instance of PlaywrightContextPool exists per process.
+
+        Returns:
+            PlaywrightContextPool: The singleton instance.
+        """
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.logger = CoreLogger(name=__name__).get_logger()
+            cls._instance.session_store = SessionStore()
+            cls._instance.playwright = None
+            cls._instance.browser = None
+            cls._instance.context = None
+            cls._instance.page = None
+            cls._instance.storage_states = {}
+        return cls._instance
+
+    @property
+    def pool_config(self) -> dict:
+        """Returns the playwright_context_pool section of config.yml.
+
+        Returns:
+            dict: The context pool configuration.
+        """
+        base_config = self.session_store.base_config or {}
+        return base_config.get("playwright_context_pool") or {}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether the pool is enabled in config.yml.
+
+        Returns:
+            bool: True if the pool is enabled.
+        """
+        return str(PlaywrightContextPool().pool_config.get("enabled", False)).lower() == "true"
+
+    def get_browser(self, launch_browser):
+        """Returns the browser, launching it on first use or after it disconnected.
+
+        Args:
+            launch_browser: Called with the Playwright instance; returns a browser.
+
+        Returns:
+            Browser: The browser.
+        """
+        if self.browser is not None and not self.browser.is_connected():
+            self.logger.warning("Playwright browser disconnected; launching a new one")
+            self.browser = None
+        if self.browser is None:
+            if self.playwright is None:
+                from playwright.sync_api import sync_playwright
+
+                self.playwright = sync_playwright().start()
+            start = time.perf_counter()
+            self.browser = launch_browser(self.playwright)
+            self.session_store.playwright_browser = self.browser
+            self.session_store.playwright_context_pool = self
+            self.logger.info("Playwright browser launched in %.2fs", time.perf_counter() - start)
+        return self.browser
+
+    def new_context(self, storage_state: str = None, **context_args):
+        """Closes the current context and opens a new one with a page.
+
+        Args:
+            storage_state: The name of a snapshot to start from.
+            **context_args: Other arguments of Browser.new_context.
+
+        Returns:
+            Page: The page of the new context.
+        """
+        if self.browser is None:
+            raise RuntimeError("The Playwright browser has not been launched")
+        self.close_context()
+        if storage_state is not None:
+            context_args["storage_state"] = self.__load_storage_state(storage_state)
+        start = time.perf_counter()
+        self.context = self.browser.new_context(**context_args)
+        self.page = self.context.new_page()
+        self.session_store.playwright_context = self.context
+        self.session_store.playwright_page = self.page
+        self.logger.debug("Playwright context opened in %.3fs", time.perf_counter() - start)
+        return self.page
+
+    def close_context(self) -> None:
+        """Closes the context of the current test."""
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.logger.warning("Error while closing Playwright context: %s", e)
+        self.context = None
+        self.page = None
+        self.session_store.playwright_context = None
+        self.session_store.playwright_page = None
+
+    def save_storage_state(self, name: str) -> dict:
+        """Saves the cookies and local storage of the current context under a name.
+
+        Args:
+            name: The snapshot name, e.g. the user that logged in.
+
+        Returns:
+            dict: The storage state.
+        """
+        if self.context is None:
+            raise RuntimeError("There is no Playwright context to save")
+        path = self.__storage_state_path(name)
+        if path is not None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            state = self.context.storage_state(path=path)
+        else:
+            state = self.context.storage_state()
+        self.storage_states[name] = state
+        return state
+
+    def has_storage_state(self, name: str) -> bool:
+        """Returns whether a snapshot exists in memory or on disk.
+
+        Args:
+            name: The snapshot name.
+
+        Returns:
+            bool: True if the snapshot exists.
+        """
+        path = self.__storage_state_path(name)
+        return name in self.storage_states or (path is not None and os.path.exists(path))
+
+    def use_storage_state(self, name: str, login=None, **context_args):
+        """Opens a context from a snapshot, creating the snapshot if needed.
+
+        When the snapshot does not exist yet, a new context is opened, the
+        login function is called with its page, and the resulting state is
+        saved under the name.
+
+        Args:
+            name: The snapshot name.
+            login: Called with the page to log in when the snapshot is missing.
+            **context_args: Other arguments of Browser.new_context.
+
+        Returns:
+            Page: The page of the new context.
+
+        Examples:
+            >> pool.use_storage_state("admin", login=lambda page: login_page.login(page, "admin"))
+        """
+        if self.has_storage_state(name):
+            return self.new_context(storage_state=name, **context_args)
+        if login is None:
+            raise KeyError(f"No storage state named {name!r}")
+        page = self.new_context(**context_args)
+        login(page)
+        self.save_storage_state(name)
+        return page
+
+    def shutdown(self) -> None:
+        """Closes the context and the browser and stops Playwright."""
+        self.close_context()
+        try:
+            if self.browser is not None:
+                self.browser.close()
+            if self.playwright is not None:
+                self.playwright.stop()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.warning("Error while closing Playwright browser: %s", e)
+        self.browser = None
+        self.playwright = None
+        self.session_store.playwright_browser = None
+
+    def __storage_state_path(self, name: str):
+        """Returns the file of a snapshot, or None without a storage state directory."""
+        directory = self.pool_config.get("storage_state_dir")
+        if not directory:
+            return None
+        return os.path.join(directory, re.sub(r"[^\w.-]", "_", name) + ".json")
+
+    def __load_storage_state(self, name: str):
+        """Returns a snapshot, preferring the copy in memory."""
+        if name in self.storage_states:
+            return self.storage_states[name]
+        path = self.__storage_state_path(name)
+        if path is not None and os.path.exists(path):
+            return path
+        raise KeyError(f"No storage state named {name!r}")
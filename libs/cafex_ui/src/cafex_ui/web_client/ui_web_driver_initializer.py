@@ -2,15 +2,18 @@ import os
 
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.phase_timer import PhaseTimer
 from cafex_ui.cafex_ui_config_utils import WebConfigUtils
 from cafex_ui.web_client.browserstack_integration import (
     BrowserStackDriverFactory,
 )
 from cafex_ui.web_client.keyboard_mouse_actions import KeyboardMouseActions
+from cafex_ui.web_client.playwright_context_pool import PlaywrightContextPool
 from cafex_ui.web_client.web_client_actions.base_web_client_actions import (
     WebClientActions,
 )
 from cafex_ui.web_client.web_driver_factory import WebDriverFactory
+from cafex_ui.web_client.web_driver_pool import WebDriverPool
 
 
 class WebDriverInitializer:
@@ -22,12 +25,38 @@ class WebDriverInitializer:
         self.logger = CoreLogger(name=__name__).get_logger()
         self.bs_obj = None
 
+    @PhaseTimer.timed("driver_creation")
     def initialize_driver(self) -> None:
-        """Initialize the driver."""
+        """Initialize the driver.
+
+        When the driver pool is enabled in config.yml, the session of the
+        previous test on this worker is reused if it was created with the
+        same browser, capabilities and proxy.
+        """
         try:
             web_capabilities = self._get_web_capabilities()
             bs_capabilities, current_browser = self._get_browserstack_capabilities(web_capabilities)
-            driver_obj = self._create_web_driver(web_capabilities, bs_capabilities, current_browser)
+            if WebDriverPool.is_enabled():
+                key = WebDriverPool.driver_key(
+                    current_browser,
+                    capabilities=web_capabilities,
+                    browserstack_capabilities=bs_capabilities,
+                    proxies=self._get_proxy_options(
+                        self.config_utils.base_config.get("use_proxy", False)
+                    ),
+                    use_grid=self.config_utils.fetch_use_grid(),
+                    selenium_grid_ip=self.config_utils.fetch_selenium_grid_ip(),
+                )
+                driver_obj = WebDriverPool().acquire(
+                    key,
+                    lambda: self._create_web_driver(
+                        web_capabilities, bs_capabilities, current_browser
+                    ),
+                )
+            else:
+                driver_obj = self._create_web_driver(
+                    web_capabilities, bs_capabilities, current_browser
+                )
             self._store_driver_in_session(driver_obj)
         except Exception as error_before_scenario_browser_setup:
             self.logger.error(
@@ -155,27 +184,26 @@ class WebDriverInitializer:
         self.session_store.globals["obj_wca"] = WebClientActions(self.session_store.driver)
         self.session_store.globals["obj_kma"] = KeyboardMouseActions(self.session_store.driver)
 
+    @PhaseTimer.timed("driver_creation")
     def initialize_playwright_driver(self) -> None:
+        """Initialize the Playwright browser, context and page.
+
+        When the Playwright context pool is enabled in config.yml, the
+        browser is launched once per worker and every call opens a new
+        context; otherwise the browser, context and page are created once
+        and shared.
+        """
         from playwright.sync_api import sync_playwright
         self.logger.info("playwright_web configuration")
         try:
-            browser_args = self.config_utils.base_config.get("playwright_browser_args", {})
+            if PlaywrightContextPool.is_enabled():
+                pool = PlaywrightContextPool()
+                pool.get_browser(self._launch_playwright_browser)
+                pool.new_context()
+                return
             if self.session_store.playwright_browser is None:
                 playwright = sync_playwright().start()
-                browser_type = self.config_utils.fetch_current_browser()
-                if 'headless' not in browser_args or browser_args.get('headless') is None:
-                    browser_args['headless'] = False
-                if os.environ.get("isCTBuild") == "1":
-                    browser_args['headless'] = True
-                if browser_type in ["chromium","edge","chrome"]:
-                    browser = playwright.chromium.launch(**browser_args)
-                elif browser_type == "firefox":
-                    browser = playwright.firefox.launch(**browser_args)
-                elif browser_type in ["webkit","safari"]:
-                    browser = playwright.webkit.launch(**browser_args)
-                else:
-                    raise ValueError(f"Unsupported browser type: {browser_type}")
-
+                browser = self._launch_playwright_browser(playwright)
                 context = browser.new_context()
                 page = context.new_page()
                 self.session_store.playwright_browser = browser
@@ -186,3 +214,17 @@ class WebDriverInitializer:
             self.logger.exception(f"Error in playwright_web configuration: {str(e)}")
             raise e
 
+    def _launch_playwright_browser(self, playwright):
+        browser_args = self.config_utils.base_config.get("playwright_browser_args", {})
+        browser_type = self.config_utils.fetch_current_browser()
+        if 'headless' not in browser_args or browser_args.get('headless') is None:
+            browser_args['headless'] = False
+        if os.environ.get("isCTBuild") == "1":
+            browser_args['headless'] = True
+        if browser_type in ["chromium","edge","chrome"]:
+            return playwright.chromium.launch(**browser_args)
+        if browser_type == "firefox":
+            return playwright.firefox.launch(**browser_args)
+        if browser_type in ["webkit","safari"]:
+            return playwright.webkit.launch(**browser_args)
+        raise ValueError(f"Unsupported browser type: {browser_type}")
@@ -0,0 +1,290 @@
+"""This module contains the WaitEngine class which waits for single-page
+applications to settle: no pending requests, no DOM changes and idle
+frameworks."""
+
+import weakref
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.poller import Poller
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+_INSTRUMENTATION_SCRIPT = """
+(function () {
+    if (window.__cafexIdle) {
+        return;
+    }
+    var state = window.__cafexIdle = {pending: 0, lastNetwork: Date.now(), lastMutation: Date.now()};
+    function started() {
+        state.pending++;
+        state.lastNetwork = Date.now();
+    }
+    function finished() {
+        state.pending = Math.max(state.pending - 1, 0);
+        state.lastNetwork = Date.now();
+    }
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            started();
+            return fetch.apply(this, arguments).finally(finished);
+        };
+    }
+    if (window.XMLHttpRequest) {
+        var send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            started();
+            this.addEventListener('loadend', finished);
+            return send.apply(this, arguments);
+        };
+    }
+    var observe = function () {
+        new MutationObserver(function () {
+            state.lastMutation = Date.now();
+        }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    };
+    if (document.documentElement) {
+        observe();
+    } else {
+        document.addEventListener('DOMContentLoaded', observe);
+    }
+})();
+"""
+
+_STATUS_SCRIPT = """
+var hooks = [%s];
+var state = window.__cafexIdle, now = Date.now();
+
+function angularIdle() {
+    if (window.getAllAngularTestabilities) {
+        return window.getAllAngularTestabilities().every(function (testability) {
+            return testability.isStable();
+        });
+    }
+    if (window.angular && document.body) {
+        var injector = window.angular.element(document.body).injector();
+        if (injector && injector.has('$http')) {
+            return injector.get('$http').pendingRequests.length === 0;
+        }
+    }
+    return true;
+}
+
+var frameworkIdle = true, hookError = null;
+try {
+    frameworkIdle = angularIdle();
+    for (var i = 0; frameworkIdle && i < hooks.length; i++) {
+        frameworkIdle = !!hooks[i]();
+    }
+} catch (e) {
+    hookError = String(e);
+}
+return {
+    readyState: document.readyState,
+    pendingRequests: state.pending,
+    networkQuietMs: now - state.lastNetwork,
+    domQuietMs: now - state.lastMutation,
+    frameworkIdle: frameworkIdle,
+    hookError: hookError
+};
+"""
+
+
+class WaitEngine:
+    """Waits for a page to settle instead of sleeping a fixed time.
+
+    document.readyState is complete long before a single-page application
+    is ready. The engine instruments the page, patching fetch and
+    XMLHttpRequest to count pending requests and observing the DOM with a
+    MutationObserver. Each poll reads the state with one script call. A
+    page is idle when:
+    - no request is pending and none finished within the network quiet window;
+    - the DOM has not changed within the DOM quiet window;
+    - Angular and AngularJS report stable;
+    - the idle hooks of config.yml return true.
+
+    On Chromium the instrumentation is also registered for new documents
+    through CDP, so requests made while the page loads are counted too.
+    Elsewhere the page is instrumented on the first wait, and requests
+    already in flight at that moment are not seen.
+
+    React has no idle API, so React pages rely on the DOM quiet window.
+    Applications can also expose their own check as an idle hook, e.g. a
+    data-fetching client's pending count.
+
+    The engine is configured in config.yml. When before_actions is true,
+    ElementInteractions waits for the page to be idle before clicking and
+    typing. Such waits never fail the action; they give up after the
+    timeout.
+
+        'wait_engine':
+          'before_actions': false
+          'timeout': 10
+          'network_quiet_ms': 200
+          'dom_quiet_ms': 300
+          'idle_hooks': ["window.__REACT_QUERY_CLIENT__.isFetching() === 0"]
+
+    Attributes:
+        driver (WebDriver): The selenium webdriver instance.
+        poll_interval (float): The seconds between polls.
+        logger (Logger): The logger object.
+
+    Methods:
+        for_driver: Returns the engine shared by all users of a driver.
+        install: Registers the instrumentation for new documents.
+        status: Returns the current idle state of the page.
+        wait_until_idle: Waits until the page is idle.
+        before_action: Waits for the page to be idle when enabled for actions.
+    """
+
+    __engines = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, poll_interval: float = 0.1):
+        """Initialize the WaitEngine class.
+
+        Args:
+            driver: The selenium webdriver instance.
+            poll_interval: The seconds between polls.
+        """
+        self.driver = driver
+        self.poll_interval = poll_interval
+        self.logger = CoreLogger(name=__name__).get_logger()
+        self.__installed = False
+        self.__cdp = False
+        self.__status_scripts = {}
+
+    @classmethod
+    def for_driver(cls, driver) -> "WaitEngine":
+        """Returns the engine shared by all users of a driver.
+
+        Args:
+            driver: The selenium webdriver instance.
+
+        Returns:
+            WaitEngine: The engine of the driver.
+        """
+        engine = cls.__engines.get(driver)
+        if engine is None:
+            engine = cls(driver)
+            cls.__engines[driver] = engine
+        return engine
+
+    @property
+    def engine_config(self) -> dict:
+        """Returns the wait_engine section of config.yml.
+
+        Returns:
+            dict: The wait engine configuration.
+        """
+        base_config = SessionStore().base_config or {}
+        return base_config.get("wait_engine") or {}
+
+    def install(self) -> bool:
+        """Registers the instrumentation for every new document.
+
+        Returns:
+            bool: True if registered through CDP, False if the browser does not support it.
+        """
+        if not self.__installed:
+            self.__installed = True
+            try:
+                self.driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument", {"source": _INSTRUMENTATION_SCRIPT}
+                )
+                self.__cdp = True
+            except (AttributeError, WebDriverException) as e:
+                self.logger.debug("CDP is not available, instrumenting on demand: %s", e)
+                self.__cdp = False
+        return self.__cdp
+
+    def status(self) -> dict:
+        """Returns the current idle state of the page.
+
+        Returns:
+            dict: readyState, pendingRequests, networkQuietMs, domQuietMs,
+            frameworkIdle and hookError.
+        """
+        self.install()
+        hooks = tuple(self.engine_config.get("idle_hooks") or ())
+        script = self.__status_scripts.get(hooks)
+        if script is None:
+            functions = ", ".join(f"function () {{ return ({hook}); }}" for hook in hooks)
+            script = _INSTRUMENTATION_SCRIPT + _STATUS_SCRIPT % functions
+            self.__status_scripts[hooks] = script
+        return self.driver.execute_script(script)
+
+    def wait_until_idle(
+            self,
+            timeout: float = None,
+            network_quiet_ms: int = None,
+            dom_quiet_ms: int = None,
+            network: bool = True,
+            dom: bool = True,
+            framework: bool = True,
+    ) -> dict:
+        """Waits until the page is idle.
+
+        Args:
+            timeout: The maximum seconds to wait. Defaults to config.yml, then to 10.
+            network_quiet_ms: The milliseconds without requests. Defaults to config.yml, then to 200.
+            dom_quiet_ms: The milliseconds without DOM changes. Defaults to config.yml, then to 300.
+            network: Wait for pending requests.
+            dom: Wait for the DOM to be quiet.
+            framework: Wait for Angular and the idle hooks.
+
+        Returns:
+            dict: The status of the page when it became idle.
+
+        Raises:
+            TimeoutException: If the page is not idle in time.
+        """
+        config = self.engine_config
+        timeout = float(timeout if timeout is not None else config.get("timeout", 10))
+        if network_quiet_ms is None:
+            network_quiet_ms = int(config.get("network_quiet_ms", 200))
+        if dom_quiet_ms is None:
+            dom_quiet_ms = int(config.get("dom_quiet_ms", 300))
+
+        def is_idle(status):
+            return (
+                status is not None
+                and status["readyState"] == "complete"
+                and (not network or (status["pendingRequests"] == 0
+                                     and status["networkQuietMs"] >= network_quiet_ms))
+                and (not dom or status["domQuietMs"] >= dom_quiet_ms)
+                and (not framework or status["frameworkIdle"])
+            )
+
+        def probe():
+            try:
+                status = self.status()
+                if status and status.get("hookError"):
+                    self.logger.debug("An idle hook failed: %s", status["hookError"])
+                return status
+            except WebDriverException as e:
+                # The page can navigate away between polls.
+                self.logger.debug("Page status is not available yet: %s", e)
+                return None
+
+        poller = Poller(
+            timeout=timeout,
+            initial_interval=self.poll_interval,
+            max_interval=max(self.poll_interval, 0.25),
+        )
+        met, status, stats = poller.wait(probe, is_idle)
+        if not met:
+            raise TimeoutException(f"The page was not idle after {timeout}s: {status}")
+        self.logger.debug("Page idle after %ss: %s", stats["seconds"], status)
+        return status
+
+    def before_action(self) -> None:
+        """Waits for the page to be idle when enabled for actions in config.yml.
+
+        A page that does not settle in time is logged and the action goes on.
+        """
+        if str(self.engine_config.get("before_actions", False)).lower() != "true":
+            return
+        try:
+            self.wait_until_idle()
+        except TimeoutException as e:
+            self.logger.warning("Continuing before the page was idle: %s", e.msg)
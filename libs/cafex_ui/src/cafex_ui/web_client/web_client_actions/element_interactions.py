@@ -1,6 +1,5 @@
 import time
 from typing import List, Union
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
@@ -9,6 +8,101 @@ from selenium.webdriver.support.ui import Select, WebDriverWait
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
 from cafex_ui.cafex_ui_config_utils import WebConfigUtils
+from cafex_ui.web_client.locator_engine import LocatorEngine, locator_strategy, parse_locator
+from cafex_ui.web_client.page_snapshot import PageSnapshot
+from cafex_ui.web_client.wait_engine import WaitEngine
+
+ELEMENT_STATES = ("text", "displayed", "enabled", "selected", "rect")
+
+_ELEMENT_STATE_SCRIPT = """
+var specs = arguments[0], states = arguments[1], attributes = arguments[2];
+
+function findAll(by, value) {
+    switch (by) {
+        case 'xpath':
+            var snapshot = document.evaluate(
+                value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        case 'id':
+            return document.querySelectorAll('#' + CSS.escape(value));
+        case 'name':
+            return document.querySelectorAll('[name="' + CSS.escape(value) + '"]');
+        case 'class name':
+            return document.querySelectorAll('.' + CSS.escape(value));
+        case 'link text':
+            return Array.prototype.filter.call(document.querySelectorAll('a'), function (a) {
+                return a.innerText.trim() === value;
+            });
+        case 'partial link text':
+            return Array.prototype.filter.call(document.querySelectorAll('a'), function (a) {
+                return a.innerText.indexOf(value) !== -1;
+            });
+        default:
+            return document.querySelectorAll(value);
+    }
+}
+
+function isDisplayed(element) {
+    if (!element.isConnected || element.getClientRects().length === 0) {
+        return false;
+    }
+    if (element.checkVisibility) {
+        return element.checkVisibility({visibilityProperty: true, opacityProperty: true});
+    }
+    var style = window.getComputedStyle(element);
+    return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0';
+}
+
+function attributeValue(element, name) {
+    var property = element[name];
+    if (typeof property === 'boolean') {
+        return property ? 'true' : null;
+    }
+    if (typeof property === 'string' || typeof property === 'number') {
+        return String(property);
+    }
+    return element.getAttribute(name);
+}
+
+return specs.map(function (spec) {
+    var elements;
+    try {
+        elements = spec[2] ? [spec[2]] : findAll(spec[0], spec[1]);
+    } catch (e) {
+        return {found: false, count: 0, error: String(e)};
+    }
+    if (elements.length === 0) {
+        return {found: false, count: 0};
+    }
+    var element = elements[0], result = {found: true, count: elements.length};
+    states.forEach(function (state) {
+        if (state === 'text') {
+            result.text = element.innerText !== undefined ? element.innerText : element.textContent;
+        } else if (state === 'displayed') {
+            result.displayed = isDisplayed(element);
+        } else if (state === 'enabled') {
+            result.enabled = !element.matches(':disabled');
+        } else if (state === 'selected') {
+            result.selected = !!(element.selected || element.checked);
+        } else if (state === 'rect') {
+            var rect = element.getBoundingClientRect();
+            result.rect = {x: rect.left + window.scrollX, y: rect.top + window.scrollY,
+                           width: rect.width, height: rect.height};
+        }
+    });
+    if (attributes.length) {
+        result.attributes = {};
+        attributes.forEach(function (name) {
+            result.attributes[name] = attributeValue(element, name);
+        });
+    }
+    return result;
+});
+"""
 
 
 class ElementInteractions:
@@ -53,6 +147,7 @@ class ElementInteractions:
         """
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
+            WaitEngine.for_driver(self.driver).before_action()
             self.get_clickable_web_element(locator, explicit_wait).click()
         except Exception as e:
             self.logger.exception(
@@ -93,6 +188,7 @@ class ElementInteractions:
         """
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
+            WaitEngine.for_driver(self.driver).before_action()
             if click_before_type:
                 self.get_clickable_web_element(locator, explicit_wait).click()
             if clear:
@@ -124,15 +220,8 @@ class ElementInteractions:
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
             if isinstance(locator, str):
-                locator_details = locator.split("=", 1)
-
-                if locator.lower().find("accessibility id") != -1:
-                    locator = locator.replace("accessibility id", "id")
-
-                element = WebDriverWait(self.driver, explicit_wait).until(
-                    EC.presence_of_element_located(
-                        (self.get_locator_strategy(locator_details[0]), locator_details[1])
-                    )
+                element = LocatorEngine.for_driver(self.driver).find(
+                    locator, explicit_wait, LocatorEngine.PRESENT
                 )
                 return element is not None
             if isinstance(locator, WebElement):
@@ -163,14 +252,8 @@ class ElementInteractions:
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
             if isinstance(locator, str):
-                if locator.lower().find("accessibility id") != -1:
-                    locator = locator.replace("accessibility id", "id")
-
-                locator_details = locator.split("=", 1)
-                element = WebDriverWait(self.driver, explicit_wait).until(
-                    EC.visibility_of_element_located(
-                        (self.get_locator_strategy(locator_details[0]), locator_details[1])
-                    )
+                element = LocatorEngine.for_driver(self.driver).find(
+                    locator, explicit_wait, LocatorEngine.VISIBLE
                 )
                 return element is not None
             if isinstance(locator, WebElement):
@@ -181,6 +264,32 @@ class ElementInteractions:
             )
             return False
 
+    def is_element_absent(self, locator: str, timeout: float = 0, visible: bool = False) -> bool:
+        """Verify that the given locator matches nothing on the page, without
+        waiting the explicit wait when the element was never there.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> CafeXWeb().is_element_absent("xpath=//div[@class='error']")
+            >> CafeXWeb().is_element_absent("xpath=//div[@class='spinner']", timeout=10, visible=True)
+
+        Args:
+            locator: A string representing the locator in a fixed format which is, locator_type=locator.
+                     For example: id=username or xpath=.//*[@id='username']
+            timeout: The maximum seconds to wait for the element to go away. By default, it is checked once.
+            visible: If True, elements that are present but hidden count as absent.
+
+        Returns:
+            A boolean indicating if the element is absent.
+        """
+        try:
+            return LocatorEngine.for_driver(self.driver).is_absent(locator, timeout, visible)
+        except Exception as e:
+            self.logger.exception(
+                "Exception in is_element_absent method. Exception Details: %s", repr(e)
+            )
+            return False
+
     def get_web_element(
             self, locator: Union[str, WebElement], explicit_wait: int = None
     ) -> WebElement:
@@ -202,11 +311,8 @@ class ElementInteractions:
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
             if isinstance(locator, str):
-                locator_details = locator.split("=", 1)
-                return WebDriverWait(self.driver, explicit_wait).until(
-                    EC.presence_of_element_located(
-                        (self.get_locator_strategy(locator_details[0]), locator_details[1])
-                    )
+                return LocatorEngine.for_driver(self.driver).find(
+                    locator, explicit_wait, LocatorEngine.PRESENT
                 )
             if isinstance(locator, WebElement):
                 return locator
@@ -237,11 +343,8 @@ class ElementInteractions:
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
             if isinstance(locator, str):
-                locator_details = locator.split("=", 1)
-                return WebDriverWait(self.driver, explicit_wait).until(
-                    EC.element_to_be_clickable(
-                        (self.get_locator_strategy(locator_details[0]), locator_details[1])
-                    )
+                return LocatorEngine.for_driver(self.driver).find(
+                    locator, explicit_wait, LocatorEngine.CLICKABLE
                 )
             if isinstance(locator, WebElement):
                 return locator
@@ -269,11 +372,8 @@ class ElementInteractions:
         """
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
-            locator_type, locator_value = locator.split("=", 1)
             return WebDriverWait(self.driver, explicit_wait).until(
-                EC.presence_of_all_elements_located(
-                    (self.get_locator_strategy(locator_type), locator_value)
-                )
+                EC.presence_of_all_elements_located(parse_locator(locator))
             )
         except Exception as e:
             self.logger.exception(
@@ -302,11 +402,8 @@ class ElementInteractions:
         """
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
-            locator_details = locator.split("=", 1)
             return WebDriverWait(self.driver, explicit_wait).until(
-                EC.invisibility_of_element_located(
-                    (self.get_locator_strategy(locator_details[0]), locator_details[1])
-                )
+                EC.invisibility_of_element_located(parse_locator(locator))
             )
 
         except Exception as e:
@@ -371,6 +468,100 @@ class ElementInteractions:
             )
             return ""
 
+    def get_elements_state(
+            self,
+            locators: List[Union[str, WebElement]],
+            states: List[str] = ("text", "displayed"),
+            attributes: List[str] = (),
+    ) -> dict:
+        """Return the state of many elements with a single script call.
+
+        Reading 30 fields one by one costs around 90 WebDriver commands, each
+        a round-trip to the driver or the remote grid. This method finds all
+        the locators and reads their state in the browser in one
+        execute_script call. It does not wait, so use it once the page has
+        loaded. Text is the rendered innerText, and displayed is computed by
+        the browser's visibility check rather than Selenium's isDisplayed atom.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> CafeXWeb().get_elements_state(
+                   ["id=username", "id=password", "xpath=//button[@type='submit']"],
+                   states=["displayed", "enabled"], attributes=["value", "class"])
+            >> # {"id=username": {"found": True, "count": 1, "displayed": True, "enabled": True,
+            >> #                  "attributes": {"value": "admin", "class": "input"}}, ...}
+
+        Args:
+            locators: A list of strings in the format locator_type=locator, or web elements.
+            states: The states to read, any of text, displayed, enabled, selected and rect.
+                    rect is the bounding box in page coordinates with x, y, width and height.
+            attributes: The attributes to read, with the same values as get_attribute_value.
+
+        Returns:
+            A dictionary from each locator to its state. found and count tell whether and how
+            often the locator matched, and the state is read from the first match. A locator
+            the browser cannot evaluate also has an error.
+        """
+        try:
+            unsupported = [state for state in states if state not in ELEMENT_STATES]
+            if unsupported:
+                raise ValueError(
+                    f"Unsupported element states - {unsupported}! "
+                    f"Supported element states are {list(ELEMENT_STATES)}"
+                )
+            specs = [
+                [None, None, locator] if isinstance(locator, WebElement)
+                else [*parse_locator(locator), None]
+                for locator in locators
+            ]
+            results = self.driver.execute_script(
+                _ELEMENT_STATE_SCRIPT, specs, list(states), list(attributes)
+            )
+            return dict(zip(locators, results))
+        except Exception as e:
+            self.logger.exception(
+                "Exception in get_elements_state method. Exception Details: %s", repr(e)
+            )
+            raise e
+
+    def get_page_snapshot(
+            self, locator: Union[str, WebElement] = None, explicit_wait: int = None
+    ) -> PageSnapshot:
+        """Capture the page, or one element, once and return a parsed, static
+        snapshot to query locally.
+
+        Use it for read-heavy checks such as report pages and large tables,
+        where hundreds of assertions would otherwise each cost a driver call.
+        The snapshot does not follow later changes to the page; take a new
+        one after any action, and keep using the driver for visibility,
+        layout and interaction.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> snapshot = CafeXWeb().get_page_snapshot("xpath=//table[@id='report']")
+            >> snapshot.get_row_count()
+            >> snapshot.get_texts("xpath=//tbody/tr/td[2]")
+            >> snapshot.find("id=total").text_content()
+
+        Args:
+            locator: A string or WebElement of the element to capture, in the format
+                     locator_type=locator. By default, the whole page source is captured.
+            explicit_wait: An integer representing the explicit wait time (in seconds) for the element.
+
+        Returns:
+            A PageSnapshot exposing the HTMLParser methods and find, find_all, get_texts and count.
+        """
+        try:
+            if locator is None:
+                return PageSnapshot(self.driver.page_source, url=self.driver.current_url)
+            element = self.get_web_element(locator, explicit_wait)
+            return PageSnapshot(element.get_attribute("outerHTML"), url=self.driver.current_url)
+        except Exception as e:
+            self.logger.exception(
+                "Exception in get_page_snapshot method. Exception Details: %s", repr(e)
+            )
+            raise e
+
     def get_locator_strategy(self, pstr_locator_strategy):
         """Get the locator strategy.
 
@@ -384,27 +575,7 @@ class ElementInteractions:
         Returns:
             The locator strategy.
         """
-        locator_strategies = [
-            "XPATH",
-            "ID",
-            "NAME",
-            "CLASS_NAME",
-            "LINK_TEXT",
-            "CSS_SELECTOR",
-            "PARTIAL_LINK_TEXT",
-            "TAG_NAME",
-        ]
-
-        if pstr_locator_strategy.upper() not in locator_strategies:
-            raise Exception(
-                "Unsupported locator strategy - "
-                + pstr_locator_strategy.upper()
-                + "! "
-                + "Supported locator strategies are 'XPATH', 'ID', 'NAME', "
-                  "'CSS_SELECTOR', 'TAG_NAME', 'LINK_TEXT' , 'CLASS_NAME' and 'PARTIAL_LINK_TEXT'"
-            )
-        else:
-            return getattr(By, pstr_locator_strategy.upper())
+        return locator_strategy(pstr_locator_strategy)
 
     def get_child_elements(
             self,
@@ -1,7 +1,6 @@
 import time
 
 import pandas as pd
-import requests
 from selenium.common import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -9,6 +8,8 @@ from selenium.webdriver.support.wait import WebDriverWait
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
 from cafex_ui.cafex_ui_config_utils import WebConfigUtils
+from cafex_ui.web_client.download_watcher import DownloadWatcher
+from cafex_ui.web_client.link_checker import LinkChecker
 from cafex_ui.web_client.web_client_actions.element_interactions import (
     ElementInteractions,
 )
@@ -316,6 +317,37 @@ class UtilityMethods:
             self.logger.exception(f"Error in the __check_download_status method. Error: {str(e)}")
             raise e
 
+    def watch_downloads(self, download_dir: str = None, stable_seconds: float = 0.5):
+        """Start watching the download directory and return the watcher.
+
+        Unlike wait_until_file_download, this works for any browser, including
+        headless Chrome, Firefox and Playwright, and opens no tabs. Start the
+        watcher before triggering the download, so files that already exist
+        are ignored.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> with CafeXWeb().watch_downloads() as downloads:
+            >>     CafeXWeb().click("xpath=//a[text()='Export']")
+            >>     paths = downloads.wait(expected_count=1, timeout=120)
+
+        Args:
+            download_dir: The directory the browser downloads to. By default, it is read from
+                          download_dir, chrome_preferences or firefox_preferences in config.yml.
+            stable_seconds: The seconds a file size must stay unchanged to count as complete.
+
+        Returns:
+            A started DownloadWatcher. Call wait on it for the completed paths, and stop it,
+            or use it as a context manager.
+        """
+        try:
+            return DownloadWatcher(download_dir, stable_seconds=stable_seconds).start()
+        except Exception as e:
+            self.logger.exception(
+                "Exception in watch_downloads method. Exception Details: ", exc_info=e
+            )
+            raise e
+
     def check_stale_element_exception(self, locator: str) -> bool:
         """Check for stale element exception and attempt to click the element
         up to three times.
@@ -431,40 +463,58 @@ class UtilityMethods:
             An integer representing the number of broken links on the page.
         """
         try:
-            total_links = 0
-            broken_links = 0
-            anchor_links = self.driver.find_elements(By.CSS_SELECTOR, "a")
-            images = self.driver.find_elements(By.CSS_SELECTOR, "img")
-            links = anchor_links + images
-            self.logger.info("The total number of links on the page are: %d", len(links))
-            for link in links:
-                flag = "href"
-                temp_variable = link.get_attribute("href")
-                if temp_variable is None:
-                    flag = "src"
-                    temp_variable = link.get_attribute("src")
-                try:
-                    if "https" in temp_variable:
-                        r = requests.head(link.get_attribute(flag))
-                        if r.status_code in [400, 403, 404, 408, 409, 500, 501, 502, 503, 504]:
-                            broken_links += 1
-                            self.logger.info("Broken link: %s", link.get_attribute(flag))
-                except Exception as e:
-                    self.logger.exception(e)
-                total_links += 1
+            report = self.get_broken_links_report()
             self.logger.info(
                 "Final Value: %d out of %d are broken on this URL: %s",
-                broken_links,
-                total_links,
-                self.driver.current_url,
+                len(report["broken"]),
+                report["checked"],
+                report["page"],
             )
-            return broken_links
+            return len(report["broken"])
         except Exception as e:
             self.logger.exception(
                 "Exception in search_broken_links method. Exception Details: %s", str(e)
             )
             raise e
 
+    def get_broken_links_report(self, max_workers: int = None) -> dict:
+        """Check the links and images on the web page concurrently and return
+        a report of the broken ones.
+
+        The links are read in one script call, normalised and deduplicated,
+        then checked by the LinkChecker. Links already checked on an earlier
+        page are not requested again.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> report = CafeXWeb().get_broken_links_report()
+            >> for link in report["broken"]:
+            >>     print(link["url"], link["status_code"], link["seconds"])
+
+        Args:
+            max_workers: The number of links checked at once. By default, it is read from the
+                         link_checker section of config.yml.
+
+        Returns:
+            A dictionary with the page URL, the total number of links, the number of distinct
+            links checked, the broken links and all results with their status codes and latencies.
+        """
+        try:
+            page = self.driver.current_url
+            links = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href], img[src]'), function (e) {"
+                " return typeof e.href === 'string' ? e.href : e.src || e.getAttribute('href'); });"
+            )
+            self.logger.info("The total number of links on the page are: %d", len(links))
+            report = LinkChecker().check_urls(links, base_url=page, max_workers=max_workers)
+            report["page"] = page
+            return report
+        except Exception as e:
+            self.logger.exception(
+                "Exception in get_broken_links_report method. Exception Details: %s", str(e)
+            )
+            raise e
+
     def get_browser_logs(self, log_type: str = None) -> list:
         """Get console logs from the Chrome browser. Captures errors like
         '404', '500', etc.
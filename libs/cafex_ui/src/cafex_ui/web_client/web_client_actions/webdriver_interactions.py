@@ -6,6 +6,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from cafex_core.logging.logger_ import CoreLogger
 from cafex_core.singletons_.session_ import SessionStore
 from cafex_ui.cafex_ui_config_utils import WebConfigUtils
+from cafex_ui.web_client.locator_engine import LocatorEngine
+from cafex_ui.web_client.wait_engine import WaitEngine
 
 
 class WebDriverInteractions:
@@ -106,6 +108,7 @@ class WebDriverInteractions:
         try:
             explicit_wait = explicit_wait or self.default_explicit_wait
             self.driver.get(url)
+            LocatorEngine.for_driver(self.driver).invalidate()
             self.wait_for_page_readyState(explicit_wait)
         except Exception as e:
             self.logger.exception("Exception in navigate method. Exception Details:", exc_info=e)
@@ -155,6 +158,7 @@ class WebDriverInteractions:
         """
         try:
             self.driver.forward()
+            LocatorEngine.for_driver(self.driver).invalidate()
             self.wait_for_page_readyState(explicit_wait)
         except Exception as e:
             self.logger.exception(
@@ -177,6 +181,7 @@ class WebDriverInteractions:
         """
         try:
             self.driver.back()
+            LocatorEngine.for_driver(self.driver).invalidate()
             self.wait_for_page_readyState(explicit_wait)
         except Exception as e:
             self.logger.exception(
@@ -210,6 +215,112 @@ class WebDriverInteractions:
             )
             raise e
 
+    def wait_for_page_idle(
+            self,
+            explicit_wait: int = None,
+            network_quiet_ms: int = None,
+            dom_quiet_ms: int = None,
+    ) -> dict:
+        """Wait until the page has no pending requests, its DOM has stopped
+        changing and Angular and the configured idle hooks report idle.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> CafeXWeb().wait_for_page_idle()
+            >> CafeXWeb().wait_for_page_idle(30, network_quiet_ms=500, dom_quiet_ms=500)
+
+        Args:
+            explicit_wait: An integer representing the maximum wait time in seconds.
+            network_quiet_ms: The milliseconds without requests. By default, it is read from config.yml.
+            dom_quiet_ms: The milliseconds without DOM changes. By default, it is read from config.yml.
+
+        Returns:
+            A dictionary with the state of the page when it became idle.
+        """
+        try:
+            return WaitEngine.for_driver(self.driver).wait_until_idle(
+                explicit_wait or self.default_explicit_wait, network_quiet_ms, dom_quiet_ms
+            )
+        except Exception as e:
+            self.logger.exception(
+                "Exception in wait_for_page_idle method. Exception Details: ", exc_info=e
+            )
+            raise e
+
+    def wait_for_network_idle(self, explicit_wait: int = None, quiet_ms: int = None) -> dict:
+        """Wait until the page has no pending fetch or XMLHttpRequest requests.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> CafeXWeb().wait_for_network_idle(30, quiet_ms=500)
+
+        Args:
+            explicit_wait: An integer representing the maximum wait time in seconds.
+            quiet_ms: The milliseconds without requests. By default, it is read from config.yml.
+
+        Returns:
+            A dictionary with the state of the page when the network became idle.
+        """
+        try:
+            return WaitEngine.for_driver(self.driver).wait_until_idle(
+                explicit_wait or self.default_explicit_wait, network_quiet_ms=quiet_ms,
+                dom=False, framework=False,
+            )
+        except Exception as e:
+            self.logger.exception(
+                "Exception in wait_for_network_idle method. Exception Details: ", exc_info=e
+            )
+            raise e
+
+    def wait_for_dom_stable(self, explicit_wait: int = None, quiet_ms: int = None) -> dict:
+        """Wait until the DOM of the page has not changed for a quiet window.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> CafeXWeb().wait_for_dom_stable(30, quiet_ms=500)
+
+        Args:
+            explicit_wait: An integer representing the maximum wait time in seconds.
+            quiet_ms: The milliseconds without DOM changes. By default, it is read from config.yml.
+
+        Returns:
+            A dictionary with the state of the page when the DOM became stable.
+        """
+        try:
+            return WaitEngine.for_driver(self.driver).wait_until_idle(
+                explicit_wait or self.default_explicit_wait, dom_quiet_ms=quiet_ms,
+                network=False, framework=False,
+            )
+        except Exception as e:
+            self.logger.exception(
+                "Exception in wait_for_dom_stable method. Exception Details: ", exc_info=e
+            )
+            raise e
+
+    def wait_for_framework_idle(self, explicit_wait: int = None) -> dict:
+        """Wait until Angular or AngularJS and the idle hooks in config.yml
+        report that the application is idle.
+
+        Examples:
+            >> from cafex_ui import CafeXWeb
+            >> CafeXWeb().wait_for_framework_idle(30)
+
+        Args:
+            explicit_wait: An integer representing the maximum wait time in seconds.
+
+        Returns:
+            A dictionary with the state of the page when the application became idle.
+        """
+        try:
+            return WaitEngine.for_driver(self.driver).wait_until_idle(
+                explicit_wait or self.default_explicit_wait, network=False, dom=False
+            )
+        except Exception as e:
+            self.logger.exception(
+                "Exception in wait_for_framework_idle method. Exception Details: ", exc_info=e
+            )
+            raise e
+
     def switch_to_last_open_window(self):
         """Switch the user to the last open window.
 
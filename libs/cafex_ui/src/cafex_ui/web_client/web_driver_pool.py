@@ -0,0 +1,212 @@
+"""This module contains the WebDriverPool class which keeps a browser session
+alive across compatible tests on the same worker."""
+
+import json
+
+from cafex_core.logging.logger_ import CoreLogger
+from cafex_core.singletons_.session_ import SessionStore
+from selenium.common.exceptions import WebDriverException
+
+
+class WebDriverPool:
+    """A per-process pool that reuses one WebDriver session across tests.
+
+    Every xdist worker is its own process, so each worker keeps its own
+    session. A test acquires the session with a key describing the browser,
+    capabilities and proxy it needs; the pooled session is reused only when
+    the key matches and the browser still answers, otherwise it is quit and
+    a new one is created. On release the session is reset: extra windows are
+    closed, local and session storage and cookies are cleared, and the
+    remaining window is navigated to the reset URL.
+
+    The pool is configured in config.yml:
+
+        'driver_pool':
+          'enabled': true
+          'max_reuse': 50
+          'reset_url': 'about:blank'
+
+    Attributes:
+        logger (Logger): The logger object.
+        session_store (SessionStore): The session store object.
+
+    Methods:
+        is_enabled: Returns whether the pool is enabled in config.yml.
+        driver_key: Builds the key that decides whether a session can be reused.
+        acquire: Returns the pooled session, or a new one.
+        release: Resets a session and keeps it for the next test.
+        is_healthy: Returns whether a session still answers.
+        reset: Clears the state a test left in a session.
+        shutdown: Quits the pooled session.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Ensures only one instance of WebDriverPool exists per process.
+
+        Returns:
+            WebDriverPool: The singleton instance.
+        """
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.logger = CoreLogger(name=__name__).get_logger()
+            cls._instance.session_store = SessionStore()
+            cls._instance.driver = None
+            cls._instance.key = None
+            cls._instance.uses = 0
+            cls._instance.in_use = False
+        return cls._instance
+
+    @property
+    def pool_config(self) -> dict:
+        """Returns the driver_pool section of config.yml.
+
+        Returns:
+            dict: The driver pool configuration.
+        """
+        base_config = self.session_store.base_config or {}
+        return base_config.get("driver_pool") or {}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether the pool is enabled in config.yml.
+
+        Returns:
+            bool: True if the pool is enabled.
+        """
+        return str(WebDriverPool().pool_config.get("enabled", False)).lower() == "true"
+
+    @staticmethod
+    def driver_key(browser: str, **settings) -> str:
+        """Builds the key that decides whether a session can be reused.
+
+        Args:
+            browser: The browser name.
+            **settings: Everything else the session was created with, such as
+                capabilities, proxies and grid settings.
+
+        Returns:
+            str: The key.
+        """
+        return json.dumps({"browser": browser, **settings}, sort_keys=True, default=str)
+
+    def acquire(self, key: str, create_driver):
+        """Returns the pooled session if it matches the key and is healthy,
+        or a new one.
+
+        Args:
+            key: The key of the session, from driver_key.
+            create_driver: Called without arguments to create a new session.
+
+        Returns:
+            WebDriver: The session.
+        """
+        if self.driver is not None:
+            max_reuse = int(self.pool_config.get("max_reuse", 50) or 0)
+            if self.in_use:
+                self.logger.warning("Pooled driver was not released; replacing it")
+                self.__discard()
+            elif self.key != key:
+                self.logger.info("Pooled driver does not match the requested browser; replacing it")
+                self.__discard()
+            elif max_reuse and self.uses >= max_reuse:
+                self.logger.info("Pooled driver was used %s times; recycling it", self.uses)
+                self.__discard()
+            elif not self.is_healthy(self.driver):
+                self.logger.warning("Pooled driver is not responding; recycling it")
+                self.__discard()
+        if self.driver is None:
+            self.driver = create_driver()
+            self.key = key
+            self.uses = 0
+            self.session_store.web_driver_pool = self
+        else:
+            self.logger.info("Reusing pooled driver (use %s)", self.uses + 1)
+        self.uses += 1
+        self.in_use = True
+        return self.driver
+
+    def release(self, driver) -> None:
+        """Resets a session and keeps it for the next test.
+
+        A session that is not the pooled one, or that cannot be reset, is quit.
+
+        Args:
+            driver: The session the test used.
+        """
+        if driver is None:
+            return
+        if driver is not self.driver:
+            self.__quit(driver)
+            return
+        self.in_use = False
+        if not self.reset(driver):
+            self.__discard()
+
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        """Returns whether a session still answers.
+
+        Args:
+            driver: The session.
+
+        Returns:
+            bool: True if the browser answered.
+        """
+        try:
+            return len(driver.window_handles) > 0
+        except WebDriverException:
+            return False
+
+    def reset(self, driver) -> bool:
+        """Clears the state a test left in a session.
+
+        Storage is cleared on the origin the test ended on; cookies are
+        cleared for every domain where the browser supports it (Chromium
+        DevTools) and for the current domain otherwise.
+
+        Args:
+            driver: The session.
+
+        Returns:
+            bool: True if the session was reset.
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass  # storage is not accessible on about:blank, data: and file: pages
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except (AttributeError, WebDriverException):
+                driver.delete_all_cookies()
+            driver.get(self.pool_config.get("reset_url", "about:blank"))
+            return True
+        except WebDriverException as e:
+            self.logger.warning("Could not reset pooled driver: %s", e)
+            return False
+
+    def shutdown(self) -> None:
+        """Quits the pooled session."""
+        self.__discard()
+
+    def __discard(self) -> None:
+        """Quits the pooled session and empties the pool."""
+        if self.driver is not None:
+            self.__quit(self.driver)
+        self.driver = None
+        self.key = None
+        self.uses = 0
+        self.in_use = False
+
+    def __quit(self, driver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.warning("Error while quitting pooled driver: %s", e)
@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from cafex_core.singletons_.session_ import SessionStore
+
+from cafex_ui.browserstack_catalog import BrowserStackCatalog
+from cafex_ui.mobile_client.mobile_utils import MobileUtils
+
+DEVICES_URL = "https://api-cloud.browserstack.com/app-automate/devices.json"
+
+DEVICES = [
+    {"os": "android", "os_version": "14.0", "device": "Google Pixel 8", "realMobile": True},
+    {"os": "android", "os_version": "13.0", "device": "Samsung Galaxy S23", "realMobile": True},
+    {"os": "android", "os_version": "12.0", "device": "Google Pixel 6", "realMobile": True},
+    {"os": "ios", "os_version": "17", "device": "iPhone 15", "realMobile": True},
+]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return BrowserStackCatalog(cache_dir=str(tmp_path), ttl_seconds=60)
+
+
+class TestBrowserStackCatalog:
+
+    def test_catalog_is_fetched_once(self, catalog):
+        fetch = MagicMock(return_value=DEVICES)
+        assert catalog.get(DEVICES_URL, "user", fetch) == DEVICES
+        assert catalog.get(DEVICES_URL, "user", fetch) == DEVICES
+        fetch.assert_called_once()
+
+    def test_catalog_is_shared_through_cache_dir(self, catalog, tmp_path):
+        catalog.get(DEVICES_URL, "user", lambda: DEVICES)
+        fetch = MagicMock()
+        assert BrowserStackCatalog(str(tmp_path), 60).get(DEVICES_URL, "user", fetch) == DEVICES
+        fetch.assert_not_called()
+
+    def test_expired_catalog_is_fetched_again(self, catalog, tmp_path):
+        catalog.get(DEVICES_URL, "user", lambda: DEVICES)
+        for name in os.listdir(tmp_path):
+            old = time.time() - 120
+            os.utime(tmp_path / name, (old, old))
+        fetch = MagicMock(return_value=DEVICES[:1])
+        assert catalog.get(DEVICES_URL, "user", fetch) == DEVICES[:1]
+
+    def test_failed_fetch_is_not_cached(self, catalog):
+        with pytest.raises(requests.HTTPError):
+            catalog.get(DEVICES_URL, "user", MagicMock(side_effect=requests.HTTPError("401")))
+        assert catalog.get(DEVICES_URL, "user", lambda: DEVICES) == DEVICES
+
+    def test_concurrent_workers_fetch_once(self, tmp_path):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return DEVICES
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    BrowserStackCatalog(str(tmp_path), 60).get(DEVICES_URL, "user", fetch)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert results == [DEVICES] * 4
+
+    def test_select_is_seeded_and_ignores_order(self, catalog):
+        wanted = [dict(reversed(list(device.items()))) for device in DEVICES[:3]]
+        first = catalog.select(DEVICES, wanted, seed=7)
+        assert first in DEVICES[:3]
+        assert catalog.select(list(reversed(DEVICES)), wanted, seed=7) == first
+
+    def test_select_without_common_entries(self, catalog):
+        with pytest.raises(ValueError, match="No common devices"):
+            catalog.select(DEVICES, [{"device": "Nokia 3310"}], seed=1, entry_type="devices")
+
+
+def test_available_devices_from_cached_catalog(tmp_path):
+    session_store = SessionStore()
+    previous_config = session_store.base_config
+    session_store.base_config = {"browserstack_catalog": {"cache_dir": str(tmp_path / "cache")}}
+    device_file = tmp_path / "android_devices.json"
+    device_file.write_text('[{"os_version": "13.0", "device": "Samsung Galaxy S23"}]')
+    response = MagicMock(status_code=200)
+    response.json.return_value = DEVICES
+
+    try:
+        with patch("cafex_ui.mobile_client.mobile_utils.UISecurity") as ui_security:
+            ui_security.return_value.get_browser_stack_devices_list.return_value = response
+            for _ in range(2):
+                device = MobileUtils().get_available_devices(
+                    "android", "user", "key", DEVICES_URL,
+                    android_device_json_path=str(device_file), seed=3,
+                )
+                assert device == {"os_version": "13.0", "device": "Samsung Galaxy S23"}
+        ui_security.return_value.get_browser_stack_devices_list.assert_called_once()
+    finally:
+        session_store.base_config = previous_config
@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from cafex_core.singletons_.session_ import SessionStore
+
+from cafex_ui.web_client.download_watcher import DownloadWatcher
+
+
+def write_later(path, chunks, delay=0.05, rename_to=None):
+    """Writes a file in chunks from another thread, like a browser download."""
+
+    def download():
+        with open(path, "wb") as file:
+            for chunk in chunks:
+                time.sleep(delay)
+                file.write(chunk)
+                file.flush()
+        if rename_to:
+            os.rename(path, rename_to)
+
+    thread = threading.Thread(target=download)
+    thread.start()
+    return thread
+
+
+class TestDownloadWatcher:
+
+    def test_existing_files_are_ignored(self, tmp_path):
+        (tmp_path / "old.pdf").write_bytes(b"old")
+        with DownloadWatcher(str(tmp_path), stable_seconds=0.1) as downloads:
+            (tmp_path / "new.pdf").write_bytes(b"new")
+            assert downloads.wait(timeout=5) == [str(tmp_path / "new.pdf")]
+
+    def test_wait_requires_start(self, tmp_path):
+        (tmp_path / "old.pdf").write_bytes(b"old")
+        with pytest.raises(RuntimeError, match="not started"):
+            DownloadWatcher(str(tmp_path), stable_seconds=0.1).wait(timeout=1)
+
+    def test_waits_for_chrome_partial_file_to_be_renamed(self, tmp_path):
+        with DownloadWatcher(str(tmp_path), stable_seconds=0.1) as downloads:
+            thread = write_later(
+                str(tmp_path / "report.csv.crdownload"), [b"a" * 100] * 5,
+                rename_to=str(tmp_path / "report.csv"),
+            )
+            time.sleep(0.1)
+            assert downloads.pending() == [str(tmp_path / "report.csv.crdownload")]
+            assert downloads.wait(timeout=5) == [str(tmp_path / "report.csv")]
+            thread.join()
+        assert os.path.getsize(tmp_path / "report.csv") == 500
+
+    def test_firefox_placeholder_is_not_complete_while_part_exists(self, tmp_path):
+        with DownloadWatcher(str(tmp_path), stable_seconds=0.1) as downloads:
+            (tmp_path / "data.zip").write_bytes(b"")
+            (tmp_path / "data.zip.part").write_bytes(b"partial")
+            time.sleep(0.2)
+            assert downloads.completed() == []
+            assert downloads.completed() == []
+            os.replace(tmp_path / "data.zip.part", tmp_path / "data.zip")
+            assert downloads.wait(timeout=5) == [str(tmp_path / "data.zip")]
+
+    def test_waits_for_expected_count(self, tmp_path):
+        with DownloadWatcher(str(tmp_path), stable_seconds=0.1) as downloads:
+            threads = [write_later(str(tmp_path / f"file{i}.txt"), [b"x"] * 3) for i in range(3)]
+            paths = downloads.wait(expected_count=3, timeout=5)
+            for thread in threads:
+                thread.join()
+        assert [os.path.basename(path) for path in paths] == ["file0.txt", "file1.txt", "file2.txt"]
+
+    def test_timeout_reports_pending_downloads(self, tmp_path):
+        with DownloadWatcher(str(tmp_path), stable_seconds=0.1) as downloads:
+            (tmp_path / "big.iso.crdownload").write_bytes(b"x")
+            with pytest.raises(TimeoutError, match="big.iso.crdownload"):
+                downloads.wait(timeout=0.3)
+
+    def test_polls_without_inotify(self, tmp_path):
+        with patch("sys.platform", "darwin"):
+            with DownloadWatcher(str(tmp_path), stable_seconds=0.1) as downloads:
+                (tmp_path / "new.pdf").write_bytes(b"new")
+                assert downloads.wait(timeout=5) == [str(tmp_path / "new.pdf")]
+
+    def test_configured_directory(self):
+        session_store = SessionStore()
+        previous_config = session_store.base_config
+        try:
+            session_store.base_config = {
+                "chrome_preferences": {"download.default_directory": "/tmp/chrome"}}
+            assert DownloadWatcher.configured_directory() == "/tmp/chrome"
+            session_store.base_config["download_dir"] = "/tmp/downloads"
+            assert DownloadWatcher.configured_directory() == "/tmp/downloads"
+        finally:
+            session_store.base_config = previous_config
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from cafex_ui.web_client.web_client_actions.element_interactions import ElementInteractions
+
+
+@pytest.fixture
+def driver():
+    return MagicMock()
+
+
+@pytest.fixture
+def element_interactions(driver):
+    return ElementInteractions(web_driver=driver, default_explicit_wait=5, default_implicit_wait=1)
+
+
+class TestGetElementsState:
+
+    def test_states_are_read_in_one_script_call(self, element_interactions, driver):
+        element = MagicMock(spec=WebElement)
+        driver.execute_script.return_value = [
+            {"found": True, "count": 1, "displayed": True, "attributes": {"value": "admin"}},
+            {"found": False, "count": 0},
+            {"found": True, "count": 1, "displayed": False, "attributes": {"value": None}},
+        ]
+
+        state = element_interactions.get_elements_state(
+            ["id=username", "xpath=//div[@id='missing']", element],
+            states=["displayed"],
+            attributes=["value"],
+        )
+
+        driver.execute_script.assert_called_once()
+        _, specs, states, attributes = driver.execute_script.call_args.args
+        assert specs == [["id", "username", None], ["xpath", "//div[@id='missing']", None],
+                         [None, None, element]]
+        assert states == ["displayed"]
+        assert attributes == ["value"]
+        assert state["id=username"]["attributes"]["value"] == "admin"
+        assert state["xpath=//div[@id='missing']"]["found"] is False
+        assert state[element]["displayed"] is False
+
+    def test_unsupported_state(self, element_interactions, driver):
+        with pytest.raises(ValueError, match="Unsupported element states"):
+            element_interactions.get_elements_state(["id=username"], states=["colour"])
+        driver.execute_script.assert_not_called()
+
+    def test_unsupported_locator_strategy(self, element_interactions, driver):
+        with pytest.raises(Exception, match="Unsupported locator strategy"):
+            element_interactions.get_elements_state(["jquery=$('a')"])
+        driver.execute_script.assert_not_called()
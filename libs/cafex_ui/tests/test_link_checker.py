@@ -0,0 +1,125 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+from cafex_core.singletons_.session_ import SessionStore
+
+from cafex_ui.web_client.link_checker import LinkChecker
+from cafex_ui.web_client.web_client_actions.utility_methods import UtilityMethods
+
+
+class LinkHandler(BaseHTTPRequestHandler):
+    requests = []
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append((self.command, self.path))
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.2)
+            if self.path == "/missing":
+                status = 404
+            elif self.path == "/no-head" and self.command == "HEAD":
+                status = 405
+            else:
+                status = 200
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    do_HEAD = respond
+    do_GET = respond
+
+
+@pytest.fixture
+def http_server():
+    LinkHandler.requests = []
+    LinkHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def checker():
+    session_store = SessionStore()
+    previous_config = session_store.base_config
+    session_store.base_config = {"link_checker": {"max_workers": 8, "max_per_host": 2, "timeout": 5}}
+    LinkChecker._instance = None
+    yield LinkChecker()
+    LinkChecker._instance = None
+    session_store.base_config = previous_config
+
+
+class TestLinkChecker:
+
+    def test_normalize_url(self):
+        assert LinkChecker.normalize_url("HTTPS://Example.COM:443#top") == "https://example.com/"
+        assert LinkChecker.normalize_url("http://example.com:8080/a?b=1#c") == \
+            "http://example.com:8080/a?b=1"
+        assert LinkChecker.normalize_url("../b", "http://example.com/a/c") == "http://example.com/b"
+        assert LinkChecker.normalize_url("mailto:someone@example.com") is None
+        assert LinkChecker.normalize_url("javascript:void(0)") is None
+        assert LinkChecker.normalize_url(None) is None
+
+    def test_report_with_deduplication(self, checker, http_server):
+        report = checker.check_urls(
+            [f"{http_server}/ok", f"{http_server}/ok#section", "/missing", "/no-head", "mailto:x@y.z"],
+            base_url=http_server + "/page",
+        )
+
+        assert report["total"] == 5
+        assert report["checked"] == 3
+        assert [result["url"] for result in report["broken"]] == [f"{http_server}/missing"]
+        assert report["broken"][0]["status_code"] == 404
+        no_head = report["results"][2]
+        assert (no_head["status_code"], no_head["method"]) == (200, "GET")
+        assert all(result["seconds"] >= 0 for result in report["results"])
+
+    def test_results_are_cached_across_pages(self, checker, http_server):
+        checker.check_urls([f"{http_server}/ok"])
+        checker.check_urls([f"{http_server}/ok", f"{http_server}/other"])
+
+        assert LinkHandler.requests == [("HEAD", "/ok"), ("HEAD", "/other")]
+        checker.clear_cache()
+        checker.check_urls([f"{http_server}/ok"])
+        assert len(LinkHandler.requests) == 3
+
+    def test_requests_per_host_are_limited(self, checker, http_server):
+        start = time.perf_counter()
+        report = checker.check_urls([f"{http_server}/slow/{i}" for i in range(6)])
+
+        assert report["broken"] == []
+        assert LinkHandler.max_in_flight == 2
+        assert time.perf_counter() - start < 6 * 0.2
+
+    def test_unreachable_link_is_broken(self, checker):
+        report = checker.check_urls(["http://127.0.0.1:9/"])
+        assert report["broken"][0]["status_code"] is None
+        assert report["broken"][0]["error"]
+
+
+def test_search_broken_links(checker, http_server):
+    driver = MagicMock()
+    driver.current_url = http_server + "/page"
+    driver.execute_script.return_value = ["/ok", "/missing", f"{http_server}/missing"]
+    utility_methods = UtilityMethods(web_driver=driver, default_explicit_wait=5, default_implicit_wait=1)
+
+    assert utility_methods.search_broken_links() == 1
+    driver.execute_script.assert_called_once()
@@ -0,0 +1,129 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cafex_core.singletons_.session_ import SessionStore
+from cafex_core.utils.phase_timer import LOCATOR_TIMINGS
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+
+from cafex_ui.web_client.locator_engine import LocatorEngine, parse_locator
+
+
+@pytest.fixture
+def driver():
+    driver = MagicMock()
+    driver.timeouts.implicit_wait = 0
+    return driver
+
+
+@pytest.fixture
+def session_store():
+    session_store = SessionStore()
+    previous_config = session_store.base_config
+    session_store.base_config = {"locator_engine": {"cache_elements": True}}
+    session_store.storage.pop(LOCATOR_TIMINGS, None)
+    yield session_store
+    session_store.base_config = previous_config
+    session_store.storage.pop(LOCATOR_TIMINGS, None)
+
+
+class TestParseLocator:
+
+    def test_parse_locator(self):
+        assert parse_locator("xpath=//a[@href='x=y']") == (By.XPATH, "//a[@href='x=y']")
+        assert parse_locator("css_selector=#id") == (By.CSS_SELECTOR, "#id")
+        assert parse_locator("accessibility id=login") == (By.ID, "login")
+
+    def test_parse_locator_is_cached(self):
+        parse_locator.cache_clear()
+        parse_locator("id=username")
+        parse_locator("id=username")
+        assert parse_locator.cache_info().hits == 1
+
+    def test_unsupported_strategy(self):
+        with pytest.raises(Exception, match="Unsupported locator strategy - JQUERY"):
+            parse_locator("jquery=$('a')")
+
+
+class TestLocatorEngine:
+
+    def test_for_driver_shares_one_engine(self, driver):
+        assert LocatorEngine.for_driver(driver) is LocatorEngine.for_driver(driver)
+        assert LocatorEngine.for_driver(driver) is not LocatorEngine.for_driver(MagicMock())
+
+    def test_find_caches_element_and_records_latency(self, driver, session_store):
+        element = MagicMock()
+        driver.find_element.return_value = element
+        engine = LocatorEngine(driver)
+
+        assert engine.find("id=username", 5) is element
+        assert engine.find("id=username", 5) is element
+
+        driver.find_element.assert_called_once_with(By.ID, "username")
+        assert len(session_store.storage[LOCATOR_TIMINGS]["id=username"]) == 2
+
+    def test_find_without_element_cache(self, driver, session_store):
+        session_store.base_config = {}
+        engine = LocatorEngine(driver)
+        engine.find("id=username", 5)
+        engine.find("id=username", 5)
+        assert driver.find_element.call_count == 2
+
+    def test_stale_element_is_found_again(self, driver, session_store):
+        stale, fresh = MagicMock(), MagicMock()
+        type(stale).tag_name = property(
+            lambda self: (_ for _ in ()).throw(StaleElementReferenceException()))
+        driver.find_element.side_effect = [stale, fresh]
+        engine = LocatorEngine(driver)
+        engine.find("id=username", 5)
+
+        assert engine.find("id=username", 5) is fresh
+
+    def test_invalidate_clears_cache(self, driver, session_store):
+        engine = LocatorEngine(driver)
+        engine.find("id=username", 5)
+        engine.invalidate()
+        engine.find("id=username", 5)
+        assert driver.find_element.call_count == 2
+
+    def test_is_absent_returns_without_waiting(self, driver, session_store):
+        driver.find_elements.return_value = []
+        engine = LocatorEngine(driver)
+        with patch("time.sleep") as mock_sleep:
+            assert engine.is_absent("xpath=//div[@class='error']", timeout=30) is True
+        mock_sleep.assert_not_called()
+        driver.find_elements.assert_called_once_with(By.XPATH, "//div[@class='error']")
+
+    def test_is_absent_suspends_implicit_wait(self, driver, session_store):
+        driver.timeouts.implicit_wait = 10
+        driver.find_elements.return_value = []
+        LocatorEngine(driver).is_absent("id=spinner")
+        assert [call.args for call in driver.implicitly_wait.call_args_list] == [(0,), (10,)]
+
+    def test_is_absent_waits_for_element_to_go(self, driver, session_store):
+        driver.find_elements.side_effect = [[MagicMock()], [MagicMock()], []]
+        with patch("time.sleep"):
+            assert LocatorEngine(driver).is_absent("id=spinner", timeout=5) is True
+        assert driver.find_elements.call_count == 3
+
+    def test_is_absent_with_hidden_element(self, driver, session_store):
+        hidden = MagicMock()
+        hidden.is_displayed.return_value = False
+        driver.find_elements.return_value = [hidden]
+        engine = LocatorEngine(driver)
+        assert engine.is_absent("id=spinner", visible=True) is True
+        assert engine.is_absent("id=spinner") is False
+
+    def test_is_present(self, driver, session_store):
+        driver.find_elements.return_value = [MagicMock()]
+        assert LocatorEngine(driver).is_present("id=username") is True
+
+    def test_find_times_out(self, driver, session_store):
+        driver.find_element.side_effect = NoSuchElementException()
+        with patch("time.sleep"), pytest.raises(TimeoutException):
+            LocatorEngine(driver).find("id=username", 0)
+        assert len(session_store.storage[LOCATOR_TIMINGS]["id=username"]) == 1
@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import WebDriverException
+
+from cafex_ui.mobile_client.mobile_client_actions import MobileClientActions
+
+
+class FakeList:
+    """A list of pages that a swipe moves through, with the target on one of them."""
+
+    def __init__(self, pages, target_page=None):
+        self.pages = pages
+        self.target_page = target_page
+        self.page = 0
+
+    def swipe(self, *args):
+        self.page = min(self.page + 1, self.pages - 1)
+
+    def find_elements(self, strategy, value):
+        if self.page == self.target_page:
+            return [MagicMock(**{"is_displayed.return_value": True})]
+        return []
+
+    @property
+    def page_source(self):
+        return f"<list page='{self.page}'/>"
+
+
+def mobile_driver(platform, fake_list):
+    driver = MagicMock()
+    driver.capabilities = {"platformName": platform}
+    driver.get_window_size.return_value = {"width": 400, "height": 800}
+    driver.swipe.side_effect = fake_list.swipe
+    driver.find_elements.side_effect = fake_list.find_elements
+    type(driver).page_source = property(lambda _: fake_list.page_source)
+    return driver
+
+
+class TestScrollMobile:
+
+    def test_swipes_until_found(self):
+        fake_list = FakeList(pages=10, target_page=3)
+        driver = mobile_driver("Android", fake_list)
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+        assert actions.scroll_mobile("down", "xpath=//*[@text='Item 30']", explicit_wait=0)
+        assert driver.swipe.call_count == 3
+        driver.swipe.assert_called_with(80.0, 640.0, 80.0, 160.0, 1000)
+
+    def test_stops_at_end_of_list(self):
+        fake_list = FakeList(pages=3)
+        driver = mobile_driver("Android", fake_list)
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+        assert not actions.scroll_mobile("down", "xpath=//*[@text='Missing']", explicit_wait=0)
+        assert driver.swipe.call_count == 3
+
+    def test_swipes_inside_scroll_container(self):
+        fake_list = FakeList(pages=2, target_page=1)
+        driver = mobile_driver("Android", fake_list)
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+        actions.get_web_element = MagicMock(
+            return_value=MagicMock(rect={"x": 100, "y": 200, "width": 200, "height": 100})
+        )
+        assert actions.scroll_mobile(
+            "right", "id=tab", explicit_wait=0, scroll_container="id=tabs"
+        )
+        driver.swipe.assert_called_once_with(260.0, 250.0, 140.0, 250.0, 1000)
+        assert AppiumBy.ANDROID_UIAUTOMATOR not in [
+            call.args[0] for call in driver.find_elements.call_args_list
+        ]
+
+    def test_android_uses_ui_scrollable(self):
+        fake_list = FakeList(pages=10)
+        driver = mobile_driver("Android", fake_list)
+
+        def find_elements(strategy, value):
+            if strategy == AppiumBy.ANDROID_UIAUTOMATOR:
+                fake_list.target_page = fake_list.page
+            return fake_list.find_elements(strategy, value)
+
+        driver.find_elements.side_effect = find_elements
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+
+        assert actions.scroll_mobile("down", 'id=item_"30"', explicit_wait=0, max_swipes=5)
+        driver.find_elements.assert_any_call(
+            AppiumBy.ANDROID_UIAUTOMATOR,
+            "new UiScrollable(new UiSelector().scrollable(true)).setMaxSearchSwipes(5)"
+            '.scrollIntoView(new UiSelector().resourceIdMatches(".*:id/item_\\"30\\""))',
+        )
+        driver.swipe.assert_not_called()
+
+    def test_ios_uses_mobile_scroll(self):
+        fake_list = FakeList(pages=10)
+        driver = mobile_driver("iOS", fake_list)
+
+        def scroll(script, args):
+            fake_list.target_page = fake_list.page
+
+        driver.execute_script.side_effect = scroll
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+
+        assert actions.scroll_mobile("up", "accessibility_id=Settings", explicit_wait=0)
+        driver.execute_script.assert_called_once_with("mobile: scroll", {"name": "Settings"})
+        driver.swipe.assert_not_called()
+
+    def test_ios_predicate_is_sent_without_direction(self):
+        fake_list = FakeList(pages=10)
+        driver = mobile_driver("iOS", fake_list)
+
+        def scroll(script, args):
+            fake_list.target_page = fake_list.page
+
+        driver.execute_script.side_effect = scroll
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+
+        assert actions.scroll_mobile("down", "ios_predicate=label == 'Wi-Fi'", explicit_wait=0)
+        driver.execute_script.assert_called_once_with(
+            "mobile: scroll", {"predicateString": "label == 'Wi-Fi'"}
+        )
+
+    def test_swipes_when_native_scroll_does_not_find_element(self):
+        fake_list = FakeList(pages=10, target_page=2)
+        driver = mobile_driver("Android", fake_list)
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+        assert actions.scroll_mobile("down", "accessibility_id=Item 20", explicit_wait=0)
+        driver.find_elements.assert_any_call(
+            AppiumBy.ANDROID_UIAUTOMATOR,
+            "new UiScrollable(new UiSelector().scrollable(true)).setMaxSearchSwipes(10)"
+            '.scrollIntoView(new UiSelector().description("Item 20"))',
+        )
+        assert driver.swipe.call_count == 2
+
+    def test_failed_native_scroll_falls_back_to_swiping(self):
+        fake_list = FakeList(pages=10, target_page=2)
+        driver = mobile_driver("iOS", fake_list)
+        driver.execute_script.side_effect = WebDriverException("no scrollable view")
+        actions = MobileClientActions(driver, default_explicit_wait=30)
+        assert actions.scroll_mobile("down", "accessibility_id=Settings", explicit_wait=0)
+        assert driver.swipe.call_count == 2
+
+    def test_unsupported_direction(self):
+        actions = MobileClientActions(MagicMock(), default_explicit_wait=30)
+        with pytest.raises(ValueError, match="Unsupported scroll direction"):
+            actions.scroll_mobile("sideways", "id=item")
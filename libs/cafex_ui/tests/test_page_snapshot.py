@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from cafex_ui.web_client.page_snapshot import PageSnapshot
+from cafex_ui.web_client.web_client_actions.element_interactions import ElementInteractions
+
+REPORT = """<html><body>
+<h1 id="title">Monthly <b>report</b></h1>
+<a href="/export" class="link primary">Export  CSV</a>
+<table id="report">
+  <tr><th>Region</th><th>Total</th></tr>
+  <tr><td>North</td><td>10</td></tr>
+  <tr><td>South</td><td>20</td></tr>
+</table>
+<input name="search" class="field"/>
+</body></html>"""
+
+
+@pytest.fixture
+def snapshot():
+    return PageSnapshot(REPORT, url="http://example.com/report")
+
+
+class TestPageSnapshot:
+
+    def test_find_with_locator_strategies(self, snapshot):
+        assert snapshot.find("id=report").tag == "table"
+        assert snapshot.find("name=search").tag == "input"
+        assert snapshot.count("class_name=primary") == 1
+        assert snapshot.count("class_name=prim") == 0
+        assert snapshot.count("tag_name=tr") == 3
+        assert snapshot.find("link_text=Export CSV").get("href") == "/export"
+        assert snapshot.count("partial_link_text=Export") == 1
+        assert snapshot.find("id=missing") is None
+
+    def test_locator_values_are_not_injected(self, snapshot):
+        assert snapshot.count("id=x' or '1'='1") == 0
+
+    def test_css_selector(self, snapshot):
+        pytest.importorskip("cssselect")
+        assert snapshot.count("css_selector=#report td") == 4
+
+    def test_unsupported_strategy(self, snapshot):
+        with pytest.raises(ValueError, match="Unsupported locator strategy - JQUERY"):
+            snapshot.find_all("jquery=$('a')")
+
+    def test_get_texts(self, snapshot):
+        assert snapshot.get_texts("xpath=//tr/td[1]") == ["North", "South"]
+        assert snapshot.get_texts("id=title") == ["Monthly report"]
+
+    def test_html_parser_methods_use_the_snapshot(self, snapshot):
+        assert snapshot.get_row_count(table_xpath="//table[@id='report']") == 3
+        assert snapshot.get_column_data() == ["Region", "Total"]
+        assert snapshot.get_cell_value(by_locator=False, row=3, col=2) == "20"
+        assert snapshot.get_element_count("//td") == 4
+
+    def test_unknown_attribute(self, snapshot):
+        with pytest.raises(AttributeError):
+            snapshot.parse_html_data("<p/>")
+
+    def test_snapshot_is_static(self, snapshot):
+        assert snapshot.url == "http://example.com/report"
+        assert snapshot.age_seconds >= 0
+        assert "http://example.com/report" in repr(snapshot)
+
+
+class TestGetPageSnapshot:
+
+    @pytest.fixture
+    def driver(self):
+        driver = MagicMock()
+        driver.page_source = REPORT
+        driver.current_url = "http://example.com/report"
+        return driver
+
+    def test_page_source_is_read_once(self, driver):
+        element_interactions = ElementInteractions(driver, default_explicit_wait=5,
+                                                   default_implicit_wait=1)
+        snapshot = element_interactions.get_page_snapshot()
+        assert snapshot.get_texts("xpath=//td[2]") == ["10", "20"]
+        driver.execute_script.assert_not_called()
+        driver.find_element.assert_not_called()
+
+    def test_element_snapshot(self, driver):
+        element = MagicMock()
+        element.get_attribute.return_value = "<table><tr><td>North</td><td>10</td></tr></table>"
+        element_interactions = ElementInteractions(driver, default_explicit_wait=5,
+                                                   default_implicit_wait=1)
+        element_interactions.get_web_element = MagicMock(return_value=element)
+
+        snapshot = element_interactions.get_page_snapshot("id=report")
+
+        element.get_attribute.assert_called_once_with("outerHTML")
+        assert snapshot.get_row_data(row_number=1) == ["North", "10"]
@@ -0,0 +1,129 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+from cafex_core.singletons_.session_ import SessionStore
+
+from cafex_ui.web_client.playwright_context_pool import PlaywrightContextPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    session_store = SessionStore()
+    previous_config = session_store.base_config
+    session_store.base_config = {"playwright_context_pool": {"enabled": True}}
+    PlaywrightContextPool._instance = None
+    yield PlaywrightContextPool()
+    PlaywrightContextPool._instance.shutdown()
+    PlaywrightContextPool._instance = None
+    session_store.base_config = previous_config
+    session_store.storage.pop("playwright_context_pool", None)
+
+
+class TestPlaywrightContextPool:
+
+    @pytest.fixture
+    def browser(self, pool):
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+        pool.playwright = MagicMock()
+        pool.get_browser(lambda playwright: browser)
+        return browser
+
+    def test_browser_is_launched_once(self, pool, browser):
+        launch_browser = MagicMock()
+        assert pool.get_browser(launch_browser) is browser
+        launch_browser.assert_not_called()
+        assert pool.session_store.playwright_browser is browser
+
+    def test_disconnected_browser_is_relaunched(self, pool, browser):
+        browser.is_connected.return_value = False
+        new_browser = MagicMock()
+        assert pool.get_browser(lambda playwright: new_browser) is new_browser
+
+    def test_new_context_per_test(self, pool, browser):
+        first_page = pool.new_context()
+        first_context = pool.context
+        second_page = pool.new_context(viewport={"width": 800, "height": 600})
+
+        first_context.close.assert_called_once()
+        browser.new_context.assert_called_with(viewport={"width": 800, "height": 600})
+        assert pool.session_store.playwright_page is second_page
+        assert first_page is not None
+
+    def test_close_context_clears_session_store(self, pool, browser):
+        pool.new_context()
+        context = pool.context
+        pool.close_context()
+
+        context.close.assert_called_once()
+        assert pool.session_store.playwright_context is None
+        assert pool.session_store.playwright_page is None
+
+    def test_use_storage_state_logs_in_once(self, pool, browser):
+        state = {"cookies": [{"name": "session", "value": "1"}], "origins": []}
+        browser.new_context.return_value.storage_state.return_value = state
+        login = MagicMock()
+
+        pool.use_storage_state("admin", login=login)
+        pool.use_storage_state("admin", login=login)
+
+        login.assert_called_once()
+        browser.new_context.assert_called_with(storage_state=state)
+
+    def test_storage_state_is_shared_through_directory(self, pool, browser, tmp_path):
+        pool.session_store.base_config["playwright_context_pool"]["storage_state_dir"] = str(tmp_path)
+        pool.new_context()
+        pool.save_storage_state("user/one")
+        path = str(tmp_path / "user_one.json")
+        pool.context.storage_state.assert_called_once_with(path=path)
+
+        (tmp_path / "user_one.json").write_text("{}")
+        pool.storage_states.clear()
+        assert pool.has_storage_state("user/one")
+        pool.new_context(storage_state="user/one")
+        browser.new_context.assert_called_with(storage_state=path)
+
+    def test_missing_storage_state(self, pool, browser):
+        with pytest.raises(KeyError):
+            pool.use_storage_state("unknown")
+
+
+class LoginHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        if self.path == "/login":
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        self.wfile.write(b"<html><body>ok</body></html>")
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LoginHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_contexts_with_headless_chromium(pool, http_server):
+    try:
+        pool.get_browser(lambda playwright: playwright.chromium.launch(headless=True))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        pytest.skip(f"Headless Chromium is not available: {e}")
+
+    page = pool.use_storage_state("user", login=lambda login_page: login_page.goto(http_server + "/login"))
+    assert pool.context.cookies()[0]["value"] == "abc"
+
+    page = pool.new_context()
+    page.goto(http_server)
+    assert pool.context.cookies() == []
+
+    pool.use_storage_state("user")
+    assert pool.context.cookies()[0]["value"] == "abc"
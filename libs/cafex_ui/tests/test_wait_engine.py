@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cafex_core.singletons_.session_ import SessionStore
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from cafex_ui.web_client.wait_engine import WaitEngine
+from cafex_ui.web_client.web_client_actions.element_interactions import ElementInteractions
+from cafex_ui.web_client.web_client_actions.webdriver_interactions import WebDriverInteractions
+
+
+def page_status(**changes):
+    status = {
+        "readyState": "complete",
+        "pendingRequests": 0,
+        "networkQuietMs": 1000,
+        "domQuietMs": 1000,
+        "frameworkIdle": True,
+        "hookError": None,
+    }
+    status.update(changes)
+    return status
+
+
+@pytest.fixture
+def session_store():
+    session_store = SessionStore()
+    previous_config = session_store.base_config
+    session_store.base_config = {"wait_engine": {"timeout": 5, "network_quiet_ms": 200,
+                                                 "dom_quiet_ms": 300}}
+    yield session_store
+    session_store.base_config = previous_config
+
+
+@pytest.fixture
+def driver():
+    return MagicMock()
+
+
+class TestWaitEngine:
+
+    def test_waits_for_pending_requests_and_quiet_dom(self, driver, session_store):
+        driver.execute_script.side_effect = [
+            page_status(readyState="interactive"),
+            page_status(pendingRequests=2),
+            page_status(networkQuietMs=50),
+            page_status(domQuietMs=100),
+            page_status(),
+        ]
+        with patch("time.sleep"):
+            WaitEngine(driver).wait_until_idle()
+        assert driver.execute_script.call_count == 5
+
+    def test_framework_idle(self, driver, session_store):
+        driver.execute_script.side_effect = [page_status(frameworkIdle=False), page_status()]
+        with patch("time.sleep"):
+            WaitEngine(driver).wait_until_idle(network=False, dom=False)
+        assert driver.execute_script.call_count == 2
+
+    def test_only_requested_signals_are_awaited(self, driver, session_store):
+        driver.execute_script.return_value = page_status(domQuietMs=0, frameworkIdle=False)
+        assert WaitEngine(driver).wait_until_idle(dom=False, framework=False)["domQuietMs"] == 0
+
+    def test_timeout_reports_last_status(self, driver, session_store):
+        driver.execute_script.return_value = page_status(pendingRequests=1)
+        with pytest.raises(TimeoutException, match="'pendingRequests': 1"):
+            WaitEngine(driver).wait_until_idle(timeout=0.2)
+
+    def test_navigation_between_polls_is_retried(self, driver, session_store):
+        driver.execute_script.side_effect = [WebDriverException("navigated"), page_status()]
+        with patch("time.sleep"):
+            assert WaitEngine(driver).wait_until_idle()["readyState"] == "complete"
+
+    def test_instrumentation_is_registered_once_through_cdp(self, driver, session_store):
+        driver.execute_script.return_value = page_status()
+        engine = WaitEngine(driver)
+        engine.wait_until_idle()
+        engine.wait_until_idle()
+
+        driver.execute_cdp_cmd.assert_called_once()
+        assert driver.execute_cdp_cmd.call_args.args[0] == "Page.addScriptToEvaluateOnNewDocument"
+
+    def test_without_cdp(self, session_store):
+        driver = MagicMock(spec=["execute_script"])
+        driver.execute_script.return_value = page_status()
+        engine = WaitEngine(driver)
+        assert engine.install() is False
+        assert engine.wait_until_idle()["frameworkIdle"] is True
+
+    def test_idle_hooks_are_embedded_in_the_script(self, driver, session_store):
+        session_store.base_config["wait_engine"]["idle_hooks"] = ["window.appIdle === true"]
+        driver.execute_script.return_value = page_status()
+        WaitEngine(driver).status()
+        script = driver.execute_script.call_args.args[0]
+        assert "function () { return (window.appIdle === true); }" in script
+
+    def test_before_action_is_off_by_default(self, driver, session_store):
+        WaitEngine(driver).before_action()
+        driver.execute_script.assert_not_called()
+
+    def test_before_action_does_not_fail_the_action(self, driver, session_store):
+        session_store.base_config["wait_engine"].update({"before_actions": True, "timeout": 0.2})
+        driver.execute_script.return_value = page_status(pendingRequests=1)
+        WaitEngine(driver).before_action()
+        assert driver.execute_script.called
+
+
+def test_click_waits_for_idle_page_when_enabled(driver, session_store):
+    session_store.base_config["wait_engine"]["before_actions"] = True
+    driver.execute_script.return_value = page_status()
+    element_interactions = ElementInteractions(driver, default_explicit_wait=5, default_implicit_wait=1)
+    with patch.object(ElementInteractions, "get_clickable_web_element") as get_element:
+        element_interactions.click("id=submit")
+    driver.execute_script.assert_called_once()
+    get_element.return_value.click.assert_called_once()
+
+
+def test_wait_for_network_idle(driver, session_store):
+    driver.execute_script.return_value = page_status(domQuietMs=0)
+    web_driver_interactions = WebDriverInteractions(driver, default_explicit_wait=5,
+                                                    default_implicit_wait=1)
+    assert web_driver_interactions.wait_for_network_idle(quiet_ms=500)["pendingRequests"] == 0
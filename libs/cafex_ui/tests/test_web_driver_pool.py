@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+
+import pytest
+from cafex_core.singletons_.session_ import SessionStore
+from selenium.common.exceptions import WebDriverException
+
+from cafex_ui.web_client.web_driver_pool import WebDriverPool
+
+
+def make_driver(handles=("main",)):
+    driver = MagicMock()
+    driver.window_handles = list(handles)
+    return driver
+
+
+class TestWebDriverPool:
+
+    @pytest.fixture(autouse=True)
+    def pool(self):
+        session_store = SessionStore()
+        previous_config = session_store.base_config
+        session_store.base_config = {"driver_pool": {"enabled": True, "max_reuse": 3}}
+        WebDriverPool._instance = None
+        yield WebDriverPool()
+        WebDriverPool._instance = None
+        session_store.base_config = previous_config
+        session_store.storage.pop("web_driver_pool", None)
+
+    def test_is_enabled(self, pool):
+        assert WebDriverPool.is_enabled() is True
+        pool.session_store.base_config = {}
+        assert WebDriverPool.is_enabled() is False
+
+    def test_driver_key_ignores_setting_order(self):
+        assert WebDriverPool.driver_key("chrome", proxies="", capabilities={"a": 1, "b": 2}) == \
+            WebDriverPool.driver_key("chrome", capabilities={"b": 2, "a": 1}, proxies="")
+        assert WebDriverPool.driver_key("chrome") != WebDriverPool.driver_key("firefox")
+
+    def test_reuses_released_driver_with_same_key(self, pool):
+        driver = make_driver()
+        create_driver = MagicMock(return_value=driver)
+
+        assert pool.acquire("chrome", create_driver) is driver
+        pool.release(driver)
+        assert pool.acquire("chrome", create_driver) is driver
+
+        create_driver.assert_called_once()
+        driver.quit.assert_not_called()
+        assert pool.session_store.web_driver_pool is pool
+
+    def test_replaces_driver_for_other_key(self, pool):
+        chrome, firefox = make_driver(), make_driver()
+        pool.acquire("chrome", lambda: chrome)
+        pool.release(chrome)
+
+        assert pool.acquire("firefox", lambda: firefox) is firefox
+        chrome.quit.assert_called_once()
+
+    def test_replaces_driver_that_was_not_released(self, pool):
+        first, second = make_driver(), make_driver()
+        pool.acquire("chrome", lambda: first)
+
+        assert pool.acquire("chrome", lambda: second) is second
+        first.quit.assert_called_once()
+
+    def test_recycles_crashed_driver(self, pool):
+        crashed, fresh = make_driver(), make_driver()
+        pool.acquire("chrome", lambda: crashed)
+        pool.release(crashed)
+        type(crashed).window_handles = property(
+            lambda self: (_ for _ in ()).throw(WebDriverException("session deleted")))
+
+        assert pool.acquire("chrome", lambda: fresh) is fresh
+        crashed.quit.assert_called_once()
+
+    def test_recycles_driver_after_max_reuse(self, pool):
+        first, second = make_driver(), make_driver()
+        drivers = iter([first, second])
+        for _ in range(3):
+            pool.release(pool.acquire("chrome", lambda: next(drivers)))
+
+        assert pool.acquire("chrome", lambda: next(drivers)) is second
+        first.quit.assert_called_once()
+
+    def test_reset_clears_state_between_tests(self, pool):
+        driver = make_driver(handles=("main", "popup"))
+        pool.acquire("chrome", lambda: driver)
+        pool.release(driver)
+
+        driver.switch_to.window.assert_any_call("popup")
+        driver.close.assert_called_once()
+        driver.switch_to.window.assert_called_with("main")
+        driver.execute_script.assert_called_once_with(
+            "window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.execute_cdp_cmd.assert_called_once_with("Network.clearBrowserCookies", {})
+        driver.get.assert_called_once_with("about:blank")
+
+    def test_reset_falls_back_to_current_domain_cookies(self, pool):
+        driver = make_driver()
+        driver.execute_cdp_cmd.side_effect = WebDriverException("not a chromium browser")
+
+        assert pool.reset(driver) is True
+        driver.delete_all_cookies.assert_called_once()
+
+    def test_driver_that_cannot_be_reset_is_quit(self, pool):
+        driver = make_driver()
+        driver.get.side_effect = WebDriverException("renderer crashed")
+        pool.acquire("chrome", lambda: driver)
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.driver is None
+
+    def test_shutdown_quits_pooled_driver(self, pool):
+        driver = make_driver()
+        pool.acquire("chrome", lambda: driver)
+        pool.shutdown()
+
+        driver.quit.assert_called_once()
+        assert pool.driver is None
@@ -25,6 +25,11 @@ def pytest_configure(config):
     HOOK_HELPER_.pytest_configure_(config)
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    HOOK_HELPER_.pytest_collection_modifyitems_(session, config, items)
+
+
 @pytest.hookimpl()
 def pytest_collection_finish(session):
     HOOK_HELPER_.pytest_collection_finish_(session)
@@ -56,6 +61,11 @@ def pytest_runtest_setup(item):
     HOOK_HELPER_.pytest_run_test_setup(item)
 
 
+@pytest.hookimpl()
+def pytest_runtest_teardown(item):
+    HOOK_HELPER_.pytest_run_test_teardown(item)
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport():
     HOOK_HELPER_.pytest_run_test_make_report((yield).get_result())